@@ -0,0 +1,42 @@
+"""
+Database Migration: Add integrity_report to interview_answers table
+
+Per-answer integrity reports (AI detection, structure, timing, self-similarity)
+are now computed once when the answer is submitted and stored in a new JSON
+column. Answers stored before this migration keep NULL and are analyzed on
+demand, so no backfill is needed.
+
+Run this script to update the database schema.
+"""
+
+from app.database import engine
+from sqlalchemy import text, inspect
+
+def run_migration():
+    """Add integrity_report column to interview_answers table"""
+    try:
+        print("Starting migration: Adding integrity_report column...")
+
+        inspector = inspect(engine)
+        if not inspector.has_table('interview_answers'):
+            print("✓ interview_answers table does not exist yet (created with the column on startup)")
+            return
+
+        existing_columns = [col['name'] for col in inspector.get_columns('interview_answers')]
+        if 'integrity_report' not in existing_columns:
+            print("Adding integrity_report column...")
+            with engine.connect() as conn:
+                conn.execute(text("ALTER TABLE interview_answers ADD COLUMN integrity_report JSON"))
+                conn.commit()
+            print("✓ integrity_report column added")
+        else:
+            print("✓ integrity_report column already exists")
+
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,42 @@
+"""
+Database Migration: Add adaptive_state to session_resume table
+
+Adaptive (CAT) sessions now store their AdaptiveState with every question
+transition, so a session resumed from the database keeps selecting questions
+instead of finishing after the ones already asked. Rows stored before this
+migration keep NULL: those sessions continue as fixed ones, as before.
+
+Run this script to update the database schema.
+"""
+
+from app.database import engine
+from sqlalchemy import text, inspect
+
+def run_migration():
+    """Add adaptive_state column to session_resume table"""
+    try:
+        print("Starting migration: Adding adaptive_state column...")
+
+        inspector = inspect(engine)
+        if not inspector.has_table('session_resume'):
+            print("✓ session_resume table does not exist yet (created with the column on startup)")
+            return
+
+        existing_columns = [col['name'] for col in inspector.get_columns('session_resume')]
+        if 'adaptive_state' not in existing_columns:
+            print("Adding adaptive_state column...")
+            with engine.connect() as conn:
+                conn.execute(text("ALTER TABLE session_resume ADD COLUMN adaptive_state JSON"))
+                conn.commit()
+            print("✓ adaptive_state column added")
+        else:
+            print("✓ adaptive_state column already exists")
+
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration()
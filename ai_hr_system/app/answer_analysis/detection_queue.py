@@ -0,0 +1,145 @@
+from app.answer_analysis.ai_detector import AIDetector
+from app.answer_analysis.final_analyzer import FinalAnalyzer
+from app.answer_analysis.schemas import AnswerIntegrityReport, TypingFeatures
+from typing import Callable, Dict, List, Optional
+import queue
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AIDetectionQueue:
+    """
+    Bounded in-process queue that runs answer analysis off the submit path.
+
+    `submit` only enqueues: worker threads run AIDetector (filling the
+    answer's `ai_score` / `ai_explanation`), build its AnswerIntegrityReport
+    and hand both to `on_result` (persistence). When the queue is full the
+    job is rejected instead of blocking the candidate; the answer stays
+    pending and consumers compute it on demand.
+    """
+
+    def __init__(
+        self,
+        detector: Optional[AIDetector] = None,
+        max_size: int = 1000,
+        workers: int = 1,
+        on_result: Optional[Callable[[str, int, object, AnswerIntegrityReport], None]] = None,
+        analyzer: Optional[FinalAnalyzer] = None
+    ):
+        self.detector = detector or AIDetector()
+        self.analyzer = analyzer or FinalAnalyzer()
+        self.max_size = max_size
+        self.on_result = on_result
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_size)
+        self._idle = threading.Condition()
+        self._pending = 0
+        self._threads = [
+            threading.Thread(target=self._work, name=f"ai-detection-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for t in self._threads:
+            t.start()
+        self.enqueued = 0
+        self.processed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.high_water = 0
+        self._wait_ms_total = 0.0
+        self._analyze_ms_total = 0.0
+
+    def submit(
+        self,
+        session_id: str,
+        seq: int,
+        answer,
+        difficulty: str = "medium",
+        previous_texts: Optional[List[str]] = None,
+        typing_features: Optional[TypingFeatures] = None
+    ) -> bool:
+        """
+        Schedule analysis of `answer` (the answer at position `seq` of the session).
+        `previous_texts` are the earlier answers, for the self-similarity check;
+        `typing_features` come from the answer's telemetry.
+
+        Returns:
+            False if the queue is full (backpressure) and the job was dropped
+        """
+        with self._idle:
+            self._pending += 1
+        try:
+            self._queue.put_nowait(
+                (session_id, seq, answer, difficulty, previous_texts or [], typing_features, time.perf_counter())
+            )
+        except queue.Full:
+            with self._idle:
+                self._pending -= 1
+                self._idle.notify_all()
+            self.rejected += 1
+            logger.warning(f"[AI-QUEUE] full ({self.max_size}), analysis of {session_id}#{seq} deferred")
+            return False
+        self.enqueued += 1
+        self.high_water = max(self.high_water, self._queue.qsize())
+        return True
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            session_id, seq, answer, difficulty, previous_texts, typing_features, enqueued_at = job
+            started = time.perf_counter()
+            try:
+                ai_result = None
+                if answer.ai_score is None:
+                    ai_result = self.detector.analyze(text=answer.answer_text, time_spent=answer.time_spent)
+                    answer.ai_explanation = ", ".join(ai_result.flags)
+                    answer.ai_score = ai_result.score
+                report = self.analyzer.analyze_answer(
+                    answer, difficulty, previous_texts, ai_res=ai_result, typing_features=typing_features
+                )
+                if self.on_result:
+                    self.on_result(session_id, seq, answer, report)
+                self.processed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"[AI-QUEUE] analysis of {session_id}#{seq} failed: {e}")
+            finally:
+                done = time.perf_counter()
+                self._wait_ms_total += (started - enqueued_at) * 1000
+                self._analyze_ms_total += (done - started) * 1000
+                with self._idle:
+                    self._pending -= 1
+                    self._idle.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every accepted job is done. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def stop(self, timeout: float = 5.0):
+        """Finish queued jobs (up to `timeout`) and stop the workers"""
+        self.wait_idle(timeout)
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break
+        for t in self._threads:
+            t.join(timeout=0.5)
+
+    def metrics(self) -> Dict:
+        done = self.processed + self.failed
+        return {
+            "depth": self._queue.qsize(),
+            "max_size": self.max_size,
+            "high_water": self.high_water,
+            "workers": len(self._threads),
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "avg_wait_ms": round(self._wait_ms_total / done, 3) if done else 0.0,
+            "avg_analyze_ms": round(self._analyze_ms_total / done, 3) if done else 0.0
+        }
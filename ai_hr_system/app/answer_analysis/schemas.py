@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from pydantic import BaseModel
 from enum import Enum
 
@@ -16,6 +16,24 @@ class AnalysisResult(BaseModel):
     flags: List[str] = []
     details: Dict[str, Any] = {}
 
+class TypingFeatures(BaseModel):
+    """Behavior features derived from an answer's typing telemetry"""
+    keystrokes: int = 0
+    paste_count: int = 0
+    paste_chars: int = 0
+    paste_ratio: float = 0.0  # pasted share of entered characters
+    bursts: int = 0  # runs of keystrokes less than a second apart
+    burst_rate: float = 0.0  # keystrokes per second inside bursts
+    blur_count: int = 0  # times the candidate left the interview window
+    away_seconds: float = 0.0
+
+class TelemetryBatch(BaseModel):
+    """Client telemetry collected since the previous batch, for one question"""
+    question_index: int
+    keys: List[int] = []  # milliseconds since the previous keystroke
+    pastes: List[Tuple[int, int]] = []  # (ms since question start, pasted length)
+    focus: List[Tuple[int, int]] = []  # (ms since question start, 0 = blur / 1 = focus)
+
 class AnswerIntegrityReport(BaseModel):
     """Integrity report for a single answer"""
     question_id: int
@@ -0,0 +1,236 @@
+from app.answer_analysis.schemas import TypingFeatures
+from app.models import AnswerTelemetry
+from sqlalchemy import update
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+import asyncio
+import sys
+import threading
+import weakref
+import zlib
+
+# Keystroke gaps of at least this long end a typing burst
+BURST_GAP_MS = 1000
+# Intervals are stored as unsigned 16-bit milliseconds (longer pauses are clamped)
+MAX_INTERVAL_MS = 0xFFFF
+# Paste/focus times and lengths are unsigned 32-bit
+MAX_U32 = 0xFFFFFFFF
+# Keystrokes kept per answer (beyond it only pastes and focus changes are recorded)
+MAX_KEYSTROKES = 50000
+# Events accepted in one client batch
+MAX_BATCH_EVENTS = 5000
+# Transactions tried per batch when other workers keep creating the answer's row first
+INGEST_ATTEMPTS = 3
+
+# Focus event kinds
+BLUR = 0
+FOCUS = 1
+
+def pack(values: array) -> bytes:
+    """zlib-compressed little-endian bytes of a packed array"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return zlib.compress(values.tobytes())
+
+def unpack(blob: Optional[bytes], typecode: str) -> array:
+    values = array(typecode)
+    if blob:
+        values.frombytes(zlib.decompress(blob))
+        if sys.byteorder == "big":
+            values.byteswap()
+    return values
+
+def typing_features(keys: array, pastes: array, focus: array) -> TypingFeatures:
+    """
+    Features of one answer's telemetry.
+
+    Args:
+        keys: milliseconds between consecutive keystrokes ('H')
+        pastes: interleaved (ms since question start, pasted length) ('I')
+        focus: interleaved (ms since question start, BLUR/FOCUS) ('I')
+    """
+    burst_keys = 0
+    burst_ms = 0
+    bursts = 0
+    in_burst = False
+    for gap in keys:
+        if gap < BURST_GAP_MS:
+            burst_keys += 1
+            burst_ms += gap
+            if not in_burst:
+                bursts += 1
+                in_burst = True
+        else:
+            in_burst = False
+
+    paste_chars = sum(pastes[1::2])
+    entered = len(keys) + paste_chars
+
+    blur_count = 0
+    away_ms = 0
+    blurred_at = None
+    for t, kind in sorted(zip(focus[0::2], focus[1::2])):
+        if kind == BLUR:
+            if blurred_at is None:
+                blur_count += 1
+                blurred_at = t
+        elif blurred_at is not None:
+            away_ms += t - blurred_at
+            blurred_at = None
+
+    return TypingFeatures(
+        keystrokes=len(keys),
+        paste_count=len(pastes) // 2,
+        paste_chars=paste_chars,
+        paste_ratio=round(paste_chars / entered, 3) if entered else 0.0,
+        bursts=bursts,
+        burst_rate=round(burst_keys / (burst_ms / 1000), 2) if burst_ms else 0.0,
+        blur_count=blur_count,
+        away_seconds=round(away_ms / 1000, 1)
+    )
+
+class TelemetryRecorder:
+    """
+    Typing, paste and focus telemetry of answers, stored as packed arrays.
+
+    Each answer (session, question index) has one answer_telemetry row with
+    zlib-compressed arrays: keystroke intervals as uint16 ms, pastes and
+    focus changes as interleaved uint32 pairs. Batches are appended to the
+    arrays and the TypingFeatures are recomputed and stored next to them,
+    so analyzers read the features without decoding the events.
+
+    Batches of one answer must not interleave (the arrays are read, extended
+    and written back): in a process they are serialized by `ingest_lock`,
+    across workers by the write lock `ingest` takes before reading the row.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self.cache_size = cache_size
+        self._features: "OrderedDict[Tuple[str, int], TypingFeatures]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Held only while a batch of the answer is being stored
+        self._ingest_locks: "weakref.WeakValueDictionary[Tuple[str, int], asyncio.Lock]" = weakref.WeakValueDictionary()
+        self.batches = 0
+        self.events = 0
+        self.array_bytes_written = 0
+        self.compressed_bytes_written = 0
+
+    def ingest(
+        self,
+        db,
+        session_id: str,
+        question_index: int,
+        keys: Sequence[int],
+        pastes: Sequence[Sequence[int]],
+        focus: Sequence[Sequence[int]]
+    ) -> TypingFeatures:
+        """
+        Append one client batch to the answer's arrays (in the caller's transaction).
+        The row is write-locked before it is read and stays locked until the
+        transaction ends. If another transaction creates the row first, the
+        commit fails with IntegrityError and the batch must be retried.
+        """
+        # Portable SELECT ... FOR UPDATE: a no-op write locks the row on PostgreSQL,
+        # and on SQLite (no FOR UPDATE) takes the database write lock before the read
+        db.execute(
+            update(AnswerTelemetry).where(
+                AnswerTelemetry.session_id == session_id, AnswerTelemetry.question_index == question_index
+            ).values(updated_at=AnswerTelemetry.updated_at).execution_options(synchronize_session=False)
+        )
+        row = db.query(AnswerTelemetry).filter(
+            AnswerTelemetry.session_id == session_id, AnswerTelemetry.question_index == question_index
+        ).first()
+        if row is None:
+            row = AnswerTelemetry(session_id=session_id, question_index=question_index)
+            db.add(row)
+
+        key_values = unpack(row.keys, "H")
+        room = max(0, MAX_KEYSTROKES - len(key_values))
+        key_values.extend(min(max(0, gap), MAX_INTERVAL_MS) for gap in keys[:room])
+        paste_values = unpack(row.pastes, "I")
+        for t, length in pastes:
+            paste_values.extend((min(max(0, t), MAX_U32), min(max(0, length), MAX_U32)))
+        focus_values = unpack(row.focus, "I")
+        for t, kind in focus:
+            focus_values.extend((min(max(0, t), MAX_U32), FOCUS if kind else BLUR))
+
+        features = typing_features(key_values, paste_values, focus_values)
+        row.keys = pack(key_values)
+        row.pastes = pack(paste_values)
+        row.focus = pack(focus_values)
+        row.features = features.model_dump()
+        row.updated_at = datetime.utcnow()
+
+        with self._lock:
+            self._features[(session_id, question_index)] = features
+            self._features.move_to_end((session_id, question_index))
+            while len(self._features) > self.cache_size:
+                self._features.popitem(last=False)
+            self.batches += 1
+            self.events += len(keys) + len(pastes) + len(focus)
+            self.array_bytes_written += len(key_values) * 2 + len(paste_values) * 4 + len(focus_values) * 4
+            self.compressed_bytes_written += len(row.keys) + len(row.pastes) + len(row.focus)
+        return features
+
+    def ingest_lock(self, session_id: str, question_index: int) -> asyncio.Lock:
+        """Lock serializing this process's ingest transactions of one answer"""
+        with self._lock:
+            lock = self._ingest_locks.get((session_id, question_index))
+            if lock is None:
+                lock = self._ingest_locks[(session_id, question_index)] = asyncio.Lock()
+            return lock
+
+    def cached(self, session_id: str, question_index: int) -> Optional[TypingFeatures]:
+        """Features from a batch this worker ingested"""
+        with self._lock:
+            return self._features.get((session_id, question_index))
+
+    def load_features(self, db, session_id: str, question_index: int) -> Optional[TypingFeatures]:
+        """Stored features of an answer (the packed events are not read)"""
+        data = db.query(AnswerTelemetry.features).filter(
+            AnswerTelemetry.session_id == session_id, AnswerTelemetry.question_index == question_index
+        ).scalar()
+        return TypingFeatures.model_validate(data) if data else None
+
+    def load_session_features(self, db, session_id: str) -> Dict[int, TypingFeatures]:
+        """Stored features of all answers of a session, by question index"""
+        rows = db.query(AnswerTelemetry.question_index, AnswerTelemetry.features).filter(
+            AnswerTelemetry.session_id == session_id, AnswerTelemetry.features.isnot(None)
+        ).all()
+        return {index: TypingFeatures.model_validate(data) for index, data in rows}
+
+    def load_events(self, db, session_id: str, question_index: int) -> Optional[Dict[str, List]]:
+        """Features and decoded events of an answer (review and debugging)"""
+        row = db.query(AnswerTelemetry).filter(
+            AnswerTelemetry.session_id == session_id, AnswerTelemetry.question_index == question_index
+        ).first()
+        if row is None:
+            return None
+        pastes = unpack(row.pastes, "I")
+        focus = unpack(row.focus, "I")
+        return {
+            "features": row.features,
+            "keys": unpack(row.keys, "H").tolist(),
+            "pastes": [list(p) for p in zip(pastes[0::2], pastes[1::2])],
+            "focus": [list(f) for f in zip(focus[0::2], focus[1::2])]
+        }
+
+    def forget(self, session_id: str, question_index: int):
+        with self._lock:
+            self._features.pop((session_id, question_index), None)
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "events": self.events,
+                "cached_features": len(self._features),
+                "array_bytes_written": self.array_bytes_written,
+                "compressed_bytes_written": self.compressed_bytes_written,
+                "compression_ratio": (
+                    round(self.array_bytes_written / self.compressed_bytes_written, 2) if self.compressed_bytes_written else 0.0
+                )
+            }
@@ -1,4 +1,5 @@
-from app.answer_analysis.schemas import AnalysisResult, AnalysisType
+from app.answer_analysis.schemas import AnalysisResult, AnalysisType, TypingFeatures
+from typing import Optional
 
 class TimeBehaviorAnalyzer:
     """
@@ -6,7 +7,13 @@ class TimeBehaviorAnalyzer:
     Detects suspiciously fast or uniform response times.
     """
 
-    def analyze(self, time_spent: int, difficulty: str, text_length: int) -> AnalysisResult:
+    def analyze(
+        self,
+        time_spent: int,
+        difficulty: str,
+        text_length: int,
+        typing_features: Optional[TypingFeatures] = None
+    ) -> AnalysisResult:
         """
         Analyze timing behavior.
         
@@ -14,6 +21,7 @@ class TimeBehaviorAnalyzer:
             time_spent: seconds
             difficulty: easy/medium/hard
             text_length: length of answer in characters
+            typing_features: derived from the answer's typing telemetry, if the client sent any
         """
         flags = []
         score = 1.0 # 1.0 is healthy, lower is suspicious
@@ -44,13 +52,34 @@ class TimeBehaviorAnalyzer:
                 flags.append("extremely_high_typing_speed")
                 score *= 0.6
 
+        details = {
+            "time_spent": time_spent,
+            "difficulty": difficulty,
+            "chars_per_second": round(text_length / time_spent, 1) if time_spent > 0 else 999
+        }
+
+        # 3. Typing telemetry: what was pasted, how fast it was typed, leaving the window
+        if typing_features is not None:
+            if typing_features.paste_chars >= 50 and typing_features.paste_ratio >= 0.5:
+                flags.append("mostly_pasted_answer")
+                score *= 0.3
+            elif typing_features.paste_chars >= 50 and typing_features.paste_ratio >= 0.2:
+                flags.append("partially_pasted_answer")
+                score *= 0.7
+
+            # Sustained > 20 keystrokes/sec is beyond fast human typing (scripted input)
+            if typing_features.keystrokes >= 50 and typing_features.burst_rate > 20:
+                flags.append("inhuman_typing_bursts")
+                score *= 0.4
+
+            if typing_features.blur_count >= 3 or typing_features.away_seconds >= 30:
+                flags.append("left_interview_window")
+                score *= 0.8
+            details["typing"] = typing_features.model_dump()
+
         return AnalysisResult(
             type=AnalysisType.TIME_BEHAVIOR,
             score=score,
             flags=flags,
-            details={
-                "time_spent": time_spent,
-                "difficulty": difficulty,
-                "chars_per_second": round(text_length / time_spent, 1) if time_spent > 0 else 999
-            }
+            details=details
         )
@@ -19,4 +19,75 @@ class Settings:
     # CORS Settings
     ALLOWED_ORIGINS: list = os.getenv("ALLOWED_ORIGINS", "*").split(",")
 
+    # Adaptive (CAT) interview settings
+    ADAPTIVE_CONFIDENCE_THRESHOLD: float = float(os.getenv("ADAPTIVE_CONFIDENCE_THRESHOLD", "0.85"))
+    ADAPTIVE_MIN_QUESTIONS: int = int(os.getenv("ADAPTIVE_MIN_QUESTIONS", "2"))
+    ADAPTIVE_SOFT_SKILLS_QUESTIONS: int = int(os.getenv("ADAPTIVE_SOFT_SKILLS_QUESTIONS", "3"))
+
+    # Semantic near-duplicate suppression in question selection (cosine similarity)
+    SEMANTIC_DEDUP_THRESHOLD: float = float(os.getenv("SEMANTIC_DEDUP_THRESHOLD", "0.88"))
+
+    # Startup warm-up of question pools from recent sessions
+    QUESTION_WARMUP_ENABLED: bool = os.getenv("QUESTION_WARMUP_ENABLED", "true").lower() == "true"
+    QUESTION_WARMUP_TOP_N: int = int(os.getenv("QUESTION_WARMUP_TOP_N", "30"))
+    QUESTION_WARMUP_BUDGET_MS: int = int(os.getenv("QUESTION_WARMUP_BUDGET_MS", "2000"))
+    QUESTION_WARMUP_LOOKBACK: int = int(os.getenv("QUESTION_WARMUP_LOOKBACK", "500"))
+
+    # Live interview session store: memory (single worker), sqlite (shared WAL file) or redis
+    SESSION_STORE: str = os.getenv("SESSION_STORE", "memory")
+    SESSION_STORE_URL: str = os.getenv("SESSION_STORE_URL", "")
+    SESSION_STORE_TTL: int = int(os.getenv("SESSION_STORE_TTL", "86400"))
+
+    # Worker-local cache of hydrated (finished/historical) sessions
+    SESSION_CACHE_MAX_SIZE: int = int(os.getenv("SESSION_CACHE_MAX_SIZE", "256"))
+    SESSION_CACHE_TTL: int = int(os.getenv("SESSION_CACHE_TTL", "900"))
+    # Sessions whose question list JSON is kept for their responses
+    SESSION_PAYLOAD_CACHE_SIZE: int = int(os.getenv("SESSION_PAYLOAD_CACHE_SIZE", "4096"))
+
+    # Server-side question deadlines (extra seconds allowed for slow networks)
+    QUESTION_TIMEOUT_GRACE_SECONDS: float = float(os.getenv("QUESTION_TIMEOUT_GRACE_SECONDS", "5"))
+
+    # Background AI detection (off the submit path)
+    AI_DETECTION_QUEUE_SIZE: int = int(os.getenv("AI_DETECTION_QUEUE_SIZE", "1000"))
+    AI_DETECTION_WORKERS: int = int(os.getenv("AI_DETECTION_WORKERS", "1"))
+
+    # Append-only session event log (state = fold over events, snapshot every N events)
+    SESSION_EVENT_LOG: bool = os.getenv("SESSION_EVENT_LOG", "true").lower() == "true"
+    SESSION_SNAPSHOT_EVERY: int = int(os.getenv("SESSION_SNAPSHOT_EVERY", "20"))
+
+    # Write-behind persistence of session writes (batched commits, local fsync'd journal per worker)
+    WRITE_BEHIND_ENABLED: bool = os.getenv("WRITE_BEHIND_ENABLED", "false").lower() == "true"
+    WRITE_BEHIND_JOURNAL: str = os.getenv("WRITE_BEHIND_JOURNAL", "logs/write_behind.journal")
+    WRITE_BEHIND_FLUSH_MS: int = int(os.getenv("WRITE_BEHIND_FLUSH_MS", "50"))
+    WRITE_BEHIND_MAX_BATCH: int = int(os.getenv("WRITE_BEHIND_MAX_BATCH", "200"))
+    WRITE_BEHIND_FSYNC: bool = os.getenv("WRITE_BEHIND_FSYNC", "true").lower() == "true"
+
+    # Live sessions written on graceful shutdown and restored on startup (empty: disabled)
+    LIVE_SNAPSHOT_PATH: str = os.getenv("LIVE_SNAPSHOT_PATH", "logs/live_state.snapshot")
+
+    # Answer draft autosave (text deltas buffered in memory, debounced writes)
+    DRAFT_AUTOSAVE: bool = os.getenv("DRAFT_AUTOSAVE", "true").lower() == "true"
+    DRAFT_DEBOUNCE_MS: int = int(os.getenv("DRAFT_DEBOUNCE_MS", "1500"))
+    DRAFT_MAX_DELAY_MS: int = int(os.getenv("DRAFT_MAX_DELAY_MS", "10000"))
+    DRAFT_MAX_CHARS: int = int(os.getenv("DRAFT_MAX_CHARS", "20000"))
+
+    # Answer size limits (413 above them): JSON /submit-answer, and streamed /submit-answer-stream
+    ANSWER_MAX_CHARS: int = int(os.getenv("ANSWER_MAX_CHARS", "20000"))
+    ANSWER_STREAM_MAX_CHARS: int = int(os.getenv("ANSWER_STREAM_MAX_CHARS", "200000"))
+
+    # Typing/paste/focus telemetry of answers (packed arrays + derived features)
+    TELEMETRY_ENABLED: bool = os.getenv("TELEMETRY_ENABLED", "true").lower() == "true"
+
+    # Session router (run_router.py): shared secret of the workers' /internal endpoints (empty: disabled)
+    ROUTER_INTERNAL_TOKEN: str = os.getenv("ROUTER_INTERNAL_TOKEN", "")
+    ROUTER_VNODES: int = int(os.getenv("ROUTER_VNODES", "160"))
+
+    # Memoized /generate-recommendation results (in-process LRU in front of the DB copy)
+    RECOMMENDATION_CACHE_SIZE: int = int(os.getenv("RECOMMENDATION_CACHE_SIZE", "1024"))
+
+    # Server-Sent Events push channel (candidate timer ticks, admin live updates)
+    SSE_TICK_SECONDS: float = float(os.getenv("SSE_TICK_SECONDS", "1"))
+    SSE_QUEUE_SIZE: int = int(os.getenv("SSE_QUEUE_SIZE", "64"))
+    SSE_HEARTBEAT_SECONDS: float = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
 settings = Settings()
@@ -1,5 +1,7 @@
 import os
-from sqlalchemy import create_engine
+import asyncio
+import threading
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -10,16 +12,197 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./hr_system.db")
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+# Pool settings (PostgreSQL and file-based SQLite). SQLite has a single writer:
+# a small pool without overflow queues requests fairly in the pool instead of
+# letting many connections busy-poll for the write lock.
+_IS_SQLITE = DATABASE_URL.startswith("sqlite")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5" if _IS_SQLITE else "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "0" if _IS_SQLITE else "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds; below typical server idle timeouts
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# SQLite pragmas applied to every new connection
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+def _is_sqlite_memory(url: str) -> bool:
+    return url.split("?")[0].rstrip("/") in ("sqlite:", "sqlite+aiosqlite:") or ":memory:" in url
+
+def engine_options(url: str) -> dict:
+    """create_engine / create_async_engine keyword arguments for a database URL"""
+    if _is_sqlite_memory(url):
+        return {"connect_args": {"check_same_thread": False}}
+    options = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING
+    }
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}
+    return options
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    cursor.close()
+
+class PoolMetrics:
+    """Connection pool counters, fed by pool events"""
+
+    def __init__(self, name: str, sync_engine):
+        self.name = name
+        self.engine = sync_engine
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.max_checked_out = 0
+        self._checked_out = 0
+        self._lock = threading.Lock()
+        event.listen(sync_engine, "connect", self._on_connect)
+        event.listen(sync_engine, "checkout", self._on_checkout)
+        event.listen(sync_engine, "checkin", self._on_checkin)
+        event.listen(sync_engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, *args):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, *args):
+        with self._lock:
+            self.checkouts += 1
+            self._checked_out += 1
+            self.max_checked_out = max(self.max_checked_out, self._checked_out)
+
+    def _on_checkin(self, *args):
+        with self._lock:
+            self.checkins += 1
+            self._checked_out = max(0, self._checked_out - 1)
+
+    def _on_invalidate(self, *args):
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool
+        data = {
+            "pool": type(pool).__name__,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "checked_out": self._checked_out,
+            "max_checked_out": self.max_checked_out,
+            "invalidations": self.invalidations
+        }
+        # QueuePool exposes its current state
+        for key in ("size", "checkedin", "overflow"):
+            if hasattr(pool, key):
+                data[key] = getattr(pool, key)()
+        return data
+
+def configure_engine(sync_engine, url: str):
+    """Attach SQLite pragmas (file databases) to an engine"""
+    if url.startswith("sqlite") and not _is_sqlite_memory(url):
+        event.listen(sync_engine, "connect", _set_sqlite_pragmas)
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+configure_engine(engine, DATABASE_URL)
+pool_metrics = {"sync": PoolMetrics("sync", engine)}
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+def _async_url(url: str) -> str:
+    """Same database through an async driver (aiosqlite / asyncpg)"""
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _async_url(DATABASE_URL))
+
+# How async endpoints reach the database:
+#   driver - async engine (asyncpg / aiosqlite)
+#   thread - sync session in a worker thread
+#   auto   - driver for PostgreSQL, thread for SQLite (aiosqlite hops to its
+#            own thread on every statement, which is slower than one hop per transaction)
+DB_ASYNC_MODE = os.getenv("DB_ASYNC_MODE", "auto").lower()
+
+async_engine = None
+AsyncSessionLocal = None
+
+def init_async_engine(mode: str = "auto"):
+    """Create (or drop) the async engine for the given DB_ASYNC_MODE"""
+    global async_engine, AsyncSessionLocal
+    if mode == "auto":
+        mode = "thread" if DATABASE_URL.startswith("sqlite") else "driver"
+    async_engine, AsyncSessionLocal = None, None
+    pool_metrics.pop("async", None)
+    if mode != "driver":
+        return
+    # Optional: without aiosqlite/asyncpg the async helpers fall back to thread offload
+    try:
+        import greenlet  # required by SQLAlchemy's asyncio extension
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL))
+        configure_engine(async_engine.sync_engine, ASYNC_DATABASE_URL)
+        pool_metrics["async"] = PoolMetrics("async", async_engine.sync_engine)
+        AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    except ImportError as e:
+        print(f"Async database driver not available ({e}), using thread offload")
+
+init_async_engine(DB_ASYNC_MODE)
+
+def get_pool_metrics() -> dict:
+    """Usage of every engine's connection pool"""
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+def run_sync_db(fn, *args):
+    """
+    Run fn(db, *args) in a sync session and commit.
+    Rolls back and re-raises on error.
+    """
+    db = SessionLocal()
+    try:
+        result = fn(db, *args)
+        db.commit()
+        return result
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+async def run_async_db(fn, *args):
+    """
+    Run the same sync-style fn(db, *args) without blocking the event loop:
+    on the async engine via AsyncSession.run_sync, or in a worker thread
+    when no async driver is installed.
+    """
+    if AsyncSessionLocal is None:
+        return await asyncio.to_thread(run_sync_db, fn, *args)
+
+    async with AsyncSessionLocal() as db:
+        try:
+            result = await db.run_sync(fn, *args)
+            await db.commit()
+            return result
+        except Exception:
+            await db.rollback()
+            raise
@@ -0,0 +1,90 @@
+from fastapi import HTTPException
+from typing import AsyncIterable, List
+import codecs
+
+# A JSON-encoded character takes at most 6 bytes ("\uXXXX"), plus quotes/whitespace
+JSON_BYTES_PER_CHAR = 6
+JSON_OVERHEAD_BYTES = 64
+# A UTF-8 character takes at most 4 bytes (raw /submit-answer-stream bodies)
+UTF8_MAX_BYTES_PER_CHAR = 4
+
+class AnswerTooLarge(ValueError):
+    """Answer text over the configured limit (HTTP 413)"""
+
+    def __init__(self, limit: int):
+        super().__init__(f"Answer exceeds the limit of {limit} characters")
+        self.limit = limit
+
+async def read_answer_stream(chunks: AsyncIterable[bytes], max_chars: int) -> str:
+    """
+    Decode a streamed UTF-8 answer body chunk by chunk.
+
+    Stops reading as soon as the text passes `max_chars` (the rest of the
+    upload is never buffered) and joins the pieces once at the end.
+
+    Raises:
+        AnswerTooLarge: the text is longer than `max_chars`
+        ValueError: the body is not valid UTF-8
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts: List[str] = []
+    chars = 0
+    try:
+        async for chunk in chunks:
+            text = decoder.decode(chunk)
+            chars += len(text)
+            if chars > max_chars:
+                raise AnswerTooLarge(max_chars)
+            parts.append(text)
+        parts.append(decoder.decode(b"", final=True))
+    except UnicodeDecodeError:
+        raise ValueError("Answer is not valid UTF-8")
+    return "".join(parts)
+
+class AnswerBodyLimit:
+    """
+    ASGI middleware: 413 for /submit-answer bodies that cannot fit the answer
+    limit, before they are read and parsed. Declared sizes are checked up
+    front; chunked bodies are counted while the endpoint reads them.
+    """
+
+    def __init__(self, app, max_chars: int, path_prefix: str = "/submit-answer/"):
+        self.app = app
+        self.max_chars = max_chars
+        self.max_bytes = max_chars * JSON_BYTES_PER_CHAR + JSON_OVERHEAD_BYTES
+        self.path_prefix = path_prefix
+        self.rejected = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope["headers"]).get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > self.max_bytes:
+            self.rejected += 1
+            await self._reject(send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            received += len(message.get("body", b""))
+            if received > self.max_bytes:
+                self.rejected += 1
+                # Re-raised by the body parser: the endpoint answers 413
+                raise HTTPException(status_code=413, detail=str(AnswerTooLarge(self.max_chars)))
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    async def _reject(self, send):
+        body = ('{"detail": "%s"}' % AnswerTooLarge(self.max_chars)).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("latin-1"))]
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,203 @@
+from app.database import run_async_db
+from app.models import AnswerDraft
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class DraftConflict(Exception):
+    """Delta built on another revision; the client resends the whole text against `rev`"""
+
+    def __init__(self, rev: int, length: int):
+        super().__init__(f"Draft is at revision {rev}")
+        self.rev = rev
+        self.length = length
+
+class Draft:
+    """Unsubmitted answer text of a session's current question"""
+
+    __slots__ = ("question_index", "text", "rev", "dirty_since", "changed_at")
+
+    def __init__(self, question_index: int, text: str = "", rev: int = 0):
+        self.question_index = question_index
+        self.text = text
+        self.rev = rev
+        self.dirty_since: Optional[float] = None
+        self.changed_at = 0.0
+
+class DraftBuffer:
+    """
+    Autosaved answer drafts, edited with small deltas and flushed with debouncing.
+
+    A delta replaces `delete` characters at `offset` with `text` and must be
+    based on the current revision. Drafts are written to `answer_drafts` once
+    typing pauses for `debounce_ms` (at the latest `max_delay_ms` after the
+    first unsaved change), all due drafts in one transaction.
+    """
+
+    def __init__(self, debounce_ms: int = 1500, max_delay_ms: int = 10000, max_chars: int = 20000):
+        self.debounce = debounce_ms / 1000
+        self.max_delay = max_delay_ms / 1000
+        self.max_chars = max_chars
+        self._drafts: Dict[str, Draft] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.deltas = 0
+        self.delta_chars = 0
+        self.conflicts = 0
+        self.flushes = 0
+        self.rows_written = 0
+
+    def apply(self, session_id: str, question_index: int, rev: int, offset: int, delete: int, text: str) -> Dict:
+        """
+        Apply one delta. Returns the new {"rev", "length"}.
+
+        Raises:
+            DraftConflict: `rev` is not the current revision
+            ValueError: delta outside the text, or the draft would exceed max_chars
+        """
+        with self._lock:
+            draft = self._drafts.get(session_id)
+            if draft is None or draft.question_index != question_index:
+                draft = Draft(question_index)
+                self._drafts[session_id] = draft
+            if rev != draft.rev:
+                self.conflicts += 1
+                raise DraftConflict(draft.rev, len(draft.text))
+            if offset < 0 or delete < 0 or offset + delete > len(draft.text):
+                raise ValueError("Delta outside the draft")
+            if len(draft.text) - delete + len(text) > self.max_chars:
+                raise ValueError(f"Draft longer than {self.max_chars} characters")
+
+            draft.text = draft.text[:offset] + text + draft.text[offset + delete:]
+            draft.rev += 1
+            now = time.monotonic()
+            if draft.dirty_since is None:
+                draft.dirty_since = now
+            draft.changed_at = now
+            self.deltas += 1
+            self.delta_chars += len(text)
+            return {"rev": draft.rev, "length": len(draft.text)}
+
+    def get(self, session_id: str) -> Optional[Draft]:
+        with self._lock:
+            return self._drafts.get(session_id)
+
+    async def load(self, session_id: str) -> Optional[Draft]:
+        """Buffered draft, else the stored one (which then becomes the buffer to edit)"""
+        draft = self.get(session_id)
+        if draft is not None:
+            return draft
+        row = await run_async_db(_db_load_draft, session_id)
+        if row is None:
+            return None
+        with self._lock:
+            return self._drafts.setdefault(session_id, Draft(*row))
+
+    def take(self, session_id: str) -> Optional[Draft]:
+        """Remove and return a draft (handing the session to another worker)"""
+        with self._lock:
+            return self._drafts.pop(session_id, None)
+
+    def put(self, session_id: str, question_index: int, text: str, rev: int):
+        """Adopt a draft handed over by another worker (saved with the next flush)"""
+        draft = Draft(question_index, text, rev)
+        draft.dirty_since = draft.changed_at = time.monotonic()
+        with self._lock:
+            current = self._drafts.get(session_id)
+            if current is None or current.question_index != question_index or current.rev < rev:
+                self._drafts[session_id] = draft
+
+    def discard(self, session_id: str):
+        """Answer submitted: the draft is done (the stored row goes with the answer write)"""
+        with self._lock:
+            self._drafts.pop(session_id, None)
+
+    def _take_due(self, now: float, everything: bool = False) -> List[Tuple[str, int, str, int]]:
+        due = []
+        with self._lock:
+            for session_id, draft in self._drafts.items():
+                if draft.dirty_since is None:
+                    continue
+                if everything or now - draft.changed_at >= self.debounce or now - draft.dirty_since >= self.max_delay:
+                    due.append((session_id, draft.question_index, draft.text, draft.rev))
+                    draft.dirty_since = None
+        return due
+
+    async def flush(self, everything: bool = False) -> int:
+        """Store due drafts in one transaction. Returns the number written."""
+        due = self._take_due(time.monotonic(), everything)
+        if not due:
+            return 0
+        try:
+            await run_async_db(_db_store_drafts, due)
+        except Exception as e:
+            logger.error(f"[DRAFTS] flushing {len(due)} drafts failed: {e}")
+            with self._lock:
+                for session_id, *_ in due:
+                    draft = self._drafts.get(session_id)
+                    if draft is not None and draft.dirty_since is None:
+                        draft.dirty_since = time.monotonic()
+            return 0
+        self.flushes += 1
+        self.rows_written += len(due)
+        return len(due)
+
+    def start(self):
+        """Start the debounce flusher on the running event loop"""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush(everything=True)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.debounce / 2)
+            await self.flush()
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            dirty = sum(1 for d in self._drafts.values() if d.dirty_since is not None)
+            size = len(self._drafts)
+        return {
+            "drafts": size,
+            "unsaved": dirty,
+            "deltas": self.deltas,
+            "avg_delta_chars": round(self.delta_chars / self.deltas, 1) if self.deltas else 0.0,
+            "conflicts": self.conflicts,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written
+        }
+
+def _db_load_draft(db, session_id: str) -> Optional[Tuple[int, str, int]]:
+    row = db.query(AnswerDraft.question_index, AnswerDraft.text, AnswerDraft.rev).filter(
+        AnswerDraft.session_id == session_id
+    ).first()
+    return (row.question_index, row.text or "", row.rev) if row else None
+
+def _db_store_drafts(db, drafts: List[Tuple[str, int, str, int]]):
+    now = datetime.utcnow()
+    rows = {
+        row.session_id: row
+        for row in db.query(AnswerDraft).filter(AnswerDraft.session_id.in_([d[0] for d in drafts])).all()
+    }
+    for session_id, question_index, text, rev in drafts:
+        row = rows.get(session_id)
+        if row is None:
+            db.add(AnswerDraft(session_id=session_id, question_index=question_index, text=text, rev=rev, updated_at=now))
+        else:
+            row.question_index = question_index
+            row.text = text
+            row.rev = rev
+            row.updated_at = now
@@ -0,0 +1,185 @@
+from typing import AsyncIterator, Dict, Iterable, Optional, Set, Tuple
+import asyncio
+import json
+import math
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+ADMIN_TOPIC = "admin"
+
+def session_topic(session_id: str) -> str:
+    return f"session:{session_id}"
+
+def encode_event(event: str, data: Dict) -> str:
+    """One Server-Sent Events frame"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+class Subscription:
+    """One connected client: a bounded queue of encoded frames"""
+
+    __slots__ = ("topic", "queue", "closed")
+
+    def __init__(self, topic: str, queue_size: int):
+        self.topic = topic
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+
+class EventBroadcaster:
+    """
+    In-process pub/sub behind the SSE endpoints.
+
+    Candidates subscribe to `session:<id>` (question transitions, server-side
+    time-remaining ticks, finish); admins subscribe to `admin` (session
+    created, answer submitted, session finished, status updated).
+
+    A published event is encoded once and the same frame is queued for every
+    subscriber of its topic. A subscriber whose queue is full is disconnected
+    instead of slowing the publisher down; the browser reconnects and resyncs.
+    """
+
+    def __init__(self, queue_size: int = 64, tick_seconds: float = 1.0, heartbeat_seconds: float = 15.0):
+        self.queue_size = queue_size
+        self.tick_seconds = tick_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self._topics: Dict[str, Set[Subscription]] = {}
+        self._deadlines: Dict[str, Tuple[int, float]] = {}  # session_id -> (question index, monotonic deadline)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self.published = 0
+        self.delivered = 0
+        self.dropped_subscribers = 0
+
+    def start(self):
+        """Bind to the running event loop and start the tick task"""
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._tick_loop())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for subscribers in list(self._topics.values()):
+            for sub in list(subscribers):
+                self._close(sub)
+
+    def subscribe(self, topic: str) -> Subscription:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        sub = Subscription(topic, self.queue_size)
+        self._topics.setdefault(topic, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        subscribers = self._topics.get(sub.topic)
+        if subscribers is not None:
+            subscribers.discard(sub)
+            if not subscribers:
+                del self._topics[sub.topic]
+
+    def publish(self, topic: str, event: str, data: Dict):
+        """Queue an event for every subscriber of `topic` (safe to call from any thread)"""
+        self.published += 1
+        if self._loop is None or topic not in self._topics:
+            return
+        frame = encode_event(event, data)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._deliver(topic, frame)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._deliver, topic, frame)
+
+    def _deliver(self, topic: str, frame: str):
+        for sub in list(self._topics.get(topic, ())):
+            try:
+                sub.queue.put_nowait(frame)
+                self.delivered += 1
+            except asyncio.QueueFull:
+                logger.warning(f"[SSE] slow subscriber on {topic} disconnected")
+                self.dropped_subscribers += 1
+                self._close(sub)
+
+    def _close(self, sub: Subscription):
+        sub.closed = True
+        self.unsubscribe(sub)
+        try:
+            # Wake the reader so it notices
+            sub.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+    def publish_question(self, session_id: str, question: Dict):
+        """Question transition for the candidate; its deadline drives the ticks"""
+        with self._lock:
+            self._deadlines[session_id] = (question["index"], time.monotonic() + question["time_remaining"])
+        self.publish(session_topic(session_id), "question", question)
+
+    def forget_session(self, session_id: str):
+        with self._lock:
+            self._deadlines.pop(session_id, None)
+
+    def disconnect_session(self, session_id: str):
+        """End the session's streams (clients reconnect after `retry`, e.g. to the session's new worker)"""
+        self.forget_session(session_id)
+        for sub in list(self._topics.get(session_topic(session_id), ())):
+            self._close(sub)
+
+    async def stream(self, topic: str, initial: Iterable[Tuple[str, Dict]] = ()) -> AsyncIterator[str]:
+        """
+        SSE frames for one client: `initial` events first, then everything
+        published to `topic`, with comment heartbeats while idle.
+        """
+        sub = self.subscribe(topic)
+        try:
+            yield "retry: 3000\n\n"
+            for event, data in initial:
+                yield encode_event(event, data)
+            while not sub.closed:
+                try:
+                    frame = await asyncio.wait_for(sub.queue.get(), timeout=self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            self.unsubscribe(sub)
+
+    def _tick(self, now: float):
+        # Only sessions somebody is watching
+        for topic in [t for t in self._topics if t.startswith("session:")]:
+            with self._lock:
+                entry = self._deadlines.get(topic[len("session:"):])
+            if entry:
+                index, deadline = entry
+                remaining = max(0, math.ceil(deadline - now))
+                self._deliver(topic, encode_event("tick", {"index": index, "time_remaining": remaining}))
+
+    async def _tick_loop(self):
+        while True:
+            await asyncio.sleep(self.tick_seconds)
+            try:
+                self._tick(time.monotonic())
+            except Exception as e:
+                logger.error(f"[SSE] tick failed: {e}")
+
+    def metrics(self) -> Dict:
+        return {
+            "topics": len(self._topics),
+            "subscribers": sum(len(s) for s in self._topics.values()),
+            "timed_sessions": len(self._deadlines),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped_subscribers": self.dropped_subscribers
+        }
@@ -0,0 +1,173 @@
+from app.interview_flow.schemas import InterviewSession, SessionStatus, QuestionProgress, Answer
+from app.question_engine.schemas import AdaptiveState
+from app.models import SessionEvent, SessionSnapshot, InterviewAnswer
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func
+import threading
+
+# Event types
+SESSION_CREATED = "SessionCreated"
+QUESTION_STARTED = "QuestionStarted"
+ANSWER_SUBMITTED = "AnswerSubmitted"
+TIMED_OUT = "TimedOut"
+FINISHED = "Finished"
+STATUS_CHANGED = "StatusChanged"
+
+def apply_event(session: Optional[InterviewSession], event_type: str, data: Dict) -> Optional[InterviewSession]:
+    """Fold one event into the session state (pure: `session` is not modified)"""
+    if event_type == SESSION_CREATED:
+        return InterviewSession.model_validate(data)
+    if session is None:
+        # History without its SessionCreated (e.g. a truncated log): nothing to apply to
+        return None
+
+    session = session.model_copy(deep=True)
+    if event_type == QUESTION_STARTED:
+        index = data["index"]
+        if index >= len(session.questions):
+            session.questions.append(data["question"])
+        session.current_question_index = index
+        session.current_question = QuestionProgress.model_validate(data["progress"])
+    elif event_type in (ANSWER_SUBMITTED, TIMED_OUT):
+        session.answers.append(Answer.model_validate(data["answer"]))
+        session.current_question_index = data["seq"] + 1
+        session.current_question = None
+        session.total_questions = data.get("total_questions", session.total_questions)
+        if data.get("adaptive_state") is not None:
+            session.adaptive_state = AdaptiveState.model_validate(data["adaptive_state"])
+    elif event_type == FINISHED:
+        session.status = SessionStatus.FINISHED
+        session.end_time = datetime.fromisoformat(data["end_time"])
+        session.current_question = None
+    elif event_type == STATUS_CHANGED:
+        session.status_internal = data["status_internal"]
+        if data.get("status_public"):
+            session.status_public = data["status_public"]
+    return session
+
+def fold(events: Iterable[Tuple[str, Dict]], session: Optional[InterviewSession] = None) -> Optional[InterviewSession]:
+    """Current state = fold of (type, data) events over an optional snapshot"""
+    for event_type, data in events:
+        session = apply_event(session, event_type, data)
+    return session
+
+# Answer texts are stored once, in interview_answers: events and snapshots refer to them by seq
+ANSWER_TEXT_EXCLUDE = {"answers": {"__all__": {"answer_text"}}}
+
+def attach_answer_texts(db, session: Optional[InterviewSession]) -> Optional[InterviewSession]:
+    """Fill the answer texts of a folded session from its interview_answers rows"""
+    if session is None or not session.answers:
+        return session
+    rows = db.query(InterviewAnswer.seq, InterviewAnswer.answer_text).filter(
+        InterviewAnswer.session_id == session.session_id, InterviewAnswer.seq < len(session.answers)
+    ).all()
+    for row in rows:
+        session.answers[row.seq].answer_text = row.answer_text or ""
+    return session
+
+class SessionEventLog:
+    """
+    Append-only log of interview session events, with periodic snapshots.
+
+    State changes are `record`ed in memory as they happen; the write that
+    persists the change `take`s them and `append`s them in its transaction,
+    so an event costs one INSERT and no extra round trip.
+    Every `snapshot_every` events (and on Finished) the folded state is
+    stored, so hydration reads one snapshot plus the events after it.
+    """
+
+    def __init__(self, snapshot_every: int = 20):
+        self.snapshot_every = max(1, snapshot_every)
+        self._pending: Dict[str, List[Tuple[str, Dict]]] = {}
+        self._lock = threading.Lock()
+        self.appended = 0
+        self.snapshots = 0
+        self.hydrated = 0
+        self.replayed_events = 0
+
+    def record(self, session_id: str, event_type: str, data: Dict):
+        """Queue an event for the next flush of this session"""
+        with self._lock:
+            self._pending.setdefault(session_id, []).append((event_type, data))
+
+    def discard(self, session_id: str):
+        with self._lock:
+            self._pending.pop(session_id, None)
+
+    def take(self, session_id: str) -> List[Tuple[str, Dict]]:
+        """Remove and return the session's recorded, not yet written events"""
+        with self._lock:
+            return self._pending.pop(session_id, [])
+
+    def append(self, db, session_id: str, events: List[Tuple[str, Dict]]) -> int:
+        """Append (type, data) events in the caller's transaction. Returns the count."""
+        if not events:
+            return 0
+
+        last_seq = db.query(func.max(SessionEvent.seq)).filter(SessionEvent.session_id == session_id).scalar()
+        first_seq = 0 if last_seq is None else last_seq + 1
+        now = datetime.utcnow()
+        for offset, (event_type, data) in enumerate(events):
+            db.add(SessionEvent(session_id=session_id, seq=first_seq + offset, type=event_type, data=data, created_at=now))
+        # Visible to the next append of this transaction (batched writes)
+        db.flush()
+        self.appended += len(events)
+
+        last_seq = first_seq + len(events) - 1
+        crossed = (last_seq + 1) // self.snapshot_every > first_seq // self.snapshot_every
+        if crossed or any(event_type == FINISHED for event_type, _ in events):
+            self._snapshot(db, session_id)
+        return len(events)
+
+    def _snapshot(self, db, session_id: str):
+        session, seq = self._fold_from_db(db, session_id)
+        if session is None:
+            return
+        row = db.query(SessionSnapshot).filter(SessionSnapshot.session_id == session_id).first()
+        if row is None:
+            row = SessionSnapshot(session_id=session_id)
+            db.add(row)
+        row.seq = seq
+        row.state = session.model_dump(mode="json", exclude=ANSWER_TEXT_EXCLUDE)
+        row.created_at = datetime.utcnow()
+        self.snapshots += 1
+
+    def hydrate(self, db, session_id: str) -> Optional[InterviewSession]:
+        """Rebuild the session: latest snapshot + events since, with the stored answer texts"""
+        session, _ = self._fold_from_db(db, session_id)
+        self.hydrated += 1
+        return attach_answer_texts(db, session)
+
+    def _fold_from_db(self, db, session_id: str) -> Tuple[Optional[InterviewSession], int]:
+        snapshot = db.query(SessionSnapshot).filter(SessionSnapshot.session_id == session_id).first()
+        session = InterviewSession.model_validate(snapshot.state) if snapshot else None
+        seq = snapshot.seq if snapshot else -1
+        rows = db.query(SessionEvent.seq, SessionEvent.type, SessionEvent.data).filter(
+            SessionEvent.session_id == session_id, SessionEvent.seq > seq
+        ).order_by(SessionEvent.seq).all()
+        self.replayed_events += len(rows)
+        session = fold(((row.type, row.data) for row in rows), session)
+        return session, rows[-1].seq if rows else seq
+
+    def events(self, db, session_id: str, until_seq: Optional[int] = None) -> List[Dict]:
+        """Full history of a session (oldest first), optionally up to `until_seq`"""
+        query = db.query(SessionEvent).filter(SessionEvent.session_id == session_id)
+        if until_seq is not None:
+            query = query.filter(SessionEvent.seq <= until_seq)
+        return [
+            {"seq": row.seq, "type": row.type, "data": row.data, "created_at": row.created_at}
+            for row in query.order_by(SessionEvent.seq).all()
+        ]
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            pending = sum(len(events) for events in self._pending.values())
+        return {
+            "snapshot_every": self.snapshot_every,
+            "appended": self.appended,
+            "pending": pending,
+            "snapshots": self.snapshots,
+            "hydrated": self.hydrated,
+            "replayed_events": self.replayed_events
+        }
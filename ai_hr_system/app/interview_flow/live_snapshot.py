@@ -0,0 +1,66 @@
+from app.interview_flow.schemas import InterviewSession
+from typing import Iterable, List, Tuple
+import os
+import struct
+import time
+import zlib
+import pydantic_core
+
+# File: header, then one zlib stream of records (header + session JSON)
+MAGIC = b"HRLS"
+VERSION = 1
+HEADER = struct.Struct("<4sBdI")  # magic, version, saved at (unix seconds), session count
+RECORD = struct.Struct("<qI")  # ns spent on the current question (-1: none), session JSON length
+
+class SnapshotFormatError(ValueError):
+    """Not a live-state snapshot, or one written by an unsupported version"""
+
+def write_snapshot(path: str, entries: Iterable[Tuple[InterviewSession, int]]) -> int:
+    """
+    Write (session, ns spent on its current question) pairs to `path`.
+    The file is replaced atomically. Returns its size in bytes.
+    """
+    body = bytearray()
+    count = 0
+    for session, elapsed_ns in entries:
+        payload = pydantic_core.to_json(session)
+        body += RECORD.pack(elapsed_ns, len(payload))
+        body += payload
+        count += 1
+
+    data = HEADER.pack(MAGIC, VERSION, time.time(), count) + zlib.compress(bytes(body))
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(data)
+
+def read_snapshot(path: str) -> Tuple[float, List[Tuple[InterviewSession, int]]]:
+    """(saved at, [(session, ns spent on its current question)]) of a snapshot file"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise SnapshotFormatError(f"{path} is not a live-state snapshot")
+    magic, version, saved_at, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotFormatError(f"{path} is not a live-state snapshot")
+    if version != VERSION:
+        raise SnapshotFormatError(f"Unsupported live-state snapshot version {version}")
+    try:
+        body = zlib.decompress(data[HEADER.size:])
+    except zlib.error as e:
+        raise SnapshotFormatError(f"Corrupt live-state snapshot: {e}")
+
+    entries = []
+    offset = 0
+    for _ in range(count):
+        elapsed_ns, length = RECORD.unpack_from(body, offset)
+        offset += RECORD.size
+        entries.append((InterviewSession.model_validate_json(body[offset:offset + length]), elapsed_ns))
+        offset += length
+    return saved_at, entries
@@ -0,0 +1,85 @@
+from app.interview_flow.schemas import InterviewSession
+from collections import OrderedDict
+from fastapi.responses import JSONResponse, Response
+from typing import Dict, Tuple
+import threading
+import pydantic_core
+
+try:
+    import orjson
+except ImportError:  # optional: FastJSONResponse falls back to the json module
+    orjson = None
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by orjson when it is installed. Same output as
+    fastapi's ORJSONResponse, which newer FastAPI releases deprecate.
+    """
+
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+# Session fields serialized on every request (the question list is cached)
+SESSION_EXCLUDE = {"questions"}
+
+class SessionPayloadCache:
+    """
+    JSON responses of interview sessions without re-serializing their questions.
+
+    A session's question list is fixed when it starts (adaptive sessions only
+    append to it), yet it is most of the session payload. Its JSON is
+    rendered once per session (and length) and spliced into each response;
+    the rest of the session is dumped straight to JSON bytes by pydantic,
+    without the dict round trip and re-validation of `response_model`.
+    """
+
+    def __init__(self, max_sessions: int = 4096):
+        self.max_sessions = max_sessions
+        self._entries: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_reused = 0
+
+    def questions_json(self, session: InterviewSession) -> bytes:
+        count = len(session.questions)
+        with self._lock:
+            entry = self._entries.get(session.session_id)
+            if entry is not None and entry[0] == count:
+                self._entries.move_to_end(session.session_id)
+                self.hits += 1
+                self.bytes_reused += len(entry[1])
+                return entry[1]
+            self.misses += 1
+        payload = pydantic_core.to_json(session.questions)
+        with self._lock:
+            self._entries[session.session_id] = (count, payload)
+            self._entries.move_to_end(session.session_id)
+            while len(self._entries) > self.max_sessions:
+                self._entries.popitem(last=False)
+        return payload
+
+    def render(self, session: InterviewSession) -> bytes:
+        """Session JSON (same fields as the InterviewSession response model)"""
+        rest = pydantic_core.to_json(session, exclude=SESSION_EXCLUDE)
+        return b'{"questions":' + self.questions_json(session) + b"," + rest[1:]
+
+    def response(self, session: InterviewSession) -> Response:
+        return Response(content=self.render(session), media_type="application/json")
+
+    def forget(self, session_id: str):
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            return {
+                "sessions": len(self._entries),
+                "max_sessions": self.max_sessions,
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes_reused": self.bytes_reused,
+                "json_backend": "orjson" if orjson is not None else "json"
+            }
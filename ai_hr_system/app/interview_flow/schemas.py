@@ -2,6 +2,7 @@ from typing import List, Optional, Dict
 from pydantic import BaseModel
 from datetime import datetime
 from enum import Enum
+from app.question_engine.schemas import AdaptiveState
 
 class SessionStatus(str, Enum):
     """Interview session status"""
@@ -12,12 +13,12 @@ class SessionStatus(str, Enum):
 class Answer(BaseModel):
     """Candidate answer to a question"""
     question_id: int
-    answer_text: str
+    answer_text: str = ""  # the event log and snapshots leave it to the interview_answers row
     time_spent: int  # seconds
     submitted_at: datetime
     is_timeout: bool = False
     
-    # AI Detection Results
+    # AI Detection Results (None while background detection is pending)
     ai_score: Optional[float] = 0.0
     ai_explanation: Optional[str] = ""
 
@@ -29,7 +30,8 @@ class QuestionProgress(BaseModel):
     difficulty: str
     time_limit: int  # seconds
     time_remaining: Optional[int] = None
-    started_at: datetime
+    started_at: datetime  # wall clock, display only
+    timer: Optional[Dict] = None  # Timer.to_state(): monotonic start
 
 class InterviewSession(BaseModel):
     """Complete interview session"""
@@ -50,6 +52,13 @@ class InterviewSession(BaseModel):
     # Hidden logic: internal HR state vs what candidate sees
     status_internal: str = "PENDING" 
     status_public: str = "UNDER_REVIEW"
+    # Adaptive (CAT) interviews grow `questions` one at a time
+    mode: str = "fixed"
+    adaptive_state: Optional[AdaptiveState] = None
+    # Lets the candidate continue after a reload/disconnect (GET /resume/{token})
+    resume_token: Optional[str] = None
+    # Revision of the live store record this copy was loaded at (compare-and-set on save)
+    revision: int = 0
 
 class SessionSummary(BaseModel):
     """Summary of completed interview session"""
@@ -60,3 +69,17 @@ class SessionSummary(BaseModel):
     total_time_spent: int  # seconds
     status: SessionStatus
     answers: List[Answer]
+
+class DraftDelta(BaseModel):
+    """Autosave edit of the current answer: replace `delete` characters at `offset` with `text`"""
+    question_index: int
+    rev: int  # draft revision the edit is based on
+    offset: int
+    delete: int = 0
+    text: str = ""
+
+class DraftState(BaseModel):
+    """Autosaved, unsubmitted answer of the current question"""
+    question_index: int
+    text: str
+    rev: int
@@ -0,0 +1,70 @@
+from app.interview_flow.schemas import InterviewSession
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import threading
+import time
+
+class SessionCache:
+    """
+    Size- and age-bounded LRU cache for hydrated (read-only) sessions.
+
+    Entries expire `ttl_seconds` after they were stored; when the cache is
+    full the least recently used entry is evicted.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: int = 900):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, InterviewSession]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, session_id: str) -> Optional[InterviewSession]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, session = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[session_id]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return session
+
+    def peek(self, session_id: str) -> Optional[InterviewSession]:
+        """Entry without touching LRU order or hit/miss counters"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            return entry[1] if entry else None
+
+    def put(self, session_id: str, session: InterviewSession):
+        with self._lock:
+            self._entries[session_id] = (time.monotonic(), session)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, session_id: str):
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def metrics(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
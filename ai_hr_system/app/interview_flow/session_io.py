@@ -0,0 +1,165 @@
+from app.interview_flow.schemas import InterviewSession
+from app.interview_flow.session_store import SessionStore
+from app.interview_flow.event_log import SessionEventLog
+from app.interview_flow.write_behind import WriteBehindWriter
+from app.database import run_sync_db, run_async_db
+from abc import ABC, abstractmethod
+from typing import Callable, Coroutine, Dict, List, Optional, TypeVar
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class SessionIO(ABC):
+    """
+    Persistence wiring of a SessionManager: the live session store, the
+    database (directly or through the write-behind writer) and the event log.
+
+    The manager's interview flows are written once, as coroutines doing all
+    their I/O through a SessionIO. AsyncSessionIO keeps that I/O off the
+    event loop; BlockingSessionIO does it in the calling thread, so a flow
+    using it never suspends and `run_blocking` completes it synchronously.
+    """
+
+    def __init__(
+        self,
+        store: SessionStore,
+        apply_write: Callable[[object, str, Dict], object],
+        event_log: Optional[SessionEventLog] = None,
+        write_behind: Optional[WriteBehindWriter] = None
+    ):
+        self.store = store
+        # Applies one write in a transaction (SessionManager.apply_write)
+        self.apply_write = apply_write
+        self.event_log = event_log
+        self.write_behind = write_behind
+
+    # --- Event log (buffered in memory until the session's next write) ---
+
+    def record_event(self, session_id: str, event_type: str, data: Dict):
+        """Queue a history event; the next write of the session carries it"""
+        if self.event_log is not None:
+            self.event_log.record(session_id, event_type, data)
+
+    def take_events(self, session_id: str) -> List:
+        return self.event_log.take(session_id) if self.event_log is not None else []
+
+    def append_events(self, db, payload: Dict):
+        """Append the history events carried by a write, in its transaction"""
+        if self.event_log is not None and payload.get("events"):
+            self.event_log.append(db, payload["session_id"], payload["events"])
+
+    # --- Live store ---
+
+    @abstractmethod
+    async def load(self, session_id: str) -> Optional[InterviewSession]:
+        ...
+
+    @abstractmethod
+    async def save(self, session: InterviewSession):
+        ...
+
+    @abstractmethod
+    async def delete(self, session_id: str, revision: Optional[int] = None):
+        ...
+
+    # --- Database ---
+
+    async def run_db(self, action: Optional[str], fn, *args):
+        """
+        Run fn(db, *args) in a transaction.
+        Errors are logged and swallowed when `action` is given, re-raised otherwise.
+        """
+        try:
+            return await self._run(fn, *args)
+        except Exception as e:
+            if action is None:
+                raise
+            logger.error(f"DB Error while {action}: {e}")
+
+    async def write(self, action: str, op: str, payload: Dict):
+        """
+        Persist one write: journaled and batched by the write-behind writer,
+        else in its own transaction. Errors are logged and swallowed.
+        """
+        if self.write_behind is None:
+            await self.run_db(action, self.apply_write, op, payload)
+            return
+        try:
+            await self._journal(payload["session_id"], op, payload)
+        except Exception as e:
+            logger.error(f"DB Error while {action}: {e}")
+
+    async def wait_for_writes(self, session_id: str):
+        """Before reading a session from the database: commit its write-behind writes"""
+        if self.write_behind is not None and self.write_behind.pending(session_id):
+            await self._wait(session_id)
+
+    @abstractmethod
+    async def _run(self, fn, *args):
+        ...
+
+    @abstractmethod
+    async def _journal(self, session_id: str, op: str, payload: Dict):
+        ...
+
+    @abstractmethod
+    async def _wait(self, session_id: str):
+        ...
+
+class BlockingSessionIO(SessionIO):
+    """I/O in the calling thread: sync entry points, worker threads, startup and shutdown"""
+
+    async def load(self, session_id: str) -> Optional[InterviewSession]:
+        return self.store.load(session_id)
+
+    async def save(self, session: InterviewSession):
+        self.store.save(session)
+
+    async def delete(self, session_id: str, revision: Optional[int] = None):
+        self.store.delete(session_id, revision=revision)
+
+    async def _run(self, fn, *args):
+        return run_sync_db(fn, *args)
+
+    async def _journal(self, session_id: str, op: str, payload: Dict):
+        self.write_behind.submit(session_id, op, payload)
+
+    async def _wait(self, session_id: str):
+        self.write_behind.wait_for(session_id)
+
+class AsyncSessionIO(SessionIO):
+    """I/O without blocking the event loop: store *_async calls, async engine (or a worker thread), journal fsync in a thread"""
+
+    async def load(self, session_id: str) -> Optional[InterviewSession]:
+        return await self.store.load_async(session_id)
+
+    async def save(self, session: InterviewSession):
+        await self.store.save_async(session)
+
+    async def delete(self, session_id: str, revision: Optional[int] = None):
+        await self.store.delete_async(session_id, revision=revision)
+
+    async def _run(self, fn, *args):
+        return await run_async_db(fn, *args)
+
+    async def _journal(self, session_id: str, op: str, payload: Dict):
+        await self.write_behind.submit_async(session_id, op, payload)
+
+    async def _wait(self, session_id: str):
+        await asyncio.to_thread(self.write_behind.wait_for, session_id)
+
+def run_blocking(flow: Coroutine[object, object, T]) -> T:
+    """
+    Result of a flow doing its I/O through a BlockingSessionIO.
+    Such a coroutine never suspends, so it completes in one step without an
+    event loop (also when called from code running on one).
+    """
+    try:
+        flow.send(None)
+    except StopIteration as done:
+        return done.value
+    flow.close()
+    raise RuntimeError("Flow suspended: run_blocking needs a BlockingSessionIO")
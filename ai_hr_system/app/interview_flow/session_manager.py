@@ -3,38 +3,108 @@ from app.interview_flow.schemas import (
     SessionStatus,
     QuestionProgress,
     Answer,
-    SessionSummary
+    SessionSummary,
+    DraftState
 )
 from app.interview_flow.timer import Timer
 from app.interview_flow.answer_handler import AnswerHandler
-from app.question_engine.schemas import QuestionSet
+from app.interview_flow.session_store import SessionStore, InMemorySessionStore, StaleSessionError
+from app.interview_flow.session_io import SessionIO, BlockingSessionIO, AsyncSessionIO, run_blocking
+from app.interview_flow.session_cache import SessionCache
+from app.interview_flow.timeout_scheduler import QuestionTimeoutScheduler
+from app.interview_flow.event_broadcaster import EventBroadcaster, ADMIN_TOPIC, session_topic
+from app.interview_flow.write_behind import WriteBehindWriter
+from app.interview_flow.draft_buffer import DraftBuffer
+from app.interview_flow.live_snapshot import write_snapshot, read_snapshot
+from app.interview_flow.event_log import (
+    SessionEventLog,
+    SESSION_CREATED,
+    QUESTION_STARTED,
+    ANSWER_SUBMITTED,
+    TIMED_OUT,
+    FINISHED,
+    STATUS_CHANGED
+)
+from app.question_engine.schemas import QuestionSet, AdaptiveState
+from app.candidate_level.schemas import LevelDetectionResult
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
+import os
+import secrets
+import time
 import uuid
-import json
+import logging
+from sqlalchemy import func, null
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 from app.notifications.dispatcher import NotificationDispatcher
 from app.notifications.logger import NotificationLogger
-from app.database import SessionLocal
-from sqlalchemy.orm.attributes import flag_modified
-from app.models import Candidate, SessionModel
+from app.models import Candidate, SessionModel, InterviewAnswer, SessionRecommendation, SessionResume, AnswerDraft
 from app.answer_analysis.ai_detector import AIDetector
+from app.answer_analysis.detection_queue import AIDetectionQueue
+from app.answer_analysis.final_analyzer import FinalAnalyzer
+from app.answer_analysis.schemas import AnswerIntegrityReport, TypingFeatures, TelemetryBatch
+from app.answer_analysis.telemetry import TelemetryRecorder, MAX_BATCH_EVENTS, INGEST_ATTEMPTS
 from app.interview_flow.schemas import SessionStatus as SessionStatusEnum
 
+logger = logging.getLogger(__name__)
+
 class SessionManager:
     """
     Manages interview sessions from start to finish.
     Orchestrates question flow, timing, and answer collection.
+
+    Flows that touch the store or the database are coroutines taking a
+    SessionIO: the sync entry points run them with `self.io` (run_blocking),
+    the *_async ones await them with `self.aio`.
     """
     
-    def __init__(self):
-        # Store active sessions in memory
-        # In production, this would be a database
-        self.sessions: Dict[str, InterviewSession] = {}
-        self.timers: Dict[str, Timer] = {}
+    def __init__(
+        self,
+        adaptive_tester=None,
+        session_store: Optional[SessionStore] = None,
+        session_cache: Optional[SessionCache] = None,
+        timeout_scheduler: Optional[QuestionTimeoutScheduler] = None,
+        broadcaster: Optional[EventBroadcaster] = None,
+        ai_queue: Optional[AIDetectionQueue] = None,
+        event_log: Optional[SessionEventLog] = None,
+        write_behind: Optional[WriteBehindWriter] = None,
+        drafts: Optional[DraftBuffer] = None,
+        telemetry: Optional[TelemetryRecorder] = None
+    ):
+        # Live sessions (progress + current question start) go through the store,
+        # so any worker can serve any request. Use a shared backend with several workers.
+        self.store: SessionStore = session_store or InMemorySessionStore()
+        # Finished/hydrated historical sessions (admin/reporting): bounded LRU with TTL
+        self.sessions: SessionCache = session_cache if session_cache is not None else SessionCache()
         self.answer_handlers: Dict[str, AnswerHandler] = {}
         self.notification_dispatcher = NotificationDispatcher()
         self.audit_logger = NotificationLogger()
         self.ai_detector = AIDetector()
+        # Optional AdaptiveTester for CAT-mode interviews
+        self.adaptive_tester = adaptive_tester
+        # Optional server-side deadlines: abandoned questions time out without a client
+        self.timeout_scheduler = timeout_scheduler
+        # Optional push channel (SSE) for candidates and the admin panel
+        self.broadcaster = broadcaster
+        # Optional background AI detection: submit then only stores the answer
+        self.ai_queue = ai_queue
+        if ai_queue is not None and ai_queue.on_result is None:
+            ai_queue.on_result = self._save_analysis
+        # Per-answer integrity reports are computed once, when the answer arrives
+        self.integrity_analyzer = ai_queue.analyzer if ai_queue is not None else FinalAnalyzer()
+        # Optional append-only session history; live sessions lost with a worker are rebuilt from it
+        self.event_log = event_log
+        # Optional write-behind persistence: writes are journaled and committed in batches
+        # (the owner calls write_behind.start(manager.apply_write))
+        self.write_behind = write_behind
+        # Optional answer draft autosave (deltas in memory, debounced writes to answer_drafts)
+        self.drafts = drafts
+        # Optional typing/paste/focus telemetry; its features refine the timing analysis
+        self.telemetry = telemetry
+        # Store, database, write-behind and event-log access of the flows
+        self.io: SessionIO = BlockingSessionIO(self.store, self.apply_write, event_log, write_behind)
+        self.aio: SessionIO = AsyncSessionIO(self.store, self.apply_write, event_log, write_behind)
     
     def create_session(
         self,
@@ -44,7 +114,9 @@ class SessionManager:
         candidate_email: str,
         question_set: QuestionSet,
         candidate_lang: str = "en",
-        cv_path: str = ""
+        cv_path: str = "",
+        adaptive_state: Optional[AdaptiveState] = None,
+        session_id: Optional[str] = None
     ) -> InterviewSession:
         """
         Create a new interview session.
@@ -54,15 +126,39 @@ class SessionManager:
             candidate_name: Candidate name
             question_set: Set of questions from question engine
             candidate_lang: Preferred language
+            adaptive_state: CAT state; questions are then added one at a time
+            session_id: ID chosen by the caller (the session router), else a new UUID
         
         Returns:
             InterviewSession object
         """
-        session_id = str(uuid.uuid4())
+        return run_blocking(self._create_session(
+            self.io, candidate_id, candidate_name, candidate_phone, candidate_email,
+            question_set, candidate_lang, cv_path, adaptive_state, session_id
+        ))
+
+    async def create_session_async(self, *args, **kwargs) -> InterviewSession:
+        """Same as create_session, without blocking the event loop on the database"""
+        return await self._create_session(self.aio, *args, **kwargs)
+
+    async def _create_session(
+        self,
+        io: SessionIO,
+        candidate_id: str,
+        candidate_name: str,
+        candidate_phone: str,
+        candidate_email: str,
+        question_set: QuestionSet,
+        candidate_lang: str = "en",
+        cv_path: str = "",
+        adaptive_state: Optional[AdaptiveState] = None,
+        session_id: Optional[str] = None
+    ) -> InterviewSession:
+        session_id = session_id or str(uuid.uuid4())
+        self._purge_expired()
         
-        # Convert questions to dict format
-        # Prepare questions for JSON storage (serialize datetimes)
-        questions_dicts = [json.loads(q.json()) for q in question_set.questions]
+        # JSON-safe question dicts for storage (one dump, no string round trip)
+        questions_dicts = [q.model_dump(mode="json") for q in question_set.questions]
         
         # Create session Pydantic object
         session = InterviewSession(
@@ -80,66 +176,198 @@ class SessionManager:
             current_question_index=0,
             questions=questions_dicts,
             answers=[],
-            current_question=None
+            current_question=None,
+            mode="adaptive" if adaptive_state else "fixed",
+            adaptive_state=adaptive_state,
+            resume_token=secrets.token_urlsafe(24)
         )
-        
-        # Database Persistence
-        db = SessionLocal()
-        try:
-            # 1. Find or create candidate
-            db_candidate = db.query(Candidate).filter(Candidate.email == candidate_email).first()
-            if not db_candidate:
-                db_candidate = Candidate(
-                    name=candidate_name,
-                    email=candidate_email,
-                    phone=candidate_phone,
-                    cv_path=cv_path,
-                    language=candidate_lang
-                )
-                db.add(db_candidate)
-            else:
-                # Update existing candidate details
-                db_candidate.name = candidate_name
-                db_candidate.phone = candidate_phone
-                db_candidate.cv_path = cv_path
-                db_candidate.language = candidate_lang
-            
-            db.flush() # Get ID / Commit updates
-            
-            # 2. Create DB Session
-            db_session = SessionModel(
-                id=session_id,
-                candidate_id=db_candidate.id,
-                # SNAPSHOT: Save candidate details at this moment
-                candidate_name=candidate_name,
-                candidate_phone=candidate_phone,
-                candidate_email=candidate_email,
-                candidate_lang=candidate_lang,  # Save language used in this session
-                
-                status=SessionStatus.ACTIVE.value,
-                status_internal="PENDING",
-                status_public="UNDER_REVIEW",
-                total_questions=len(questions_dicts),
-                current_question_index=0,
-                questions=questions_dicts,
-                answers=[]
+        io.record_event(session_id, SESSION_CREATED, session.model_dump(mode="json"))
+        self._start_next_question(io, session)
+        await io.write("creating session", "create_session", self._create_payload(io, session, cv_path))
+
+        # Publish the live session (its first question is already started)
+        self.answer_handlers[session.session_id] = AnswerHandler()
+        await io.save(session)
+        if self.broadcaster:
+            self.broadcaster.publish(ADMIN_TOPIC, "session_created", {
+                "session_id": session.session_id,
+                "candidate_name": session.candidate_name,
+                "candidate_email": session.candidate_email,
+                "candidate_phone": session.candidate_phone,
+                "candidate_lang": session.candidate_lang,
+                "status_public": session.status_public,
+                "status_internal": session.status_internal,
+                "score": None,
+                "decision": None,
+                "cv_path": cv_path,
+                "questions": session.questions,
+                "answers": [],
+                "hr_comment": "",
+                "flags": [],
+                "start_time": session.start_time.isoformat()
+            })
+        return session
+
+    def _create_payload(self, io: SessionIO, session: InterviewSession, cv_path: str) -> Dict:
+        return {
+            "session_id": session.session_id,
+            "candidate_name": session.candidate_name,
+            "candidate_email": session.candidate_email,
+            "candidate_phone": session.candidate_phone,
+            "candidate_lang": session.candidate_lang,
+            "total_questions": session.total_questions,
+            "questions": list(session.questions),
+            "cv_path": cv_path,
+            "resume_token": session.resume_token,
+            "question": self._question_state(session),
+            "events": io.take_events(session.session_id)
+        }
+
+    @staticmethod
+    def _question_state(session: InterviewSession) -> Optional[Dict]:
+        """Start of the current question and the CAT state, as stored for resuming (None once finished)"""
+        question = session.current_question
+        if question is None:
+            return None
+        return {
+            "index": session.current_question_index,
+            "started_at": question.started_at.isoformat(),
+            "timer": question.timer,
+            "adaptive_state": session.adaptive_state.model_dump(mode="json") if session.adaptive_state else None
+        }
+
+    @staticmethod
+    def _apply_question_state(resume: SessionResume, state: Dict):
+        resume.question_index = state["index"]
+        resume.question_started_at = datetime.fromisoformat(state["started_at"])
+        resume.timer = state["timer"]
+        resume.adaptive_state = state.get("adaptive_state")
+
+    def _db_create_session(self, db, payload: Dict):
+        """Find or create the candidate and insert the session row"""
+        candidate_name = payload["candidate_name"]
+        candidate_email = payload["candidate_email"]
+        candidate_phone = payload["candidate_phone"]
+        candidate_lang = payload["candidate_lang"]
+        cv_path = payload["cv_path"]
+        # 1. Find or create candidate
+        db_candidate = db.query(Candidate).filter(Candidate.email == candidate_email).first()
+        if not db_candidate:
+            db_candidate = Candidate(
+                name=candidate_name,
+                email=candidate_email,
+                phone=candidate_phone,
+                cv_path=cv_path,
+                language=candidate_lang
             )
-            db.add(db_session)
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            print(f"DB Error while creating session: {e}")
-        finally:
-            db.close()
-
-        # Store session in memory for active tracking (optional, but keep for compatibility)
-        self.sessions[session_id] = session
-        self.answer_handlers[session_id] = AnswerHandler()
+            db.add(db_candidate)
+        else:
+            # Update existing candidate details
+            db_candidate.name = candidate_name
+            db_candidate.phone = candidate_phone
+            db_candidate.cv_path = cv_path
+            db_candidate.language = candidate_lang
         
-        # Start first question
-        self._start_next_question(session_id)
+        db.flush() # Get ID / Commit updates
         
-        return session
+        # 2. Create DB Session
+        db_session = SessionModel(
+            id=payload["session_id"],
+            candidate_id=db_candidate.id,
+            # SNAPSHOT: Save candidate details at this moment
+            candidate_name=candidate_name,
+            candidate_phone=candidate_phone,
+            candidate_email=candidate_email,
+            candidate_lang=candidate_lang,  # Save language used in this session
+            
+            status=SessionStatus.ACTIVE.value,
+            status_internal="PENDING",
+            status_public="UNDER_REVIEW",
+            total_questions=payload["total_questions"],
+            current_question_index=0,
+            questions=payload["questions"],
+            answers=[]
+        )
+        db.add(db_session)
+        if payload.get("resume_token"):
+            resume = SessionResume(token=payload["resume_token"], session_id=payload["session_id"])
+            if payload.get("question"):
+                self._apply_question_state(resume, payload["question"])
+            db.add(resume)
+        self.io.append_events(db, payload)
+
+    def create_adaptive_session(
+        self,
+        candidate_id: str,
+        candidate_name: str,
+        candidate_phone: str,
+        candidate_email: str,
+        level_result: LevelDetectionResult,
+        max_technical_questions: int = 5,
+        candidate_lang: str = "en",
+        cv_path: str = "",
+        session_id: Optional[str] = None
+    ) -> InterviewSession:
+        """
+        Create an adaptive interview session.
+        Only the first question is chosen up front; the rest follow the scored answers.
+        """
+        return run_blocking(self._create_adaptive_session(
+            self.io, candidate_id, candidate_name, candidate_phone, candidate_email,
+            level_result, max_technical_questions, candidate_lang, cv_path, session_id
+        ))
+
+    async def create_adaptive_session_async(self, *args, **kwargs) -> InterviewSession:
+        """Same as create_adaptive_session, without blocking the event loop on the database"""
+        return await self._create_adaptive_session(self.aio, *args, **kwargs)
+
+    async def _create_adaptive_session(
+        self,
+        io: SessionIO,
+        candidate_id: str,
+        candidate_name: str,
+        candidate_phone: str,
+        candidate_email: str,
+        level_result: LevelDetectionResult,
+        max_technical_questions: int = 5,
+        candidate_lang: str = "en",
+        cv_path: str = "",
+        session_id: Optional[str] = None
+    ) -> InterviewSession:
+        state, question_set = self._start_adaptive(level_result, max_technical_questions, candidate_lang)
+        return await self._create_session(
+            io,
+            candidate_id=candidate_id,
+            candidate_name=candidate_name,
+            candidate_phone=candidate_phone,
+            candidate_email=candidate_email,
+            question_set=question_set,
+            candidate_lang=candidate_lang,
+            cv_path=cv_path,
+            adaptive_state=state,
+            session_id=session_id
+        )
+
+    def _start_adaptive(self, level_result: LevelDetectionResult, max_technical_questions: int, candidate_lang: str):
+        """CAT state and a one-question QuestionSet for a new adaptive session"""
+        if not self.adaptive_tester:
+            raise ValueError("Adaptive mode is not configured")
+
+        state, first_question = self.adaptive_tester.start(
+            level_result,
+            max_technical_questions=max_technical_questions,
+            lang=candidate_lang
+        )
+        if not first_question:
+            raise ValueError("No questions available for adaptive interview")
+
+        question_set = QuestionSet(
+            candidate_name=level_result.candidate_name,
+            candidate_level=str(level_result.level.value),
+            questions=[first_question],
+            total_questions=1
+        )
+        return state, question_set
     
     def get_current_question(self, session_id: str) -> Optional[QuestionProgress]:
         """
@@ -151,7 +379,14 @@ class SessionManager:
         Returns:
             QuestionProgress or None
         """
-        session = self.sessions.get(session_id)
+        return run_blocking(self._current_question(self.io, session_id))
+
+    async def get_current_question_async(self, session_id: str) -> Optional[QuestionProgress]:
+        """Same as get_current_question, without blocking the event loop on recovery from the database"""
+        return await self._current_question(self.aio, session_id)
+
+    async def _current_question(self, io: SessionIO, session_id: str) -> Optional[QuestionProgress]:
+        session = await self._load_live(io, session_id)
         if not session:
             # Only active sessions have a current question. For historical sessions, return None.
             return None
@@ -160,8 +395,8 @@ class SessionManager:
             return None
         
         # Update time remaining
-        if session.current_question and session_id in self.timers:
-            timer = self.timers[session_id]
+        if session.current_question:
+            timer = self._timer_for(session)
             session.current_question.time_remaining = timer.get_time_remaining()
         
         return session.current_question
@@ -169,7 +404,8 @@ class SessionManager:
     def submit_answer(
         self,
         session_id: str,
-        answer_text: str
+        answer_text: str,
+        question_index: Optional[int] = None
     ) -> Answer:
         """
         Submit answer for current question and move to next.
@@ -177,11 +413,39 @@ class SessionManager:
         Args:
             session_id: Session ID
             answer_text: Candidate's answer
+            question_index: Question the answer was written for (rejected if it is no longer current)
         
         Returns:
             Answer object
         """
-        session = self.sessions.get(session_id)
+        return run_blocking(self._submit_answer(self.io, session_id, answer_text, question_index))
+
+    async def submit_answer_async(self, session_id: str, answer_text: str, question_index: Optional[int] = None) -> Answer:
+        """Same as submit_answer, without blocking the event loop on the database"""
+        return await self._submit_answer(self.aio, session_id, answer_text, question_index)
+
+    async def _submit_answer(self, io: SessionIO, session_id: str, answer_text: str, question_index: Optional[int]) -> Answer:
+        session, answer = self._record_answer(
+            session_id, answer_text, await self._load_live(io, session_id), question_index
+        )
+        typing_features = await self._typing_features(io, session_id, len(session.answers) - 1)
+        report = self._inline_integrity_report(session, answer, typing_features)
+        finished = await self._advance(io, session, ANSWER_SUBMITTED)
+        await io.write("submitting answer", "insert_answer", self._answer_payload(io, session, answer, report))
+        self._enqueue_analysis(session, answer, typing_features)
+        if finished:
+            await io.write("finishing session", "finish_session", self._finish_payload(io, session))
+        return answer
+
+    def _record_answer(
+        self,
+        session_id: str,
+        answer_text: str,
+        live: Optional[InterviewSession] = None,
+        question_index: Optional[int] = None
+    ):
+        """Validate the live session and build the Answer for its current question"""
+        session = live or self.sessions.get(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
         
@@ -190,62 +454,261 @@ class SessionManager:
         
         if not session.current_question:
             raise ValueError("No active question")
+
+        if len(session.answers) > session.current_question_index:
+            raise ValueError("Question already answered")
+
+        if question_index is not None and question_index != session.current_question_index:
+            raise ValueError(f"Question {question_index} is not the current question")
         
-        # Stop timer
-        timer = self.timers.get(session_id)
-        if not timer:
-            raise ValueError("Timer not found")
+        # Stop timer (rebuilt from the stored question start)
+        timer = self._timer_for(session)
         
         time_spent = timer.stop()
         is_timeout = timer.is_timeout()
         
         # Submit answer
-        # 3. Analyze for AI / Cheating
-        ai_result = self.ai_detector.analyze(text=answer_text, time_spent=time_spent)
-        
         answer = Answer(
             question_id=session.current_question.question_id,
             answer_text=answer_text,
             time_spent=time_spent,
             submitted_at=datetime.now(),
             is_timeout=is_timeout,
-            ai_score=ai_result.score,
-            ai_explanation=", ".join(ai_result.flags)
+            ai_score=None,
+            ai_explanation=None
         )
+        if self.ai_queue is None:
+            # 3. Analyze for AI / Cheating (inline without a background queue)
+            ai_result = self.ai_detector.analyze(text=answer_text, time_spent=time_spent)
+            answer.ai_score = ai_result.score
+            answer.ai_explanation = ", ".join(ai_result.flags)
         
         # Add to session
         session.answers.append(answer)
-        
-        # Database Persistence
-        db = SessionLocal()
+
+        # Adaptive mode: score this answer and materialize the next question
+        if session.adaptive_state and self.adaptive_tester:
+            self._advance_adaptive(session, answer)
+        return session, answer
+
+    async def expire_question_async(self, session_id: str, question_index: int) -> bool:
+        """
+        Deadline callback of the timeout scheduler.
+        Records an empty timeout answer and advances or finishes the session.
+
+        Returns:
+            True if the question was expired, False if it had already moved on
+        """
+        io = self.aio
+        session = await io.load(session_id)
+        if (
+            not session
+            or session.status != SessionStatus.ACTIVE
+            or not session.current_question
+            or session.current_question_index != question_index
+            or len(session.answers) > question_index
+        ):
+            return False
+
+        timer = self._timer_for(session)
+        if not timer.is_timeout():
+            # Question was restarted elsewhere (e.g. on another worker): wait for the new deadline
+            if self.timeout_scheduler:
+                self.timeout_scheduler.schedule(session_id, question_index, timer.get_time_remaining())
+            return False
+
+        answer = Answer(
+            question_id=session.current_question.question_id,
+            answer_text="",
+            time_spent=timer.time_limit,
+            submitted_at=datetime.now(),
+            is_timeout=True,
+            ai_score=0.0,
+            ai_explanation="no answer before deadline"
+        )
+        session.answers.append(answer)
+        if session.adaptive_state and self.adaptive_tester:
+            self._advance_adaptive(session, answer)
+
+        typing_features = await self._typing_features(io, session_id, question_index)
+        report = self._inline_integrity_report(session, answer, typing_features)
         try:
-            db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
-            if db_session:
-                # Append answer to JSON field (serialize datetime)
-                current_answers = list(db_session.answers) if db_session.answers else []
-                answer_dict = json.loads(answer.json())
-                current_answers.append(answer_dict)
-                db_session.answers = current_answers
-                flag_modified(db_session, "answers")
-                db_session.current_question_index += 1
-                db.commit()
-        except Exception as e:
-            db.rollback()
-            print(f"DB Error while submitting answer: {e}")
-        finally:
-            db.close()
+            finished = await self._advance(io, session, TIMED_OUT)
+        except StaleSessionError:
+            # Answered (or expired) by another worker meanwhile
+            return False
+        await io.write("expiring question", "insert_answer", self._answer_payload(io, session, answer, report))
+        self._enqueue_analysis(session, answer, typing_features)
+        if finished:
+            await io.write("finishing session", "finish_session", self._finish_payload(io, session))
+        return True
+
+    def _analysis_context(self, session: InterviewSession, answer: Answer):
+        """(position, question difficulty, earlier answer texts) of the newest answer"""
+        seq = len(session.answers) - 1
+        question = next((q for q in reversed(session.questions) if q.get("id") == answer.question_id), {})
+        previous_texts = [a.answer_text for a in session.answers[:seq]]
+        return seq, question.get("difficulty", "medium"), previous_texts
+
+    def _inline_integrity_report(
+        self,
+        session: InterviewSession,
+        answer: Answer,
+        typing_features: Optional[TypingFeatures] = None
+    ) -> Optional[AnswerIntegrityReport]:
+        """Integrity report stored with the answer row (None: the background queue builds it)"""
+        if self.ai_queue is not None:
+            return None
+        _, difficulty, previous_texts = self._analysis_context(session, answer)
+        return self.integrity_analyzer.analyze_answer(answer, difficulty, previous_texts, typing_features=typing_features)
 
-        # Move to next question in memory
+    def _enqueue_analysis(self, session: InterviewSession, answer: Answer, typing_features: Optional[TypingFeatures] = None):
+        """Hand a stored answer to the background analysis queue"""
+        if self.ai_queue is not None:
+            seq, difficulty, previous_texts = self._analysis_context(session, answer)
+            self.ai_queue.submit(session.session_id, seq, answer, difficulty, previous_texts, typing_features)
+
+    async def _typing_features(self, io: SessionIO, session_id: str, question_index: int) -> Optional[TypingFeatures]:
+        """Telemetry features of an answer (no raw events are read)"""
+        if self.telemetry is None:
+            return None
+        features = self.telemetry.cached(session_id, question_index)
+        if features is None:
+            features = await io.run_db(
+                "loading typing telemetry", self.telemetry.load_features, session_id, question_index
+            )
+        self.telemetry.forget(session_id, question_index)
+        return features
+
+    def _save_analysis(self, session_id: str, seq: int, answer: Answer, report: AnswerIntegrityReport):
+        """Analysis queue callback (worker thread): persist and patch the live and cached copies"""
+        run_blocking(self.io.write("saving answer analysis", "set_analysis", {
+            "session_id": session_id,
+            "seq": seq,
+            "ai_score": answer.ai_score,
+            "ai_explanation": answer.ai_explanation,
+            "report": report.model_dump(mode="json")
+        }))
+        run_blocking(self._save_live_analysis(self.io, session_id, seq, answer))
+        cached = self.sessions.peek(session_id)
+        if cached and seq < len(cached.answers) and cached.answers[seq].ai_score is None:
+            cached.answers[seq].ai_explanation = answer.ai_explanation
+            cached.answers[seq].ai_score = answer.ai_score
+        if self.broadcaster:
+            self.broadcaster.publish(ADMIN_TOPIC, "answer_analyzed", {
+                "session_id": session_id,
+                "seq": seq,
+                "ai_score": answer.ai_score,
+                "ai_explanation": answer.ai_explanation,
+                "honesty_score": report.honesty_score,
+                "is_suspicious": report.is_suspicious
+            })
+
+    async def _save_live_analysis(self, io: SessionIO, session_id: str, seq: int, answer: Answer):
+        """Store an analysis result on the live record; re-applied to a fresh copy if it moved on meanwhile"""
+        session = await io.load(session_id)
+        while session is not None and seq < len(session.answers) and session.answers[seq].ai_score is None:
+            session.answers[seq].ai_explanation = answer.ai_explanation
+            session.answers[seq].ai_score = answer.ai_score
+            try:
+                await io.save(session)
+                return
+            except StaleSessionError:
+                session = await io.load(session_id)
+
+    def _db_set_analysis(self, db, payload: Dict):
+        db.query(InterviewAnswer).filter(
+            InterviewAnswer.session_id == payload["session_id"], InterviewAnswer.seq == payload["seq"]
+        ).update({
+            InterviewAnswer.ai_score: payload["ai_score"],
+            InterviewAnswer.ai_explanation: payload["ai_explanation"],
+            InterviewAnswer.integrity_report: payload["report"]
+        }, synchronize_session=False)
+
+    def _answer_payload(
+        self,
+        io: SessionIO,
+        session: InterviewSession,
+        answer: Answer,
+        report: Optional[AnswerIntegrityReport]
+    ) -> Dict:
+        """Write for the newest answer (adaptive sessions also store their grown question list)"""
+        return {
+            "session_id": session.session_id,
+            "seq": len(session.answers) - 1,
+            "answer": answer.model_dump(mode="json"),
+            "report": report.model_dump(mode="json") if report else None,
+            "questions": list(session.questions) if session.adaptive_state else None,
+            "total_questions": session.total_questions,
+            "question": self._question_state(session),  # next question, already started
+            "events": io.take_events(session.session_id)
+        }
+
+    def _db_insert_answer(self, db, payload: Dict):
+        """Database Persistence: one INSERT per answer; progress is the answer count"""
+        answer = Answer.model_validate(payload["answer"])
+        db.add(InterviewAnswer(
+            session_id=payload["session_id"],
+            question_id=answer.question_id,
+            seq=payload["seq"],
+            answer_text=answer.answer_text,
+            time_spent=answer.time_spent,
+            is_timeout=answer.is_timeout,
+            ai_score=answer.ai_score,
+            ai_explanation=answer.ai_explanation,
+            # SQL NULL, not JSON null, while the background queue builds the report
+            integrity_report=payload["report"] if payload["report"] is not None else null(),
+            submitted_at=answer.submitted_at
+        ))
+        if payload["questions"] is not None:
+            db.query(SessionModel).filter(SessionModel.id == payload["session_id"]).update({
+                SessionModel.questions: payload["questions"],
+                SessionModel.total_questions: payload["total_questions"]
+            }, synchronize_session=False)
+        if self.drafts is not None:
+            db.query(AnswerDraft).filter(AnswerDraft.session_id == payload["session_id"]).delete(synchronize_session=False)
+        if payload.get("question"):
+            resume = db.query(SessionResume).filter(SessionResume.session_id == payload["session_id"]).first()
+            if resume is not None:
+                self._apply_question_state(resume, payload["question"])
+        self.io.append_events(db, payload)
+
+    async def _advance(self, io: SessionIO, session: InterviewSession, answer_event: str) -> bool:
+        """
+        Commit the newest answer to the live store and move to the next question.
+        Returns True if the interview finished.
+
+        Raises:
+            StaleSessionError: another request or worker changed the session
+                since it was loaded; nothing has been recorded or announced
+        """
         session.current_question_index += 1
-        
-        if session.current_question_index >= session.total_questions:
-            # Interview finished
-            self._finish_session(session_id)
+        finished = session.current_question_index >= session.total_questions
+        if finished:
+            await io.delete(session.session_id, revision=session.revision)
         else:
-            # Start next question
-            self._start_next_question(session_id)
+            self._set_current_question(session)
+            await io.save(session)
+
+        self._record_answer_event(io, session, session.answers[-1], answer_event)
+        if self.broadcaster:
+            self.broadcaster.publish(ADMIN_TOPIC, "answer_submitted", {
+                "session_id": session.session_id,
+                "answer": session.answers[-1].model_dump(mode="json"),
+                "answered": len(session.answers),
+                "total": session.total_questions
+            })
+        if self.drafts is not None:
+            self.drafts.discard(session.session_id)
         
-        return answer
+        if finished:
+            # Interview finished
+            self._finish_session(io, session)
+            return True
+
+        # Announce the next question
+        self._announce_question(io, session)
+        return False
     
     def get_session_status(self, session_id: str) -> InterviewSession:
         """
@@ -257,18 +720,17 @@ class SessionManager:
         Returns:
             InterviewSession object
         """
-        session = self.sessions.get(session_id)
-        if not session:
-            # Fallback: hydrate from DB for completed/historical sessions (admin + AI analysis)
-            session = self._load_session_from_db(session_id)
-            if not session:
-                raise ValueError(f"Session {session_id} not found")
-        
+        return self._with_time_remaining(run_blocking(self._get_session(self.io, session_id)))
+
+    async def get_session_status_async(self, session_id: str) -> InterviewSession:
+        """Same as get_session_status, without blocking the event loop on the database"""
+        return self._with_time_remaining(await self._get_session(self.aio, session_id))
+
+    def _with_time_remaining(self, session: InterviewSession) -> InterviewSession:
         # Update current question time if active
         if session.status == SessionStatus.ACTIVE and session.current_question:
-            timer = self.timers.get(session_id)
-            if timer:
-                session.current_question.time_remaining = timer.get_time_remaining()
+            timer = self._timer_for(session)
+            session.current_question.time_remaining = timer.get_time_remaining()
         
         return session
     
@@ -282,12 +744,13 @@ class SessionManager:
         Returns:
             SessionSummary object
         """
-        session = self.sessions.get(session_id)
-        if not session:
-            session = self._load_session_from_db(session_id)
-            if not session:
-                raise ValueError(f"Session {session_id} not found")
+        return self._summarize(run_blocking(self._get_session(self.io, session_id)))
 
+    async def get_session_summary_async(self, session_id: str) -> SessionSummary:
+        """Same as get_session_summary, without blocking the event loop on the database"""
+        return self._summarize(await self._get_session(self.aio, session_id))
+
+    def _summarize(self, session: InterviewSession) -> SessionSummary:
         # Compute total time from answers (AnswerHandler is not a reliable source for historical sessions)
         total_time = sum(a.time_spent for a in (session.answers or []))
         
@@ -301,78 +764,159 @@ class SessionManager:
             answers=session.answers
         )
 
+    async def _get_session(self, io: SessionIO, session_id: str) -> InterviewSession:
+        """Live session from the store, else the worker-local copy, else the database"""
+        session = (
+            await io.load(session_id)
+            or self.sessions.get(session_id)
+            or await self._fetch_session(io, session_id)
+        )
+        if not session:
+            raise ValueError(f"Session {session_id} not found")
+        return session
+
     def _load_session_from_db(self, session_id: str) -> Optional[InterviewSession]:
+        return run_blocking(self._fetch_session(self.io, session_id))
+
+    async def _fetch_session(self, io: SessionIO, session_id: str) -> Optional[InterviewSession]:
         """
         Hydrate an InterviewSession from the database for admin/reporting endpoints.
         This preserves the existing DB structure and avoids rewriting session flow.
         """
-        db = SessionLocal()
-        try:
-            db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
-            if not db_session:
-                return None
-
-            candidate = db_session.candidate
-            candidate_name = db_session.candidate_name or (candidate.name if candidate else "Unknown")
-            candidate_email = db_session.candidate_email or (candidate.email if candidate else "")
-            candidate_phone = db_session.candidate_phone or (candidate.phone if candidate else "")
-            candidate_lang = getattr(db_session, "candidate_lang", None) or (candidate.language if candidate else "en")
-
-            # Parse answers into Pydantic Answer objects (handles datetime parsing)
-            answers_raw = list(db_session.answers) if db_session.answers else []
-            parsed_answers = []
-            for a in answers_raw:
-                try:
-                    parsed_answers.append(Answer(**a))
-                except Exception:
-                    # Keep compatibility with older shapes if any
-                    parsed_answers.append(Answer(
-                        question_id=a.get("question_id", -1),
-                        answer_text=a.get("answer_text", ""),
-                        time_spent=int(a.get("time_spent", 0) or 0),
-                        submitted_at=a.get("submitted_at") or datetime.utcnow(),
-                        is_timeout=bool(a.get("is_timeout", False)),
-                        ai_score=float(a.get("ai_score", 0.0) or 0.0),
-                        ai_explanation=a.get("ai_explanation", "") or ""
-                    ))
-
-            status_val = db_session.status or SessionStatus.ACTIVE.value
-            status_enum = SessionStatusEnum.FINISHED if status_val == SessionStatus.FINISHED.value else SessionStatusEnum.ACTIVE
-
-            session = InterviewSession(
-                session_id=db_session.id,
-                candidate_id=str(db_session.candidate_id),
-                candidate_name=candidate_name,
-                candidate_email=candidate_email,
-                candidate_phone=candidate_phone,
-                candidate_lang=candidate_lang,
-                start_time=db_session.start_time or datetime.utcnow(),
-                end_time=db_session.end_time,
-                status=status_enum,
-                status_internal=db_session.status_internal or "PENDING",
-                status_public=db_session.status_public or "UNDER_REVIEW",
-                total_questions=int(db_session.total_questions or (len(db_session.questions) if db_session.questions else 0)),
-                current_question_index=int(db_session.current_question_index or 0),
-                questions=list(db_session.questions) if db_session.questions else [],
-                answers=parsed_answers,
-                current_question=None
+        await io.wait_for_writes(session_id)
+        session = await io.run_db(None, self._db_fetch_session, session_id)
+        if session:
+            # Cache it for subsequent admin/report requests
+            self.sessions.put(session_id, session)
+        return session
+
+    # Session row, candidate, answers and resume state in one statement
+    _HYDRATE_OPTIONS = (
+        joinedload(SessionModel.candidate),
+        joinedload(SessionModel.answer_rows),
+        joinedload(SessionModel.resume)
+    )
+
+    def _db_fetch_session(self, db, session_id: str) -> Optional[InterviewSession]:
+        db_session = db.query(SessionModel).options(*self._HYDRATE_OPTIONS).filter(SessionModel.id == session_id).first()
+        return self._hydrate(db_session) if db_session else None
+
+    def _db_fetch_by_resume_token(self, db, token: str) -> Optional[InterviewSession]:
+        db_session = db.query(SessionModel).join(SessionModel.resume).options(*self._HYDRATE_OPTIONS).filter(
+            SessionResume.token == token
+        ).first()
+        return self._hydrate(db_session) if db_session else None
+
+    def _hydrate(self, db_session: SessionModel) -> InterviewSession:
+        """InterviewSession from its row; active sessions get their current question and timer back"""
+        candidate = db_session.candidate
+        candidate_name = db_session.candidate_name or (candidate.name if candidate else "Unknown")
+        candidate_email = db_session.candidate_email or (candidate.email if candidate else "")
+        candidate_phone = db_session.candidate_phone or (candidate.phone if candidate else "")
+        candidate_lang = getattr(db_session, "candidate_lang", None) or (candidate.language if candidate else "en")
+
+        # Parse answers into Pydantic Answer objects (handles datetime parsing)
+        answers_raw = db_session.answers_list()
+        parsed_answers = []
+        for a in answers_raw:
+            try:
+                parsed_answers.append(Answer(**a))
+            except Exception:
+                # Keep compatibility with older shapes if any
+                parsed_answers.append(Answer(
+                    question_id=a.get("question_id", -1),
+                    answer_text=a.get("answer_text", ""),
+                    time_spent=int(a.get("time_spent", 0) or 0),
+                    submitted_at=a.get("submitted_at") or datetime.utcnow(),
+                    is_timeout=bool(a.get("is_timeout", False)),
+                    ai_score=float(a.get("ai_score", 0.0) or 0.0),
+                    ai_explanation=a.get("ai_explanation", "") or ""
+                ))
+
+        status_val = db_session.status or SessionStatus.ACTIVE.value
+        status_enum = SessionStatusEnum.FINISHED if status_val == SessionStatus.FINISHED.value else SessionStatusEnum.ACTIVE
+        questions = list(db_session.questions) if db_session.questions else []
+        # Sessions written after the answers table derive progress from the answer count
+        current_index = max(int(db_session.current_question_index or 0), len(parsed_answers))
+
+        resume = db_session.resume
+        current_question = None
+        if (
+            status_enum == SessionStatusEnum.ACTIVE
+            and resume is not None
+            and resume.question_started_at is not None
+            and resume.question_index == len(parsed_answers)
+            and resume.question_index < len(questions)
+        ):
+            question_data = questions[resume.question_index]
+            current_question = QuestionProgress(
+                question_id=question_data["id"],
+                question_text=question_data["question"],
+                skill=question_data["skill"],
+                difficulty=question_data["difficulty"],
+                time_limit=Timer.get_time_limit(question_data["difficulty"]),
+                started_at=resume.question_started_at,
+                timer=resume.timer
             )
+            current_index = resume.question_index
 
-            # Cache it for subsequent admin/report requests
-            self.sessions[session_id] = session
-            return session
-        finally:
-            db.close()
+        # Adaptive sessions continue their CAT estimate (stored with each question transition)
+        adaptive_state = None
+        if current_question is not None and resume.adaptive_state:
+            adaptive_state = AdaptiveState.model_validate(resume.adaptive_state)
+
+        session = InterviewSession(
+            session_id=db_session.id,
+            candidate_id=str(db_session.candidate_id),
+            candidate_name=candidate_name,
+            candidate_email=candidate_email,
+            candidate_phone=candidate_phone,
+            candidate_lang=candidate_lang,
+            start_time=db_session.start_time or datetime.utcnow(),
+            end_time=db_session.end_time,
+            status=status_enum,
+            status_internal=db_session.status_internal or "PENDING",
+            status_public=db_session.status_public or "UNDER_REVIEW",
+            total_questions=int(db_session.total_questions or len(questions)),
+            current_question_index=current_index,
+            questions=questions,
+            answers=parsed_answers,
+            current_question=current_question,
+            resume_token=resume.token if resume is not None else None,
+            mode="adaptive" if adaptive_state else "fixed",
+            adaptive_state=adaptive_state
+        )
+        return session
+
+    def _advance_adaptive(self, session: InterviewSession, answer: Answer):
+        """Update the CAT estimate and append the next question (if any) to the session"""
+        state = session.adaptive_state
+        question_data = session.questions[session.current_question_index]
+        self.adaptive_tester.record_answer(state, question_data, answer)
+
+        next_question = self.adaptive_tester.next_question(state)
+        if next_question:
+            session.questions.append(next_question.model_dump(mode="json"))
+        session.total_questions = len(session.questions)
+    
+    def _timer_for(self, session: InterviewSession) -> Timer:
+        """Timer of the current question, restored from its stored state"""
+        question = session.current_question
+        return Timer.from_state(question.difficulty, question.timer, question.started_at)
     
-    def _start_next_question(self, session_id: str):
+    def _start_next_question(self, io: SessionIO, session: InterviewSession):
         """Start the next question in the session"""
-        session = self.sessions[session_id]
-        
         if session.current_question_index >= len(session.questions):
             return
-        
+        self._set_current_question(session)
+        self._announce_question(io, session)
+
+    def _set_current_question(self, session: InterviewSession):
+        """Current question of `session` = its question at current_question_index, timer started now"""
         # Get next question
         question_data = session.questions[session.current_question_index]
+        timer = Timer(question_data["difficulty"])
+        timer.start()
         
         # Create question progress
         question_progress = QuestionProgress(
@@ -380,74 +924,468 @@ class SessionManager:
             question_text=question_data["question"],
             skill=question_data["skill"],
             difficulty=question_data["difficulty"],
-            time_limit=Timer.get_time_limit(question_data["difficulty"]),
-            started_at=datetime.now()
+            time_limit=timer.time_limit,
+            started_at=timer.started_at,
+            timer=timer.to_state()
         )
         
-        # Start timer
-        timer = Timer(question_data["difficulty"])
-        timer.start()
-        self.timers[session_id] = timer
-        
-        # Update session
+        # Timer starts now; its state travels with the session
         session.current_question = question_progress
+
+    def _announce_question(self, io: SessionIO, session: InterviewSession):
+        """Record the started question, arm its deadline and push it to the candidate"""
+        question_progress = session.current_question
+        io.record_event(session.session_id, QUESTION_STARTED, {
+            "index": session.current_question_index,
+            "question": session.questions[session.current_question_index],
+            "progress": question_progress.model_dump(mode="json")
+        })
+        if self.timeout_scheduler:
+            self.timeout_scheduler.schedule(session.session_id, session.current_question_index, question_progress.time_limit)
+        if self.broadcaster:
+            self.broadcaster.publish_question(session.session_id, self.question_event(session))
+
+    def question_event(self, session: InterviewSession) -> Dict:
+        """Push payload of the current question (what the candidate screen needs)"""
+        question = session.current_question
+        return {
+            "index": session.current_question_index,
+            "total": session.total_questions,
+            "question_id": question.question_id,
+            "question_text": question.question_text,
+            "skill": question.skill,
+            "difficulty": question.difficulty,
+            "time_limit": question.time_limit,
+            "time_remaining": self._timer_for(session).get_time_remaining()
+        }
     
-    def _finish_session(self, session_id: str):
+    def _finish_session(self, io: SessionIO, session: InterviewSession):
         """Mark session as finished"""
-        session = self.sessions[session_id]
+        session_id = session.session_id
         session.status = SessionStatus.FINISHED
         session.end_time = datetime.now()
         session.current_question = None
-        
-        # Database Persistence
-        db = SessionLocal()
+        io.record_event(session_id, FINISHED, {"end_time": session.end_time.isoformat()})
+
+        # No longer live (removed from the store by _advance): later reads are
+        # served from this worker's copy or the database
+        self.sessions.put(session_id, session)
+        self.answer_handlers.pop(session_id, None)
+        if self.timeout_scheduler:
+            self.timeout_scheduler.cancel(session_id)
+        if self.broadcaster:
+            self.broadcaster.forget_session(session_id)
+            finished = {"session_id": session_id, "answered": len(session.answers), "total": session.total_questions}
+            self.broadcaster.publish(session_topic(session_id), "finished", finished)
+            self.broadcaster.publish(ADMIN_TOPIC, "session_finished", finished)
+
+    def _finish_payload(self, io: SessionIO, session: InterviewSession) -> Dict:
+        return {
+            "session_id": session.session_id,
+            "end_time": session.end_time.isoformat(),
+            "events": io.take_events(session.session_id)
+        }
+
+    def _db_finish_session(self, db, payload: Dict):
+        db.query(SessionModel).filter(SessionModel.id == payload["session_id"]).update({
+            SessionModel.status: SessionStatus.FINISHED.value,
+            SessionModel.end_time: datetime.fromisoformat(payload["end_time"])
+        }, synchronize_session=False)
+        self.io.append_events(db, payload)
+
+    def apply_write(self, db, op: str, payload: Dict):
+        """Apply one write in the caller's transaction (direct, batched or replayed from the journal)"""
+        handler = {
+            "create_session": self._db_create_session,
+            "insert_answer": self._db_insert_answer,
+            "set_analysis": self._db_set_analysis,
+            "finish_session": self._db_finish_session,
+            "update_status": self._db_update_status
+        }[op]
+        return handler(db, payload)
+
+    def write_behind_metrics(self) -> Dict:
+        return self.write_behind.metrics() if self.write_behind is not None else {"enabled": False}
+
+    def _record_answer_event(self, io: SessionIO, session: InterviewSession, answer: Answer, event_type: str):
+        io.record_event(session.session_id, event_type, {
+            "seq": len(session.answers) - 1,
+            "answer": answer.model_dump(mode="json", exclude={"answer_text"}),  # text: interview_answers row
+            "total_questions": session.total_questions,
+            "adaptive_state": session.adaptive_state.model_dump(mode="json") if session.adaptive_state else None
+        })
+
+    async def _load_live(self, io: SessionIO, session_id: str) -> Optional[InterviewSession]:
+        """Live session from the store, else rebuilt from the event log (e.g. after a crash)"""
+        session = await io.load(session_id)
+        if session is None and self.event_log is not None:
+            await io.wait_for_writes(session_id)
+            hydrated = await io.run_db("recovering session", self.event_log.hydrate, session_id)
+            session = await self._restore_live(io, hydrated) or await io.load(session_id)
+        return session
+
+    async def resume_session_async(self, token: str) -> InterviewSession:
+        """
+        Session of a resume token, with its current question and the time left on it.
+        An active session becomes live on this worker again (timer and deadline restored).
+        """
+        io = self.aio
+        session = await io.run_db(None, self._db_fetch_by_resume_token, token)
+        if session is None:
+            raise ValueError("Unknown resume token")
+        live = await io.load(session.session_id)
+        if live is not None:
+            return self._with_time_remaining(live)
+        if self.write_behind is not None and self.write_behind.pending(session.session_id):
+            await io.wait_for_writes(session.session_id)
+            session = await io.run_db(None, self._db_fetch_by_resume_token, token)
+        if not await self._restore_live(io, session):
+            # Finished, or made live by another request meanwhile
+            session = await io.load(session.session_id) or session
+            self.sessions.put(session.session_id, session)
+        return self._with_time_remaining(session)
+
+    async def _restore_live(
+        self,
+        io: SessionIO,
+        session: Optional[InterviewSession],
+        replace: Optional[InterviewSession] = None
+    ) -> Optional[InterviewSession]:
+        """
+        Put a session rebuilt from history back in the live store (active ones only),
+        over the live record `replace` if given. Returns None if it was not restored,
+        also when another request or worker made it live meanwhile.
+        """
+        if session is None or session.status != SessionStatus.ACTIVE or not session.current_question:
+            return None
+        session.revision = replace.revision if replace is not None else 0
         try:
-            db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
-            if db_session:
-                db_session.status = SessionStatus.FINISHED.value
-                db_session.end_time = session.end_time
-                db.commit()
-        except Exception as e:
-            db.rollback()
-            print(f"DB Error while finishing session: {e}")
-        finally:
-            db.close()
+            await io.save(session)
+        except StaleSessionError:
+            return None
+        self.answer_handlers.setdefault(session.session_id, AnswerHandler())
+        if self.timeout_scheduler:
+            self.timeout_scheduler.schedule(
+                session.session_id, session.current_question_index, self._timer_for(session).get_time_remaining()
+            )
+        return session
+
+    async def session_for_resume_token_async(self, token: str) -> Optional[str]:
+        """Session ID of a resume token (the session router routes /resume by it)"""
+        return await self.aio.run_db(None, self._db_session_for_token, token)
+
+    def _db_session_for_token(self, db, token: str) -> Optional[str]:
+        return db.query(SessionResume.session_id).filter(SessionResume.token == token).scalar()
+
+    async def release_sessions_async(self, keep: Callable[[str], bool]) -> List[Dict]:
+        """
+        Rebalancing: hand over the live sessions this worker no longer owns.
+        Their pending writes are committed first; each is returned with its
+        unsaved draft and dropped here (local record, deadline, open streams).
+        """
+        io = self.aio
+        released = []
+        for session_id in await self.store.session_ids_async():
+            if keep(session_id):
+                continue
+            session = await io.load(session_id)
+            if session is None:
+                continue
+            await io.wait_for_writes(session_id)
+            handoff = {"session": session.model_dump(mode="json")}
+            draft = self.drafts.take(session_id) if self.drafts is not None else None
+            if draft is not None:
+                handoff["draft"] = {"question_index": draft.question_index, "text": draft.text, "rev": draft.rev}
+            if not self.store.shared:
+                await io.delete(session_id)
+            self.answer_handlers.pop(session_id, None)
+            if self.timeout_scheduler:
+                self.timeout_scheduler.cancel(session_id)
+            if self.broadcaster:
+                self.broadcaster.disconnect_session(session_id)
+            released.append(handoff)
+        return released
+
+    def adopt_sessions(self, handoffs: List[Dict]) -> int:
+        """Take over sessions released by another worker. Returns how many became live here."""
+        return run_blocking(self._adopt_sessions(self.io, handoffs))
+
+    async def adopt_sessions_async(self, handoffs: List[Dict]) -> int:
+        """Same as adopt_sessions, without blocking the event loop on the live store"""
+        return await self._adopt_sessions(self.aio, handoffs)
+
+    async def _adopt_sessions(self, io: SessionIO, handoffs: List[Dict]) -> int:
+        adopted = 0
+        for handoff in handoffs:
+            session = InterviewSession.model_validate(handoff["session"])
+            current = await io.load(session.session_id)
+            if current is not None and len(current.answers) > len(session.answers):
+                # Rebuilt from history here meanwhile, and already further along
+                continue
+            if await self._restore_live(io, session, replace=current) is None:
+                continue
+            draft = handoff.get("draft")
+            if draft and self.drafts is not None:
+                self.drafts.put(session.session_id, draft["question_index"], draft["text"], draft["rev"])
+            adopted += 1
+        return adopted
 
-        # Clean up timer
-        if session_id in self.timers:
-            del self.timers[session_id]
+    def snapshot_live(self, path: str) -> int:
+        """
+        Graceful shutdown: write the live sessions (progress, current question,
+        time spent on it) to `path` for the next process. Call it once pending
+        writes are flushed. Returns the number of sessions written.
+        """
+        if self.store.shared:
+            # The store outlives this process
+            return 0
+        entries = []
+        for session_id in self.store.session_ids():
+            session = self.store.load(session_id)
+            if session is None or session.status != SessionStatus.ACTIVE or not session.current_question:
+                continue
+            entries.append((session, self._timer_for(session).elapsed_ns()))
+        size = write_snapshot(path, entries)
+        logger.info(f"Live state snapshot: {len(entries)} sessions, {size} bytes -> {path}")
+        return len(entries)
+
+    def restore_live(self, path: str) -> int:
+        """
+        Startup, before serving traffic: put the sessions of a shutdown snapshot
+        back in the live store with their deadlines scheduled. Timers continue
+        where they were; after a reboot the monotonic start is rebuilt from the
+        time spent at shutdown plus the downtime. The snapshot is consumed.
+        Returns the number of sessions restored.
+        """
+        if not path or not os.path.exists(path):
+            return 0
+        try:
+            saved_at, entries = read_snapshot(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Live state snapshot {path} not restored: {e}")
+            return 0
+
+        offline_ns = max(0, int((time.time() - saved_at) * 1_000_000_000))
+        restored = 0
+        for session, elapsed_ns in entries:
+            current = self.store.load(session.session_id)
+            if current is not None and len(current.answers) >= len(session.answers):
+                continue
+            question = session.current_question
+            if not question.timer or question.timer.get("clock") != Timer.CLOCK_ID:
+                timer = Timer.from_elapsed(question.difficulty, elapsed_ns + offline_ns, question.started_at)
+                question.timer = timer.to_state()
+            if run_blocking(self._restore_live(self.io, session, replace=current)) is not None:
+                restored += 1
+        os.remove(path)
+        logger.info(f"Live state snapshot: {restored}/{len(entries)} sessions restored from {path}")
+        return restored
+
+    async def get_session_events_async(self, session_id: str, until_seq: Optional[int] = None) -> List[Dict]:
+        """Recorded history of a session, oldest first"""
+        if self.event_log is None:
+            return []
+        await self.aio.wait_for_writes(session_id)
+        return await self.aio.run_db(None, self.event_log.events, session_id, until_seq)
+
+    async def save_draft_async(self, session_id: str, question_index: int, rev: int, offset: int, delete: int, text: str) -> Dict:
+        """
+        Apply an autosave delta to the current question's draft.
+        Only the draft buffer changes; answers are written on submit.
+
+        Raises:
+            DraftConflict: the delta is based on another revision
+            ValueError: no active question `question_index`, or an invalid delta
+        """
+        if self.drafts is None:
+            raise ValueError("Draft autosave is disabled")
+        session = await self._load_live(self.aio, session_id)
+        self._check_current_question(session, question_index)
+        return self.drafts.apply(session_id, question_index, rev, offset, delete, text)
+
+    async def get_draft_async(self, session_id: str) -> DraftState:
+        """Autosaved draft of the current question (empty if none was saved)"""
+        if self.drafts is None:
+            raise ValueError("Draft autosave is disabled")
+        session = await self._load_live(self.aio, session_id)
+        self._check_current_question(session, None)
+        draft = await self.drafts.load(session_id)
+        if draft is None or draft.question_index != session.current_question_index:
+            return DraftState(question_index=session.current_question_index, text="", rev=0)
+        return DraftState(question_index=draft.question_index, text=draft.text, rev=draft.rev)
+
+    @staticmethod
+    def _check_current_question(session: Optional[InterviewSession], question_index: Optional[int]):
+        if not session or session.status != SessionStatus.ACTIVE or not session.current_question:
+            raise ValueError("No active question")
+        if question_index is not None and question_index != session.current_question_index:
+            raise ValueError(f"Question {question_index} is not the current question")
+
+    async def record_telemetry_async(self, session_id: str, batch: TelemetryBatch) -> TypingFeatures:
+        """
+        Store a telemetry batch of the current question.
+
+        Raises:
+            ValueError: telemetry is disabled, the batch is too large,
+                or `batch.question_index` is not the active question
+        """
+        if self.telemetry is None:
+            raise ValueError("Telemetry is disabled")
+        if len(batch.keys) + len(batch.pastes) + len(batch.focus) > MAX_BATCH_EVENTS:
+            raise ValueError(f"More than {MAX_BATCH_EVENTS} events in one batch")
+        session = await self._load_live(self.aio, session_id)
+        self._check_current_question(session, batch.question_index)
+        async with self.telemetry.ingest_lock(session_id, batch.question_index):
+            for attempt in range(INGEST_ATTEMPTS):
+                try:
+                    return await self.aio.run_db(
+                        None, self.telemetry.ingest, session_id, batch.question_index, batch.keys, batch.pastes, batch.focus
+                    )
+                except IntegrityError:
+                    # Another worker created the answer's row first: append to it
+                    if attempt == INGEST_ATTEMPTS - 1:
+                        raise
+
+    async def get_answer_telemetry_async(self, session_id: str, question_index: int) -> Optional[Dict]:
+        """Stored features and decoded events of an answer"""
+        if self.telemetry is None:
+            return None
+        return await self.aio.run_db(None, self.telemetry.load_events, session_id, question_index)
+
+    def telemetry_metrics(self) -> Dict:
+        return self.telemetry.metrics() if self.telemetry is not None else {"enabled": False}
+
+    def drafts_metrics(self) -> Dict:
+        return self.drafts.metrics() if self.drafts is not None else {"enabled": False}
+
+    def event_log_metrics(self) -> Dict:
+        return self.event_log.metrics() if self.event_log is not None else {"enabled": False}
+
+    def _purge_expired(self):
+        """Forget sessions abandoned mid-interview (timed out in the store)"""
+        for session_id in self.store.purge_expired():
+            self.answer_handlers.pop(session_id, None)
+
+    async def get_session_version_async(self, session_id: str) -> int:
+        """
+        Session version: number of answers + number of status changes.
+        Bumped by every answer and every status update.
+        """
+        await self.aio.wait_for_writes(session_id)
+        return await self.aio.run_db(None, self._db_session_version, session_id)
+
+    def _db_session_version(self, db, session_id: str) -> int:
+        answers = db.query(func.count(InterviewAnswer.id)).filter(InterviewAnswer.session_id == session_id).scalar() or 0
+        if not answers:
+            # Sessions stored before the answers table
+            legacy = db.query(SessionModel.answers).filter(SessionModel.id == session_id).first()
+            answers = len(legacy[0] or []) if legacy else 0
+        status_version = db.query(SessionRecommendation.status_version).filter(
+            SessionRecommendation.session_id == session_id
+        ).scalar() or 0
+        return answers + status_version
+
+    async def get_analysis_version_async(self, session_id: str) -> int:
+        """
+        Analysis version: number of analyzed answers (AI score and integrity report stored).
+        Bumped by every background analysis that lands.
+        """
+        await self.aio.wait_for_writes(session_id)
+        return await self.aio.run_db(None, self._db_analysis_version, session_id)
+
+    def _db_analysis_version(self, db, session_id: str) -> int:
+        return db.query(func.count(InterviewAnswer.id)).filter(
+            InterviewAnswer.session_id == session_id,
+            InterviewAnswer.ai_score.isnot(None)
+        ).scalar() or 0
+
+    async def get_typing_features_async(self, session_id: str) -> Dict[int, TypingFeatures]:
+        """Stored telemetry features of a session's answers, by answer position"""
+        if self.telemetry is None:
+            return {}
+        return await self.aio.run_db(
+            "loading typing telemetry", self.telemetry.load_session_features, session_id
+        ) or {}
+
+    def get_integrity_reports(self, session_id: str) -> Dict[int, AnswerIntegrityReport]:
+        """Stored per-answer integrity reports by answer position (missing ones are still pending)"""
+        return run_blocking(self._integrity_reports(self.io, session_id))
+
+    async def get_integrity_reports_async(self, session_id: str) -> Dict[int, AnswerIntegrityReport]:
+        """Same as get_integrity_reports, without blocking the event loop on the database"""
+        return await self._integrity_reports(self.aio, session_id)
+
+    async def _integrity_reports(self, io: SessionIO, session_id: str) -> Dict[int, AnswerIntegrityReport]:
+        await io.wait_for_writes(session_id)
+        return await io.run_db("loading integrity reports", self._db_fetch_integrity_reports, session_id) or {}
+
+    def _db_fetch_integrity_reports(self, db, session_id: str) -> Dict[int, AnswerIntegrityReport]:
+        rows = db.query(InterviewAnswer.seq, InterviewAnswer.integrity_report).filter(
+            InterviewAnswer.session_id == session_id,
+            InterviewAnswer.integrity_report.isnot(None)
+        ).all()
+        # Rows stored before pending reports were SQL NULL hold JSON null
+        return {seq: AnswerIntegrityReport.model_validate(report) for seq, report in rows if report is not None}
+
+    def ai_queue_metrics(self) -> Dict:
+        """Background AI detection queue depth, throughput and rejections"""
+        return self.ai_queue.metrics() if self.ai_queue is not None else {"enabled": False}
+
+    def cache_metrics(self) -> Dict:
+        """Sizes and hit rates of the live store and the historical session cache"""
+        return {
+            "active": self.store.metrics(),
+            "hydrated": self.sessions.metrics(),
+            "answer_handlers": len(self.answer_handlers)
+        }
 
     async def update_status(self, session_id: str, new_internal: str, new_public: Optional[str] = None, actor: str = "HR_SYSTEM"):
         """
         Update internal and/or public status.
         If public status changes, trigger notification.
         """
-        session = self.sessions.get(session_id)
-        db = SessionLocal()
+        io = self.aio
+        live = await io.load(session_id)
+        session = live or self.sessions.get(session_id)
         try:
-            db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
-            if not session and not db_session:
+            io.record_event(session_id, STATUS_CHANGED, {"status_internal": new_internal, "status_public": new_public})
+            payload = {
+                "session_id": session_id,
+                "status_internal": new_internal,
+                "status_public": new_public,
+                "events": io.take_events(session_id)
+            }
+            if session and self.write_behind is not None:
+                # Previous state is known here, so the write can go behind
+                db_state = None
+                await io.write("updating status", "update_status", payload)
+            else:
+                # Update DB (returns the previous state, None if there is no row)
+                await io.wait_for_writes(session_id)
+                db_state = await io.run_db(None, self.apply_write, "update_status", payload)
+            if not session and not db_state:
                 raise ValueError(f"Session {session_id} not found")
 
             # Capture old states
-            old_internal = session.status_internal if session else db_session.status_internal
-            old_public = session.status_public if session else db_session.status_public
-
-            # Update DB
-            if db_session:
-                db_session.status_internal = new_internal
-                if new_public:
-                    db_session.status_public = new_public
-                db.commit()
+            old_internal = session.status_internal if session else db_state["status_internal"]
+            old_public = session.status_public if session else db_state["status_public"]
             
             # Update memory
             if session:
                 session.status_internal = new_internal
                 if new_public:
                     session.status_public = new_public
+                if live:
+                    await self._save_live_status(io, live, new_internal, new_public)
 
             # Log internal change
             self.audit_logger.log_status_change(session_id, old_internal, new_internal, actor)
+            if self.broadcaster:
+                self.broadcaster.publish(ADMIN_TOPIC, "status_updated", {
+                    "session_id": session_id,
+                    "status_internal": new_internal,
+                    "status_public": new_public or old_public
+                })
 
             # Handle public notification
             if new_public and new_public != old_public:
@@ -457,8 +1395,8 @@ class SessionManager:
                 name, email, phone, lang = "", "", "", "en"
                 if session:
                     name, email, phone, lang = session.candidate_name, session.candidate_email, session.candidate_phone, session.candidate_lang
-                elif db_session and db_session.candidate:
-                    name, email, phone, lang = db_session.candidate.name, db_session.candidate.email, db_session.candidate.phone, db_session.candidate.language
+                elif db_state and db_state["candidate"]:
+                    name, email, phone, lang = db_state["candidate"]
 
                 await self.notification_dispatcher.send_final_decision(
                     candidate_id=session_id,
@@ -468,11 +1406,43 @@ class SessionManager:
                     status_public=new_public,
                     lang=lang
                 )
-            else:
-                print(f"DEBUG: Notification skipped. new_public({new_public}) == old_public({old_public})")
         except Exception as e:
-            db.rollback()
-            print(f"Error in update_status: {e}")
+            logger.error(f"Error in update_status: {e}")
             raise
-        finally:
-            db.close()
+
+    async def _save_live_status(self, io: SessionIO, session: InterviewSession, new_internal: str, new_public: Optional[str]):
+        """Store new statuses on the live record; re-applied to a fresh copy if it moved on meanwhile"""
+        while session is not None:
+            session.status_internal = new_internal
+            if new_public:
+                session.status_public = new_public
+            try:
+                await io.save(session)
+                return
+            except StaleSessionError:
+                session = await io.load(session.session_id)
+
+    def _db_update_status(self, db, payload: Dict) -> Optional[Dict]:
+        session_id = payload["session_id"]
+        new_internal = payload["status_internal"]
+        new_public = payload["status_public"]
+        db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
+        if not db_session:
+            return None
+        candidate = db_session.candidate
+        state = {
+            "status_internal": db_session.status_internal,
+            "status_public": db_session.status_public,
+            "candidate": (candidate.name, candidate.email, candidate.phone, candidate.language) if candidate else None
+        }
+        db_session.status_internal = new_internal
+        if new_public:
+            db_session.status_public = new_public
+        self.io.append_events(db, payload)
+        # Status change bumps the session version (invalidates the memoized recommendation)
+        versions = db.query(SessionRecommendation).filter(SessionRecommendation.session_id == session_id).first()
+        if versions is None:
+            db.add(SessionRecommendation(session_id=session_id, status_version=1))
+        else:
+            versions.status_version = (versions.status_version or 0) + 1
+        return state
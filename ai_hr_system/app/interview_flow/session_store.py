@@ -0,0 +1,342 @@
+from app.interview_flow.schemas import InterviewSession
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+
+try:
+    from redis.exceptions import WatchError
+except ImportError:  # optional: only RedisSessionStore talks to a server
+    class WatchError(Exception):
+        """A WATCHed key changed before EXEC"""
+
+class StaleSessionError(ValueError):
+    """The live record was changed by another request or worker since this copy was loaded"""
+
+    def __init__(self, session_id: str):
+        super().__init__(f"Session {session_id} was changed by another request")
+        self.session_id = session_id
+
+class SessionStore(ABC):
+    """
+    Keyed storage for live interview sessions.
+
+    A stored record is the whole InterviewSession: progress, answers, adaptive
+    state and the current question with its timer state.
+    Any worker can serve any request with a single `load`, which returns a
+    copy: changes reach the record only through `save`.
+
+    Writes are compare-and-set on `session.revision`: `save` of a copy loaded
+    at revision N succeeds only while the record is still at N (revision 0:
+    only if there is no record), and moves the record and the copy to N + 1.
+    A stale copy raises StaleSessionError, so two workers answering the same
+    question cannot both win.
+
+    The *_async variants are for code running on the event loop: by default
+    they run the backend call in a worker thread.
+    """
+
+    # True when every worker sees the same records
+    shared = True
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[InterviewSession]:
+        ...
+
+    @abstractmethod
+    def save(self, session: InterviewSession):
+        ...
+
+    @abstractmethod
+    def delete(self, session_id: str, revision: Optional[int] = None):
+        """Remove the record (only while it is at `revision`, if given)"""
+
+    @abstractmethod
+    def count(self) -> int:
+        ...
+
+    @abstractmethod
+    def session_ids(self) -> List[str]:
+        """IDs of the stored (not expired) sessions"""
+
+    async def load_async(self, session_id: str) -> Optional[InterviewSession]:
+        return await asyncio.to_thread(self.load, session_id)
+
+    async def save_async(self, session: InterviewSession):
+        await asyncio.to_thread(self.save, session)
+
+    async def delete_async(self, session_id: str, revision: Optional[int] = None):
+        await asyncio.to_thread(self.delete, session_id, revision)
+
+    async def session_ids_async(self) -> List[str]:
+        return await asyncio.to_thread(self.session_ids)
+
+    def purge_expired(self) -> List[str]:
+        """Drop timed-out sessions, returning their IDs (shared backends expire by themselves)"""
+        return []
+
+    def metrics(self) -> Dict:
+        return {"backend": type(self).__name__, "active": self.count()}
+
+    @staticmethod
+    def _encode(session: InterviewSession) -> str:
+        return session.model_dump_json()
+
+    @staticmethod
+    def _decode(payload) -> InterviewSession:
+        return InterviewSession.model_validate_json(payload)
+
+    @staticmethod
+    def _check_revision(session_id: str, expected: int, current: Optional[int]):
+        """`current`: revision of the stored record (None: no record, 0: written before revisions)"""
+        if (current or 0) != expected:
+            raise StaleSessionError(session_id)
+
+class InMemorySessionStore(SessionStore):
+    """
+    Process-local store (single worker, development).
+    Active sessions stay pinned until they finish or sit idle for `ttl_seconds`.
+    Records are deep copies, like the serialized ones of the shared stores,
+    so a copy loaded before another request's save is stale here as well.
+    """
+
+    shared = False
+
+    def __init__(self, ttl_seconds: int = 86400):
+        self.ttl_seconds = ttl_seconds
+        self._sessions: Dict[str, Tuple[float, InterviewSession]] = {}
+        self.expired = 0
+
+    def load(self, session_id: str) -> Optional[InterviewSession]:
+        current = self._current(session_id)
+        return current.model_copy(deep=True) if current is not None else None
+
+    def _current(self, session_id: str) -> Optional[InterviewSession]:
+        """The stored record itself (not a copy), None if missing or expired"""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl_seconds:
+            self._sessions.pop(session_id, None)
+            self.expired += 1
+            return None
+        return entry[1]
+
+    def save(self, session: InterviewSession):
+        current = self._current(session.session_id)
+        self._check_revision(session.session_id, session.revision, current.revision if current else None)
+        session.revision += 1
+        self._sessions[session.session_id] = (time.monotonic(), session.model_copy(deep=True))
+
+    def delete(self, session_id: str, revision: Optional[int] = None):
+        if revision is not None:
+            current = self._current(session_id)
+            self._check_revision(session_id, revision, current.revision if current else None)
+        self._sessions.pop(session_id, None)
+
+    # No I/O: a thread hop would cost more than the call
+    async def load_async(self, session_id: str) -> Optional[InterviewSession]:
+        return self.load(session_id)
+
+    async def save_async(self, session: InterviewSession):
+        self.save(session)
+
+    async def delete_async(self, session_id: str, revision: Optional[int] = None):
+        self.delete(session_id, revision)
+
+    async def session_ids_async(self) -> List[str]:
+        return self.session_ids()
+
+    def count(self) -> int:
+        return len(self._sessions)
+
+    def session_ids(self) -> List[str]:
+        deadline = time.monotonic() - self.ttl_seconds
+        return [sid for sid, (touched, _) in list(self._sessions.items()) if touched >= deadline]
+
+    def purge_expired(self) -> List[str]:
+        deadline = time.monotonic() - self.ttl_seconds
+        expired = [sid for sid, (touched, _) in list(self._sessions.items()) if touched < deadline]
+        for sid in expired:
+            self._sessions.pop(sid, None)
+        self.expired += len(expired)
+        return expired
+
+    def metrics(self) -> Dict:
+        metrics = super().metrics()
+        metrics["expired"] = self.expired
+        return metrics
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Shared store in a SQLite file in WAL mode.
+    All uvicorn workers on one host open the same file; readers never block the writer.
+    """
+
+    def __init__(self, path: str = "./live_sessions.db", ttl_seconds: int = 86400):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS live_sessions ("
+            " session_id TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " question_started_at TEXT,"
+            " expires_at REAL NOT NULL,"
+            " revision INTEGER NOT NULL DEFAULT 0)"
+        )
+        if "revision" not in [row[1] for row in conn.execute("PRAGMA table_info(live_sessions)")]:
+            conn.execute("ALTER TABLE live_sessions ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+        conn.execute("DELETE FROM live_sessions WHERE expires_at < ?", (time.time(),))
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    def load(self, session_id: str) -> Optional[InterviewSession]:
+        row = self._conn().execute(
+            "SELECT payload FROM live_sessions WHERE session_id = ? AND expires_at >= ?",
+            (session_id, time.time())
+        ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def save(self, session: InterviewSession):
+        started_at = session.current_question.started_at.isoformat() if session.current_question else None
+        expected = session.revision
+        session.revision = expected + 1
+        now = time.time()
+        params = (self._encode(session), started_at, now + self.ttl_seconds, session.revision, session.session_id)
+        if expected == 0:
+            # New record; an expired or unversioned one may be replaced
+            cursor = self._conn().execute(
+                "INSERT INTO live_sessions (payload, question_started_at, expires_at, revision, session_id) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET payload = excluded.payload, "
+                "question_started_at = excluded.question_started_at, expires_at = excluded.expires_at, "
+                "revision = excluded.revision WHERE live_sessions.expires_at < ? OR live_sessions.revision = 0",
+                params + (now,)
+            )
+        else:
+            cursor = self._conn().execute(
+                "UPDATE live_sessions SET payload = ?, question_started_at = ?, expires_at = ?, revision = ? "
+                "WHERE session_id = ? AND revision = ? AND expires_at >= ?",
+                params + (expected, now)
+            )
+        if cursor.rowcount == 0:
+            session.revision = expected
+            raise StaleSessionError(session.session_id)
+
+    def delete(self, session_id: str, revision: Optional[int] = None):
+        if revision is None:
+            self._conn().execute("DELETE FROM live_sessions WHERE session_id = ?", (session_id,))
+            return
+        cursor = self._conn().execute(
+            "DELETE FROM live_sessions WHERE session_id = ? AND revision = ?", (session_id, revision)
+        )
+        if cursor.rowcount == 0:
+            raise StaleSessionError(session_id)
+
+    def count(self) -> int:
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM live_sessions WHERE expires_at >= ?", (time.time(),)
+        ).fetchone()[0]
+
+    def session_ids(self) -> List[str]:
+        rows = self._conn().execute(
+            "SELECT session_id FROM live_sessions WHERE expires_at >= ?", (time.time(),)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+class RedisSessionStore(SessionStore):
+    """
+    Shared store on Redis (or anything speaking its GET/SET/DEL subset and
+    WATCH/MULTI/EXEC pipelines, used for the compare-and-set writes).
+    Sessions expire after `ttl_seconds` so abandoned interviews do not pile up.
+    """
+
+    KEY_PREFIX = "hr:session:"
+
+    def __init__(self, url: str = "redis://localhost:6379/0", ttl_seconds: int = 86400, client=None):
+        if client is None:
+            try:
+                import redis
+            except ImportError:
+                raise ImportError("redis package is required for SESSION_STORE=redis. Install: pip install redis")
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+
+    def load(self, session_id: str) -> Optional[InterviewSession]:
+        payload = self.client.get(self.KEY_PREFIX + session_id)
+        return self._decode(payload) if payload else None
+
+    def save(self, session: InterviewSession):
+        expected = session.revision
+        session.revision = expected + 1
+        try:
+            self._write_if(session.session_id, expected, self._encode(session))
+        except StaleSessionError:
+            session.revision = expected
+            raise
+
+    def delete(self, session_id: str, revision: Optional[int] = None):
+        if revision is None:
+            self.client.delete(self.KEY_PREFIX + session_id)
+            return
+        self._write_if(session_id, revision, None)
+
+    def _write_if(self, session_id: str, expected: int, payload: Optional[str]):
+        """SET (DEL when `payload` is None) while the record is still at revision `expected`"""
+        key = self.KEY_PREFIX + session_id
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                current = pipe.get(key)
+                self._check_revision(session_id, expected, json.loads(current).get("revision") if current else None)
+                pipe.multi()
+                if payload is None:
+                    pipe.delete(key)
+                else:
+                    pipe.set(key, payload, ex=self.ttl_seconds)
+                pipe.execute()
+            except WatchError:
+                raise StaleSessionError(session_id)
+
+    def count(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=self.KEY_PREFIX + "*"))
+
+    def session_ids(self) -> List[str]:
+        ids = []
+        for key in self.client.scan_iter(match=self.KEY_PREFIX + "*"):
+            key = key.decode() if isinstance(key, bytes) else key
+            ids.append(key[len(self.KEY_PREFIX):])
+        return ids
+
+def build_session_store(backend: str = "memory", url: str = "", ttl_seconds: int = 86400) -> SessionStore:
+    """
+    Create the session store selected by configuration.
+
+    Args:
+        backend: memory | sqlite | redis
+        url: SQLite file path or Redis URL
+        ttl_seconds: lifetime of a live session record
+    """
+    backend = (backend or "memory").lower()
+    if backend == "memory":
+        return InMemorySessionStore(ttl_seconds=ttl_seconds)
+    if backend == "sqlite":
+        return SQLiteSessionStore(url or "./live_sessions.db", ttl_seconds=ttl_seconds)
+    if backend == "redis":
+        return RedisSessionStore(url or "redis://localhost:6379/0", ttl_seconds=ttl_seconds)
+    raise ValueError(f"Unknown session store backend: {backend}")
@@ -0,0 +1,126 @@
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class QuestionTimeoutScheduler:
+    """
+    Deadlines of all active questions in one min-heap, served by a single asyncio task.
+
+    schedule() is O(log n); superseded entries (answered questions, finished
+    sessions) are not removed from the heap but skipped when they surface.
+    When a deadline passes, `on_expire(session_id, question_index)` is awaited.
+    """
+
+    def __init__(self, grace_seconds: float = 5.0):
+        self.grace_seconds = grace_seconds
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._current: Dict[str, int] = {}  # session_id -> question index being timed
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._on_expire: Optional[Callable[[str, int], Awaitable]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.scheduled = 0
+        self.expired = 0
+        self.stale_skipped = 0
+        self.errors = 0
+
+    def schedule(self, session_id: str, question_index: int, delay_seconds: float):
+        """Track the deadline of a session's current question (replaces the previous one)"""
+        deadline = time.monotonic() + max(0.0, delay_seconds) + self.grace_seconds
+        with self._lock:
+            self._current[session_id] = question_index
+            heapq.heappush(self._heap, (deadline, next(self._counter), session_id, question_index))
+            self.scheduled += 1
+            earliest = self._heap[0][0] == deadline
+        if earliest:
+            self._wake()
+
+    def cancel(self, session_id: str):
+        """Stop tracking a session (finished); its heap entries become stale"""
+        with self._lock:
+            self._current.pop(session_id, None)
+
+    def start(self, on_expire: Callable[[str, int], Awaitable]):
+        """Start the background task on the running event loop"""
+        self._on_expire = on_expire
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _wake(self):
+        if not self._loop or not self._wakeup:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wakeup.set()
+        else:
+            # Called from a worker thread
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _pop_due(self, now: float) -> List[Tuple[str, int]]:
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, _, session_id, question_index = heapq.heappop(self._heap)
+                if self._current.get(session_id) != question_index:
+                    self.stale_skipped += 1
+                    continue
+                del self._current[session_id]
+                due.append((session_id, question_index))
+        return due
+
+    async def expire_due(self, now: Optional[float] = None) -> int:
+        """Fire every deadline up to `now` (monotonic). Returns the number fired."""
+        fired = 0
+        for session_id, question_index in self._pop_due(time.monotonic() if now is None else now):
+            try:
+                await self._on_expire(session_id, question_index)
+                self.expired += 1
+                fired += 1
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"[TIMEOUT] expiring {session_id} q={question_index} failed: {e}")
+        return fired
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            await self.expire_due()
+            with self._lock:
+                delay = self._heap[0][0] - time.monotonic() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=None if delay is None else max(0.0, delay))
+            except asyncio.TimeoutError:
+                pass
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            return {
+                "tracked_sessions": len(self._current),
+                "heap_size": len(self._heap),
+                "next_deadline_in_s": round(self._heap[0][0] - time.monotonic(), 1) if self._heap else None,
+                "scheduled": self.scheduled,
+                "expired": self.expired,
+                "stale_skipped": self.stale_skipped,
+                "errors": self.errors
+            }
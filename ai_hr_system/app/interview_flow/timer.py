@@ -1,93 +1,154 @@
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime
+from typing import Dict, Optional
+import os
+import socket
+import time
+
+def _clock_id() -> str:
+    """
+    Identity of this host's monotonic clock.
+    Monotonic readings are only comparable between processes of the same boot.
+    """
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        # No boot id: trust our own readings only
+        return f"{socket.gethostname()}:{os.getpid()}"
 
 class Timer:
     """
     Timer for tracking time limits on interview questions.
+
+    Elapsed time is measured on the monotonic clock (nanoseconds), so NTP
+    corrections and DST changes cannot distort `time_spent`. The wall-clock
+    start is kept for display only.
     """
-    
+
     # Time limits by difficulty (in seconds)
     TIME_LIMITS = {
         "easy": 300,    # 5 minutes
         "medium": 600,  # 10 minutes
         "hard": 900     # 15 minutes
     }
-    
+
+    CLOCK_ID = _clock_id()
+
+    __slots__ = ("difficulty", "time_limit", "started_ns", "stopped_ns", "started_at")
+
     def __init__(self, difficulty: str):
         """
         Initialize timer with difficulty-based time limit.
-        
+
         Args:
             difficulty: Question difficulty (easy/medium/hard)
         """
         self.difficulty = difficulty.lower()
         self.time_limit = self.TIME_LIMITS.get(self.difficulty, 600)  # Default 10 min
-        self.start_time: Optional[datetime] = None
-        self.end_time: Optional[datetime] = None
-    
+        self.started_ns: Optional[int] = None
+        self.stopped_ns: Optional[int] = None
+        self.started_at: Optional[datetime] = None  # display only
+
     def start(self):
         """Start the timer"""
-        self.start_time = datetime.now()
-        self.end_time = None
-    
+        self.started_ns = time.monotonic_ns()
+        self.stopped_ns = None
+        self.started_at = datetime.now()
+
     def stop(self) -> int:
         """
         Stop the timer and return time spent.
-        
+
         Returns:
             Time spent in seconds
         """
-        if not self.start_time:
+        if self.started_ns is None:
             return 0
-        
-        self.end_time = datetime.now()
+
+        self.stopped_ns = time.monotonic_ns()
         return self.get_time_spent()
-    
+
     def get_time_spent(self) -> int:
         """
         Get time spent so far.
-        
+
         Returns:
             Time spent in seconds
         """
-        if not self.start_time:
+        if self.started_ns is None:
             return 0
-        
-        end = self.end_time or datetime.now()
-        delta = end - self.start_time
-        return int(delta.total_seconds())
-    
+
+        end = self.stopped_ns if self.stopped_ns is not None else time.monotonic_ns()
+        return max(0, (end - self.started_ns) // 1_000_000_000)
+
     def get_time_remaining(self) -> int:
         """
         Get time remaining.
-        
+
         Returns:
             Time remaining in seconds (0 if timeout)
         """
-        if not self.start_time:
+        if self.started_ns is None:
             return self.time_limit
-        
+
         time_spent = self.get_time_spent()
         remaining = self.time_limit - time_spent
         return max(0, remaining)
-    
+
     def is_timeout(self) -> bool:
         """
         Check if time limit has been exceeded.
-        
+
         Returns:
             True if timeout, False otherwise
         """
         return self.get_time_remaining() == 0
-    
+
+    def elapsed_ns(self) -> int:
+        """Nanoseconds since the start (0 if not started)"""
+        if self.started_ns is None:
+            return 0
+        end = self.stopped_ns if self.stopped_ns is not None else time.monotonic_ns()
+        return max(0, end - self.started_ns)
+
+    def to_state(self) -> Dict:
+        """Compact serializable form, stored with the session's current question"""
+        return {"clock": self.CLOCK_ID, "started_ns": self.started_ns}
+
+    @classmethod
+    def from_state(cls, difficulty: str, state: Optional[Dict], started_at: Optional[datetime] = None) -> "Timer":
+        """
+        Restore a running timer saved by `to_state`.
+
+        On another host (or for sessions saved without a state) the monotonic
+        reading is meaningless, so the start is rebased from the wall-clock
+        `started_at` once; from then on the timer is monotonic again.
+        """
+        timer = cls(difficulty)
+        timer.started_at = started_at
+        if state and state.get("clock") == cls.CLOCK_ID and state.get("started_ns") is not None:
+            timer.started_ns = state["started_ns"]
+        elif started_at is not None:
+            elapsed = max(0.0, (datetime.now() - started_at).total_seconds())
+            timer.started_ns = time.monotonic_ns() - int(elapsed * 1_000_000_000)
+        return timer
+
+    @classmethod
+    def from_elapsed(cls, difficulty: str, elapsed_ns: int, started_at: Optional[datetime] = None) -> "Timer":
+        """Running timer that started `elapsed_ns` ago on this host's monotonic clock"""
+        timer = cls(difficulty)
+        timer.started_at = started_at
+        timer.started_ns = time.monotonic_ns() - max(0, elapsed_ns)
+        return timer
+
     @staticmethod
     def get_time_limit(difficulty: str) -> int:
         """
         Get time limit for a difficulty level.
-        
+
         Args:
             difficulty: Question difficulty
-        
+
         Returns:
             Time limit in seconds
         """
@@ -0,0 +1,224 @@
+from app.database import run_sync_db
+from app.models import WriteBehindCheckpoint
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import json
+import os
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class WriteBehindWriter:
+    """
+    Write-behind persistence for session writes.
+
+    `submit` appends the write (an op name and a JSON payload) to a local
+    journal and fsyncs it before returning, so an acknowledged answer
+    survives a crash. A flusher thread applies buffered writes in one
+    transaction every `flush_interval_ms`, or as soon as `max_batch` are
+    waiting, together with the journal position it reached
+    (write_behind_checkpoints). On start, journal entries past that position
+    are applied again, exactly once.
+
+    Reads that must see a session's writes call `wait_for(session_id)` first.
+    One journal per worker process.
+    """
+
+    def __init__(
+        self,
+        journal_path: str,
+        flush_interval_ms: int = 50,
+        max_batch: int = 200,
+        fsync: bool = True
+    ):
+        self.journal_path = journal_path
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch = max(1, max_batch)
+        self.fsync = fsync
+        self._apply: Optional[Callable[[object, str, Dict], object]] = None
+        self._buffer: List[Tuple[int, str, str, Dict]] = []  # (seq, session_id, op, payload)
+        self._pending: Dict[str, int] = {}  # session_id -> writes not yet committed
+        self._cond = threading.Condition()
+        self._flushing = False
+        self._flush_requested = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._fd: Optional[int] = None
+        self._seq = 0
+        self.submitted = 0
+        self.written = 0
+        self.commits = 0
+        self.failed = 0
+        self.recovered = 0
+        self.fsyncs = 0
+        self._flush_ms_total = 0.0
+
+    def start(self, apply: Callable[[object, str, Dict], object]):
+        """Replay the journal left by a previous run, then start the flusher"""
+        self._apply = apply
+        os.makedirs(os.path.dirname(os.path.abspath(self.journal_path)), exist_ok=True)
+        self._recover()
+        self._fd = os.open(self.journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def _recover(self):
+        checkpoint = run_sync_db(_db_load_checkpoint, self.journal_path)
+        entries = []
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn last line: that write was never acknowledged
+                    self._seq = max(self._seq, entry["seq"])
+                    if entry["seq"] > checkpoint:
+                        entries.append((entry["seq"], entry["session_id"], entry["op"], entry["payload"]))
+        self._seq = max(self._seq, checkpoint)
+        if entries:
+            logger.warning(f"[WRITE-BEHIND] replaying {len(entries)} journaled writes from {self.journal_path}")
+            self._commit(entries)
+            self.recovered += len(entries)
+        # Everything in the journal is in the database now
+        open(self.journal_path, "w").close()
+
+    def submit(self, session_id: str, op: str, payload: Dict):
+        """Journal a write (durable on return) and buffer it for the next batch"""
+        with self._cond:
+            self._seq += 1
+            entry = (self._seq, session_id, op, payload)
+            line = json.dumps({"seq": self._seq, "session_id": session_id, "op": op, "payload": payload}, default=str)
+            os.write(self._fd, (line + "\n").encode("utf-8"))
+            if self.fsync:
+                os.fsync(self._fd)
+                self.fsyncs += 1
+            self._buffer.append(entry)
+            self._pending[session_id] = self._pending.get(session_id, 0) + 1
+            self.submitted += 1
+            if len(self._buffer) >= self.max_batch:
+                self._cond.notify_all()
+
+    async def submit_async(self, session_id: str, op: str, payload: Dict):
+        """Same as submit, with the journal fsync off the event loop"""
+        await asyncio.to_thread(self.submit, session_id, op, payload)
+
+    def pending(self, session_id: str) -> int:
+        with self._cond:
+            return self._pending.get(session_id, 0)
+
+    def wait_for(self, session_id: str, timeout: Optional[float] = 5.0) -> bool:
+        """Flush now and block until the session's writes are committed. False on timeout."""
+        with self._cond:
+            if not self._pending.get(session_id):
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._pending.get(session_id), timeout=timeout)
+
+    def drain(self, timeout: Optional[float] = 5.0) -> bool:
+        """Flush now and block until every buffered write is committed"""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._buffer and not self._flushing, timeout=timeout)
+
+    def stop(self, timeout: float = 5.0):
+        self.drain(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                # Coalesce until the interval passes, the batch is full or a reader needs the writes
+                self._cond.wait_for(
+                    lambda: len(self._buffer) >= self.max_batch or self._flush_requested or self._stopping,
+                    timeout=self.flush_interval
+                )
+                if self._stopping and not self._buffer:
+                    return
+                batch, self._buffer = self._buffer, []
+                self._flushing = bool(batch)
+                self._flush_requested = False
+            if not batch:
+                continue
+
+            started = time.perf_counter()
+            self._commit(batch)
+            self._flush_ms_total += (time.perf_counter() - started) * 1000
+
+            with self._cond:
+                for _, session_id, _, _ in batch:
+                    left = self._pending.get(session_id, 0) - 1
+                    if left > 0:
+                        self._pending[session_id] = left
+                    else:
+                        self._pending.pop(session_id, None)
+                self._flushing = False
+                if not self._buffer:
+                    # Whole journal is committed: start it over
+                    os.ftruncate(self._fd, 0)
+                self._cond.notify_all()
+
+    def _commit(self, batch: List[Tuple[int, str, str, Dict]]):
+        """Apply a batch in one transaction; if it fails, write by write"""
+        try:
+            run_sync_db(self._apply_batch, batch)
+            self.commits += 1
+            self.written += len(batch)
+            return
+        except Exception as e:
+            logger.error(f"[WRITE-BEHIND] batch of {len(batch)} failed ({e}), retrying one by one")
+        for entry in batch:
+            try:
+                run_sync_db(self._apply_batch, [entry])
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"[WRITE-BEHIND] {entry[2]} for {entry[1]} dropped: {e}")
+                run_sync_db(_db_save_checkpoint, self.journal_path, entry[0])
+            self.commits += 1
+
+    def _apply_batch(self, db, batch: List[Tuple[int, str, str, Dict]]):
+        for _, _, op, payload in batch:
+            self._apply(db, op, payload)
+        _db_save_checkpoint(db, self.journal_path, batch[-1][0])
+
+    def metrics(self) -> Dict:
+        with self._cond:
+            buffered = len(self._buffer)
+        batches = max(1, self.commits)
+        return {
+            "journal": self.journal_path,
+            "journal_bytes": os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0,
+            "buffered": buffered,
+            "submitted": self.submitted,
+            "written": self.written,
+            "commits": self.commits,
+            "commits_saved": max(0, self.written - self.commits),
+            "avg_batch": round(self.written / batches, 2),
+            "avg_flush_ms": round(self._flush_ms_total / batches, 3),
+            "fsyncs": self.fsyncs,
+            "recovered": self.recovered,
+            "failed": self.failed
+        }
+
+def _db_load_checkpoint(db, journal: str) -> int:
+    seq = db.query(WriteBehindCheckpoint.seq).filter(WriteBehindCheckpoint.journal == journal).scalar()
+    return seq or 0
+
+def _db_save_checkpoint(db, journal: str, seq: int):
+    row = db.query(WriteBehindCheckpoint).filter(WriteBehindCheckpoint.journal == journal).first()
+    if row is None:
+        db.add(WriteBehindCheckpoint(journal=journal, seq=seq))
+    else:
+        row.seq = seq
@@ -1,8 +1,8 @@
 # -----------------------------------------
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, Body, Form, Depends
-from sqlalchemy.orm import Session
-from app.database import engine, Base, get_db, SessionLocal
+from fastapi import FastAPI, UploadFile, File, HTTPException, Body, Form, Depends, Header, Request
+from sqlalchemy.orm import Session, selectinload
+from app.database import engine, Base, get_db, run_async_db, get_pool_metrics
 from app import models
 from contextlib import asynccontextmanager
 import os
@@ -20,17 +20,34 @@ from app.candidate_level.level_detector import LevelDetector
 from app.candidate_level.difficulty_mapper import DifficultyMapper
 from app.candidate_level.schemas import LevelDetectionResult, InterviewPlan
 from app.question_engine.question_selector import QuestionSelector
-from app.question_engine.schemas import QuestionSet
+from app.question_engine.adaptive_tester import AdaptiveTester
+from app.question_engine.warmup import QuestionPoolWarmer
+from app.question_engine.schemas import QuestionSet, WarmupReport
 from app.interview_flow.session_manager import SessionManager
-from app.interview_flow.schemas import InterviewSession, QuestionProgress, SessionStatus, SessionSummary
+from app.interview_flow.session_store import build_session_store, StaleSessionError
+from app.interview_flow.session_cache import SessionCache
+from app.interview_flow.timeout_scheduler import QuestionTimeoutScheduler
+from app.interview_flow.event_broadcaster import EventBroadcaster, ADMIN_TOPIC, session_topic
+from app.interview_flow.event_log import SessionEventLog
+from app.interview_flow.write_behind import WriteBehindWriter
+from app.interview_flow.draft_buffer import DraftBuffer, DraftConflict
+from app.interview_flow.answer_upload import AnswerBodyLimit, AnswerTooLarge, UTF8_MAX_BYTES_PER_CHAR, read_answer_stream
+from app.interview_flow.payloads import SessionPayloadCache, FastJSONResponse
+from app.interview_flow.schemas import InterviewSession, QuestionProgress, SessionStatus, SessionSummary, DraftDelta, DraftState
 from app.answer_analysis.final_analyzer import FinalAnalyzer
-from app.answer_analysis.schemas import FullIntegrityReport
+from app.answer_analysis.detection_queue import AIDetectionQueue
+from app.answer_analysis.schemas import FullIntegrityReport, TelemetryBatch
+from app.answer_analysis.telemetry import TelemetryRecorder
 from app.scoring.score_engine import ScoreEngine
 from app.scoring.recommendation import RecommendationEngine
 from app.scoring.confidence_level import ConfidenceAnalyzer
 from app.scoring.schemas import FinalRecommendation
+from app.scoring.recommendation_cache import RecommendationCache
+from app.routing.hash_ring import HashRing
 from app.config import settings
-from typing import List, Optional
+from typing import Dict, List, Optional
+import hmac
+import asyncio
 import uvicorn
 import shutil
 import os
@@ -41,7 +58,7 @@ async def lifespan(app: FastAPI):
     """
     Lifespan event handler for FastAPI (Startup and Shutdown).
     """
-    global analyzer, summarizer, ranker, level_detector, difficulty_mapper, question_selector, session_manager, integrity_analyzer, score_engine, recommendation_engine, confidence_analyzer, bot, notifier
+    global analyzer, summarizer, ranker, level_detector, difficulty_mapper, question_selector, session_manager, integrity_analyzer, score_engine, recommendation_engine, confidence_analyzer, bot, notifier, warmup_report, timeout_scheduler, broadcaster, ai_queue, recommendation_cache, write_behind, drafts, session_payloads
     
     # Initialize Database
     models.Base.metadata.create_all(bind=engine)
@@ -57,18 +74,107 @@ async def lifespan(app: FastAPI):
     level_detector = LevelDetector()
     difficulty_mapper = DifficultyMapper()
     question_selector = QuestionSelector()
-    session_manager = SessionManager()
+    try:
+        # Reuse the SkillMapper model; embeddings are computed once here, never per request
+        question_selector.build_semantic_index(analyzer.mapper.model, threshold=settings.SEMANTIC_DEDUP_THRESHOLD)
+    except Exception as e:
+        print(f"Semantic question de-duplication disabled: {e}")
+    if settings.QUESTION_WARMUP_ENABLED:
+        # Pre-materialize pools for the most common recent (skill, difficulty, lang) combinations
+        warmup_report = QuestionPoolWarmer(
+            question_selector,
+            top_n=settings.QUESTION_WARMUP_TOP_N,
+            time_budget_ms=settings.QUESTION_WARMUP_BUDGET_MS,
+            lookback_sessions=settings.QUESTION_WARMUP_LOOKBACK
+        ).warm()
+        print(f"Question pools warmed: {len(warmup_report.warmed)} in {warmup_report.elapsed_ms}ms")
     integrity_analyzer = FinalAnalyzer()
     score_engine = ScoreEngine()
+    adaptive_tester = AdaptiveTester(
+        question_selector,
+        score_engine,
+        confidence_threshold=settings.ADAPTIVE_CONFIDENCE_THRESHOLD,
+        min_technical_questions=settings.ADAPTIVE_MIN_QUESTIONS,
+        soft_skills_questions=settings.ADAPTIVE_SOFT_SKILLS_QUESTIONS
+    )
+    session_store = build_session_store(
+        settings.SESSION_STORE,
+        settings.SESSION_STORE_URL,
+        ttl_seconds=settings.SESSION_STORE_TTL
+    )
+    session_cache = SessionCache(max_size=settings.SESSION_CACHE_MAX_SIZE, ttl_seconds=settings.SESSION_CACHE_TTL)
+    timeout_scheduler = QuestionTimeoutScheduler(grace_seconds=settings.QUESTION_TIMEOUT_GRACE_SECONDS)
+    broadcaster = EventBroadcaster(
+        queue_size=settings.SSE_QUEUE_SIZE,
+        tick_seconds=settings.SSE_TICK_SECONDS,
+        heartbeat_seconds=settings.SSE_HEARTBEAT_SECONDS
+    )
+    ai_queue = AIDetectionQueue(
+        max_size=settings.AI_DETECTION_QUEUE_SIZE,
+        workers=settings.AI_DETECTION_WORKERS,
+        analyzer=integrity_analyzer
+    )
+    event_log = SessionEventLog(snapshot_every=settings.SESSION_SNAPSHOT_EVERY) if settings.SESSION_EVENT_LOG else None
+    write_behind = None
+    if settings.WRITE_BEHIND_ENABLED:
+        write_behind = WriteBehindWriter(
+            settings.WRITE_BEHIND_JOURNAL,
+            flush_interval_ms=settings.WRITE_BEHIND_FLUSH_MS,
+            max_batch=settings.WRITE_BEHIND_MAX_BATCH,
+            fsync=settings.WRITE_BEHIND_FSYNC
+        )
+    drafts = None
+    if settings.DRAFT_AUTOSAVE:
+        drafts = DraftBuffer(
+            debounce_ms=settings.DRAFT_DEBOUNCE_MS,
+            max_delay_ms=settings.DRAFT_MAX_DELAY_MS,
+            max_chars=settings.DRAFT_MAX_CHARS
+        )
+    session_manager = SessionManager(
+        adaptive_tester=adaptive_tester,
+        session_store=session_store,
+        session_cache=session_cache,
+        timeout_scheduler=timeout_scheduler,
+        broadcaster=broadcaster,
+        ai_queue=ai_queue,
+        event_log=event_log,
+        write_behind=write_behind,
+        drafts=drafts,
+        telemetry=TelemetryRecorder() if settings.TELEMETRY_ENABLED else None
+    )
+    if write_behind:
+        # Replays writes journaled but not committed before the last shutdown/crash
+        write_behind.start(session_manager.apply_write)
+    timeout_scheduler.start(session_manager.expire_question_async)
+    broadcaster.start()
+    if drafts:
+        drafts.start()
+    if settings.LIVE_SNAPSHOT_PATH:
+        # Interviews in progress at the last shutdown (reload/deploy) continue here
+        session_manager.restore_live(settings.LIVE_SNAPSHOT_PATH)
     recommendation_engine = RecommendationEngine()
     confidence_analyzer = ConfidenceAnalyzer()
+    recommendation_cache = RecommendationCache(max_size=settings.RECOMMENDATION_CACHE_SIZE)
+    session_payloads = SessionPayloadCache(max_sessions=settings.SESSION_PAYLOAD_CACHE_SIZE)
     yield
     # Shutdown logic
+    await timeout_scheduler.stop()
+    await broadcaster.stop()
+    ai_queue.stop()
+    if drafts:
+        await drafts.stop()
+    if write_behind:
+        write_behind.stop()
+    if settings.LIVE_SNAPSHOT_PATH:
+        try:
+            session_manager.snapshot_live(settings.LIVE_SNAPSHOT_PATH)
+        except OSError as e:
+            print(f"Live state snapshot failed: {e}")
     if bot:
         await bot.session.close()
 
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 app = FastAPI(title="AI HR System - Complete", version="6.0", lifespan=lifespan)
@@ -82,6 +188,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Oversized /submit-answer bodies are refused before they are read and parsed
+app.add_middleware(AnswerBodyLimit, max_chars=settings.ANSWER_MAX_CHARS)
+
 # Mount static files
 static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
 if not os.path.exists(static_dir):
@@ -116,6 +225,14 @@ recommendation_engine = None
 confidence_analyzer = None
 bot = None
 notifier = None
+warmup_report = None
+timeout_scheduler = None
+broadcaster = None
+ai_queue = None
+recommendation_cache = None
+write_behind = None
+drafts = None
+session_payloads = None
 
 # The startup event is now handled by the lifespan context manager above.
 
@@ -292,6 +409,232 @@ async def generate_interview_questions(
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/admin/question-warmup", response_model=WarmupReport)
+async def get_question_warmup_report():
+    """
+    Report of question pools pre-materialized at startup.
+    """
+    return warmup_report or WarmupReport()
+
+@app.get("/admin/question-cache")
+async def get_question_cache_metrics():
+    """
+    Question pools and generated questions held in memory (size, bound, hits, evictions).
+    """
+    if not question_selector:
+        raise HTTPException(status_code=500, detail="Question selector not initialized")
+    return question_selector.cache_metrics()
+
+@app.get("/admin/session-cache")
+async def get_session_cache_metrics():
+    """
+    Live session store and historical session cache metrics (size, hit rate, evictions).
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    return session_manager.cache_metrics()
+
+@app.get("/admin/db-pool")
+async def get_db_pool_metrics():
+    """
+    Database connection pool usage (checkouts, peak concurrency, overflow).
+    """
+    return get_pool_metrics()
+
+@app.get("/admin/ai-queue")
+async def get_ai_queue_metrics():
+    """
+    Background AI detection queue: depth, high-water mark, rejected jobs, latency.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    return session_manager.ai_queue_metrics()
+
+@app.get("/admin/recommendation-cache")
+async def get_recommendation_cache_metrics():
+    """
+    Memoized recommendations: in-process size, memory/DB hits, recomputations.
+    """
+    if not recommendation_cache:
+        raise HTTPException(status_code=500, detail="Recommendation cache not initialized")
+    return recommendation_cache.metrics()
+
+@app.get("/admin/event-log")
+async def get_event_log_metrics():
+    """
+    Session event log: appended events, snapshots, sessions rebuilt from history.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    return session_manager.event_log_metrics()
+
+@app.get("/admin/session-events/{session_id}")
+async def get_session_events(session_id: str, until_seq: Optional[int] = None):
+    """
+    Recorded history of a session (oldest first), optionally up to event `until_seq`.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    events = await session_manager.get_session_events_async(session_id, until_seq)
+    if not events:
+        raise HTTPException(status_code=404, detail=f"No events recorded for session {session_id}")
+    return events
+
+@app.get("/admin/write-behind")
+async def get_write_behind_metrics():
+    """
+    Write-behind persistence: buffered writes, commits per batch, commits saved, journal size.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    return session_manager.write_behind_metrics()
+
+@app.get("/admin/drafts")
+async def get_draft_metrics():
+    """
+    Draft autosave: buffered drafts, deltas received and their size, debounced writes.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    return session_manager.drafts_metrics()
+
+@app.get("/admin/telemetry")
+async def get_telemetry_metrics():
+    """
+    Answer telemetry: batches and events ingested, packed vs compressed bytes written.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    return session_manager.telemetry_metrics()
+
+@app.get("/admin/answer-telemetry/{session_id}/{question_index}")
+async def get_answer_telemetry(session_id: str, question_index: int):
+    """
+    Typing features and decoded keystroke/paste/focus events of one answer.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    telemetry = await session_manager.get_answer_telemetry_async(session_id, question_index)
+    if telemetry is None:
+        raise HTTPException(status_code=404, detail=f"No telemetry recorded for answer {question_index} of {session_id}")
+    return telemetry
+
+@app.get("/internal/health")
+async def internal_health(x_internal_token: Optional[str] = Header(None)):
+    """
+    Session router health check.
+    """
+    _check_internal_token(x_internal_token)
+    if not session_manager:
+        raise HTTPException(status_code=503, detail="Session manager not initialized")
+    return {"status": "ok", "live_sessions": session_manager.store.count()}
+
+@app.post("/internal/handoff")
+async def internal_handoff(
+    workers: List[str] = Body(...),
+    node: str = Body(...),
+    vnodes: int = Body(160),
+    x_internal_token: Optional[str] = Header(None)
+):
+    """
+    Session router rebalancing: release the live sessions that `node` (this
+    worker) no longer owns on the ring of `workers`, returning their state.
+    """
+    _check_internal_token(x_internal_token)
+    if not session_manager:
+        raise HTTPException(status_code=503, detail="Session manager not initialized")
+    ring = HashRing(workers, vnodes)
+    sessions = await session_manager.release_sessions_async(lambda session_id: ring.node_for(session_id) == node)
+    return {"sessions": sessions}
+
+@app.post("/internal/adopt")
+async def internal_adopt(sessions: List[Dict] = Body(..., embed=True), x_internal_token: Optional[str] = Header(None)):
+    """
+    Session router rebalancing: take over sessions released by another worker.
+    """
+    _check_internal_token(x_internal_token)
+    if not session_manager:
+        raise HTTPException(status_code=503, detail="Session manager not initialized")
+    return {"adopted": await session_manager.adopt_sessions_async(sessions)}
+
+@app.get("/internal/resume-owner/{token}")
+async def internal_resume_owner(token: str, x_internal_token: Optional[str] = Header(None)):
+    """
+    Session ID of a resume token, so the router can send /resume to the session's worker.
+    """
+    _check_internal_token(x_internal_token)
+    if not session_manager:
+        raise HTTPException(status_code=503, detail="Session manager not initialized")
+    session_id = await session_manager.session_for_resume_token_async(token)
+    if session_id is None:
+        raise HTTPException(status_code=404, detail="Unknown resume token")
+    return {"session_id": session_id}
+
+@app.get("/admin/payload-cache")
+async def get_payload_cache_metrics():
+    """
+    Cached question JSON of session responses: hits, misses, bytes reused.
+    """
+    if not session_payloads:
+        raise HTTPException(status_code=500, detail="Session payload cache not initialized")
+    return session_payloads.metrics()
+
+@app.get("/admin/timeout-scheduler")
+async def get_timeout_scheduler_metrics():
+    """
+    Server-side question deadlines: tracked sessions, heap size, expirations.
+    """
+    if not timeout_scheduler:
+        raise HTTPException(status_code=500, detail="Timeout scheduler not initialized")
+    return timeout_scheduler.metrics()
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+@app.get("/events/session/{session_id}")
+async def stream_session_events(session_id: str):
+    """
+    Server-Sent Events for the candidate screen.
+    Pushes the current question on connect, then question transitions,
+    time-remaining ticks and `finished`.
+    """
+    if not session_manager or not broadcaster:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    try:
+        session = await session_manager.get_session_status_async(session_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    if session.status == SessionStatus.ACTIVE and session.current_question:
+        question = session_manager.question_event(session)
+        broadcaster.publish_question(session_id, question)  # re-arm ticks on this worker
+        initial = [("question", question)]
+    else:
+        initial = [("finished", {"session_id": session_id, "answered": len(session.answers), "total": session.total_questions})]
+    return StreamingResponse(
+        broadcaster.stream(session_topic(session_id), initial),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+@app.get("/admin/events")
+async def stream_admin_events():
+    """
+    Server-Sent Events for the admin panel: session_created, answer_submitted,
+    session_finished and status_updated, instead of reloading /admin/sessions.
+    """
+    if not broadcaster:
+        raise HTTPException(status_code=500, detail="Event broadcaster not initialized")
+    return StreamingResponse(broadcaster.stream(ADMIN_TOPIC), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@app.get("/admin/events/metrics")
+async def get_event_metrics():
+    """
+    Push channel usage: subscribers, events published and delivered, dropped slow clients.
+    """
+    if not broadcaster:
+        raise HTTPException(status_code=500, detail="Event broadcaster not initialized")
+    return broadcaster.metrics()
+
 @app.post("/start-interview", response_model=InterviewSession)
 async def start_interview(
     candidate_id: str = Body(...),
@@ -300,7 +643,9 @@ async def start_interview(
     candidate_email: str = Body(...),
     question_set: QuestionSet = Body(...),
     lang: str = Body("en"),
-    cv_path: str = Body("")
+    cv_path: str = Body(""),
+    x_session_id: Optional[str] = Header(None),
+    x_internal_token: Optional[str] = Header(None)
 ):
     """
     Start a new interview session.
@@ -308,18 +653,96 @@ async def start_interview(
     """
     if not session_manager:
         raise HTTPException(status_code=500, detail="Session manager not initialized")
+    session_id = _routed_session_id(x_session_id, x_internal_token)
     
     try:
-        session = session_manager.create_session(
+        session = await session_manager.create_session_async(
             candidate_id=candidate_id,
             candidate_name=candidate_name,
             candidate_phone=candidate_phone,
             candidate_email=candidate_email,
             question_set=question_set,
             candidate_lang=lang,
-            cv_path=cv_path
+            cv_path=cv_path,
+            session_id=session_id
+        )
+        return session_payloads.response(session)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _check_internal_token(token: Optional[str]):
+    """Internal endpoints answer only the session router (shared ROUTER_INTERNAL_TOKEN)"""
+    expected = settings.ROUTER_INTERNAL_TOKEN
+    if not expected or not token or not hmac.compare_digest(token, expected):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+def _routed_session_id(session_id: Optional[str], token: Optional[str]) -> Optional[str]:
+    """Session ID chosen by the session router, so the session starts on its owner worker"""
+    if session_id is None:
+        return None
+    _check_internal_token(token)
+    try:
+        return str(uuid.UUID(session_id))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid X-Session-Id")
+
+@app.get("/resume/{token}", response_model=InterviewSession)
+async def resume_interview(token: str):
+    """
+    Continue an interrupted interview (browser reload, lost connection).
+    Returns the session with its current question and the time left on it.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+
+    try:
+        return session_payloads.response(await session_manager.resume_session_async(token))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/start-adaptive-interview", response_model=InterviewSession)
+async def start_adaptive_interview(
+    candidate_id: str = Body(...),
+    candidate_name: str = Body(...),
+    candidate_phone: str = Body(...),
+    candidate_email: str = Body(...),
+    level_result: LevelDetectionResult = Body(...),
+    max_questions: int = Body(5),
+    lang: str = Body("en"),
+    cv_path: str = Body(""),
+    x_session_id: Optional[str] = Header(None),
+    x_internal_token: Optional[str] = Header(None)
+):
+    """
+    Start an adaptive interview session.
+    Each next question's difficulty follows the scored previous answer and the
+    technical part stops early once the level estimate is confident.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    session_id = _routed_session_id(x_session_id, x_internal_token)
+    
+    try:
+        session = await session_manager.create_adaptive_session_async(
+            candidate_id=candidate_id,
+            candidate_name=candidate_name,
+            candidate_phone=candidate_phone,
+            candidate_email=candidate_email,
+            level_result=level_result,
+            max_technical_questions=max_questions,
+            candidate_lang=lang,
+            cv_path=cv_path,
+            session_id=session_id
         )
-        return session
+        return session_payloads.response(session)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -335,10 +758,10 @@ async def get_current_question(session_id: str):
         raise HTTPException(status_code=500, detail="Session manager not initialized")
     
     try:
-        question = session_manager.get_current_question(session_id)
+        question = await session_manager.get_current_question_async(session_id)
         if not question:
             raise HTTPException(status_code=404, detail="No active question")
-        return question
+        return FastJSONResponse(question.model_dump(mode="json"))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -349,25 +772,33 @@ async def get_current_question(session_id: str):
 @app.post("/submit-answer/{session_id}")
 async def submit_answer(
     session_id: str,
-    answer_text: str = Body(...)
+    answer_text: str = Body(...),
+    question_index: Optional[int] = None
 ):
     """
     Submit answer for current question.
     Automatically moves to next question or finishes session.
+    Answers over ANSWER_MAX_CHARS get 413: send them to /submit-answer-stream.
     """
     if not session_manager:
         raise HTTPException(status_code=500, detail="Session manager not initialized")
+    if len(answer_text) > settings.ANSWER_MAX_CHARS:
+        raise HTTPException(status_code=413, detail=str(AnswerTooLarge(settings.ANSWER_MAX_CHARS)))
     
     try:
-        answer = session_manager.submit_answer(
+        answer = await session_manager.submit_answer_async(
             session_id=session_id,
-            answer_text=answer_text
+            answer_text=answer_text,
+            question_index=question_index
         )
-        return {
+        return FastJSONResponse({
             "status": "success",
-            "answer": answer,
+            "answer": answer.model_dump(mode="json"),
             "message": "Answer submitted successfully"
-        }
+        })
+    except StaleSessionError as e:
+        # Lost the race against a concurrent submit (e.g. on another worker)
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -375,6 +806,85 @@ async def submit_answer(
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/submit-answer-stream/{session_id}")
+async def submit_answer_stream(session_id: str, request: Request, question_index: Optional[int] = None):
+    """
+    Submit a large (code) answer as a raw UTF-8 body (text/plain, may be chunked).
+    The body is decoded as it arrives, up to ANSWER_STREAM_MAX_CHARS (413 above it),
+    and stored as the answer row without a JSON round trip.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > settings.ANSWER_STREAM_MAX_CHARS * UTF8_MAX_BYTES_PER_CHAR:
+        raise HTTPException(status_code=413, detail=str(AnswerTooLarge(settings.ANSWER_STREAM_MAX_CHARS)))
+
+    try:
+        answer_text = await read_answer_stream(request.stream(), settings.ANSWER_STREAM_MAX_CHARS)
+        answer = await session_manager.submit_answer_async(session_id, answer_text, question_index)
+        return FastJSONResponse({
+            "status": "success",
+            "answer": answer.model_dump(mode="json", exclude={"answer_text"}),  # not echoed back
+            "answer_chars": len(answer_text),
+            "message": "Answer submitted successfully"
+        })
+    except AnswerTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except StaleSessionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/draft/{session_id}")
+async def save_answer_draft(session_id: str, delta: DraftDelta):
+    """
+    Autosave the current answer as a text delta (offset, deleted length, inserted text).
+    409 carries the server's revision and length: resend the whole text as one delta.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+
+    try:
+        return await session_manager.save_draft_async(
+            session_id, delta.question_index, delta.rev, delta.offset, delta.delete, delta.text
+        )
+    except DraftConflict as e:
+        raise HTTPException(status_code=409, detail={"rev": e.rev, "length": e.length})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/telemetry/{session_id}")
+async def record_telemetry(session_id: str, batch: TelemetryBatch):
+    """
+    Batched typing telemetry of the current answer: keystroke intervals,
+    pastes and focus changes since the previous batch.
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+
+    try:
+        await session_manager.record_telemetry_async(session_id, batch)
+        return {"status": "success"}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/draft/{session_id}", response_model=DraftState)
+async def get_answer_draft(session_id: str):
+    """
+    Autosaved draft of the current question (restored after a reload or resume).
+    """
+    if not session_manager:
+        raise HTTPException(status_code=500, detail="Session manager not initialized")
+
+    try:
+        return await session_manager.get_draft_async(session_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
 @app.get("/session-status/{session_id}", response_model=InterviewSession)
 async def get_session_status(session_id: str):
     """
@@ -384,8 +894,8 @@ async def get_session_status(session_id: str):
         raise HTTPException(status_code=500, detail="Session manager not initialized")
     
     try:
-        session = session_manager.get_session_status(session_id)
-        return session
+        session = await session_manager.get_session_status_async(session_id)
+        return session_payloads.response(session)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -402,8 +912,8 @@ async def get_session_summary(session_id: str):
         raise HTTPException(status_code=500, detail="Session manager not initialized")
     
     try:
-        summary = session_manager.get_session_summary(session_id)
-        return summary
+        summary = await session_manager.get_session_summary_async(session_id)
+        return FastJSONResponse(summary.model_dump(mode="json"))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -422,13 +932,15 @@ async def analyze_integrity(session_id: str):
     
     try:
         # 1. Get session summary
-        summary = session_manager.get_session_summary(session_id)
+        summary = await session_manager.get_session_summary_async(session_id)
         
         # 2. Get the session to access question data (difficulty, etc.)
-        session = session_manager.get_session_status(session_id)
+        session = await session_manager.get_session_status_async(session_id)
         
-        # 3. Perform analysis
-        report = integrity_analyzer.analyze_session(summary, session.questions)
+        # 3. Aggregate the per-answer reports stored at submit time (analyzes only missing ones)
+        stored_reports = await session_manager.get_integrity_reports_async(session_id)
+        typing_features = await session_manager.get_typing_features_async(session_id)
+        report = integrity_analyzer.analyze_session(summary, session.questions, stored_reports, typing_features)
         return report
         
     except ValueError as e:
@@ -439,36 +951,49 @@ async def analyze_integrity(session_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/generate-recommendation/{session_id}", response_model=FinalRecommendation)
-async def generate_recommendation(session_id: str):
+async def generate_recommendation(session_id: str, force: bool = False):
     """
     Generate the absolute final HR recommendation.
     Aggregates technical score, integrity flags, and behavior.
+
+    The result is memoized per session version (answers + status changes),
+    analysis version (answers analyzed) and scoring config; repeated calls
+    return it without recomputing or notifying HR again. `force=true`
+    recomputes explicitly.
     """
-    if not all([session_manager, integrity_analyzer, score_engine, recommendation_engine, confidence_analyzer]):
+    if not all([session_manager, integrity_analyzer, score_engine, recommendation_engine, confidence_analyzer, recommendation_cache]):
         raise HTTPException(status_code=500, detail="Engines not initialized")
     
     try:
+        # 0. Memoized result for this version
+        version = await session_manager.get_session_version_async(session_id)
+        analyzed = await session_manager.get_analysis_version_async(session_id)
+        if not force:
+            cached = await recommendation_cache.get(session_id, version, analyzed)
+            if cached:
+                return cached
+
         # 1. Get session summary and technical data
-        summary = session_manager.get_session_summary(session_id)
-        session = session_manager.get_session_status(session_id)
+        summary = await session_manager.get_session_summary_async(session_id)
+        session = await session_manager.get_session_status_async(session_id)
         
-        # 2. Get integrity report (Step 6)
-        integrity_report = integrity_analyzer.analyze_session(summary, session.questions)
+        # 2. Get integrity report (Step 6), aggregated from the stored per-answer reports
+        stored_reports = await session_manager.get_integrity_reports_async(session_id)
+        typing_features = await session_manager.get_typing_features_async(session_id)
+        integrity_report = integrity_analyzer.analyze_session(
+            summary, session.questions, stored_reports, typing_features
+        )
         
         # 3. Get CV Skills to calculate Skills Match
         cv_skills = []
-        db_fetch = SessionLocal()
         try:
-            db_session_fetch = db_fetch.query(models.SessionModel).filter(models.SessionModel.id == session_id).first()
-            candidate_ref = db_fetch.query(models.Candidate).filter(models.Candidate.id == db_session_fetch.candidate_id).first()
-            if candidate_ref and candidate_ref.cv_path:
-                # Re-parse or use cached if we had it, but re-parse is safe
-                cv_analysis = analyzer.analyze(candidate_ref.cv_path)
+            cv_path = await run_async_db(_candidate_cv_path, session_id)
+            if cv_path:
+                # Re-parse or use cached if we had it, but re-parse is safe (file I/O: off the event loop)
+                cv_analysis = await asyncio.to_thread(analyzer.analyze, cv_path)
                 cv_skills = cv_analysis.skills_detected + cv_analysis.inferred_skills
         except Exception as e:
             print(f"Error fetching CV skills for scoring: {e}")
-        finally:
-            db_fetch.close()
 
         # 4. Calculate Confidence early to include in score
         ans_lengths = [len(a.answer_text) for a in summary.answers]
@@ -522,37 +1047,15 @@ async def generate_recommendation(session_id: str):
         )
         
         # 7. Database Persistence
-        db = SessionLocal()
         try:
-            db_session = db.query(models.SessionModel).filter(models.SessionModel.id == session_id).first()
-            candidate = db.query(models.Candidate).filter(models.Candidate.id == db_session.candidate_id).first() if db_session else None
-            
-            if db_session:
-                db_session.score = recommendation.final_score
-                db_session.decision = recommendation.decision
-                db_session.hr_comment = recommendation.hr_comment
-                db_session.confidence = recommendation.confidence
-                db_session.ai_summary = recommendation.metadata.get("integrity_summary", "")
-                db_session.flags = recommendation.flags
-                
-                # Add CV URL to metadata for bot
-                if candidate and candidate.cv_path:
-                    cv_filename = os.path.basename(candidate.cv_path)
-                    recommendation.metadata["cv_url"] = f"https://yourdomain.com/uploads/{cv_filename}" # Replace with actual domain context if available
-                    # Actually, since it's local dev, maybe just the filename for now or a relative path
-                    # But the bot needs an absolute URL to open it.
-                    # For now, let's just pass the filename and let the bot/keyboard handle it if needed
-                    recommendation.metadata["cv_filename"] = cv_filename
-
-                db.commit()
+            await run_async_db(_save_recommendation, recommendation)
         except Exception as e:
-            db.rollback()
             print(f"DB Error while saving recommendation: {e}")
-        finally:
-            db.close()
 
-        # 8. Notify HR via Telegram (Step 8 Integration)
-        if notifier:
+        await recommendation_cache.put(recommendation, version, analyzed)
+
+        # 8. Notify HR via Telegram (Step 8 Integration), once per session version
+        if notifier and await recommendation_cache.claim_notification(session_id, version):
             try:
                 await notifier.notify_new_candidate(recommendation)
             except Exception as e:
@@ -567,6 +1070,33 @@ async def generate_recommendation(session_id: str):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+def _candidate_cv_path(db, session_id: str) -> Optional[str]:
+    db_session = db.query(models.SessionModel).filter(models.SessionModel.id == session_id).first()
+    candidate = db.query(models.Candidate).filter(models.Candidate.id == db_session.candidate_id).first() if db_session else None
+    return candidate.cv_path if candidate else None
+
+def _save_recommendation(db, recommendation: FinalRecommendation):
+    db_session = db.query(models.SessionModel).filter(models.SessionModel.id == recommendation.session_id).first()
+    if not db_session:
+        return
+    candidate = db.query(models.Candidate).filter(models.Candidate.id == db_session.candidate_id).first()
+
+    db_session.score = recommendation.final_score
+    db_session.decision = recommendation.decision
+    db_session.hr_comment = recommendation.hr_comment
+    db_session.confidence = recommendation.confidence
+    db_session.ai_summary = recommendation.metadata.get("integrity_summary", "")
+    db_session.flags = recommendation.flags
+
+    # Add CV URL to metadata for bot
+    if candidate and candidate.cv_path:
+        cv_filename = os.path.basename(candidate.cv_path)
+        recommendation.metadata["cv_url"] = f"https://yourdomain.com/uploads/{cv_filename}" # Replace with actual domain context if available
+        # Actually, since it's local dev, maybe just the filename for now or a relative path
+        # But the bot needs an absolute URL to open it.
+        # For now, let's just pass the filename and let the bot/keyboard handle it if needed
+        recommendation.metadata["cv_filename"] = cv_filename
+
 @app.post("/update-session-status/{session_id}")
 async def update_session_status(
     session_id: str, 
@@ -600,43 +1130,48 @@ async def list_sessions():
     """
     Endpoint for admin to see all sessions from the database.
     """
-    db = SessionLocal()
     try:
-        # Sort by start_time descending (newest first)
-        db_sessions = db.query(models.SessionModel).order_by(models.SessionModel.start_time.desc()).all()
-        
-        results = []
-        for session in db_sessions:
-            candidate = db.query(models.Candidate).filter(models.Candidate.id == session.candidate_id).first()
-            
-            # Use snapshot if available, else fallback to current candidate profile
-            c_name = session.candidate_name if session.candidate_name else (candidate.name if candidate else "Unknown")
-            c_email = session.candidate_email if session.candidate_email else (candidate.email if candidate else "")
-            c_phone = session.candidate_phone if session.candidate_phone else (candidate.phone if candidate else "")
-            
-            results.append({
-                "session_id": session.id,
-                "candidate_name": c_name,
-                "candidate_email": c_email,
-                "candidate_phone": c_phone,
-                "candidate_lang": getattr(session, 'candidate_lang', None) or (candidate.language if candidate else "en"),
-                "status_public": session.status_public,
-                "status_internal": session.status_internal,
-                "score": session.score,
-                "decision": session.decision,
-                "cv_path": candidate.cv_path if candidate else "",
-                "questions": session.questions,
-                "answers": session.answers,
-                "hr_comment": session.hr_comment or "",
-                "flags": session.flags or [],
-                "start_time": session.start_time.isoformat() if session.start_time else ""
-            })
-        return results
+        return FastJSONResponse(await run_async_db(_list_sessions))
     except Exception as e:
         print(f"DB Error while listing sessions: {e}")
         return []
-    finally:
-        db.close()
+
+def _list_sessions(db) -> list:
+    # Sort by start_time descending (newest first)
+    db_sessions = (
+        db.query(models.SessionModel)
+        .options(selectinload(models.SessionModel.answer_rows), selectinload(models.SessionModel.candidate))
+        .order_by(models.SessionModel.start_time.desc())
+        .all()
+    )
+    
+    results = []
+    for session in db_sessions:
+        candidate = session.candidate
+        
+        # Use snapshot if available, else fallback to current candidate profile
+        c_name = session.candidate_name if session.candidate_name else (candidate.name if candidate else "Unknown")
+        c_email = session.candidate_email if session.candidate_email else (candidate.email if candidate else "")
+        c_phone = session.candidate_phone if session.candidate_phone else (candidate.phone if candidate else "")
+        
+        results.append({
+            "session_id": session.id,
+            "candidate_name": c_name,
+            "candidate_email": c_email,
+            "candidate_phone": c_phone,
+            "candidate_lang": getattr(session, 'candidate_lang', None) or (candidate.language if candidate else "en"),
+            "status_public": session.status_public,
+            "status_internal": session.status_internal,
+            "score": session.score,
+            "decision": session.decision,
+            "cv_path": candidate.cv_path if candidate else "",
+            "questions": session.questions,
+            "answers": session.answers_list(),
+            "hr_comment": session.hr_comment or "",
+            "flags": session.flags or [],
+            "start_time": session.start_time.isoformat() if session.start_time else ""
+        })
+    return results
 
 if __name__ == "__main__":
     print(f"SMTP Config Loaded: User={settings.SMTP_USER}, Server={settings.SMTP_SERVER}:{settings.SMTP_PORT}")
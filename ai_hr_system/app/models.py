@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Text, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, JSON, Text, LargeBinary, ForeignKey, Boolean, UniqueConstraint
 from sqlalchemy.orm import relationship
 from .database import Base
 from datetime import datetime
@@ -40,7 +40,7 @@ class SessionModel(Base):
     current_question_index = Column(Integer, default=0)
     
     questions = Column(JSON) # List of dicts
-    answers = Column(JSON)   # List of dicts
+    answers = Column(JSON)   # Legacy: list of dicts, superseded by interview_answers
     
     # Analysis results
     ai_summary = Column(Text, nullable=True)
@@ -51,3 +51,137 @@ class SessionModel(Base):
     flags = Column(JSON, nullable=True)  # List of flags from AI analysis
     
     candidate = relationship("Candidate", back_populates="sessions")
+    answer_rows = relationship("InterviewAnswer", order_by="InterviewAnswer.seq", back_populates="session")
+    resume = relationship("SessionResume", uselist=False, back_populates="session")
+
+    def answers_list(self) -> list:
+        """Answers as dicts: rows of interview_answers, or the legacy JSON column for old sessions"""
+        if self.answer_rows:
+            return [row.to_dict() for row in self.answer_rows]
+        return list(self.answers) if self.answers else []
+
+class InterviewAnswer(Base):
+    """One submitted answer. Append-only: each submit is a single INSERT."""
+    __tablename__ = "interview_answers"
+    __table_args__ = (UniqueConstraint("session_id", "seq", name="uq_interview_answers_session_seq"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(String, ForeignKey("interview_sessions.id"), index=True, nullable=False)
+    question_id = Column(BigInteger)  # generated questions use IDs from 2**40 up
+    seq = Column(Integer, nullable=False)  # 0-based position in the interview
+    answer_text = Column(Text)
+    time_spent = Column(Integer)
+    is_timeout = Column(Boolean, default=False)
+    ai_score = Column(Float, nullable=True)
+    ai_explanation = Column(Text, nullable=True)
+    integrity_report = Column(JSON, nullable=True)  # AnswerIntegrityReport, computed once per answer
+    submitted_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    session = relationship("SessionModel", back_populates="answer_rows")
+
+    def to_dict(self) -> dict:
+        """Same shape as the dicts in the legacy answers JSON column"""
+        return {
+            "question_id": self.question_id,
+            "answer_text": self.answer_text or "",
+            "time_spent": self.time_spent or 0,
+            "submitted_at": self.submitted_at.isoformat() if self.submitted_at else None,
+            "is_timeout": bool(self.is_timeout),
+            "ai_score": self.ai_score,
+            "ai_explanation": self.ai_explanation or ""
+        }
+
+class SessionResume(Base):
+    """
+    Resume token of a session and the start of its current question.
+    Updated with every question transition, so an interrupted interview
+    continues from one indexed read.
+    """
+    __tablename__ = "session_resume"
+
+    token = Column(String, primary_key=True)
+    session_id = Column(String, ForeignKey("interview_sessions.id"), unique=True, index=True, nullable=False)
+    question_index = Column(Integer, default=0, nullable=False)
+    question_started_at = Column(DateTime, nullable=True)  # wall clock
+    timer = Column(JSON, nullable=True)  # Timer.to_state() (monotonic start on the same host)
+    adaptive_state = Column(JSON, nullable=True)  # AdaptiveState of CAT sessions (None: fixed question set)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    session = relationship("SessionModel", back_populates="resume")
+
+class SessionRecommendation(Base):
+    """
+    Memoized FinalRecommendation of a session.
+    Session version = number of answers + status_version; a stored payload is
+    valid while its version_key matches the current version and scoring config.
+    """
+    __tablename__ = "session_recommendations"
+
+    session_id = Column(String, ForeignKey("interview_sessions.id"), primary_key=True)
+    status_version = Column(Integer, default=0, nullable=False)  # bumped on each status change
+    version_key = Column(String, nullable=True)  # "<session version>:<scoring config version>" of payload
+    payload = Column(JSON, nullable=True)
+    notified_key = Column(String, nullable=True)  # version_key HR was notified about
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class SessionEvent(Base):
+    """
+    Append-only interview session history (SessionCreated, QuestionStarted,
+    AnswerSubmitted, TimedOut, Finished, StatusChanged).
+    Session state is a fold over these events; rows are never updated.
+    """
+    __tablename__ = "session_events"
+    __table_args__ = (UniqueConstraint("session_id", "seq", name="uq_session_events_session_seq"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(String, index=True, nullable=False)
+    seq = Column(Integer, nullable=False)  # 0-based position in the session's history
+    type = Column(String, nullable=False)
+    data = Column(JSON)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class SessionSnapshot(Base):
+    """Folded session state up to event `seq`; hydration replays only the events after it"""
+    __tablename__ = "session_snapshots"
+
+    session_id = Column(String, primary_key=True)
+    seq = Column(Integer, nullable=False)
+    state = Column(JSON)  # InterviewSession
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class WriteBehindCheckpoint(Base):
+    """Last write-behind journal entry committed to the database (entries after it are replayed on start)"""
+    __tablename__ = "write_behind_checkpoints"
+
+    journal = Column(String, primary_key=True)  # journal file path
+    seq = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class AnswerDraft(Base):
+    """
+    Autosaved, not yet submitted answer text of a session's current question.
+    Written by the debounced draft flusher; removed when the answer is submitted.
+    """
+    __tablename__ = "answer_drafts"
+
+    session_id = Column(String, ForeignKey("interview_sessions.id"), primary_key=True)
+    question_index = Column(Integer, nullable=False)
+    text = Column(Text, default="")
+    rev = Column(Integer, default=0, nullable=False)  # deltas applied so far
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class AnswerTelemetry(Base):
+    """
+    Typing telemetry of one answer as zlib-compressed packed arrays
+    (see app/answer_analysis/telemetry.py), with the features derived from it.
+    """
+    __tablename__ = "answer_telemetry"
+
+    session_id = Column(String, ForeignKey("interview_sessions.id"), primary_key=True)
+    question_index = Column(Integer, primary_key=True)
+    keys = Column(LargeBinary)  # uint16 ms between keystrokes
+    pastes = Column(LargeBinary)  # uint32 pairs: (ms since question start, pasted length)
+    focus = Column(LargeBinary)  # uint32 pairs: (ms since question start, 0 blur / 1 focus)
+    features = Column(JSON)  # TypingFeatures
+    updated_at = Column(DateTime, default=datetime.utcnow)
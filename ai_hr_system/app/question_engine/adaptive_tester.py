@@ -0,0 +1,211 @@
+from app.question_engine.question_selector import QuestionSelector
+from app.question_engine.schemas import Question, DifficultyLevel, AdaptiveState
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.scoring.score_engine import ScoreEngine
+from app.interview_flow.schemas import Answer
+from typing import Dict, List, Optional, Tuple
+import math
+import random
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveTester:
+    """
+    Computerized adaptive testing (CAT) for the technical part of the interview.
+
+    The candidate ability is tracked as a posterior over the three seniority levels.
+    Each answer is scored with ScoreEngine knowledge scoring and treated as partial
+    credit in a Rasch (1PL IRT) model. The next question uses the difficulty with the
+    highest expected Fisher information, and the technical part stops as soon as the
+    level estimate is confident enough.
+    """
+
+    # Ability (theta) per level and difficulty (b) per question level on the same scale
+    LEVEL_ABILITY = {
+        CandidateLevel.JUNIOR.value: -1.0,
+        CandidateLevel.MIDDLE.value: 0.0,
+        CandidateLevel.SENIOR.value: 1.0
+    }
+    DIFFICULTY_PARAM = {
+        DifficultyLevel.EASY: -1.0,
+        DifficultyLevel.MEDIUM: 0.0,
+        DifficultyLevel.HARD: 1.0
+    }
+    DISCRIMINATION = 2.0
+
+    def __init__(
+        self,
+        question_selector: QuestionSelector,
+        score_engine: ScoreEngine,
+        confidence_threshold: float = 0.85,
+        min_technical_questions: int = 2,
+        soft_skills_questions: int = 3
+    ):
+        self.selector = question_selector
+        self.score_engine = score_engine
+        self.confidence_threshold = confidence_threshold
+        self.min_technical_questions = min_technical_questions
+        self.soft_skills_questions = soft_skills_questions
+
+    def start(
+        self,
+        level_result: LevelDetectionResult,
+        max_technical_questions: int = 5,
+        lang: str = "en"
+    ) -> Tuple[AdaptiveState, Optional[Question]]:
+        """
+        Build the initial state from the CV-based level and pick the first question.
+        """
+        seen = set()
+        skills = []
+        for s in (level_result.skills or []):
+            sl = (s or "").lower().strip()
+            if sl and sl not in seen:
+                seen.add(sl)
+                skills.append(sl)
+        skills = skills[:10]
+        random.shuffle(skills)
+
+        # Prior: CV-detected level is the most likely one, neighbours share the rest
+        prior = {level: 0.25 for level in self.LEVEL_ABILITY}
+        prior[level_result.level.value] = 0.5
+        total = sum(prior.values())
+        prior = {level: p / total for level, p in prior.items()}
+
+        state = AdaptiveState(
+            lang=lang,
+            skills=skills,
+            posterior=prior,
+            max_technical_questions=max_technical_questions,
+            soft_skills_questions=self.soft_skills_questions
+        )
+        self._update_estimate(state)
+        if not skills:
+            self._finish_technical(state, "no_skills")
+
+        return state, self.next_question(state)
+
+    def record_answer(self, state: AdaptiveState, question: Dict, answer: Answer) -> float:
+        """
+        Update the ability posterior with a scored answer.
+        Soft-skill answers do not affect the technical level estimate.
+
+        Returns:
+            Knowledge score (0-100) of the answer
+        """
+        if question.get("skill") == "soft_skills":
+            return 0.0
+
+        knowledge, _ = self.score_engine.score_answer(answer, question)
+        credit = max(0.0, min(1.0, knowledge / 100.0))
+        b = self.DIFFICULTY_PARAM.get(DifficultyLevel(question.get("difficulty", "medium")), 0.0)
+
+        posterior = {}
+        for level, p in state.posterior.items():
+            prob = self._p_correct(self.LEVEL_ABILITY[level], b)
+            # Partial-credit likelihood: P^x * (1-P)^(1-x)
+            posterior[level] = p * (prob ** credit) * ((1.0 - prob) ** (1.0 - credit))
+        total = sum(posterior.values()) or 1.0
+        state.posterior = {level: p / total for level, p in posterior.items()}
+        self._update_estimate(state)
+
+        logger.info(
+            f"[ADAPTIVE] q={question.get('id')} difficulty={question.get('difficulty')} "
+            f"knowledge={knowledge:.1f} level={state.estimated_level} confidence={state.confidence:.2f}"
+        )
+
+        if state.technical_asked >= self.min_technical_questions and state.confidence >= self.confidence_threshold:
+            self._finish_technical(state, "confidence_reached")
+        elif state.technical_asked >= state.max_technical_questions:
+            self._finish_technical(state, "max_questions")
+
+        return knowledge
+
+    def next_question(self, state: AdaptiveState) -> Optional[Question]:
+        """
+        Pick the next question: most informative difficulty while the technical
+        part runs, then the queued soft-skill questions.
+        """
+        if not state.technical_finished:
+            question = self._next_technical_question(state)
+            if question:
+                state.technical_asked += 1
+                return question
+            self._finish_technical(state, "bank_exhausted")
+
+        if state.pending_questions:
+            return Question(**state.pending_questions.pop(0))
+        return None
+
+    def estimate(self, state: AdaptiveState) -> Tuple[CandidateLevel, float]:
+        """Current level estimate and its confidence"""
+        return CandidateLevel(state.estimated_level), state.confidence
+
+    def _next_technical_question(self, state: AdaptiveState) -> Optional[Question]:
+        difficulty = self._most_informative_difficulty(state)
+        distribution = self.selector.level_distribution[CandidateLevel(state.estimated_level)]
+
+        # Round-robin over skills so one skill does not dominate the interview
+        for offset in range(len(state.skills)):
+            skill = state.skills[(state.technical_asked + offset) % len(state.skills)]
+            candidates = self.selector._select_questions_for_skill(
+                skill=skill,
+                difficulty=difficulty,
+                theory_ratio=distribution["theory_ratio"],
+                max_questions=3,
+                lang=state.lang
+            )
+            for q in candidates:
+                key = self._question_key(q)
+                if key not in state.asked_keys:
+                    state.asked_keys.append(key)
+                    return q
+        return None
+
+    def _most_informative_difficulty(self, state: AdaptiveState) -> DifficultyLevel:
+        """Difficulty with maximum expected Fisher information under the posterior"""
+        best, best_info = DifficultyLevel.MEDIUM, -1.0
+        for difficulty, b in self.DIFFICULTY_PARAM.items():
+            info = 0.0
+            for level, p in state.posterior.items():
+                prob = self._p_correct(self.LEVEL_ABILITY[level], b)
+                info += p * (self.DISCRIMINATION ** 2) * prob * (1.0 - prob)
+            if info > best_info:
+                best, best_info = difficulty, info
+        return best
+
+    def _finish_technical(self, state: AdaptiveState, reason: str):
+        """Stop the technical part and queue soft-skill questions for the estimated level"""
+        if state.technical_finished:
+            return
+        state.technical_finished = True
+        state.stop_reason = reason
+
+        if state.soft_skills_questions > 0:
+            difficulty = self.selector.level_difficulty_map[CandidateLevel(state.estimated_level)]
+            soft = self.selector._select_questions_for_skill(
+                skill="soft_skills",
+                difficulty=difficulty,
+                theory_ratio=0.5,
+                max_questions=state.soft_skills_questions,
+                lang=state.lang
+            )
+            state.pending_questions = [q.model_dump(mode="json") for q in soft]
+
+        logger.info(
+            f"[ADAPTIVE] technical_finished reason={reason} asked={state.technical_asked} "
+            f"level={state.estimated_level} confidence={state.confidence:.2f}"
+        )
+
+    def _update_estimate(self, state: AdaptiveState):
+        level, confidence = max(state.posterior.items(), key=lambda item: item[1])
+        state.estimated_level = level
+        state.confidence = round(confidence, 4)
+
+    def _p_correct(self, theta: float, b: float) -> float:
+        return 1.0 / (1.0 + math.exp(-self.DISCRIMINATION * (theta - b)))
+
+    @staticmethod
+    def _question_key(q: Question) -> str:
+        return f"{q.skill.lower().strip()}|{q.question.strip()}|{q.difficulty.value}|{q.type.value}"
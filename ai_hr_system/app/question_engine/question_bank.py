@@ -1,4 +1,5 @@
 from app.question_engine.schemas import Question, QuestionType, DifficultyLevel
+from app.question_engine.question_generator import GENERATED_ID_BASE
 from typing import List, Dict
 
 class QuestionBank:
@@ -326,11 +327,17 @@ class QuestionBank:
     
     def _build_indexes(self):
         """Build indexes for fast lookup"""
+        self.by_id: Dict[int, Question] = {}
         self.by_skill: Dict[str, List[Question]] = {}
         self.by_difficulty: Dict[DifficultyLevel, List[Question]] = {}
         self.by_type: Dict[QuestionType, List[Question]] = {}
         
         for question in self.questions:
+            # Bank IDs must be unique and stay below the generated-question namespace
+            if question.id in self.by_id or question.id >= GENERATED_ID_BASE:
+                raise ValueError(f"Invalid question bank ID: {question.id}")
+            self.by_id[question.id] = question
+
             # Index by skill
             skill_lower = question.skill.lower()
             if skill_lower not in self.by_skill:
@@ -1,11 +1,28 @@
 from app.question_engine.schemas import Question, QuestionType, DifficultyLevel
-from typing import List
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import random
+import threading
+
+# Generated questions get content-hash IDs in their own namespace above the static bank,
+# so IDs are stable across processes/restarts and never collide with bank IDs.
+GENERATED_ID_BITS = 40
+GENERATED_ID_BASE = 1 << GENERATED_ID_BITS
 
 class QuestionGenerator:
     """
     AI-based question generator for fallback when question bank doesn't have suitable questions.
     Uses template-based generation (no external LLM required).
     """
+
+    # Upper bound on cached questions (skills come from free-form CV text)
+    CACHE_MAX = 4096
+
+    # Process-wide LRU of generated questions and their RU templates, keyed by content-hash ID
+    _cache: "OrderedDict[int, Tuple[Question, str]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    _cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
     
     def __init__(self):
         # Question templates by difficulty and type
@@ -47,15 +64,81 @@ class QuestionGenerator:
                 ]
             }
         }
-        
-        self.next_id = 1000  # Start generated questions from ID 1000
+
+    @staticmethod
+    def make_question_id(
+        skill: str,
+        difficulty: DifficultyLevel,
+        question_type: QuestionType,
+        lang: str,
+        text: str
+    ) -> int:
+        """
+        Deterministic ID for a generated question.
+        The same content always maps to the same ID, in any process.
+        """
+        key = f"{skill.lower().strip()}|{difficulty.value}|{question_type.value}|{lang}|{text.strip()}"
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        return GENERATED_ID_BASE + (int.from_bytes(digest, "big") & (GENERATED_ID_BASE - 1))
+
+    @staticmethod
+    def is_generated_id(question_id: int) -> bool:
+        """True if the ID belongs to the generated-question namespace"""
+        return question_id >= GENERATED_ID_BASE
+
+    @classmethod
+    def get_cached(cls, question_id: int) -> Optional[Question]:
+        """Look up a previously generated question by ID (None once evicted)"""
+        entry = cls._lookup(question_id)
+        return entry[0].model_copy(deep=True) if entry else None
+
+    @classmethod
+    def template_for(cls, question_id: int) -> Optional[str]:
+        """RU template a generated question was built from (None once evicted)"""
+        entry = cls._lookup(question_id)
+        return entry[1] if entry else None
+
+    @classmethod
+    def _lookup(cls, question_id: int) -> Optional[Tuple[Question, str]]:
+        with cls._cache_lock:
+            entry = cls._cache.get(question_id)
+            if entry is None:
+                cls._cache_stats["misses"] += 1
+                return None
+            cls._cache.move_to_end(question_id)
+            cls._cache_stats["hits"] += 1
+            return entry
+
+    @classmethod
+    def _remember(cls, question: Question, template_ru: str) -> Question:
+        """Cache a generated question; the one already cached under its ID wins"""
+        with cls._cache_lock:
+            entry = cls._cache.get(question.id)
+            if entry is None:
+                entry = cls._cache[question.id] = (question, template_ru)
+                while len(cls._cache) > cls.CACHE_MAX:
+                    cls._cache.popitem(last=False)
+                    cls._cache_stats["evictions"] += 1
+            else:
+                cls._cache.move_to_end(question.id)
+            return entry[0]
+
+    @classmethod
+    def cache_metrics(cls) -> Dict:
+        with cls._cache_lock:
+            return {"size": len(cls._cache), "max": cls.CACHE_MAX, **cls._cache_stats}
+
+    def all_templates(self) -> List[str]:
+        """All RU templates, across difficulties and types"""
+        return [t for by_type in self.templates.values() for group in by_type.values() for t in group]
     
     def generate_question(
         self,
         skill: str,
         difficulty: DifficultyLevel,
         question_type: QuestionType,
-        lang: str = "ru"
+        lang: str = "ru",
+        template_ru: Optional[str] = None
     ) -> Question:
         """
         Generate a question for a specific skill, difficulty, and type.
@@ -66,8 +149,8 @@ class QuestionGenerator:
         templates = self.templates[difficulty][question_type]
         
         # Select a random template
-        import random
-        template_ru = random.choice(templates)
+        if template_ru is None:
+            template_ru = random.choice(templates)
         
         # Translate template
         template = Translator.translate(template_ru, lang)
@@ -75,6 +158,11 @@ class QuestionGenerator:
         # Format with skill name
         skill_translated = Translator.translate(skill, lang)
         question_text = template.format(skill=skill_translated.capitalize())
+
+        question_id = self.make_question_id(skill, difficulty, question_type, lang, question_text)
+        cached = self.get_cached(question_id)
+        if cached:
+            return cached
         
         # Generate expected topics based on skill
         expected_topics_ru = self._generate_expected_topics(skill, difficulty)
@@ -82,7 +170,7 @@ class QuestionGenerator:
         
         # Create question
         question = Question(
-            id=self.next_id,
+            id=question_id,
             skill=skill,
             difficulty=difficulty,
             type=question_type,
@@ -90,9 +178,8 @@ class QuestionGenerator:
             lang=lang,
             expected_topics=expected_topics
         )
-        
-        self.next_id += 1
-        return question
+
+        return self._remember(question, template_ru).model_copy(deep=True)
     
     def generate_questions(
         self,
@@ -103,6 +190,8 @@ class QuestionGenerator:
     ) -> List[Question]:
         """
         Generate multiple questions for a skill.
+        Always returns `count` questions; they are distinct while there are
+        unused templates of the type, repeats only come after that.
         """
         questions = []
         
@@ -110,15 +199,15 @@ class QuestionGenerator:
         num_theory = count // 2
         num_case = count - num_theory
         
-        for _ in range(num_theory):
-            questions.append(
-                self.generate_question(skill, difficulty, QuestionType.THEORY, lang=lang)
-            )
-        
-        for _ in range(num_case):
-            questions.append(
-                self.generate_question(skill, difficulty, QuestionType.CASE, lang=lang)
-            )
+        for question_type, num in ((QuestionType.THEORY, num_theory), (QuestionType.CASE, num_case)):
+            # Distinct templates first, so a call does not repeat a question it can avoid
+            templates = self.templates[difficulty][question_type]
+            picks = random.sample(templates, min(num, len(templates)))
+            picks += [random.choice(templates) for _ in range(num - len(picks))]
+            for template_ru in picks:
+                questions.append(
+                    self.generate_question(skill, difficulty, question_type, lang=lang, template_ru=template_ru)
+                )
         
         return questions
     
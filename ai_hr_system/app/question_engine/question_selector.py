@@ -3,9 +3,10 @@ from app.question_engine.question_generator import QuestionGenerator
 from app.question_engine.schemas import Question, QuestionType, DifficultyLevel, QuestionSet
 from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
 from app.utils.translator import Translator
-from typing import List
+from typing import Dict, List, Tuple
 import random
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +14,18 @@ class QuestionSelector:
     """
     Intelligently selects interview questions based on candidate skills and level.
     """
+
+    # Upper bound on cached pools (skills come from free-form CV text)
+    POOL_CACHE_MAX = 4096
     
     def __init__(self):
         self.question_bank = QuestionBank()
         self.generator = QuestionGenerator()
+        # Optional QuestionEmbeddingIndex for semantic near-duplicate suppression
+        self.semantic_index = None
+        # Fully translated/formatted candidate pools per (skill, difficulty, lang)
+        self.pool_cache: Dict[Tuple[str, DifficultyLevel, str], List[Question]] = {}
+        self._pool_lock = threading.Lock()
         
         # Question distribution by level
         self.level_distribution = {
@@ -107,6 +116,10 @@ class QuestionSelector:
             deduped.append(q)
         selected_questions = deduped
 
+        # Drop paraphrases/translations of the same question (precomputed embeddings, no encoding here)
+        if self.semantic_index:
+            selected_questions = self.semantic_index.filter_near_duplicates(selected_questions)
+
         # Limit total technical questions (after dedupe)
         if len(selected_questions) > max_total_questions:
             selected_questions = random.sample(selected_questions, max_total_questions)
@@ -125,6 +138,8 @@ class QuestionSelector:
             key = (q.skill.lower().strip(), q.question.strip(), str(q.difficulty), str(q.type))
             if key in seen:
                 continue
+            if self.semantic_index and self.semantic_index.is_near_duplicate(q, selected_questions):
+                continue
             seen.add(key)
             selected_questions.append(q)
         # ---------------------------------------------------------
@@ -141,24 +156,63 @@ class QuestionSelector:
             total_questions=len(selected_questions)
         )
     
-    def _select_questions_for_skill(
-        self,
-        skill: str,
-        difficulty: DifficultyLevel,
-        theory_ratio: float,
-        max_questions: int,
-        lang: str = "en"
-    ) -> List[Question]:
+    def build_semantic_index(self, model, threshold: float = 0.88):
         """
-        Select questions for a specific skill with fallback logic.
+        Precompute embeddings of all bank and template questions with the given
+        SentenceTransformer model and enable semantic de-duplication.
+        """
+        from app.question_engine.semantic_index import QuestionEmbeddingIndex
+        self.semantic_index = QuestionEmbeddingIndex.build(
+            model, self.question_bank, self.generator, threshold=threshold
+        )
+        return self.semantic_index
+
+    def get_question_pool(self, skill: str, difficulty: DifficultyLevel, lang: str = "en") -> List[Question]:
+        """
+        All candidate questions for (skill, difficulty, lang), translated and formatted.
+        Pools are built once and cached; callers must not mutate the returned questions.
+        """
+        key = (skill.lower().strip(), difficulty, lang)
+        pool = self.pool_cache.get(key)
+        if pool is None:
+            pool, _ = self._build_question_pool(key[0], difficulty, lang)
+            with self._pool_lock:
+                if len(self.pool_cache) < self.POOL_CACHE_MAX:
+                    pool = self.pool_cache.setdefault(key, pool)
+        return pool
+
+    def cache_metrics(self) -> Dict:
+        """Sizes of the pool cache and of the generated-question cache"""
+        return {
+            "pools": len(self.pool_cache),
+            "pools_max": self.POOL_CACHE_MAX,
+            "generated": QuestionGenerator.cache_metrics()
+        }
+
+    def warm_pool(self, skill: str, difficulty: DifficultyLevel, lang: str = "en") -> Tuple[int, str]:
         """
+        Materialize a pool ahead of time.
+
+        Returns:
+            (pool size, source) where source is bank/translated/generator
+        """
+        key = (skill.lower().strip(), difficulty, lang)
+        pool, source = self._build_question_pool(key[0], difficulty, lang)
+        with self._pool_lock:
+            self.pool_cache[key] = pool
+        return len(pool), source
+
+    def _build_question_pool(self, skill: str, difficulty: DifficultyLevel, lang: str) -> Tuple[List[Question], str]:
+        """Bank questions in target lang, else translated RU questions, else generated ones"""
         # 1. Try to get available questions for this skill and difficulty in target lang
         available_questions = self.question_bank.get_questions_by_skill_difficulty_lang(
             skill, difficulty, lang
         )
+        if available_questions:
+            return list(available_questions), "bank"
         
         # 2. Fallback to RU if no questions in target lang
-        if not available_questions and lang != "ru":
+        if lang != "ru":
             logger.info(f"[LANG={lang}] No questions for {skill} in bank. Fallback to RU")
             ru_questions = self.question_bank.get_questions_by_skill_difficulty_lang(
                 skill, difficulty, "ru"
@@ -166,24 +220,38 @@ class QuestionSelector:
             if ru_questions:
                 # Translate RU questions to target lang
                 available_questions = []
+                skill_translated = Translator.translate(skill, lang)
                 for q in ru_questions:
-                    translated_q = q.copy()
+                    translated_q = q.model_copy()
                     translated_q.question = Translator.translate(q.question, lang)
                     # Also replace placeholders
-                    skill_translated = Translator.translate(skill, lang)
                     translated_q.question = translated_q.question.format(skill=skill_translated.capitalize())
                     translated_q.lang = lang
                     available_questions.append(translated_q)
+                return available_questions, "translated"
         
-        # 3. Fallback to Generator if still no questions
-        if not available_questions:
-            logger.info(f"[LANG={lang}] Still no questions for {skill}. Using Generator")
-            available_questions = self.generator.generate_questions(
-                skill=skill,
-                difficulty=difficulty,
-                count=max_questions,
-                lang=lang
-            )
+        # 3. Fallback to Generator if still no questions: every template, both types
+        logger.info(f"[LANG={lang}] Still no questions for {skill}. Using Generator")
+        available_questions = []
+        for question_type in (QuestionType.THEORY, QuestionType.CASE):
+            for template_ru in self.generator.templates[difficulty][question_type]:
+                available_questions.append(self.generator.generate_question(
+                    skill, difficulty, question_type, lang=lang, template_ru=template_ru
+                ))
+        return available_questions, "generator"
+
+    def _select_questions_for_skill(
+        self,
+        skill: str,
+        difficulty: DifficultyLevel,
+        theory_ratio: float,
+        max_questions: int,
+        lang: str = "en"
+    ) -> List[Question]:
+        """
+        Select questions for a specific skill with fallback logic.
+        """
+        available_questions = self.get_question_pool(skill, difficulty, lang)
         
         # Separate by type
         theory_questions = [q for q in available_questions if q.type == QuestionType.THEORY]
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Dict
 from pydantic import BaseModel
 from enum import Enum
 
@@ -29,3 +29,26 @@ class QuestionSet(BaseModel):
     candidate_level: str
     questions: List[Question]
     total_questions: int
+
+class AdaptiveState(BaseModel):
+    """Running state of an adaptive (CAT) interview"""
+    lang: str = "en"
+    skills: List[str] = []
+    posterior: Dict[str, float] = {}  # CandidateLevel value -> probability
+    technical_asked: int = 0
+    max_technical_questions: int = 5
+    soft_skills_questions: int = 3
+    asked_keys: List[str] = []
+    pending_questions: List[Dict] = []
+    technical_finished: bool = False
+    stop_reason: Optional[str] = None
+    estimated_level: Optional[str] = None
+    confidence: float = 0.0
+
+class WarmupReport(BaseModel):
+    """What the startup warm-up materialized"""
+    sessions_analyzed: int = 0
+    combinations_found: int = 0
+    warmed: List[Dict] = []  # {skill, difficulty, lang, occurrences, pool_size, source}
+    skipped_by_budget: int = 0
+    elapsed_ms: float = 0.0
@@ -0,0 +1,109 @@
+from app.question_engine.question_bank import QuestionBank
+from app.question_engine.question_generator import QuestionGenerator
+from app.question_engine.schemas import Question
+from app.utils.translator import Translator
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+class QuestionEmbeddingIndex:
+    """
+    Precomputed embeddings of every bank question and generator template.
+
+    All vectors are L2-normalized and stored in one float32 matrix, so a
+    near-duplicate check is a small matrix product with no encoder call
+    on the request path.
+    """
+
+    LANGS = ("ru", "en", "uz")
+
+    def __init__(self, keys: Dict[Tuple, int], matrix: np.ndarray, threshold: float = 0.88):
+        self.keys = keys
+        self.matrix = matrix
+        self.threshold = threshold
+
+    @classmethod
+    def build(
+        cls,
+        model,
+        question_bank: QuestionBank,
+        generator: QuestionGenerator,
+        threshold: float = 0.88
+    ) -> "QuestionEmbeddingIndex":
+        """
+        Encode all bank questions (in every language they can be served in)
+        and all generator templates with the given SentenceTransformer model.
+        """
+        keys: Dict[Tuple, int] = {}
+        texts: List[str] = []
+
+        def add(key: Tuple, text: str):
+            if key not in keys:
+                keys[key] = len(texts)
+                texts.append(text)
+
+        for q in question_bank.questions:
+            add(("bank", q.id, q.lang), q.question)
+            # RU questions are translated on the fly when a language has no bank entries
+            if q.lang == "ru":
+                for lang in cls.LANGS:
+                    add(("bank", q.id, lang), Translator.translate(q.question, lang))
+
+        for template_ru in generator.all_templates():
+            for lang in cls.LANGS:
+                add(("template", template_ru, lang), Translator.translate(template_ru, lang))
+
+        embeddings = model.encode(texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True)
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+        logger.info(f"[SEMANTIC] indexed {len(texts)} questions, matrix={matrix.shape} ({matrix.nbytes} bytes)")
+        return cls(keys, matrix, threshold=threshold)
+
+    def row_for(self, question: Question) -> Optional[int]:
+        """Matrix row of a question, or None if it was never indexed"""
+        if QuestionGenerator.is_generated_id(question.id):
+            template_ru = QuestionGenerator.template_for(question.id)
+            return self.keys.get(("template", template_ru, question.lang)) if template_ru else None
+        return self.keys.get(("bank", question.id, question.lang))
+
+    def filter_near_duplicates(self, questions: List[Question]) -> List[Question]:
+        """
+        Keep questions in order, dropping any that is a near-duplicate of an earlier one.
+        """
+        kept: List[Question] = []
+        for q in questions:
+            if not self.is_near_duplicate(q, kept):
+                kept.append(q)
+        return kept
+
+    def is_near_duplicate(self, question: Question, selected: List[Question]) -> bool:
+        """True if `question` is semantically too close to any already selected question"""
+        row = self.row_for(question)
+        if row is None or not selected:
+            return False
+
+        rows, others = [], []
+        for other in selected:
+            other_row = self.row_for(other)
+            # Templates are skill-agnostic: the same template is only a duplicate within one skill
+            if other_row is None or (
+                other.skill.lower() != question.skill.lower()
+                and (QuestionGenerator.is_generated_id(other.id) or QuestionGenerator.is_generated_id(question.id))
+            ):
+                continue
+            rows.append(other_row)
+            others.append(other)
+        if not rows:
+            return False
+
+        similarities = self.matrix[rows] @ self.matrix[row]
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            logger.info(
+                f"[SEMANTIC] near-duplicate dropped: q={question.id} ~ q={others[best].id} "
+                f"(cos={float(similarities[best]):.2f})"
+            )
+            return True
+        return False
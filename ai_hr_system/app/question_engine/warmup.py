@@ -0,0 +1,98 @@
+from app.question_engine.question_selector import QuestionSelector
+from app.question_engine.schemas import DifficultyLevel, WarmupReport
+from app.database import SessionLocal
+from app.models import SessionModel
+from collections import Counter
+from typing import Tuple
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class QuestionPoolWarmer:
+    """
+    Startup warm-up for the question engine.
+
+    Reads the questions of recent interview sessions, finds the most common
+    (skill, difficulty, lang) combinations and materializes their translated,
+    formatted pools in QuestionSelector before the first request arrives.
+    """
+
+    def __init__(
+        self,
+        question_selector: QuestionSelector,
+        top_n: int = 30,
+        time_budget_ms: int = 2000,
+        lookback_sessions: int = 500
+    ):
+        self.selector = question_selector
+        self.top_n = top_n
+        self.time_budget_ms = time_budget_ms
+        self.lookback_sessions = lookback_sessions
+
+    def analyze_recent_sessions(self, db=None) -> Tuple[Counter, int]:
+        """
+        Count (skill, difficulty, lang) combinations over the most recent sessions.
+
+        Returns:
+            (Counter of combinations, number of sessions analyzed)
+        """
+        own_db = db is None
+        db = db or SessionLocal()
+        try:
+            rows = (
+                db.query(SessionModel.questions, SessionModel.candidate_lang)
+                .order_by(SessionModel.start_time.desc())
+                .limit(self.lookback_sessions)
+                .all()
+            )
+        finally:
+            if own_db:
+                db.close()
+
+        combos = Counter()
+        for questions, session_lang in rows:
+            for q in questions or []:
+                try:
+                    skill = (q.get("skill") or "").lower().strip()
+                    difficulty = DifficultyLevel(q.get("difficulty"))
+                except (AttributeError, ValueError):
+                    continue
+                if skill:
+                    combos[(skill, difficulty, q.get("lang") or session_lang or "en")] += 1
+        return combos, len(rows)
+
+    def warm(self, db=None) -> WarmupReport:
+        """Materialize pools for the top-N combinations within the time budget"""
+        started = time.perf_counter()
+        report = WarmupReport()
+
+        try:
+            combos, report.sessions_analyzed = self.analyze_recent_sessions(db)
+        except Exception as e:
+            logger.warning(f"[WARMUP] could not read recent sessions: {e}")
+            combos = Counter()
+        report.combinations_found = len(combos)
+
+        top = combos.most_common(self.top_n)
+        for i, ((skill, difficulty, lang), occurrences) in enumerate(top):
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if elapsed_ms > self.time_budget_ms:
+                report.skipped_by_budget = len(top) - i
+                break
+            pool_size, source = self.selector.warm_pool(skill, difficulty, lang)
+            report.warmed.append({
+                "skill": skill,
+                "difficulty": difficulty.value,
+                "lang": lang,
+                "occurrences": occurrences,
+                "pool_size": pool_size,
+                "source": source
+            })
+
+        report.elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        logger.info(
+            f"[WARMUP] sessions={report.sessions_analyzed} combinations={report.combinations_found} "
+            f"warmed={len(report.warmed)} skipped={report.skipped_by_budget} elapsed={report.elapsed_ms}ms"
+        )
+        return report
@@ -0,0 +1,59 @@
+from bisect import bisect
+from typing import Dict, Iterable, List, Optional
+import hashlib
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+class HashRing:
+    """
+    Consistent hashing of session IDs onto workers.
+
+    Each worker owns `vnodes` points on a 64-bit ring; a key belongs to the
+    first point clockwise from its hash. Adding or removing one of N workers
+    moves only ~1/N of the keys, and only to or from that worker.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: int = 160):
+        self.vnodes = max(1, vnodes)
+        self._points: List[int] = []
+        self._owners: Dict[int, str] = {}
+        self._nodes: List[str] = []
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._nodes)
+
+    def add(self, node: str):
+        if node in self._nodes:
+            return
+        self._nodes.append(node)
+        for i in range(self.vnodes):
+            point = _hash(f"{node}#{i}")
+            if point not in self._owners:
+                self._owners[point] = node
+        self._points = sorted(self._owners)
+
+    def remove(self, node: str):
+        if node not in self._nodes:
+            return
+        self._nodes.remove(node)
+        self._owners = {point: owner for point, owner in self._owners.items() if owner != node}
+        self._points = sorted(self._owners)
+
+    def node_for(self, key: str) -> Optional[str]:
+        if not self._points:
+            return None
+        i = bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[self._points[i]]
+
+    def copy(self) -> "HashRing":
+        return HashRing(self._nodes, self.vnodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._nodes
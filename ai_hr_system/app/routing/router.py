@@ -0,0 +1,398 @@
+from app.routing.hash_ring import HashRing
+from app.interview_flow.answer_upload import AnswerTooLarge, JSON_BYTES_PER_CHAR, JSON_OVERHEAD_BYTES, UTF8_MAX_BYTES_PER_CHAR
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+import asyncio
+import itertools
+import json
+import re
+import uuid
+import hmac
+import logging
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Paths that carry a session ID: always served by the worker owning that session
+SESSION_PATH = re.compile(
+    r"^/(?:current-question|submit-answer|submit-answer-stream|session-status|session-summary|analyze-integrity|"
+    r"generate-recommendation|update-session-status|events/session|draft|telemetry|"
+    r"admin/session-events|admin/answer-telemetry)/([^/?]+)"
+)
+RESUME_PATH = re.compile(r"^/resume/([^/?]+)$")
+# Session creation: the router picks the ID, so the session starts on its owner
+CREATE_PATHS = ("/start-interview", "/start-adaptive-interview")
+
+INTERNAL_TOKEN_HEADER = "x-internal-token"
+SESSION_ID_HEADER = "x-session-id"
+# Not forwarded (connection-level, or set by the proxy). Content-Length is
+# kept: the body is streamed through unchanged, and workers check it up front
+HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailers",
+    "transfer-encoding", "upgrade", "host", INTERNAL_TOKEN_HEADER, SESSION_ID_HEADER
+}
+ADMIN_MAX_BODY_BYTES = 64 * 1024
+
+class ClientDisconnected(Exception):
+    """The client went away while its request body was being forwarded"""
+
+class SessionRouter:
+    """
+    ASGI front process that pins every session to one worker.
+
+    Requests for a session (by path, or by resume token) go to the worker
+    that owns its ID on a consistent-hash ring, so that worker's in-memory
+    session state stays hot; other requests are spread round-robin.
+    Workers can join and leave at runtime (/router/workers, or the health
+    check); only the sessions whose owner changed are moved, and their live
+    state is handed from the old worker to the new one through the workers'
+    /internal endpoints.
+
+    Request bodies are forwarded chunk by chunk as they arrive. Answer bodies
+    are held to the workers' answer limits (`answer_max_chars` for JSON
+    /submit-answer, `answer_stream_max_chars` for /submit-answer-stream), so
+    an oversized upload gets its 413 from the router without being relayed.
+    """
+
+    def __init__(
+        self,
+        workers: Iterable[str],
+        internal_token: str,
+        vnodes: int = 160,
+        health_interval: float = 5.0,
+        client: Optional[httpx.AsyncClient] = None,
+        answer_max_chars: Optional[int] = None,
+        answer_stream_max_chars: Optional[int] = None
+    ):
+        if not internal_token:
+            raise ValueError("The session router needs ROUTER_INTERNAL_TOKEN (shared with the workers)")
+        self.internal_token = internal_token
+        # Path prefix -> (byte limit of the body, character limit reported in the 413)
+        self.body_limits: Dict[str, Tuple[int, int]] = {}
+        if answer_max_chars:
+            self.body_limits["/submit-answer/"] = (
+                answer_max_chars * JSON_BYTES_PER_CHAR + JSON_OVERHEAD_BYTES, answer_max_chars
+            )
+        if answer_stream_max_chars:
+            self.body_limits["/submit-answer-stream/"] = (
+                answer_stream_max_chars * UTF8_MAX_BYTES_PER_CHAR, answer_stream_max_chars
+            )
+        self.ring = HashRing([w.rstrip("/") for w in workers], vnodes)
+        self.health_interval = health_interval
+        self.client = client
+        self._owns_client = client is None
+        self._round_robin = itertools.count()
+        self._rebalance_lock = asyncio.Lock()
+        self._health_task: Optional[asyncio.Task] = None
+        self._down: Set[str] = set()  # removed by the health check, re-added when healthy again
+        self.requests: Dict[str, int] = {}
+        self.rebalances = 0
+        self.sessions_moved = 0
+        self.proxy_errors = 0
+        self.rejected_bodies = 0
+
+    # --- ASGI ---
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            if scope["path"].startswith("/router/"):
+                await self._admin(scope, receive, send)
+            else:
+                await self._proxy(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def start(self):
+        if self.client is None:
+            self.client = httpx.AsyncClient(timeout=httpx.Timeout(30.0, read=None))
+        if self.health_interval > 0:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop(self):
+        if self._health_task:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        if self._owns_client and self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    # --- Routing ---
+
+    async def pick_worker(self, method: str, path: str) -> Tuple[Optional[str], Dict[str, str]]:
+        """(worker, extra headers) for a request"""
+        match = SESSION_PATH.match(path)
+        if match:
+            return self.ring.node_for(match.group(1)), {}
+        if method == "POST" and path in CREATE_PATHS:
+            session_id = str(uuid.uuid4())
+            return self.ring.node_for(session_id), {SESSION_ID_HEADER: session_id, INTERNAL_TOKEN_HEADER: self.internal_token}
+        match = RESUME_PATH.match(path)
+        if match:
+            session_id = await self._session_for_token(match.group(1))
+            if session_id:
+                return self.ring.node_for(session_id), {}
+        return self._any_worker(), {}
+
+    def _any_worker(self) -> Optional[str]:
+        nodes = self.ring.nodes
+        return nodes[next(self._round_robin) % len(nodes)] if nodes else None
+
+    async def _session_for_token(self, token: str) -> Optional[str]:
+        worker = self._any_worker()
+        if worker is None:
+            return None
+        try:
+            res = await self.client.get(f"{worker}/internal/resume-owner/{token}", headers=self._internal_headers())
+        except httpx.HTTPError:
+            return None
+        return res.json().get("session_id") if res.status_code == 200 else None
+
+    async def _proxy(self, scope, receive, send):
+        worker, extra = await self.pick_worker(scope["method"], scope["path"])
+        if worker is None:
+            await self._respond(send, 503, {"detail": "No workers available"})
+            return
+
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        limit = self._body_limit(scope["method"], scope["path"])
+        declared = headers.get("content-length", "")
+        if limit and declared.isdigit() and int(declared) > limit[0]:
+            self.rejected_bodies += 1
+            await self._respond(send, 413, {"detail": str(AnswerTooLarge(limit[1]))})
+            return
+
+        forward = [
+            (k.decode("latin-1").lower(), v.decode("latin-1"))
+            for k, v in scope["headers"] if k.decode("latin-1").lower() not in HOP_HEADERS
+        ]
+        forward.extend(extra.items())
+        url = worker + (scope["raw_path"].decode("latin-1") if scope.get("raw_path") else scope["path"])
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+        # Without Content-Length or Transfer-Encoding the request has no body
+        has_body = declared not in ("", "0") or "transfer-encoding" in headers
+        content = self._request_body(receive, limit) if has_body else None
+
+        started = False
+        try:
+            async with self.client.stream(scope["method"], url, headers=forward, content=content) as response:
+                self.requests[worker] = self.requests.get(worker, 0) + 1
+                await send({
+                    "type": "http.response.start",
+                    "status": response.status_code,
+                    "headers": [
+                        (k.encode("latin-1"), v.encode("latin-1"))
+                        for k, v in response.headers.multi_items() if k.lower() not in HOP_HEADERS
+                    ]
+                })
+                started = True
+                # Streamed through chunk by chunk (SSE)
+                async for chunk in response.aiter_raw():
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                await send({"type": "http.response.body", "body": b""})
+        except AnswerTooLarge as e:
+            # Raised while the body was uploading, before the worker answered
+            self.rejected_bodies += 1
+            await self._respond(send, 413, {"detail": str(e)})
+        except ClientDisconnected:
+            pass
+        except httpx.HTTPError as e:
+            if started:
+                raise
+            self.proxy_errors += 1
+            logger.warning(f"[ROUTER] {worker} unreachable: {e}")
+            await self._respond(send, 502, {"detail": "Worker unavailable"})
+
+    def _body_limit(self, method: str, path: str) -> Optional[Tuple[int, int]]:
+        if method != "POST":
+            return None
+        for prefix, limit in self.body_limits.items():
+            if path.startswith(prefix):
+                return limit
+        return None
+
+    async def _request_body(self, receive, limit: Optional[Tuple[int, int]] = None) -> AsyncIterator[bytes]:
+        """
+        The ASGI request body as it arrives, for httpx to send on.
+
+        Raises:
+            AnswerTooLarge: more than the byte limit of `limit` was received
+            ClientDisconnected: the client left before the body was complete
+        """
+        received = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise ClientDisconnected()
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if limit and received > limit[0]:
+                raise AnswerTooLarge(limit[1])
+            if chunk:
+                yield chunk
+            if not message.get("more_body"):
+                return
+
+    async def _respond(self, send, status: int, payload: Dict):
+        body = json.dumps(payload).encode("utf-8")
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": body})
+
+    # --- Membership and handoff ---
+
+    def _internal_headers(self) -> Dict[str, str]:
+        return {INTERNAL_TOKEN_HEADER: self.internal_token}
+
+    async def add_worker(self, worker: str) -> int:
+        """
+        Join: the new worker drops any live sessions it still holds (stale,
+        from before it left), then takes over its share of sessions from the
+        others. Returns the number of sessions moved.
+        """
+        worker = worker.rstrip("/")
+        async with self._rebalance_lock:
+            if worker in self.ring:
+                return 0
+            await self._release(worker, [])
+            new_ring = self.ring.copy()
+            new_ring.add(worker)
+            old_workers = self.ring.nodes
+            self.ring = new_ring
+            moved = 0
+            for old in old_workers:
+                moved += await self._hand_off(old, new_ring)
+            self.rebalances += 1
+            return moved
+
+    async def remove_worker(self, worker: str, graceful: bool = True) -> int:
+        """
+        Leave: its sessions go to their next owners on the ring. A graceful
+        leave hands over their live state; otherwise the new owners rebuild
+        them from the database/event log on first use.
+        """
+        worker = worker.rstrip("/")
+        async with self._rebalance_lock:
+            if worker not in self.ring:
+                return 0
+            new_ring = self.ring.copy()
+            new_ring.remove(worker)
+            self.ring = new_ring
+            moved = await self._hand_off(worker, new_ring) if graceful else 0
+            self.rebalances += 1
+            return moved
+
+    async def _hand_off(self, worker: str, ring: HashRing) -> int:
+        """Move the sessions `worker` no longer owns under `ring` to their owners"""
+        released = await self._release(worker, ring.nodes, ring.vnodes)
+        by_owner: Dict[str, List[Dict]] = {}
+        for handoff in released:
+            owner = ring.node_for(handoff["session"]["session_id"])
+            if owner is not None:
+                by_owner.setdefault(owner, []).append(handoff)
+        for owner, sessions in by_owner.items():
+            try:
+                res = await self.client.post(
+                    f"{owner}/internal/adopt", json={"sessions": sessions}, headers=self._internal_headers()
+                )
+                res.raise_for_status()
+                self.sessions_moved += len(sessions)
+            except httpx.HTTPError as e:
+                # The owner rebuilds them from history on first use
+                logger.error(f"[ROUTER] handing {len(sessions)} sessions to {owner} failed: {e}")
+        return len(released)
+
+    async def _release(self, worker: str, workers: List[str], vnodes: Optional[int] = None) -> List[Dict]:
+        try:
+            res = await self.client.post(
+                f"{worker}/internal/handoff",
+                json={"workers": workers, "node": worker, "vnodes": vnodes or self.ring.vnodes},
+                headers=self._internal_headers()
+            )
+            res.raise_for_status()
+            return res.json()["sessions"]
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            logger.warning(f"[ROUTER] {worker} did not release its sessions: {e}")
+            return []
+
+    async def _healthy(self, worker: str) -> bool:
+        try:
+            res = await self.client.get(f"{worker}/internal/health", headers=self._internal_headers(), timeout=2.0)
+            return res.status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    async def check_health(self):
+        """Remove unreachable workers (no handoff possible) and re-add recovered ones"""
+        for worker in self.ring.nodes:
+            if not await self._healthy(worker):
+                logger.warning(f"[ROUTER] {worker} is down, removing it from the ring")
+                self._down.add(worker)
+                await self.remove_worker(worker, graceful=False)
+        for worker in list(self._down):
+            if await self._healthy(worker):
+                logger.info(f"[ROUTER] {worker} is back")
+                self._down.discard(worker)
+                await self.add_worker(worker)
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.error(f"[ROUTER] health check failed: {e}")
+
+    # --- Admin ---
+
+    async def _admin(self, scope, receive, send):
+        """/router/* endpoints, for holders of the internal token only (like the workers' /internal)"""
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        token = headers.get(INTERNAL_TOKEN_HEADER, "")
+        if not token or not hmac.compare_digest(token.encode("latin-1"), self.internal_token.encode("latin-1")):
+            await self._respond(send, 403, {"detail": "Forbidden"})
+            return
+        if scope["path"] == "/router/status" and scope["method"] == "GET":
+            await self._respond(send, 200, self.metrics())
+            return
+        if scope["path"] == "/router/workers" and scope["method"] in ("POST", "DELETE"):
+            try:
+                chunks = [chunk async for chunk in self._request_body(receive, (ADMIN_MAX_BODY_BYTES, ADMIN_MAX_BODY_BYTES))]
+                worker = json.loads(b"".join(chunks) or b"{}")["url"]
+            except ClientDisconnected:
+                return
+            except (ValueError, KeyError):
+                await self._respond(send, 400, {"detail": "Body must be {\"url\": ...}"})
+                return
+            if scope["method"] == "POST":
+                moved = await self.add_worker(worker)
+            else:
+                moved = await self.remove_worker(worker)
+            await self._respond(send, 200, {"workers": self.ring.nodes, "sessions_moved": moved})
+            return
+        await self._respond(send, 404, {"detail": "Not Found"})
+
+    def metrics(self) -> Dict:
+        return {
+            "workers": self.ring.nodes,
+            "down": sorted(self._down),
+            "vnodes": self.ring.vnodes,
+            "requests": dict(self.requests),
+            "rebalances": self.rebalances,
+            "sessions_moved": self.sessions_moved,
+            "proxy_errors": self.proxy_errors,
+            "rejected_bodies": self.rejected_bodies
+        }
@@ -0,0 +1,103 @@
+from app.scoring.schemas import FinalRecommendation
+from app.scoring.weight_config import scoring_config_version
+from app.database import run_async_db
+from app.models import SessionRecommendation
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import threading
+
+class RecommendationCache:
+    """
+    Memoized FinalRecommendation per (session_id, session version, analysis
+    version, scoring config version). The analysis version counts the answers
+    whose background analysis has landed, so a result computed while some
+    were still pending is recomputed once they arrive.
+
+    Hot entries live in a bounded in-process LRU; every computed result is
+    also stored in `session_recommendations`, so other workers and restarts
+    reuse it. The same table records which version HR was notified about,
+    so a notification goes out once per session version even under repeated
+    clicks (late analyses refresh the memo, not the notification).
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[str, FinalRecommendation]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @staticmethod
+    def version_key(version: int, analyzed: Optional[int] = None) -> str:
+        """`analyzed`: analysis version (left out of notification keys)"""
+        base = str(version) if analyzed is None else f"{version}.{analyzed}"
+        return f"{base}:{scoring_config_version()}"
+
+    async def get(self, session_id: str, version: int, analyzed: int) -> Optional[FinalRecommendation]:
+        key = self.version_key(version, analyzed)
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None and entry[0] == key:
+                self._entries.move_to_end(session_id)
+                self.memory_hits += 1
+                return entry[1]
+
+        payload = await run_async_db(_db_load_recommendation, session_id, key)
+        if payload is None:
+            self.misses += 1
+            return None
+        recommendation = FinalRecommendation.model_validate(payload)
+        self._remember(session_id, key, recommendation)
+        self.db_hits += 1
+        return recommendation
+
+    async def put(self, recommendation: FinalRecommendation, version: int, analyzed: int):
+        key = self.version_key(version, analyzed)
+        await run_async_db(_db_store_recommendation, recommendation.session_id, key, recommendation.model_dump(mode="json"))
+        self._remember(recommendation.session_id, key, recommendation)
+        self.stores += 1
+
+    async def claim_notification(self, session_id: str, version: int) -> bool:
+        """True for exactly one caller per session version (atomic in the database)"""
+        return await run_async_db(_db_claim_notification, session_id, self.version_key(version))
+
+    def _remember(self, session_id: str, key: str, recommendation: FinalRecommendation):
+        with self._lock:
+            self._entries[session_id] = (key, recommendation)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def metrics(self) -> Dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "scoring_version": scoring_config_version(),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "stores": self.stores
+        }
+
+def _db_load_recommendation(db, session_id: str, key: str) -> Optional[Dict]:
+    row = db.query(SessionRecommendation.version_key, SessionRecommendation.payload).filter(
+        SessionRecommendation.session_id == session_id
+    ).first()
+    return row.payload if row and row.version_key == key else None
+
+def _db_store_recommendation(db, session_id: str, key: str, payload: Dict):
+    row = db.query(SessionRecommendation).filter(SessionRecommendation.session_id == session_id).first()
+    if row is None:
+        row = SessionRecommendation(session_id=session_id, status_version=0)
+        db.add(row)
+    row.version_key = key
+    row.payload = payload
+
+def _db_claim_notification(db, session_id: str, key: str) -> bool:
+    claimed = db.query(SessionRecommendation).filter(
+        SessionRecommendation.session_id == session_id,
+        (SessionRecommendation.notified_key.is_(None)) | (SessionRecommendation.notified_key != key)
+    ).update({SessionRecommendation.notified_key: key}, synchronize_session=False)
+    return claimed == 1
@@ -1,8 +1,8 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from app.scoring.schemas import ScoreBreakdown
 from app.scoring.weight_config import get_weights
 from app.answer_analysis.schemas import FullIntegrityReport
-from app.interview_flow.schemas import SessionSummary
+from app.interview_flow.schemas import SessionSummary, Answer
 import re
 
 class ScoreEngine:
@@ -71,144 +71,146 @@ class ScoreEngine:
                 
         return False
 
-    def calculate_technical_scores(self, summary: SessionSummary, questions: List[Dict]) -> Dict[str, float]:
+    def score_answer(self, answer: Answer, q_data: Dict) -> Tuple[float, float]:
         """
-        Simulate technical scoring by checking for technical keywords 
-        and expected topics in answers.
+        Score a single answer against its question data.
+        Returns (knowledge, problem_solving), both 0-100.
         """
-        q_map = {q["id"]: q for q in questions}
+        expected = q_data.get("expected_topics", [])
         
-        technical_scores = []
-        problem_solving_scores = []
-
-        for answer in summary.answers:
-            q_data = q_map.get(answer.question_id, {})
-            expected = q_data.get("expected_topics", [])
-            
-            # Log zero score reason if no answer or timeout
-            if not answer.answer_text or answer.is_timeout:
-                print(f"[SCORE_LOG] why_score_zero=True: Question {answer.question_id} has no answer or timeout")
-                technical_scores.append(0.0)
-                problem_solving_scores.append(0.0)
-                continue
+        # Log zero score reason if no answer or timeout
+        if not answer.answer_text or answer.is_timeout:
+            print(f"[SCORE_LOG] why_score_zero=True: Question {answer.question_id} has no answer or timeout")
+            return 0.0, 0.0
 
-            # NEW: CHECK FOR NON-ANSWERS (gibberish/random/I don't know)
-            if self._is_non_answer(answer.answer_text):
-                print(f"[SCORE_LOG] why_score_zero=True: Non-answer detected for Question {answer.question_id}: '{answer.answer_text}'")
-                technical_scores.append(0.0)
-                problem_solving_scores.append(0.0)
-                continue
+        # NEW: CHECK FOR NON-ANSWERS (gibberish/random/I don't know)
+        if self._is_non_answer(answer.answer_text):
+            print(f"[SCORE_LOG] why_score_zero=True: Non-answer detected for Question {answer.question_id}: '{answer.answer_text}'")
+            return 0.0, 0.0
 
-            # 1. Knowledge Score: Topic matching
-            matches = 0
-            for topic in expected:
-                if re.search(r'\b' + re.escape(topic.lower()) + r'\b', answer.answer_text.lower()):
-                    matches += 1
+        # 1. Knowledge Score: Topic matching
+        matches = 0
+        for topic in expected:
+            if re.search(r'\b' + re.escape(topic.lower()) + r'\b', answer.answer_text.lower()):
+                matches += 1
+        
+        # Base score from topics
+        knowledge_base = (matches / len(expected)) * 100 if expected else 0 # CHANGED: No free 50 pts
+        
+        # Expanded Technical Keywords (RU/UZ/EN)
+        technical_keywords = [
+            # EN
+            "implementation", "performance", "complexity", "architecture", "pattern", "logic", "database",
+            "api", "interface", "class", "object", "function", "method", "async", "sync", "thread",
+            "deploy", "ci/cd", "testing", "unit", "integration", "rest", "graphql", "sql", "nosql",
+            # RU
+            "реализация", "производительность", "сложность", "архитектура", "паттерн", "логика", "база",
+            "интерфеис", "класс", "объект", "функция", "метод", "асинхрон", "поток", "деплой",
+            "тестирование", "юнит", "интеграция", "рест", "sql", "nosql", "данные", "сервер", "клиент",
+            "оптимизация", "кэширование", "безопасность", "авторизация", "аутентификация",
+            "пайтон", "питон", "программирование", "разработка", "код", "структура", "алгоритм",
+            # UZ
+            "amalga oshirish", "unumdorlik", "murakkablik", "arxitektura", "andoza", "mantiq", "ma'lumotlar",
+            "interfeys", "sinf", "obyekt", "funktsiya", "usul", "asinxron", "oqim", "joylashtirish",
+            "sinash", "birlik", "integratsiya", "rest", "sql", "nosql", "server", "mijoz",
+            "optimallashtirish", "keshlash", "xavfsizlik", "tizim", "dastur", "algoritm", "kod"
+        ]
+        
+        # Length Heuristic (Smart Grading)
+        word_count = len(answer.answer_text.split())
+        length_score = 0
+        
+        # Count keyword hits early for heuristic usage
+        keyword_hits = sum(1 for word in technical_keywords if word in answer.answer_text.lower())
+        
+        if word_count > 20: 
+            if matches > 0 or keyword_hits > 2: # Stricter
+                length_score = 70 
+            else:
+                length_score = 0 
+        elif word_count > 10:
+            if matches > 0 or keyword_hits > 1:
+                length_score = 30 
+            else:
+                length_score = 0 
+        
+        # Keyword Bonus
+        keyword_hits = sum(1 for word in technical_keywords if word in answer.answer_text.lower())
+        
+        # STRICTNESS REFINEMENT: Calculate "Junk Density"
+        # If the answer contains keywords BUT is mostly random chars/junk, penalize it.
+        # We use \w to include all language characters (RU, UZ, EN).
+        junk_chars = re.findall(r'[^\w\s.,?!:;()\-]', answer.answer_text)
+        junk_ratio = len(junk_chars) / len(answer.answer_text) if answer.answer_text else 0
+        
+        # Detect "word mashes" like "python asdfgh" or "js ffff"
+        is_keyword_plus_junk = False
+        if word_count < 20: # Increased threshold for safety
+            # check for gibberish words (long words with extremely low vowel ratio)
+            # We include common RU/UZ vowels
+            vowels_all = "aeiouyаеёиоуыэюя"
+            has_gibberish = any(len(w) > 5 and (sum(1 for c in w.lower() if c in vowels_all) / len(w) < 0.1) for w in answer.answer_text.split())
             
-            # Base score from topics
-            knowledge_base = (matches / len(expected)) * 100 if expected else 0 # CHANGED: No free 50 pts
+            # If too many very short words (1-2 chars) that aren't common prepositions
+            # RU: я, и, в, на, с, а, но, у, к, за
+            # UZ: va, bu, u, va, bo'lsa
+            common_short = {"я", "и", "в", "на", "с", "а", "но", "у", "к", "за", "от", "до", "по", "об", "va", "bu", "u", "da", "ni", "ni", "ga", "of", "in", "to", "is", "a", "an", "the", "it", "on"}
+            very_short_words = [w for w in answer.answer_text.split() if len(w) <= 2 and w.lower() not in common_short]
             
-            # Expanded Technical Keywords (RU/UZ/EN)
-            technical_keywords = [
-                # EN
-                "implementation", "performance", "complexity", "architecture", "pattern", "logic", "database",
-                "api", "interface", "class", "object", "function", "method", "async", "sync", "thread",
-                "deploy", "ci/cd", "testing", "unit", "integration", "rest", "graphql", "sql", "nosql",
-                # RU
-                "реализация", "производительность", "сложность", "архитектура", "паттерн", "логика", "база",
-                "интерфеис", "класс", "объект", "функция", "метод", "асинхрон", "поток", "деплой",
-                "тестирование", "юнит", "интеграция", "рест", "sql", "nosql", "данные", "сервер", "клиент",
-                "оптимизация", "кэширование", "безопасность", "авторизация", "аутентификация",
-                "пайтон", "питон", "программирование", "разработка", "код", "структура", "алгоритм",
-                # UZ
-                "amalga oshirish", "unumdorlik", "murakkablik", "arxitektura", "andoza", "mantiq", "ma'lumotlar",
-                "interfeys", "sinf", "obyekt", "funktsiya", "usul", "asinxron", "oqim", "joylashtirish",
-                "sinash", "birlik", "integratsiya", "rest", "sql", "nosql", "server", "mijoz",
-                "optimallashtirish", "keshlash", "xavfsizlik", "tizim", "dastur", "algoritm", "kod"
+            # REFINED RULE: triggers if high junk ratio OR has gibberish OR too many random short words in a very short answer
+            if junk_ratio > 0.4 or has_gibberish or (len(very_short_words) > 3 and word_count < 7):
+                is_keyword_plus_junk = True
+        
+        if is_keyword_plus_junk:
+            print(f"[SCORE_LOG] policy=StrictPenalty: Junk-mixed answer detected for Q{answer.question_id}: '{answer.answer_text}'")
+            return 0.0, 0.0
+
+        keyword_bonus = min(30, keyword_hits * 5)
+        
+        # Combine methods: take max of (Topic Match OR Length Heuristic) + Bonus
+        knowledge_final = min(100.0, max(knowledge_base, length_score) + keyword_bonus)
+        
+        if knowledge_final == 0:
+            print(f"[SCORE_LOG] why_score_zero=True: Knowledge score 0 for Question {answer.question_id}. Answer: '{answer.answer_text[:50]}...'")
+        
+
+        # 2. Problem Solving Score (heuristic for case questions)
+        is_case = q_data.get("type") == "case"
+        if is_case:
+            # Better score if they mention "trade-offs", "strategy", "solution"
+            ps_markers = [
+                "trade-off", "alternative", "depends", "strategy", "handling", "solution", "scale",
+                "компромисс", "альтернатива", "зависит", "стратегия", "обработка", "решение", "масштабирование",
+                "kelishuv", "muqobil", "bog'liq", "strategiya", "ishlov", "yechim", "miqyoslash",
+                "плюсы", "минусы", "вариант", "лучше", "хуже", "afzallik", "kamchilik"
             ]
+            ps_matches = sum(10 for m in ps_markers if m in answer.answer_text.lower())
+            # For case studies, length is even more important
+            ps_len_score = 75 if word_count > 30 else (50 if word_count > 15 else 0)
             
-            # Length Heuristic (Smart Grading)
-            word_count = len(answer.answer_text.split())
-            length_score = 0
-            
-            # Count keyword hits early for heuristic usage
-            keyword_hits = sum(1 for word in technical_keywords if word in answer.answer_text.lower())
-            
-            if word_count > 20: 
-                if matches > 0 or keyword_hits > 2: # Stricter
-                    length_score = 70 
-                else:
-                    length_score = 0 
-            elif word_count > 10:
-                if matches > 0 or keyword_hits > 1:
-                    length_score = 30 
-                else:
-                    length_score = 0 
-            
-            # Keyword Bonus
-            keyword_hits = sum(1 for word in technical_keywords if word in answer.answer_text.lower())
+            ps_score = min(100.0, max(knowledge_base, ps_len_score) + ps_matches)
             
-            # STRICTNESS REFINEMENT: Calculate "Junk Density"
-            # If the answer contains keywords BUT is mostly random chars/junk, penalize it.
-            # We use \w to include all language characters (RU, UZ, EN).
-            junk_chars = re.findall(r'[^\w\s.,?!:;()\-]', answer.answer_text)
-            junk_ratio = len(junk_chars) / len(answer.answer_text) if answer.answer_text else 0
-            
-            # Detect "word mashes" like "python asdfgh" or "js ffff"
-            is_keyword_plus_junk = False
-            if word_count < 20: # Increased threshold for safety
-                # check for gibberish words (long words with extremely low vowel ratio)
-                # We include common RU/UZ vowels
-                vowels_all = "aeiouyаеёиоуыэюя"
-                has_gibberish = any(len(w) > 5 and (sum(1 for c in w.lower() if c in vowels_all) / len(w) < 0.1) for w in answer.answer_text.split())
-                
-                # If too many very short words (1-2 chars) that aren't common prepositions
-                # RU: я, и, в, на, с, а, но, у, к, за
-                # UZ: va, bu, u, va, bo'lsa
-                common_short = {"я", "и", "в", "на", "с", "а", "но", "у", "к", "за", "от", "до", "по", "об", "va", "bu", "u", "da", "ni", "ni", "ga", "of", "in", "to", "is", "a", "an", "the", "it", "on"}
-                very_short_words = [w for w in answer.answer_text.split() if len(w) <= 2 and w.lower() not in common_short]
-                
-                # REFINED RULE: triggers if high junk ratio OR has gibberish OR too many random short words in a very short answer
-                if junk_ratio > 0.4 or has_gibberish or (len(very_short_words) > 3 and word_count < 7):
-                    is_keyword_plus_junk = True
-            
-            if is_keyword_plus_junk:
-                print(f"[SCORE_LOG] policy=StrictPenalty: Junk-mixed answer detected for Q{answer.question_id}: '{answer.answer_text}'")
-                technical_scores.append(0.0)
-                problem_solving_scores.append(0.0)
-                continue
+            if ps_score == 0:
+                print(f"[SCORE_LOG] why_score_zero=True: PS score 0 for case question {answer.question_id}")
+            return knowledge_final, ps_score
+        else:
+            return knowledge_final, knowledge_final * 0.8 # Non-cases don't show full PS
 
-            keyword_bonus = min(30, keyword_hits * 5)
-            
-            # Combine methods: take max of (Topic Match OR Length Heuristic) + Bonus
-            knowledge_final = min(100.0, max(knowledge_base, length_score) + keyword_bonus)
-            
-            if knowledge_final == 0:
-                print(f"[SCORE_LOG] why_score_zero=True: Knowledge score 0 for Question {answer.question_id}. Answer: '{answer.answer_text[:50]}...'")
-            
-            technical_scores.append(knowledge_final)
+    def calculate_technical_scores(self, summary: SessionSummary, questions: List[Dict]) -> Dict[str, float]:
+        """
+        Simulate technical scoring by checking for technical keywords 
+        and expected topics in answers.
+        """
+        q_map = {q["id"]: q for q in questions}
+        
+        technical_scores = []
+        problem_solving_scores = []
 
-            # 2. Problem Solving Score (heuristic for case questions)
-            is_case = q_data.get("type") == "case"
-            if is_case:
-                # Better score if they mention "trade-offs", "strategy", "solution"
-                ps_markers = [
-                    "trade-off", "alternative", "depends", "strategy", "handling", "solution", "scale",
-                    "компромисс", "альтернатива", "зависит", "стратегия", "обработка", "решение", "масштабирование",
-                    "kelishuv", "muqobil", "bog'liq", "strategiya", "ishlov", "yechim", "miqyoslash",
-                    "плюсы", "минусы", "вариант", "лучше", "хуже", "afzallik", "kamchilik"
-                ]
-                ps_matches = sum(10 for m in ps_markers if m in answer.answer_text.lower())
-                # For case studies, length is even more important
-                ps_len_score = 75 if word_count > 30 else (50 if word_count > 15 else 0)
-                
-                ps_score = min(100.0, max(knowledge_base, ps_len_score) + ps_matches)
-                
-                if ps_score == 0:
-                    print(f"[SCORE_LOG] why_score_zero=True: PS score 0 for case question {answer.question_id}")
-                problem_solving_scores.append(ps_score)
-            else:
-                problem_solving_scores.append(knowledge_final * 0.8) # Non-cases don't show full PS
+        for answer in summary.answers:
+            q_data = q_map.get(answer.question_id, {})
+            knowledge, problem_solving = self.score_answer(answer, q_data)
+            technical_scores.append(knowledge)
+            problem_solving_scores.append(problem_solving)
 
         avg_knowledge = sum(technical_scores) / len(technical_scores) if technical_scores else 0
         avg_ps = sum(problem_solving_scores) / len(problem_solving_scores) if problem_solving_scores else 0
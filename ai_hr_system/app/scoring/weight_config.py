@@ -2,6 +2,11 @@
 Configuration for how different aspects of the interview are weighted 
 based on question difficulty.
 """
+import hashlib
+import json
+
+# Bump when scoring/recommendation logic changes; weight edits change the fingerprint by themselves
+SCORING_LOGIC_VERSION = 1
 
 # Weight mapping: (Knowledge, Honesty, Time, Problem Solving)
 # sum should be 1.0
@@ -30,3 +35,8 @@ WEIGHT_CONFIG = {
 def get_weights(difficulty: str) -> dict:
     """Return weights for a specific difficulty level"""
     return WEIGHT_CONFIG.get(difficulty.lower(), WEIGHT_CONFIG["medium"])
+
+def scoring_config_version() -> str:
+    """Version of the scoring configuration, part of the recommendation cache key"""
+    digest = hashlib.sha1(json.dumps(WEIGHT_CONFIG, sort_keys=True).encode()).hexdigest()[:8]
+    return f"{SCORING_LOGIC_VERSION}-{digest}"
@@ -0,0 +1,246 @@
+"""
+Question engine benchmark.
+
+Measures QuestionBank, QuestionSelector, QuestionGenerator and Translator:
+- select_questions latency percentiles across bank sizes and skill-list lengths
+- allocations per select_questions call (tracemalloc)
+- throughput under concurrent calls
+
+Results are written as JSON so runs can be diffed:
+    python bench_question_engine.py --output bench_results/question_engine.json
+    python bench_question_engine.py --compare bench_results/question_engine.json
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import platform
+import argparse
+import statistics
+import subprocess
+import tracemalloc
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+import logging
+logging.disable(logging.INFO)
+
+from app.question_engine.question_bank import QuestionBank
+from app.question_engine.question_selector import QuestionSelector
+from app.question_engine.question_generator import QuestionGenerator
+from app.question_engine.schemas import DifficultyLevel, QuestionType
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.utils.translator import Translator
+
+SKILL_POOL = [
+    "python", "javascript", "react", "node.js", "django", "postgresql", "sql", "docker",
+    "kotlin", "rust", "golang", "terraform", "graphql", "redis", "vue", "swift"
+]
+BANK_SCALES = [1, 4, 16]
+SKILL_COUNTS = [1, 3, 5, 10, 16]  # 16 exercises the 10-skill cap
+LANGS = ["ru", "en", "uz"]
+
+def _percentiles(samples_ms):
+    ordered = sorted(samples_ms)
+    def pct(p):
+        return round(ordered[min(len(ordered) - 1, int(p / 100.0 * len(ordered)))], 4)
+    return {
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+        "mean_ms": round(statistics.mean(ordered), 4),
+        "max_ms": round(ordered[-1], 4)
+    }
+
+def _scaled_bank(scale: int) -> QuestionBank:
+    """Bank with `scale` copies of every question (distinct IDs and texts)"""
+    bank = QuestionBank()
+    base = list(bank.questions)
+    for k in range(1, scale):
+        for q in base:
+            clone = q.model_copy()
+            clone.id = q.id + 10000 * k
+            clone.question = f"{q.question} (v{k})"
+            bank.questions.append(clone)
+    bank._build_indexes()
+    return bank
+
+def _level_result(skill_count: int, rng: random.Random) -> LevelDetectionResult:
+    return LevelDetectionResult(
+        candidate_name="Bench",
+        level=rng.choice(list(CandidateLevel)),
+        confidence_overall=0.7,
+        skills=rng.sample(SKILL_POOL, skill_count)
+    )
+
+def bench_selection_latency(iterations: int):
+    results = []
+    rng = random.Random(1)
+    for scale in BANK_SCALES:
+        selector = QuestionSelector()
+        selector.question_bank = _scaled_bank(scale)
+        for skill_count in SKILL_COUNTS:
+            samples = []
+            for i in range(iterations):
+                lr = _level_result(skill_count, rng)
+                lang = LANGS[i % len(LANGS)]
+                t0 = time.perf_counter()
+                selector.select_questions(lr, max_total_questions=5, lang=lang)
+                samples.append((time.perf_counter() - t0) * 1000)
+            row = {"bank_size": len(selector.question_bank.questions), "skills": skill_count}
+            row.update(_percentiles(samples))
+            results.append(row)
+            print(f"  bank={row['bank_size']:5d} skills={skill_count:2d} p50={row['p50_ms']:.3f}ms p99={row['p99_ms']:.3f}ms")
+    return results
+
+def bench_allocations(iterations: int):
+    results = []
+    rng = random.Random(2)
+    selector = QuestionSelector()
+    for skill_count in SKILL_COUNTS:
+        blocks, peaks = [], []
+        for i in range(iterations):
+            lr = _level_result(skill_count, rng)
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            selector.select_questions(lr, max_total_questions=5, lang=LANGS[i % len(LANGS)])
+            after = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            stats = after.compare_to(before, "filename")
+            blocks.append(sum(max(0, s.count_diff) for s in stats))
+            peaks.append(peak)
+        row = {
+            "skills": skill_count,
+            "retained_blocks_mean": round(statistics.mean(blocks), 1),
+            "peak_kib_mean": round(statistics.mean(peaks) / 1024, 1),
+            "peak_kib_max": round(max(peaks) / 1024, 1)
+        }
+        results.append(row)
+        print(f"  skills={skill_count:2d} retained_blocks={row['retained_blocks_mean']} peak={row['peak_kib_mean']}KiB")
+    return results
+
+def bench_concurrency(calls: int):
+    results = []
+    selector = QuestionSelector()
+    rng = random.Random(3)
+    inputs = [(_level_result(5, rng), LANGS[i % len(LANGS)]) for i in range(calls)]
+
+    def run(args):
+        lr, lang = args
+        t0 = time.perf_counter()
+        selector.select_questions(lr, max_total_questions=5, lang=lang)
+        return (time.perf_counter() - t0) * 1000
+
+    for workers in [1, 4, 8, 16]:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            t0 = time.perf_counter()
+            samples = list(pool.map(run, inputs))
+            elapsed = time.perf_counter() - t0
+        row = {"workers": workers, "calls": calls, "throughput_per_s": round(calls / elapsed, 1)}
+        row.update(_percentiles(samples))
+        results.append(row)
+        print(f"  workers={workers:2d} {row['throughput_per_s']}/s p99={row['p99_ms']:.3f}ms")
+    return results
+
+def bench_components(iterations: int):
+    bank = QuestionBank()
+    gen = QuestionGenerator()
+    texts = list(Translator.DICTIONARY.keys())
+    out = {}
+
+    samples = []
+    for i in range(iterations):
+        skill = SKILL_POOL[i % len(SKILL_POOL)]
+        t0 = time.perf_counter()
+        bank.get_questions_by_skill_difficulty_lang(skill, DifficultyLevel.MEDIUM, LANGS[i % 3])
+        samples.append((time.perf_counter() - t0) * 1000)
+    out["bank_lookup"] = _percentiles(samples)
+
+    samples = []
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        gen.generate_question(SKILL_POOL[i % len(SKILL_POOL)], DifficultyLevel.HARD, QuestionType.CASE, lang=LANGS[i % 3])
+        samples.append((time.perf_counter() - t0) * 1000)
+    out["generate_question"] = _percentiles(samples)
+
+    samples = []
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        Translator.translate(texts[i % len(texts)], LANGS[1 + i % 2])
+        samples.append((time.perf_counter() - t0) * 1000)
+    out["translate"] = _percentiles(samples)
+
+    for name, row in out.items():
+        print(f"  {name:18s} p50={row['p50_ms']:.4f}ms p99={row['p99_ms']:.4f}ms")
+    return out
+
+def _git_rev():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+def _compare(current: dict, baseline: dict, path: str = ""):
+    """Print relative change of every *_ms / throughput metric"""
+    if isinstance(current, dict):
+        for key, value in current.items():
+            if key in ("meta",) or not isinstance(baseline, dict) or key not in baseline:
+                continue
+            _compare(value, baseline[key], f"{path}.{key}" if path else key)
+    elif isinstance(current, list) and isinstance(baseline, list):
+        for i, (c, b) in enumerate(zip(current, baseline)):
+            _compare(c, b, f"{path}[{i}]")
+    elif isinstance(current, (int, float)) and isinstance(baseline, (int, float)) and baseline:
+        if path.endswith("_ms") or "throughput" in path:
+            change = (current - baseline) / baseline * 100
+            print(f"  {path}: {baseline} -> {current} ({change:+.1f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Question engine benchmark")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--output", default="bench_results/question_engine.json")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to diff against")
+    args = parser.parse_args()
+
+    print("Benchmarking Question Engine...")
+    print("\n=== select_questions latency ===")
+    latency = bench_selection_latency(args.iterations)
+    print("\n=== select_questions allocations ===")
+    allocations = bench_allocations(max(20, args.iterations // 10))
+    print("\n=== Concurrent throughput ===")
+    concurrency = bench_concurrency(args.iterations * 2)
+    print("\n=== Components ===")
+    components = bench_components(args.iterations * 5)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "git_rev": _git_rev(),
+            "python": platform.python_version(),
+            "iterations": args.iterations
+        },
+        "selection_latency": latency,
+        "allocations": allocations,
+        "concurrency": concurrency,
+        "components": components
+    }
+
+    if args.compare and os.path.exists(args.compare):
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\n=== Compared to {args.compare} ({baseline.get('meta', {}).get('git_rev')}) ===")
+        _compare(report, baseline)
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    main()
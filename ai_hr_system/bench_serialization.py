@@ -0,0 +1,210 @@
+"""
+Serialization cost of /start-interview and /submit-answer.
+
+Runs both endpoints through FastAPI in-process (ASGI, no network) in two
+variants on the same SessionManager, and reports CPU time and peak Python
+memory allocated per request:
+- legacy: questions built with json.loads(model_dump_json()), InterviewSession
+          returned through response_model (dump, re-validate, dump, json.dumps),
+          answer dicts through jsonable_encoder
+- fast:   model_dump(mode="json") questions, session JSON with the question
+          list cached per session, orjson (FastJSONResponse) for dict responses
+
+Both endpoints also write to the database, which dominates their CPU time.
+A render-only section isolates the response serialization of a session read
+(/session-status, /resume), where no database work hides it.
+
+    python bench_serialization.py --requests 300 --questions 10
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+import tracemalloc
+
+# Benchmark on a throwaway database (must be set before app.database is imported)
+_tmp_dir = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmp_dir, 'bench.db')}")
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+import logging
+logging.disable(logging.INFO)
+
+import httpx
+from fastapi import FastAPI, Body
+from app.database import engine
+from app import models
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.question_engine.question_selector import QuestionSelector
+from app.question_engine.schemas import QuestionSet
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.schemas import InterviewSession
+from app.interview_flow.payloads import SessionPayloadCache, FastJSONResponse
+
+models.Base.metadata.create_all(bind=engine)
+
+def _question_set(questions: int) -> QuestionSet:
+    level_result = LevelDetectionResult(
+        candidate_name="Bench",
+        level=CandidateLevel.MIDDLE,
+        confidence_overall=0.7,
+        skills=["python", "sql", "docker", "git", "linux"]
+    )
+    return QuestionSelector().select_questions(level_result, max_total_questions=questions, lang="en")
+
+def _legacy_questions(question_set: QuestionSet) -> QuestionSet:
+    """Question set whose dicts come from the old string round trip"""
+    for q in question_set.questions:
+        json.loads(q.model_dump_json())
+    return question_set
+
+def _build_app(manager: SessionManager, payloads: SessionPayloadCache) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/legacy/start-interview", response_model=InterviewSession)
+    async def legacy_start(candidate_id: str = Body(...), question_set: QuestionSet = Body(...)):
+        return await manager.create_session_async(
+            candidate_id=candidate_id, candidate_name="Bench", candidate_phone="+998901234567",
+            candidate_email=f"{candidate_id}@example.com", question_set=_legacy_questions(question_set)
+        )
+
+    @app.post("/fast/start-interview", response_model=InterviewSession)
+    async def fast_start(candidate_id: str = Body(...), question_set: QuestionSet = Body(...)):
+        session = await manager.create_session_async(
+            candidate_id=candidate_id, candidate_name="Bench", candidate_phone="+998901234567",
+            candidate_email=f"{candidate_id}@example.com", question_set=question_set
+        )
+        return payloads.response(session)
+
+    @app.post("/legacy/submit-answer/{session_id}")
+    async def legacy_submit(session_id: str, answer_text: str = Body(...)):
+        answer = await manager.submit_answer_async(session_id, answer_text)
+        return {"status": "success", "answer": answer, "message": "Answer submitted successfully"}
+
+    @app.post("/fast/submit-answer/{session_id}")
+    async def fast_submit(session_id: str, answer_text: str = Body(...)):
+        answer = await manager.submit_answer_async(session_id, answer_text)
+        return FastJSONResponse({"status": "success", "answer": answer.model_dump(mode="json"), "message": "Answer submitted successfully"})
+
+    return app
+
+async def _measure(sends, count: int):
+    """
+    Per variant: CPU ms per request, then (traced, on further requests) peak KB
+    allocated per request. Variants take turns so database growth hits both alike.
+    """
+    cpu = {variant: [] for variant in sends}
+    peak = {variant: [] for variant in sends}
+    for i in range(count):
+        for variant, send in sends.items():
+            t0 = time.process_time()
+            res = await send(i)
+            cpu[variant].append((time.process_time() - t0) * 1000)
+            assert res.status_code == 200, res.text
+    tracemalloc.start()
+    for i in range(count, 2 * count):
+        for variant, send in sends.items():
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            res = await send(i)
+            peak[variant].append((tracemalloc.get_traced_memory()[1] - base) / 1024)
+            assert res.status_code == 200, res.text
+    tracemalloc.stop()
+    return {
+        variant: {
+            "cpu_ms_mean": round(statistics.mean(cpu[variant]), 3),
+            "cpu_ms_p50": round(statistics.median(cpu[variant]), 3),
+            "peak_kb_mean": round(statistics.mean(peak[variant]), 1)
+        }
+        for variant in sends
+    }
+
+def _measure_render(fn, count: int):
+    t0 = time.process_time()
+    for _ in range(count):
+        fn()
+    cpu_ms = (time.process_time() - t0) * 1000 / count
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    fn()
+    peak_kb = (tracemalloc.get_traced_memory()[1] - base) / 1024
+    tracemalloc.stop()
+    return {"cpu_ms_mean": round(cpu_ms, 4), "peak_kb_mean": round(peak_kb, 1)}
+
+async def _run(requests: int, questions: int):
+    manager = SessionManager()
+    payloads = SessionPayloadCache()
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=_build_app(manager, payloads)), base_url="http://bench")
+    question_set = _question_set(questions).model_dump(mode="json")
+    answer = "I would add a composite index, check the plan with EXPLAIN and batch the writes. " * 4
+    results = []
+    variants = ["legacy", "fast"]
+
+    def starter(variant):
+        async def start(i):
+            return await client.post(f"/{variant}/start-interview", json={"candidate_id": f"{variant}_{i}", "question_set": question_set})
+        return start
+
+    starts = {variant: starter(variant) for variant in variants}
+    for i in range(5):  # warm-up
+        for start in starts.values():
+            await start(-1 - i)
+    for variant, row in (await _measure(starts, requests)).items():
+        results.append({"endpoint": "/start-interview", "variant": variant, **row})
+
+    # One answer per question: enough sessions for 2 x `requests` submits, answered round by round
+    targets = {}
+    for variant in variants:
+        sessions = []
+        while sum(s["total_questions"] for s in sessions) < 2 * requests:
+            sessions.append((await starts[variant](2 * requests + len(sessions))).json())
+        rounds = max(s["total_questions"] for s in sessions)
+        targets[variant] = [s["session_id"] for r in range(rounds) for s in sessions if r < s["total_questions"]]
+
+    def submitter(variant):
+        async def submit(i):
+            return await client.post(f"/{variant}/submit-answer/{targets[variant][i]}", json=answer)
+        return submit
+
+    for variant, row in (await _measure({variant: submitter(variant) for variant in variants}, requests)).items():
+        results.append({"endpoint": "/submit-answer", "variant": variant, **row})
+    await client.aclose()
+
+    # Response serialization alone: a live session read
+    session = manager.store.load(next(iter(manager.store.session_ids())))
+    render = {
+        "legacy": lambda: json.dumps(InterviewSession.model_validate(session.model_dump()).model_dump(mode="json")).encode("utf-8"),
+        "fast": lambda: payloads.render(session)
+    }
+    assert json.loads(render["legacy"]()) == json.loads(render["fast"]())
+    for variant, fn in render.items():
+        results.append({"endpoint": "session render", "variant": variant, **_measure_render(fn, requests * 10)})
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialization cost of /start-interview and /submit-answer")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--output", default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    print(f"Benchmarking {args.requests} requests per endpoint, {args.questions} questions per session...")
+    results = asyncio.run(_run(args.requests, args.questions))
+    for row in results:
+        print(f"  {row['endpoint']:18s} {row['variant']:6s} cpu={row['cpu_ms_mean']}ms peak_alloc={row['peak_kb_mean']}KB")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    main()
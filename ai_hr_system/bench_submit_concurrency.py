@@ -0,0 +1,137 @@
+"""
+/submit-answer concurrency benchmark.
+
+Simulates N candidates submitting at the same moment inside one event loop,
+the way uvicorn runs the endpoint, and compares:
+- sync:   SessionManager.submit_answer (blocking DB calls on the event loop)
+- thread: SessionManager.submit_answer_async, DB_ASYNC_MODE=thread
+- driver: SessionManager.submit_answer_async, DB_ASYNC_MODE=driver (aiosqlite / asyncpg)
+
+Latency includes time spent waiting for the event loop. Loop lag is measured
+by a 10 ms heartbeat task running alongside.
+
+    python bench_submit_concurrency.py --candidates 200
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+
+# Benchmark on a throwaway database (must be set before app.database is imported)
+_tmp_dir = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmp_dir, 'bench.db')}")
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+import logging
+logging.disable(logging.INFO)
+
+from app import database
+from app.database import engine, SessionLocal
+from app import models
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.question_engine.question_selector import QuestionSelector
+from app.interview_flow.session_manager import SessionManager
+
+models.Base.metadata.create_all(bind=engine)
+
+def _percentiles(samples_ms):
+    ordered = sorted(samples_ms)
+    def pct(p):
+        return round(ordered[min(len(ordered) - 1, int(p / 100.0 * len(ordered)))], 2)
+    return {"p50_ms": pct(50), "p95_ms": pct(95), "p99_ms": pct(99), "max_ms": round(ordered[-1], 2)}
+
+def _create_sessions(manager: SessionManager, count: int):
+    level_result = LevelDetectionResult(
+        candidate_name="Bench",
+        level=CandidateLevel.MIDDLE,
+        confidence_overall=0.7,
+        skills=["python", "sql", "docker"]
+    )
+    question_set = QuestionSelector().select_questions(level_result, max_total_questions=3, lang="en")
+    return [
+        manager.create_session(
+            candidate_id=f"bench_{i}",
+            candidate_name=f"Bench {i}",
+            candidate_phone="+998901234567",
+            candidate_email=f"bench{i}@example.com",
+            question_set=question_set
+        ).session_id
+        for i in range(count)
+    ]
+
+async def _heartbeat(lags, stop):
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append((time.perf_counter() - t0 - 0.01) * 1000)
+
+async def _run(manager: SessionManager, session_ids, mode: str):
+    latencies, lags = [], []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(lags, stop))
+    await asyncio.sleep(0.05)
+
+    async def candidate(session_id):
+        # Latency is measured from the common arrival time, so queueing behind
+        # a blocked event loop is included
+        if mode == "sync":
+            manager.submit_answer(session_id, "I would add an index and check the query plan")
+        else:
+            await manager.submit_answer_async(session_id, "I would add an index and check the query plan")
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    # Requests arrive together; each one is a task like in uvicorn
+    await asyncio.gather(*(asyncio.create_task(candidate(sid)) for sid in session_ids))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await heartbeat
+
+    db = SessionLocal()
+    persisted = db.query(models.InterviewAnswer).filter(models.InterviewAnswer.session_id.in_(session_ids)).count()
+    db.close()
+
+    row = {"mode": mode, "candidates": len(session_ids), "throughput_per_s": round(len(session_ids) / elapsed, 1)}
+    row.update(_percentiles(latencies))
+    row["loop_lag_max_ms"] = round(max(lags), 2) if lags else None
+    row["rows_persisted"] = persisted
+    return row
+
+def main():
+    parser = argparse.ArgumentParser(description="/submit-answer concurrency benchmark")
+    parser.add_argument("--candidates", type=int, default=200)
+    parser.add_argument("--output", default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    print(f"Benchmarking submit_answer with {args.candidates} simultaneous candidates...")
+    print(f"  database: {database.DATABASE_URL}")
+    manager = SessionManager()
+    results = []
+    for mode in ["sync", "thread", "driver"]:
+        database.init_async_engine(mode if mode != "sync" else "thread")
+        if mode == "driver" and not database.AsyncSessionLocal:
+            print("  driver: skipped (no async driver installed)")
+            continue
+        session_ids = _create_sessions(manager, args.candidates)
+        row = asyncio.run(_run(manager, session_ids, mode))
+        results.append(row)
+        print(
+            f"  {mode:6s} p50={row['p50_ms']}ms p99={row['p99_ms']}ms "
+            f"loop_lag_max={row['loop_lag_max_ms']}ms rows={row['rows_persisted']}/{row['candidates']}"
+        )
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Write-behind persistence benchmark.
+
+N candidates answer Q questions each, submitting concurrently inside one
+event loop (like uvicorn), once with a transaction per write and once with
+the write-behind writer (journal fsync per write, batched commits). Counts
+database commits with an engine event, so commits/sec saved is measured,
+not estimated.
+
+    python bench_write_behind.py --candidates 100 --answers 3
+    python bench_write_behind.py --candidates 100 --flush-ms 20 --output bench_results/write_behind.json
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+
+# Benchmark on a throwaway database (must be set before app.database is imported)
+_tmp_dir = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmp_dir, 'bench.db')}")
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+import logging
+logging.disable(logging.INFO)
+
+from sqlalchemy import event
+from app import database
+from app.database import engine, SessionLocal
+from app import models
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.question_engine.question_selector import QuestionSelector
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.event_log import SessionEventLog
+from app.interview_flow.write_behind import WriteBehindWriter
+
+models.Base.metadata.create_all(bind=engine)
+
+class CommitCounter:
+    def __init__(self, sync_engine):
+        self.commits = 0
+        event.listen(sync_engine, "commit", self._on_commit)
+
+    def _on_commit(self, *args):
+        self.commits += 1
+
+def _percentiles(samples_ms):
+    ordered = sorted(samples_ms)
+    def pct(p):
+        return round(ordered[min(len(ordered) - 1, int(p / 100.0 * len(ordered)))], 2)
+    return {"p50_ms": pct(50), "p95_ms": pct(95), "p99_ms": pct(99)}
+
+async def _run(manager: SessionManager, question_set, candidates: int, answers: int, label: str):
+    latencies = []
+
+    async def candidate(i):
+        session = await manager.create_session_async(
+            candidate_id=f"{label}_{i}",
+            candidate_name=f"Bench {i}",
+            candidate_phone="+998901234567",
+            candidate_email=f"{label}{i}@example.com",
+            question_set=question_set
+        )
+        for _ in range(answers):
+            t0 = time.perf_counter()
+            await manager.submit_answer_async(session.session_id, "I would add an index and check the query plan")
+            latencies.append((time.perf_counter() - t0) * 1000)
+        return session.session_id
+
+    session_ids = await asyncio.gather(*(candidate(i) for i in range(candidates)))
+    return session_ids, latencies
+
+def _measure(manager: SessionManager, question_set, counter: CommitCounter, args, label: str):
+    before = counter.commits
+    started = time.perf_counter()
+    session_ids, latencies = asyncio.run(_run(manager, question_set, args.candidates, args.answers, label))
+    if manager.write_behind is not None:
+        manager.write_behind.drain(timeout=60)
+    elapsed = time.perf_counter() - started
+    commits = counter.commits - before
+
+    db = SessionLocal()
+    persisted = db.query(models.InterviewAnswer).filter(models.InterviewAnswer.session_id.in_(session_ids)).count()
+    db.close()
+    counter.commits -= 1  # the count query above
+
+    writes = args.candidates * (1 + args.answers + 1)  # create + answers + finish
+    row = {
+        "mode": label,
+        "writes": writes,
+        "db_commits": commits,
+        "elapsed_s": round(elapsed, 3),
+        "commits_per_s": round(commits / elapsed, 1),
+        "writes_per_s": round(writes / elapsed, 1),
+        "answers_persisted": persisted
+    }
+    row.update(_percentiles(latencies))
+    return row
+
+def main():
+    parser = argparse.ArgumentParser(description="Write-behind persistence benchmark")
+    parser.add_argument("--candidates", type=int, default=100)
+    parser.add_argument("--answers", type=int, default=3, help="Answers per candidate (the whole interview)")
+    parser.add_argument("--flush-ms", type=int, default=50)
+    parser.add_argument("--max-batch", type=int, default=200)
+    parser.add_argument("--no-fsync", action="store_true", help="Journal without fsync (not durable)")
+    parser.add_argument("--output", default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    level_result = LevelDetectionResult(
+        candidate_name="Bench",
+        level=CandidateLevel.MIDDLE,
+        confidence_overall=0.7,
+        skills=["python", "sql", "docker"]
+    )
+    question_set = QuestionSelector().select_questions(level_result, max_total_questions=args.answers, lang="en")
+    args.answers = len(question_set.questions)
+    print(f"Benchmarking {args.candidates} candidates x {args.answers} answers...")
+    print(f"  database: {database.DATABASE_URL}")
+    counter = CommitCounter(engine)
+    results = []
+
+    direct = SessionManager(event_log=SessionEventLog())
+    results.append(_measure(direct, question_set, counter, args, "direct"))
+
+    writer = WriteBehindWriter(
+        os.path.join(_tmp_dir, "write_behind.journal"),
+        flush_interval_ms=args.flush_ms,
+        max_batch=args.max_batch,
+        fsync=not args.no_fsync
+    )
+    behind = SessionManager(event_log=SessionEventLog(), write_behind=writer)
+    writer.start(behind.apply_write)
+    results.append(_measure(behind, question_set, counter, args, "write_behind"))
+    writer_metrics = writer.metrics()
+    writer.stop()
+
+    for row in results:
+        print(
+            f"  {row['mode']:12s} commits={row['db_commits']:5d} ({row['commits_per_s']}/s) "
+            f"writes/s={row['writes_per_s']} submit p50={row['p50_ms']}ms p95={row['p95_ms']}ms "
+            f"answers={row['answers_persisted']}"
+        )
+    saved = results[0]["db_commits"] - results[1]["db_commits"]
+    print(f"  commits saved: {saved} of {results[0]['db_commits']} (avg batch {writer_metrics['avg_batch']} writes)")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"results": results, "write_behind": writer_metrics}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    main()
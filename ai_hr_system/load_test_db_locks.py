@@ -0,0 +1,132 @@
+"""
+SQLite lock load test.
+
+Runs the interview write paths (answer INSERT, status UPDATE, session reads)
+from many threads against a fresh database, once with SQLAlchemy defaults and
+once with the tuned engine from app/database.py (WAL, synchronous=NORMAL,
+busy_timeout, sized pool), and counts "database is locked" errors.
+
+Both runs get the same lock wait budget (--timeout-ms, default: pysqlite's 5 s).
+A budget close to a request deadline shows where the defaults start failing:
+
+    python load_test_db_locks.py --threads 40 --ops 100
+    python load_test_db_locks.py --threads 40 --ops 100 --timeout-ms 200
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import tempfile
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+parser = argparse.ArgumentParser(description="SQLite lock load test")
+parser.add_argument("--threads", type=int, default=40, help="FastAPI's default thread pool size")
+parser.add_argument("--ops", type=int, default=100, help="Operations per thread")
+parser.add_argument("--timeout-ms", type=int, default=5000, help="Lock wait budget for both configurations")
+args = parser.parse_args()
+
+# The tuned engine reads its busy timeout at import
+os.environ["SQLITE_BUSY_TIMEOUT_MS"] = str(args.timeout_ms)
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, engine_options, configure_engine, PoolMetrics
+from app.models import SessionModel, InterviewAnswer
+
+SESSIONS = 50
+
+def _make_engine(url: str, tuned: bool):
+    if not tuned:
+        # What app/database.py used to do (rollback journal, default pool)
+        return create_engine(url, connect_args={"check_same_thread": False, "timeout": args.timeout_ms / 1000})
+    engine = create_engine(url, **engine_options(url))
+    configure_engine(engine, url)
+    return engine
+
+def _seed(Session):
+    db = Session()
+    for i in range(SESSIONS):
+        db.add(SessionModel(id=f"load-{i}", status="active", total_questions=100, questions=[], answers=[]))
+    db.commit()
+    db.close()
+
+def run(tuned: bool, threads: int, ops: int):
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'load.db')}"
+    engine = _make_engine(url, tuned)
+    metrics = PoolMetrics("load", engine)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    _seed(Session)
+
+    seq = {f"load-{i}": 0 for i in range(SESSIONS)}
+    seq_lock = threading.Lock()
+    errors = {"locked": 0, "other": 0}
+    latencies = []
+
+    def op(n):
+        rng = random.Random(n)
+        sid = f"load-{rng.randrange(SESSIONS)}"
+        kind = rng.random()
+        db = Session()
+        t0 = time.perf_counter()
+        try:
+            if kind < 0.6:
+                # submit_answer: one INSERT
+                with seq_lock:
+                    position = seq[sid]
+                    seq[sid] += 1
+                db.add(InterviewAnswer(
+                    session_id=sid, question_id=1, seq=position, answer_text="x" * 400,
+                    time_spent=60, ai_score=0.1, submitted_at=datetime.now()
+                ))
+            elif kind < 0.8:
+                # update_status: read then write
+                row = db.query(SessionModel).filter(SessionModel.id == sid).first()
+                row.status_internal = rng.choice(["PENDING", "REVIEWED", "SHORTLISTED"])
+            else:
+                # session status / admin reads
+                db.query(InterviewAnswer).filter(InterviewAnswer.session_id == sid).all()
+            db.commit()
+        except OperationalError as e:
+            db.rollback()
+            errors["locked" if "locked" in str(e) else "other"] += 1
+        finally:
+            db.close()
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(op, range(threads * ops)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    engine.dispose()
+    return {
+        "config": "tuned" if tuned else "defaults",
+        "operations": threads * ops,
+        "locked_errors": errors["locked"],
+        "other_errors": errors["other"],
+        "ops_per_s": round(threads * ops / elapsed, 1),
+        "p99_ms": round(latencies[int(0.99 * (len(latencies) - 1))], 2),
+        "pool": metrics.snapshot()
+    }
+
+def main():
+    print(f"Load test: {args.threads} threads x {args.ops} ops, lock wait budget {args.timeout_ms}ms")
+    results = [run(False, args.threads, args.ops), run(True, args.threads, args.ops)]
+    for r in results:
+        print(
+            f"  {r['config']:8s} locked={r['locked_errors']} other={r['other_errors']} "
+            f"{r['ops_per_s']} ops/s p99={r['p99_ms']}ms max_checked_out={r['pool']['max_checked_out']}"
+        )
+    assert results[1]["locked_errors"] == 0, "Tuned engine must not hit 'database is locked'"
+
+if __name__ == "__main__":
+    main()
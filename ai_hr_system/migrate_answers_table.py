@@ -0,0 +1,78 @@
+"""
+Database Migration: Move answers into the interview_answers table
+
+This migration:
+1. creates the interview_answers table (one row per answer, indexed by session_id)
+2. widens question_id to BIGINT on tables created with INTEGER (generated
+   questions use IDs from 2**40 up; SQLite integers are already 64-bit)
+3. backfills it from the legacy interview_sessions.answers JSON column
+
+The JSON column is left untouched, so the migration can be re-run safely:
+sessions that already have rows are skipped.
+"""
+
+from app.database import engine, SessionLocal
+from app.models import SessionModel, InterviewAnswer
+from sqlalchemy import text, inspect, BigInteger
+from datetime import datetime
+
+def _parse_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+def run_migration():
+    """Create interview_answers and copy answers from the JSON column"""
+    try:
+        print("Starting migration: interview_answers table...")
+        InterviewAnswer.__table__.create(bind=engine, checkfirst=True)
+        print("✓ interview_answers table ready")
+
+        if engine.dialect.name != "sqlite":
+            columns = {col['name']: col['type'] for col in inspect(engine).get_columns('interview_answers')}
+            if not isinstance(columns['question_id'], BigInteger):
+                print("Widening question_id to BIGINT...")
+                with engine.connect() as conn:
+                    conn.execute(text("ALTER TABLE interview_answers ALTER COLUMN question_id TYPE BIGINT"))
+                    conn.commit()
+            print("✓ question_id is BIGINT")
+
+        db = SessionLocal()
+        try:
+            migrated_sessions, migrated_answers, skipped = 0, 0, 0
+            for db_session in db.query(SessionModel).all():
+                if not db_session.answers:
+                    continue
+                if db.query(InterviewAnswer.id).filter(InterviewAnswer.session_id == db_session.id).first():
+                    skipped += 1
+                    continue
+                for seq, a in enumerate(db_session.answers):
+                    db.add(InterviewAnswer(
+                        session_id=db_session.id,
+                        question_id=a.get("question_id", -1),
+                        seq=seq,
+                        answer_text=a.get("answer_text", "") or "",
+                        time_spent=int(a.get("time_spent", 0) or 0),
+                        is_timeout=bool(a.get("is_timeout", False)),
+                        ai_score=a.get("ai_score"),
+                        ai_explanation=a.get("ai_explanation", "") or "",
+                        submitted_at=_parse_datetime(a.get("submitted_at"))
+                    ))
+                    migrated_answers += 1
+                migrated_sessions += 1
+            db.commit()
+        finally:
+            db.close()
+
+        print(f"✓ Backfilled {migrated_answers} answers from {migrated_sessions} sessions ({skipped} already migrated)")
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    run_migration()
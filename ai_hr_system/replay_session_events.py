@@ -0,0 +1,117 @@
+"""
+Replay interview sessions from the session event log.
+
+Rebuilds each session by folding its recorded events (optionally only up to
+event --until) and re-runs integrity analysis and scoring with the current
+code and weights, next to the score stored when the session was evaluated.
+Use it to see how a scoring change would have decided past interviews:
+
+    python replay_session_events.py <session_id>
+    python replay_session_events.py <session_id> --until 7 --events
+    python replay_session_events.py --all --limit 100
+
+CV skills are not re-parsed, so the skills-match part of the score uses none.
+"""
+
+import sys
+import os
+import argparse
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.database import SessionLocal
+from app.models import SessionEvent, SessionModel
+from app.interview_flow.event_log import fold, attach_answer_texts, SESSION_CREATED
+from app.interview_flow.schemas import SessionSummary
+from app.answer_analysis.final_analyzer import FinalAnalyzer
+from app.scoring.score_engine import ScoreEngine
+from app.scoring.recommendation import RecommendationEngine
+from app.scoring.confidence_level import ConfidenceAnalyzer
+
+def load_events(db, session_id: str, until_seq=None):
+    query = db.query(SessionEvent).filter(SessionEvent.session_id == session_id)
+    if until_seq is not None:
+        query = query.filter(SessionEvent.seq <= until_seq)
+    return query.order_by(SessionEvent.seq).all()
+
+def score_session(session, analyzer, score_engine, recommendation_engine, confidence_analyzer):
+    """Same steps as /generate-recommendation, on a folded session"""
+    summary = SessionSummary(
+        session_id=session.session_id,
+        candidate_name=session.candidate_name,
+        total_questions=session.total_questions,
+        answered_questions=len(session.answers),
+        total_time_spent=sum(a.time_spent for a in session.answers),
+        status=session.status,
+        answers=session.answers
+    )
+    integrity_report = analyzer.analyze_session(summary, session.questions)
+    confidence = confidence_analyzer.calculate(
+        summary.total_questions,
+        summary.answered_questions,
+        [len(a.answer_text) for a in summary.answers],
+        integrity_report.suspicious_answers_count
+    )
+    breakdown = score_engine.aggregate(summary, integrity_report, session.questions, [], confidence.value)
+    difficulty_mix = "medium"
+    if all(q.get("difficulty") == "hard" for q in session.questions):
+        difficulty_mix = "hard"
+    elif all(q.get("difficulty") == "easy" for q in session.questions):
+        difficulty_mix = "easy"
+    final_score = score_engine.calculate_final_weighted_score(breakdown, difficulty_mix)
+    decision, _ = recommendation_engine.get_recommendation(final_score, breakdown, integrity_report.global_flags)
+    return final_score, decision
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay sessions from the event log")
+    parser.add_argument("session_id", nargs="?", help="Session to replay")
+    parser.add_argument("--all", action="store_true", help="Replay every session with recorded history")
+    parser.add_argument("--limit", type=int, default=50, help="Sessions to replay with --all")
+    parser.add_argument("--until", type=int, default=None, help="Fold events up to this seq only")
+    parser.add_argument("--events", action="store_true", help="Print the event timeline")
+    args = parser.parse_args()
+    if not args.session_id and not args.all:
+        parser.error("give a session_id or --all")
+
+    analyzer = FinalAnalyzer()
+    score_engine = ScoreEngine()
+    recommendation_engine = RecommendationEngine()
+    confidence_analyzer = ConfidenceAnalyzer()
+
+    db = SessionLocal()
+    try:
+        if args.all:
+            rows = db.query(SessionEvent.session_id).filter(SessionEvent.type == SESSION_CREATED).order_by(
+                SessionEvent.id.desc()
+            ).limit(args.limit).all()
+            session_ids = [row.session_id for row in rows]
+        else:
+            session_ids = [args.session_id]
+
+        print(f"{'session':<38} {'events':>6} {'answered':>9} {'status':<9} {'stored':>7} {'replayed':>9}  decision")
+        for session_id in session_ids:
+            events = load_events(db, session_id, args.until)
+            if args.events:
+                for event in events:
+                    print(f"  #{event.seq:<4} {event.created_at}  {event.type}")
+            session = attach_answer_texts(db, fold((event.type, event.data) for event in events))
+            if session is None:
+                print(f"{session_id:<38} no SessionCreated event recorded")
+                continue
+
+            stored = db.query(SessionModel.score).filter(SessionModel.id == session_id).scalar()
+            if session.answers:
+                score, decision = score_session(session, analyzer, score_engine, recommendation_engine, confidence_analyzer)
+            else:
+                score, decision = None, "-"
+            print(
+                f"{session_id:<38} {len(events):>6} {len(session.answers):>4}/{session.total_questions:<4} "
+                f"{session.status.value:<9} {stored if stored is not None else '-':>7} "
+                f"{score if score is not None else '-':>9}  {getattr(decision, 'value', decision)}"
+            )
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Run the API as several worker processes behind the session router.
+
+Starts --workers uvicorn processes of app.main:app on consecutive ports from
+--worker-port, and the session router on --port in front of them. Every
+request for a session goes to the worker owning that session on the
+consistent-hash ring, so its live state (timers, drafts, SSE streams) stays
+in one process:
+
+    python run_router.py --workers 4
+    python run_router.py --workers 2 --port 8000 --worker-port 8101
+
+Workers can be added and removed at runtime (their sessions are handed over):
+
+    curl -X POST   -H "X-Internal-Token: $TOKEN" -d '{"url": "http://127.0.0.1:8105"}' localhost:8000/router/workers
+    curl -X DELETE -H "X-Internal-Token: $TOKEN" -d '{"url": "http://127.0.0.1:8101"}' localhost:8000/router/workers
+    curl -H "X-Internal-Token: $TOKEN" localhost:8000/router/status
+
+Set ROUTER_INTERNAL_TOKEN to reuse a token (also needed by workers started
+separately); otherwise one is generated for this run. Workers share the
+database, so use SESSION_STORE=sqlite or redis for sessions visible to all.
+"""
+
+import sys
+import os
+import time
+import secrets
+import argparse
+import subprocess
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+import uvicorn
+from app.config import settings
+from app.routing.router import SessionRouter
+
+def main():
+    parser = argparse.ArgumentParser(description="Session router in front of N API workers")
+    parser.add_argument("--workers", type=int, default=2, help="worker processes to start (0: only the router)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000, help="router port")
+    parser.add_argument("--worker-port", type=int, default=8101, help="port of the first worker")
+    parser.add_argument("--worker", action="append", default=[], help="URL of an already running worker (repeatable)")
+    parser.add_argument("--vnodes", type=int, default=settings.ROUTER_VNODES, help="ring points per worker")
+    parser.add_argument("--health-interval", type=float, default=5.0, help="seconds between worker health checks (0: off)")
+    args = parser.parse_args()
+
+    token = settings.ROUTER_INTERNAL_TOKEN or secrets.token_urlsafe(32)
+    env = dict(os.environ, ROUTER_INTERNAL_TOKEN=token)
+
+    processes = []
+    workers = list(args.worker)
+    for i in range(args.workers):
+        port = args.worker_port + i
+        # Worker-local files: the write-behind journal is truncated on start and
+        # checkpointed by path, so workers must never share one
+        worker_env = dict(env, WRITE_BEHIND_JOURNAL=f"{settings.WRITE_BEHIND_JOURNAL}.{port}")
+        if settings.LIVE_SNAPSHOT_PATH:
+            # Each worker restores its own live sessions after a restart
+            worker_env["LIVE_SNAPSHOT_PATH"] = f"{settings.LIVE_SNAPSHOT_PATH}.{port}"
+        processes.append(subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+            env=worker_env
+        ))
+        workers.append(f"http://127.0.0.1:{port}")
+    if not workers:
+        parser.error("no workers: use --workers N or --worker URL")
+
+    print(f"Session router on {args.host}:{args.port} -> {', '.join(workers)}")
+    if not settings.ROUTER_INTERNAL_TOKEN:
+        print(f"ROUTER_INTERNAL_TOKEN for this run: {token}")
+    time.sleep(1)  # let the workers bind before the first health check
+
+    router = SessionRouter(
+        workers, token, vnodes=args.vnodes, health_interval=args.health_interval,
+        answer_max_chars=settings.ANSWER_MAX_CHARS, answer_stream_max_chars=settings.ANSWER_STREAM_MAX_CHARS
+    )
+    try:
+        uvicorn.run(router, host=args.host, port=args.port)
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Shared setup of the interview-flow test scripts: a detected candidate
+level, the questions selected for it, and a started session.
+"""
+
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.question_engine.question_selector import QuestionSelector
+from app.question_engine.schemas import QuestionSet
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.schemas import InterviewSession
+from typing import Optional, Sequence
+
+CANDIDATE_NAME = "Test Candidate"
+
+def level_result(
+    level: CandidateLevel = CandidateLevel.JUNIOR,
+    skills: Sequence[str] = ("python", "sql")
+) -> LevelDetectionResult:
+    return LevelDetectionResult(
+        candidate_name=CANDIDATE_NAME,
+        level=level,
+        confidence_overall=0.7,
+        skills=list(skills)
+    )
+
+def select_questions(questions: int = 2, level: CandidateLevel = CandidateLevel.JUNIOR) -> QuestionSet:
+    return QuestionSelector().select_questions(level_result(level), max_total_questions=questions, lang="en")
+
+def new_session(
+    manager: SessionManager,
+    candidate_id: str,
+    questions: int = 2,
+    question_set: Optional[QuestionSet] = None
+) -> InterviewSession:
+    """Fixed-mode session of `candidate_id` on `question_set` (default: `questions` selected ones)"""
+    return manager.create_session(
+        candidate_id=candidate_id,
+        candidate_name=CANDIDATE_NAME,
+        candidate_phone="+998901234567",
+        candidate_email=f"{candidate_id}@example.com",
+        question_set=question_set or select_questions(questions)
+    )
@@ -84,7 +84,9 @@ function updateAdminUI() {
     document.getElementById('th-score').innerText = t.th_score;
     document.getElementById('th-actions').innerText = t.th_actions;
 
-    loadCandidates();
+    // Language switch only re-renders; live changes arrive over /admin/events
+    if (allCandidates.length) renderCandidates(allCandidates);
+    else loadCandidates();
 }
 
 let allCandidates = [];
@@ -100,6 +102,57 @@ async function loadCandidates() {
     }
 }
 
+let adminEvents = null;
+
+function connectAdminEvents() {
+    if (!window.EventSource) return;
+    adminEvents = new EventSource('/admin/events');
+    let connectedOnce = false;
+
+    adminEvents.addEventListener('open', () => {
+        // Events may have been missed while disconnected: resync once
+        if (connectedOnce) loadCandidates();
+        connectedOnce = true;
+    });
+
+    adminEvents.addEventListener('session_created', (e) => {
+        const row = JSON.parse(e.data);
+        if (allCandidates.some(c => c.session_id === row.session_id)) return;
+        allCandidates.unshift(row);
+        renderCandidates(allCandidates);
+    });
+
+    adminEvents.addEventListener('answer_submitted', (e) => {
+        const data = JSON.parse(e.data);
+        const candidate = allCandidates.find(c => c.session_id === data.session_id);
+        if (candidate) (candidate.answers = candidate.answers || []).push(data.answer);
+    });
+
+    adminEvents.addEventListener('answer_analyzed', (e) => {
+        const data = JSON.parse(e.data);
+        const candidate = allCandidates.find(c => c.session_id === data.session_id);
+        const answer = candidate && candidate.answers ? candidate.answers[data.seq] : null;
+        if (!answer) return;
+        answer.ai_score = data.ai_score;
+        answer.ai_explanation = data.ai_explanation;
+    });
+
+    adminEvents.addEventListener('session_finished', (e) => {
+        const data = JSON.parse(e.data);
+        const candidate = allCandidates.find(c => c.session_id === data.session_id);
+        if (candidate) candidate.finished = true;
+    });
+
+    adminEvents.addEventListener('status_updated', (e) => {
+        const data = JSON.parse(e.data);
+        const candidate = allCandidates.find(c => c.session_id === data.session_id);
+        if (!candidate) return;
+        candidate.status_internal = data.status_internal;
+        candidate.status_public = data.status_public;
+        renderCandidates(allCandidates);
+    });
+}
+
 function renderCandidates(candidates) {
     const body = document.getElementById('candidates-body');
     const t = adminTranslations[adminLang];
@@ -405,7 +458,7 @@ async function updateStatus(sessionId, status) {
             throw new Error(`${res.status}: ${errTxt}`);
         }
         alert(t.update_success);
-        loadCandidates();
+        if (!adminEvents) loadCandidates();
     } catch (error) {
         console.error("Failed to update status:", error);
         alert(`Failed to update status: ${error.message}`);
@@ -414,4 +467,5 @@ async function updateStatus(sessionId, status) {
 
 document.addEventListener('DOMContentLoaded', () => {
     updateAdminUI();
+    connectAdminEvents();
 });
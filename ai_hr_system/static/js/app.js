@@ -4,6 +4,14 @@ let currentQuestionIndex = 0;
 let questions = [];
 let timerInterval = null;
 let isSubmitting = false;
+let eventSource = null;       // server push channel (question transitions + timer ticks)
+let shownQuestionIndex = -1;
+let autoSubmittedIndex = -1;
+let draft = { index: -1, rev: 0, text: "" }; // last autosaved answer text (text null: unknown, resend whole)
+let draftTimer = null;
+let draftSending = false;
+const STREAM_ANSWER_CHARS = 8000; // longer answers (code) go to /submit-answer-stream as plain text
+let telemetry = null; // typing/paste/focus events of the current question since the last batch
 
 const translations = {
     en: {
@@ -199,8 +207,13 @@ async function startProcessing() {
             })
         }, 'start-interview');
         sessionId = session.session_id;
+        saveResumeToken(session.resume_token);
 
-        loadQuestion();
+        if (window.EventSource) {
+            connectSessionEvents();
+        } else {
+            loadQuestion();
+        }
         showStep('step-interview');
     } catch (error) {
         console.error(error);
@@ -211,6 +224,89 @@ async function startProcessing() {
     }
 }
 
+function saveResumeToken(token) {
+    try { if (token) localStorage.setItem('aihr_resume', token); } catch (_) {}
+}
+
+function clearResumeToken() {
+    try { localStorage.removeItem('aihr_resume'); } catch (_) {}
+}
+
+async function resumeInterview() {
+    // After a reload: continue the interrupted interview where it stopped, with the time left
+    let token = null;
+    try { token = localStorage.getItem('aihr_resume'); } catch (_) {}
+    if (!token) return;
+
+    try {
+        const res = await fetch(`/resume/${encodeURIComponent(token)}`);
+        if (!res.ok) {
+            clearResumeToken();
+            return;
+        }
+        const session = await res.json();
+        sessionId = session.session_id;
+        questions = session.questions;
+        currentQuestionIndex = session.current_question_index;
+        if (session.status !== 'active' || !session.current_question) {
+            clearResumeToken();
+            showStep('step-final');
+            return;
+        }
+
+        showStep('step-interview');
+        const q = session.current_question;
+        shownQuestionIndex = currentQuestionIndex;
+        document.getElementById('question-text').innerText = q.question_text;
+        document.getElementById('progress-fill').style.width = `${(currentQuestionIndex / session.total_questions) * 100}%`;
+        await restoreDraft();
+        resetTelemetry(currentQuestionIndex);
+        if (window.EventSource) {
+            connectSessionEvents(); // the server re-sends the current question and time remaining
+        } else {
+            startTimer(q.time_remaining);
+        }
+    } catch (error) {
+        console.error(error);
+    }
+}
+
+function connectSessionEvents() {
+    // The server owns the interview: it pushes each question and the authoritative time remaining
+    eventSource = new EventSource(`/events/session/${sessionId}`);
+
+    eventSource.addEventListener('question', (e) => {
+        const q = JSON.parse(e.data);
+        currentQuestionIndex = q.index;
+        if (q.index !== shownQuestionIndex) {
+            // Reconnects re-send the current question: keep what was typed
+            shownQuestionIndex = q.index;
+            document.getElementById('question-text').innerText = q.question_text;
+            document.getElementById('answer-text').value = "";
+            resetDraft(q.index);
+            resetTelemetry(q.index);
+        }
+        document.getElementById('progress-fill').style.width = `${(q.index / q.total) * 100}%`;
+        renderTimer(q.time_remaining);
+    });
+
+    eventSource.addEventListener('tick', (e) => {
+        const tick = JSON.parse(e.data);
+        if (tick.index !== currentQuestionIndex) return;
+        renderTimer(tick.time_remaining);
+        if (tick.time_remaining <= 0 && autoSubmittedIndex !== tick.index) {
+            autoSubmittedIndex = tick.index;
+            submitAnswer(true); // Save whatever was typed; the server times out the question anyway
+        }
+    });
+
+    eventSource.addEventListener('finished', () => {
+        eventSource.close();
+        eventSource = null;
+        finishInterview();
+    });
+}
+
 function loadQuestion() {
     if (currentQuestionIndex >= questions.length) {
         finishInterview();
@@ -220,6 +316,8 @@ function loadQuestion() {
     const q = questions[currentQuestionIndex];
     document.getElementById('question-text').innerText = q.question;
     document.getElementById('answer-text').value = "";
+    resetDraft(currentQuestionIndex);
+    resetTelemetry(currentQuestionIndex);
     document.getElementById('progress-fill').style.width = `${((currentQuestionIndex) / questions.length) * 100}%`;
 
     startTimer(120); // 2 minutes per question
@@ -235,6 +333,7 @@ async function submitAnswer(isTimeout = false) {
     }
 
     clearInterval(timerInterval);
+    clearTimeout(draftTimer); // the submitted answer replaces the draft
     isSubmitting = true;
 
     try {
@@ -242,14 +341,30 @@ async function submitAnswer(isTimeout = false) {
         const btn = document.getElementById('btn-submit');
         if (btn) btn.disabled = true;
 
-        await fetch(`/submit-answer/${sessionId}`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify(answer || "")
-        });
+        await sendTelemetry(); // the answer is analyzed with the telemetry of its question
+        const text = answer || "";
+        const streamed = text.length > STREAM_ANSWER_CHARS;
+        let res = await postAnswer(text, streamed);
+        if (res.status === 413 && !streamed) {
+            // Over the JSON limit: the stream endpoint takes long answers
+            res = await postAnswer(text, true);
+        }
+        if (res.status === 413) {
+            const error = await res.json().catch(() => ({}));
+            alert(error.detail || "Answer is too long.");
+            if (!isTimeout) {
+                // Not submitted: the question goes on
+                await resumeQuestion();
+                return;
+            }
+            // Time is up anyway: the server records the question as timed out
+        }
 
-        currentQuestionIndex++;
-        loadQuestion();
+        // With the push channel the next question (or `finished`) arrives from the server
+        if (!eventSource) {
+            currentQuestionIndex++;
+            loadQuestion();
+        }
     } catch (error) {
         console.error(error);
         alert("Failed to submit answer.");
@@ -260,7 +375,146 @@ async function submitAnswer(isTimeout = false) {
     }
 }
 
+function postAnswer(text, streamed) {
+    return fetch(
+        `/submit-answer${streamed ? '-stream' : ''}/${sessionId}?question_index=${currentQuestionIndex}`,
+        streamed
+            ? { method: 'POST', headers: { 'Content-Type': 'text/plain; charset=utf-8' }, body: text }
+            : { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify(text) }
+    );
+}
+
+async function resumeQuestion() {
+    // Keep autosaving the answer; the server kept timing the question meanwhile
+    scheduleDraftSave();
+    if (eventSource) return; // its ticks carry the countdown
+    try {
+        const q = await fetchJsonOrThrow(`/current-question/${sessionId}`, {}, "Current question");
+        startTimer(q.time_remaining);
+    } catch (error) {
+        console.error(error);
+    }
+}
+
+function resetDraft(index) {
+    clearTimeout(draftTimer);
+    draft = { index: index, rev: 0, text: "" };
+}
+
+function scheduleDraftSave() {
+    // Debounced: one small delta per typing burst
+    clearTimeout(draftTimer);
+    draftTimer = setTimeout(saveDraft, 800);
+}
+
+function draftDelta(beforeText, afterText) {
+    // Changed span between the common prefix and suffix, in code points (the server's string offsets)
+    const before = Array.from(beforeText);
+    const after = Array.from(afterText);
+    let start = 0;
+    while (start < before.length && start < after.length && before[start] === after[start]) start++;
+    let end = 0;
+    while (end < before.length - start && end < after.length - start &&
+           before[before.length - 1 - end] === after[after.length - 1 - end]) end++;
+    return { offset: start, delete: before.length - start - end, text: after.slice(start, after.length - end).join('') };
+}
+
+async function saveDraft() {
+    if (!sessionId || isSubmitting || draft.index < 0) return;
+    if (draftSending) {
+        scheduleDraftSave();
+        return;
+    }
+    const text = document.getElementById('answer-text').value;
+    if (text === draft.text) return;
+    const delta = draft.text === null
+        ? { offset: 0, delete: draft.length, text: text }
+        : draftDelta(draft.text, text);
+
+    draftSending = true;
+    try {
+        const res = await fetch(`/draft/${sessionId}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ question_index: draft.index, rev: draft.rev, ...delta })
+        });
+        if (res.ok) {
+            draft.rev = (await res.json()).rev;
+            draft.text = text;
+        } else if (res.status === 409) {
+            // Server holds another revision: replace all of it with the next save
+            const detail = (await res.json()).detail;
+            draft = { index: draft.index, rev: detail.rev, text: null, length: detail.length };
+            scheduleDraftSave();
+        }
+    } catch (error) {
+        console.error(error);
+    } finally {
+        draftSending = false;
+    }
+}
+
+async function restoreDraft() {
+    // Autosaved text of the current question (after a reload)
+    resetDraft(currentQuestionIndex);
+    try {
+        const res = await fetch(`/draft/${sessionId}`);
+        if (!res.ok) return;
+        const saved = await res.json();
+        if (saved.question_index !== currentQuestionIndex) return;
+        document.getElementById('answer-text').value = saved.text;
+        draft = { index: saved.question_index, rev: saved.rev, text: saved.text };
+    } catch (error) {
+        console.error(error);
+    }
+}
+
+function resetTelemetry(index) {
+    const now = Date.now();
+    telemetry = { index: index, startedAt: now, lastKeyAt: now, keys: [], pastes: [], focus: [] };
+}
+
+function recordKeystroke(e) {
+    if (!telemetry || ['Shift', 'Control', 'Alt', 'Meta', 'CapsLock'].includes(e.key)) return;
+    // Delta-encoded: milliseconds since the previous keystroke
+    const now = Date.now();
+    telemetry.keys.push(Math.min(now - telemetry.lastKeyAt, 65535));
+    telemetry.lastKeyAt = now;
+}
+
+function recordPaste(e) {
+    if (!telemetry) return;
+    const data = e.clipboardData || window.clipboardData;
+    const text = data ? data.getData('text') : '';
+    telemetry.pastes.push([Date.now() - telemetry.startedAt, text.length]);
+}
+
+function recordFocus(focused) {
+    if (!telemetry || !sessionId) return;
+    telemetry.focus.push([Date.now() - telemetry.startedAt, focused ? 1 : 0]);
+}
+
+async function sendTelemetry() {
+    if (!sessionId || !telemetry) return;
+    const batch = telemetry;
+    if (!batch.keys.length && !batch.pastes.length && !batch.focus.length) return;
+    const body = { question_index: batch.index, keys: batch.keys, pastes: batch.pastes, focus: batch.focus };
+    batch.keys = [];
+    batch.pastes = [];
+    batch.focus = [];
+    try {
+        await fetch(`/telemetry/${sessionId}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(body)
+        });
+    } catch (error) {
+        console.error(error);
+    }
+}
+
 async function finishInterview() {
+    clearResumeToken();
     showStep('step-loading');
     const lang = document.getElementById('lang-select').value;
     const t = translations[lang] || translations.en;
@@ -278,14 +532,18 @@ async function finishInterview() {
     }
 }
 
+function renderTimer(timeLeft) {
+    const mins = Math.floor(timeLeft / 60) || 0;
+    const secs = timeLeft % 60 || 0;
+    document.getElementById('timer').innerText = `Time Remaining: ${String(mins).padStart(2, '0')}:${String(secs).padStart(2, '0')}`;
+}
+
 function startTimer(seconds) {
+    // Fallback for browsers without EventSource
     let timeLeft = seconds;
-    const timerEl = document.getElementById('timer');
 
     timerInterval = setInterval(() => {
-        const mins = Math.floor(timeLeft / 60) || 0;
-        const secs = timeLeft % 60 || 0;
-        timerEl.innerText = `Time Remaining: ${String(mins).padStart(2, '0')}:${String(secs).padStart(2, '0')}`;
+        renderTimer(timeLeft);
 
         if (timeLeft <= 0) {
             clearInterval(timerInterval);
@@ -314,4 +572,14 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     } catch (_) {}
     updateUI();
+    const answerBox = document.getElementById('answer-text');
+    if (answerBox) {
+        answerBox.addEventListener('input', scheduleDraftSave);
+        answerBox.addEventListener('keydown', recordKeystroke);
+        answerBox.addEventListener('paste', recordPaste);
+    }
+    window.addEventListener('blur', () => recordFocus(false));
+    window.addEventListener('focus', () => recordFocus(true));
+    setInterval(sendTelemetry, 5000); // batched
+    resumeInterview();
 });
\ No newline at end of file
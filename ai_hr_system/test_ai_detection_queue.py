@@ -0,0 +1,118 @@
+import sys
+import os
+import time
+import threading
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.answer_analysis.ai_detector import AIDetector
+from app.answer_analysis.detection_queue import AIDetectionQueue
+from app.answer_analysis.final_analyzer import FinalAnalyzer
+from app.database import engine, SessionLocal
+from app import models
+from session_fixtures import new_session
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+AI_ANSWER = "It's important to note that, furthermore, best practices suggest a comprehensive overview. Moreover, " * 3
+
+class SlowDetector(AIDetector):
+    """Stands in for heavier analysis (50ms per answer)"""
+    def __init__(self, gate: threading.Event = None):
+        self.gate = gate
+
+    def analyze(self, text: str, time_spent: int = 0):
+        if self.gate:
+            self.gate.wait()
+        time.sleep(0.05)
+        return super().analyze(text, time_spent=time_spent)
+
+def _run_interview(manager: SessionManager, candidate_id: str):
+    session = new_session(manager, candidate_id)
+    timings = []
+    for i in range(session.total_questions):
+        t0 = time.perf_counter()
+        manager.submit_answer(session.session_id, AI_ANSWER if i == 0 else f"my own answer {i}")
+        timings.append((time.perf_counter() - t0) * 1000)
+    return session.session_id, timings
+
+def test_ai_detection_queue():
+    print("Testing Background AI Detection Queue...")
+
+    print("\n=== Test 1: Submit latency without inline detection ===")
+    inline = SessionManager()
+    inline.ai_detector = SlowDetector()
+    _, inline_ms = _run_interview(inline, "queue_001")
+
+    queue = AIDetectionQueue(detector=SlowDetector(), max_size=100)
+    manager = SessionManager(ai_queue=queue)
+    sid, queued_ms = _run_interview(manager, "queue_002")
+    print(f"  inline median={sorted(inline_ms)[len(inline_ms) // 2]:.1f}ms, queued median={sorted(queued_ms)[len(queued_ms) // 2]:.1f}ms")
+    assert min(inline_ms) >= 50
+    assert sorted(queued_ms)[len(queued_ms) // 2] < min(inline_ms)
+
+    assert queue.wait_idle(timeout=5)
+    session = manager.get_session_status(sid)
+    print(f"  scores after drain: {[a.ai_score for a in session.answers]}, {queue.metrics()}")
+    assert all(a.ai_score is not None for a in session.answers)
+    assert session.answers[0].ai_score > 0.5
+    db = SessionLocal()
+    try:
+        rows = db.query(models.InterviewAnswer).filter(models.InterviewAnswer.session_id == sid).order_by(models.InterviewAnswer.seq).all()
+        assert [r.ai_score for r in rows] == [a.ai_score for a in session.answers]
+    finally:
+        db.close()
+    queue.stop()
+
+    print("\n=== Test 2: Full queue rejects instead of blocking ===")
+    gate = threading.Event()
+    small = AIDetectionQueue(detector=SlowDetector(gate), max_size=2)
+    manager = SessionManager(ai_queue=small)
+    sid, timings = _run_interview(manager, "queue_003")
+    metrics = small.metrics()
+    print(f"  max submit={max(timings):.1f}ms, {metrics}")
+    assert metrics["rejected"] >= 1 and metrics["high_water"] <= 2
+    pending = manager.get_session_summary(sid)
+    assert any(a.ai_score is None for a in pending.answers)
+
+    print("\n=== Test 3: FinalAnalyzer computes pending results on demand ===")
+    session = manager.get_session_status(sid)
+    report = FinalAnalyzer().analyze_session(pending, session.questions)
+    gate.set()
+    assert small.wait_idle(timeout=5)
+    small.stop()
+    expected = AIDetector().analyze(AI_ANSWER).score
+    print(f"  first answer ai_score={report.answer_reports[0].ai_probability} (expected {expected})")
+    assert abs(report.answer_reports[0].ai_probability - expected) < 1e-9
+
+    print("\n=== Test 4: Results reach the live session ===")
+    gate = threading.Event()
+    queue = AIDetectionQueue(detector=SlowDetector(gate), max_size=10)
+    manager = SessionManager(ai_queue=queue)
+    session = new_session(manager, "queue_004")
+    sid = session.session_id
+    manager.submit_answer(sid, AI_ANSWER)
+    # The live record moves on while the first answer is analyzed
+    manager.submit_answer(sid, "my own answer 1")
+    gate.set()
+    assert queue.wait_idle(timeout=5)
+    queue.stop()
+    live = manager.store.load(sid)
+    print(f"  live scores: {[a.ai_score for a in live.answers]}, revision={live.revision}")
+    assert live.status == "active" and len(live.answers) == 2
+    assert all(a.ai_score is not None for a in live.answers)
+    assert live.answers[0].ai_score > 0.5
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Submit returns before AI detection [OK]")
+    print("- Results persisted by the worker [OK]")
+    print("- Backpressure without blocking [OK]")
+    print("- On-demand analysis for pending answers [OK]")
+    print("- Live session updated with results [OK]")
+
+if __name__ == "__main__":
+    test_ai_detection_queue()
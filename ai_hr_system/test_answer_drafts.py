@@ -0,0 +1,117 @@
+import sys
+import os
+import time
+import asyncio
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.draft_buffer import DraftBuffer, DraftConflict
+from app.database import engine, run_sync_db
+from app.models import AnswerDraft, InterviewAnswer
+from app import models
+from session_fixtures import new_session
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def _stored_draft(session_id: str):
+    def load(db):
+        row = db.query(AnswerDraft).filter(AnswerDraft.session_id == session_id).first()
+        return (row.question_index, row.text, row.rev) if row else None
+    return run_sync_db(load)
+
+def _answer_rows(session_id: str) -> int:
+    return run_sync_db(lambda db: db.query(InterviewAnswer).filter(InterviewAnswer.session_id == session_id).count())
+
+async def _run():
+    manager = SessionManager(drafts=DraftBuffer(debounce_ms=50, max_delay_ms=200))
+    session = new_session(manager, "draft_001")
+    sid = session.session_id
+
+    print("\n=== Test 1: Deltas edit the draft, answers untouched ===")
+    r = await manager.save_draft_async(sid, 0, 0, 0, 0, "I would use an index")
+    r = await manager.save_draft_async(sid, 0, r["rev"], 12, 2, "a B-tree")
+    r = await manager.save_draft_async(sid, 0, r["rev"], 0, 1, "We")
+    draft = await manager.get_draft_async(sid)
+    print(f"  rev={draft.rev} text={draft.text!r}")
+    assert draft.text == "We would use a B-tree index"
+    assert draft.rev == 3
+    assert _answer_rows(sid) == 0
+    assert manager.store.load(sid).answers == []
+
+    print("\n=== Test 2: Stale revision conflicts, whole-text delta resolves it ===")
+    try:
+        await manager.save_draft_async(sid, 0, 1, 0, 0, "lost")
+        assert False, "expected DraftConflict"
+    except DraftConflict as e:
+        print(f"  conflict: server rev={e.rev} length={e.length}")
+        assert (e.rev, e.length) == (3, len(draft.text))
+        r = await manager.save_draft_async(sid, 0, e.rev, 0, e.length, "Composite index on (user_id, created_at)")
+    assert (await manager.get_draft_async(sid)).text == "Composite index on (user_id, created_at)"
+    for bad in [(0, r["rev"], 99, 0, "x"), (0, r["rev"], 0, 999, ""), (1, r["rev"], 0, 0, "x")]:
+        try:
+            await manager.save_draft_async(sid, *bad)
+            assert False, f"expected ValueError for {bad}"
+        except ValueError as e:
+            print(f"  rejected: {e}")
+
+    print("\n=== Test 3: Writes are debounced ===")
+    written_now = await manager.drafts.flush()
+    print(f"  flushed while typing: {written_now}")
+    assert written_now == 0
+    assert _stored_draft(sid) is None
+    await asyncio.sleep(0.06)
+    assert await manager.drafts.flush() == 1
+    print(f"  stored after pause: {_stored_draft(sid)}")
+    assert _stored_draft(sid) == (0, "Composite index on (user_id, created_at)", r["rev"])
+
+    # Continuous typing is still saved after max_delay
+    rev = r["rev"]
+    started = time.monotonic()
+    while time.monotonic() - started < 0.25:
+        rev = (await manager.save_draft_async(sid, 0, rev, 0, 0, "."))["rev"]
+        await manager.drafts.flush()
+        await asyncio.sleep(0.02)
+    print(f"  stored during continuous typing: rev {_stored_draft(sid)[2]} of {rev}")
+    assert _stored_draft(sid)[2] > r["rev"]
+
+    print("\n=== Test 4: Another worker continues from the stored draft ===")
+    await manager.drafts.flush(everything=True)
+    other = SessionManager(drafts=DraftBuffer(debounce_ms=50), session_store=manager.store)
+    restored = await other.get_draft_async(sid)
+    print(f"  restored rev={restored.rev} length={len(restored.text)}")
+    assert (restored.text, restored.rev) == ((await manager.get_draft_async(sid)).text, rev)
+    r = await other.save_draft_async(sid, 0, restored.rev, len(restored.text), 0, "!")
+    assert r["rev"] == rev + 1
+
+    print("\n=== Test 5: Submitting the answer drops the draft ===")
+    await manager.submit_answer_async(sid, "Composite index on (user_id, created_at)")
+    await manager.drafts.flush(everything=True)
+    print(f"  stored draft after submit: {_stored_draft(sid)}")
+    assert _stored_draft(sid) is None
+    assert manager.drafts.get(sid) is None
+    assert (await manager.get_draft_async(sid)).text == ""
+    try:
+        await manager.save_draft_async(sid, 0, 0, 0, 0, "late delta")
+        assert False, "expected ValueError"
+    except ValueError as e:
+        print(f"  late delta rejected: {e}")
+    await manager.save_draft_async(sid, 1, 0, 0, 0, "Next answer")
+    metrics = manager.drafts_metrics()
+    print(f"  metrics: {metrics}")
+    assert metrics["conflicts"] == 1
+
+def test_answer_drafts():
+    print("Testing Answer Draft Autosave...")
+    asyncio.run(_run())
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Delta edits [OK]")
+    print("- Debounced writes [OK]")
+    print("- Draft restore + discard on submit [OK]")
+
+if __name__ == "__main__":
+    test_answer_drafts()
@@ -0,0 +1,128 @@
+import sys
+import os
+import asyncio
+
+import httpx
+from fastapi import FastAPI, Body, HTTPException, Request
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.event_log import SessionEventLog
+from app.interview_flow.answer_upload import AnswerBodyLimit, AnswerTooLarge, read_answer_stream
+from app.database import engine, run_sync_db
+from app.models import InterviewAnswer, SessionEvent, SessionSnapshot
+from app import models
+from session_fixtures import new_session
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def _limited_app(manager: SessionManager, max_chars: int) -> FastAPI:
+    """The two submit endpoints of app.main, with small limits"""
+    app = FastAPI()
+    app.add_middleware(AnswerBodyLimit, max_chars=max_chars)
+
+    @app.post("/submit-answer/{session_id}")
+    async def submit(session_id: str, answer_text: str = Body(...)):
+        if len(answer_text) > max_chars:
+            raise HTTPException(status_code=413, detail=str(AnswerTooLarge(max_chars)))
+        await manager.submit_answer_async(session_id, answer_text)
+        return {"status": "success"}
+
+    @app.post("/submit-answer-stream/{session_id}")
+    async def submit_stream(session_id: str, request: Request, question_index: int = None):
+        try:
+            answer_text = await read_answer_stream(request.stream(), max_chars * 10)
+            await manager.submit_answer_async(session_id, answer_text, question_index)
+        except AnswerTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {"status": "success", "answer_chars": len(answer_text)}
+
+    return app
+
+async def _chunks(data: bytes, size: int, sent: list):
+    for i in range(0, len(data), size):
+        sent.append(size)
+        yield data[i:i + size]
+
+async def _run():
+    print("\n=== Test 1: Streamed answers decode across chunks, stop early when too long ===")
+    code = "def f(x):\n    return x  # ĸ→λ 🐍\n" * 100
+    sent = []
+    assert await read_answer_stream(_chunks(code.encode("utf-8"), 7, sent), 10000) == code
+    sent = []
+    try:
+        await read_answer_stream(_chunks(code.encode("utf-8"), 64, sent), 500)
+        assert False, "expected AnswerTooLarge"
+    except AnswerTooLarge as e:
+        print(f"  rejected after {len(sent)} of {len(code.encode('utf-8')) // 64 + 1} chunks: {e}")
+        assert len(sent) < 20
+    try:
+        await read_answer_stream(_chunks(b"ok \xff", 2, []), 100)
+        assert False, "expected ValueError"
+    except ValueError as e:
+        print(f"  rejected: {e}")
+
+    print("\n=== Test 2: Oversized submissions get 413 ===")
+    log = SessionEventLog(snapshot_every=2)
+    manager = SessionManager(event_log=log)
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=_limited_app(manager, 1000)), base_url="http://test")
+    session = new_session(manager, "limits_001")
+    sid = session.session_id
+
+    declared = await client.post(f"/submit-answer/{sid}", json="x" * 20000)
+    print(f"  declared 20000 chars: {declared.status_code} {declared.json()}")
+    assert declared.status_code == 413
+    chunked = await client.post(f"/submit-answer/{sid}", content=_chunks(b'"' + b"y" * 20000 + b'"', 1024, []))
+    print(f"  chunked 20000 chars: {chunked.status_code}")
+    assert chunked.status_code == 413
+    escaped = await client.post(f"/submit-answer/{sid}", json="é" * 1001)
+    assert escaped.status_code == 413
+    stream = await client.post(f"/submit-answer-stream/{sid}", content=b"z" * 10001)
+    assert stream.status_code == 413
+    assert manager.store.load(sid).answers == []
+
+    print("\n=== Test 3: Large code answer streamed for its question ===")
+    stale = await client.post(f"/submit-answer-stream/{sid}?question_index=1", content=code.encode("utf-8"))
+    print(f"  wrong question: {stale.status_code} {stale.json()}")
+    assert stale.status_code == 400
+    res = await client.post(
+        f"/submit-answer-stream/{sid}?question_index=0", content=_chunks(code.encode("utf-8"), 512, [])
+    )
+    print(f"  streamed: {res.json()}")
+    assert res.status_code == 200 and res.json()["answer_chars"] == len(code)
+    ok = await client.post(f"/submit-answer/{sid}", json="Short second answer")
+    assert ok.status_code == 200
+    await client.aclose()
+
+    print("\n=== Test 4: Answer text is stored once ===")
+    def stored(db):
+        rows = db.query(InterviewAnswer.answer_text).filter(InterviewAnswer.session_id == sid).order_by(InterviewAnswer.seq).all()
+        events = db.query(SessionEvent.type, SessionEvent.data).filter(SessionEvent.session_id == sid).all()
+        snapshot = db.query(SessionSnapshot.state).filter(SessionSnapshot.session_id == sid).scalar()
+        return [r.answer_text for r in rows], events, snapshot
+    texts, events, snapshot = run_sync_db(stored)
+    answer_events = [data for event_type, data in events if event_type == "AnswerSubmitted"]
+    print(f"  answer rows: {[len(t) for t in texts]}, events with text: {sum('answer_text' in d['answer'] for d in answer_events)}")
+    assert texts == [code, "Short second answer"]
+    assert all("answer_text" not in d["answer"] for d in answer_events)
+    assert snapshot is not None and all("answer_text" not in a for a in snapshot["answers"])
+    hydrated = run_sync_db(log.hydrate, sid)
+    assert [a.answer_text for a in hydrated.answers] == texts
+
+def test_answer_limits():
+    print("Testing Answer Size Limits...")
+    asyncio.run(_run())
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- 413 for oversized answers [OK]")
+    print("- Streamed submission [OK]")
+    print("- Answer text stored once [OK]")
+
+if __name__ == "__main__":
+    test_answer_limits()
@@ -0,0 +1,138 @@
+import sys
+import os
+import json
+import random
+import asyncio
+from array import array
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.answer_analysis import telemetry as telemetry_module
+from app.answer_analysis.telemetry import TelemetryRecorder, pack, unpack
+from app.answer_analysis.schemas import TelemetryBatch
+from app.answer_analysis.time_behavior import TimeBehaviorAnalyzer
+from app.answer_analysis.final_analyzer import FinalAnalyzer
+from app.database import engine, run_sync_db
+from app.models import AnswerTelemetry
+from app import models
+from session_fixtures import new_session
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def _typing(n: int, rng: random.Random):
+    """Human-like intervals: 120-250ms keystrokes with a pause every ~40 keys"""
+    return [rng.randint(1500, 4000) if i % 40 == 39 else rng.randint(120, 250) for i in range(n)]
+
+def _time_flags(report):
+    return next(r for r in report.analysis_results if r.type.value == "time_behavior").flags
+
+async def _run():
+    rng = random.Random(7)
+    worker_a = SessionManager(telemetry=TelemetryRecorder())
+    session = new_session(worker_a, "telemetry_001")
+    sid = session.session_id
+
+    print("\n=== Test 1: Packed arrays round-trip and stay small ===")
+    keys = _typing(2000, rng)
+    packed = pack(array("H", keys))
+    print(f"  2000 intervals: json={len(json.dumps(keys))}B packed+zlib={len(packed)}B")
+    assert unpack(packed, "H").tolist() == keys
+    assert len(packed) < len(json.dumps(keys)) / 2
+    assert unpack(None, "I").tolist() == []
+
+    print("\n=== Test 2: Batches are appended, features derived ===")
+    typed = _typing(120, rng)
+    await worker_a.record_telemetry_async(sid, TelemetryBatch(question_index=0, keys=typed[:60], focus=[(5000, 0), (9000, 1)]))
+    features = await worker_a.record_telemetry_async(sid, TelemetryBatch(
+        question_index=0, keys=typed[60:] + [70000], pastes=[(20000, 600)]
+    ))
+    print(f"  features: {features.model_dump()}")
+    assert features.keystrokes == 121
+    assert features.paste_count == 1 and features.paste_chars == 600
+    assert features.paste_ratio == round(600 / 721, 3)
+    assert 3.5 < features.burst_rate < 9
+    assert features.blur_count == 1 and features.away_seconds == 4.0
+    stored = run_sync_db(lambda db: db.query(AnswerTelemetry.keys).filter(AnswerTelemetry.session_id == sid).scalar())
+    assert isinstance(stored, bytes) and unpack(stored, "H")[-1] == 65535  # long pause clamped
+
+    print("\n=== Test 3: Analysis uses stored features, not raw events ===")
+    decoded = []
+    original_unpack = telemetry_module.unpack
+    telemetry_module.unpack = lambda *args: decoded.append(args) or original_unpack(*args)
+    try:
+        worker_b = SessionManager(telemetry=TelemetryRecorder(), session_store=worker_a.store)
+        await worker_b.submit_answer_async(sid, "x" * 620)
+    finally:
+        telemetry_module.unpack = original_unpack
+    report = (await worker_b.get_integrity_reports_async(sid))[0]
+    flags = _time_flags(report)
+    print(f"  time_behavior flags: {flags}, raw arrays decoded: {len(decoded)}")
+    assert "mostly_pasted_answer" in flags
+    assert decoded == []
+
+    print("\n=== Test 4: Typed answer; scripted bursts ===")
+    await worker_b.record_telemetry_async(sid, TelemetryBatch(question_index=1, keys=[20] * 200))
+    await worker_b.submit_answer_async(sid, "y" * 200)
+    report = (await worker_b.get_integrity_reports_async(sid))[1]
+    print(f"  20ms keystrokes: {_time_flags(report)}")
+    assert "inhuman_typing_bursts" in _time_flags(report)
+    assert "mostly_pasted_answer" not in _time_flags(report)
+    plain = TimeBehaviorAnalyzer().analyze(time_spent=120, difficulty="medium", text_length=300)
+    assert "typing" not in plain.details
+
+    print("\n=== Test 5: On-demand analysis reads the features too ===")
+    summary = await worker_b.get_session_summary_async(sid)
+    questions = (await worker_b.get_session_status_async(sid)).questions
+    features = await worker_b.get_typing_features_async(sid)
+    print(f"  features stored for answers {sorted(features)}")
+    assert sorted(features) == [0, 1]
+    # No stored reports: every answer is analyzed here, as for a pending analysis
+    on_demand = FinalAnalyzer().analyze_session(summary, questions, None, features)
+    assert "mostly_pasted_answer" in _time_flags(on_demand.answer_reports[0])
+    assert "inhuman_typing_bursts" in _time_flags(on_demand.answer_reports[1])
+    without = FinalAnalyzer().analyze_session(summary, questions)
+    assert "mostly_pasted_answer" not in _time_flags(without.answer_reports[0])
+
+    print("\n=== Test 6: Concurrent batches of one answer are all kept ===")
+    racing = new_session(worker_a, "telemetry_003")
+    rid = racing.session_id
+    # Another worker with its own recorder serves part of the batches
+    worker_c = SessionManager(telemetry=TelemetryRecorder(), session_store=worker_a.store)
+    batches = [
+        (worker_a if i % 4 else worker_c).record_telemetry_async(
+            rid, TelemetryBatch(question_index=0, keys=[150] * 10, pastes=[(i, 1)])
+        ) for i in range(40)
+    ]
+    await asyncio.gather(*batches)
+    stored = await worker_a.get_answer_telemetry_async(rid, 0)
+    print(f"  40 concurrent batches: {len(stored['keys'])} keystrokes, {len(stored['pastes'])} pastes stored")
+    assert len(stored["keys"]) == 400 and stored["features"]["keystrokes"] == 400
+    assert sorted(t for t, _ in stored["pastes"]) == list(range(40))
+
+    print("\n=== Test 7: Batches for other questions or oversized are rejected ===")
+    other = new_session(worker_a, "telemetry_002")
+    for bad in [TelemetryBatch(question_index=1, keys=[100]), TelemetryBatch(question_index=0, keys=[100] * 6000)]:
+        try:
+            await worker_a.record_telemetry_async(other.session_id, bad)
+            assert False, "expected ValueError"
+        except ValueError as e:
+            print(f"  rejected: {e}")
+    print(f"  metrics: {worker_a.telemetry_metrics()}")
+
+def test_answer_telemetry():
+    print("Testing Answer Telemetry...")
+    asyncio.run(_run())
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Packed, compressed storage [OK]")
+    print("- Paste ratio / burst rate / focus features [OK]")
+    print("- Analyzers read features only [OK]")
+    print("- On-demand analysis uses telemetry [OK]")
+    print("- Concurrent batches serialized [OK]")
+
+if __name__ == "__main__":
+    test_answer_telemetry()
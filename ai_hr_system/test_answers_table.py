@@ -0,0 +1,94 @@
+import sys
+import os
+import uuid
+from datetime import datetime
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.question_engine.question_selector import QuestionSelector
+from app.interview_flow.session_manager import SessionManager
+from app.database import engine, SessionLocal
+from app import models
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def test_answers_table():
+    print("Testing interview_answers table...")
+
+    level_result = LevelDetectionResult(
+        candidate_name="Answers Candidate",
+        level=CandidateLevel.MIDDLE,
+        confidence_overall=0.7,
+        skills=["python", "sql"]
+    )
+    question_set = QuestionSelector().select_questions(level_result, max_total_questions=2, lang="en")
+    manager = SessionManager()
+    session = manager.create_session(
+        candidate_id="answers_001",
+        candidate_name="Answers Candidate",
+        candidate_phone="+998901234567",
+        candidate_email="answers@example.com",
+        question_set=question_set
+    )
+    sid = session.session_id
+
+    print("\n=== Test 1: Each submit appends one row ===")
+    for i in range(2):
+        manager.submit_answer(sid, f"Answer number {i}")
+    db = SessionLocal()
+    rows = db.query(models.InterviewAnswer).filter(models.InterviewAnswer.session_id == sid).order_by(models.InterviewAnswer.seq).all()
+    db_session = db.query(models.SessionModel).filter(models.SessionModel.id == sid).first()
+    print(f"  rows: {[(r.seq, r.question_id) for r in rows]}")
+    assert [r.seq for r in rows] == [0, 1]
+    assert rows[1].answer_text == "Answer number 1"
+    assert not db_session.answers, "The JSON column is no longer rewritten"
+    db.close()
+
+    print("\n=== Test 2: Hydration derives progress from rows ===")
+    hydrated = SessionManager()._load_session_from_db(sid)
+    print(f"  answers={len(hydrated.answers)} index={hydrated.current_question_index}")
+    assert [a.answer_text for a in hydrated.answers] == ["Answer number 0", "Answer number 1"]
+    assert hydrated.current_question_index == 2
+
+    print("\n=== Test 3: Legacy JSON sessions still load ===")
+    legacy_id = f"legacy-{uuid.uuid4()}"
+    db = SessionLocal()
+    db.add(models.SessionModel(
+        id=legacy_id,
+        status="finished",
+        total_questions=1,
+        current_question_index=1,
+        questions=[{"id": 1, "skill": "python", "difficulty": "easy", "question": "q"}],
+        answers=[{
+            "question_id": 1, "answer_text": "legacy answer", "time_spent": 42,
+            "submitted_at": datetime.now().isoformat(), "is_timeout": False, "ai_score": 0.1
+        }]
+    ))
+    db.commit()
+    db.close()
+    legacy = SessionManager()._load_session_from_db(legacy_id)
+    assert legacy.answers[0].answer_text == "legacy answer" and legacy.answers[0].time_spent == 42
+
+    print("\n=== Test 4: Duplicate seq is rejected instead of overwritten ===")
+    db = SessionLocal()
+    db.add(models.InterviewAnswer(session_id=sid, question_id=0, seq=1, answer_text="racing submit"))
+    try:
+        db.commit()
+        assert False, "A second answer at the same position must fail"
+    except Exception as e:
+        db.rollback()
+        print(f"  rejected: {type(e).__name__}")
+    finally:
+        db.close()
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Single INSERT per answer [OK]")
+    print("- Progress derived from answer count [OK]")
+    print("- Legacy JSON read path [OK]")
+
+if __name__ == "__main__":
+    test_answers_table()
@@ -0,0 +1,111 @@
+import sys
+import os
+import asyncio
+import tempfile
+import threading
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app import database
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.question_engine.question_selector import QuestionSelector
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.session_cache import SessionCache
+from app.interview_flow.session_store import SQLiteSessionStore
+from app.database import engine
+from app import models
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+class ThreadRecordingStore(SQLiteSessionStore):
+    """Shared store noting the threads its blocking calls run on"""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.threads = set()
+
+    def load(self, session_id):
+        self.threads.add(threading.get_ident())
+        return super().load(session_id)
+
+    def save(self, session):
+        self.threads.add(threading.get_ident())
+        super().save(session)
+
+    def delete(self, session_id, revision=None):
+        self.threads.add(threading.get_ident())
+        super().delete(session_id, revision)
+
+async def _interview(manager: SessionManager):
+    level_result = LevelDetectionResult(
+        candidate_name="Async Candidate",
+        level=CandidateLevel.MIDDLE,
+        confidence_overall=0.7,
+        skills=["python", "sql"]
+    )
+    question_set = QuestionSelector().select_questions(level_result, max_total_questions=2, lang="en")
+    session = await manager.create_session_async(
+        candidate_id="async_001",
+        candidate_name="Async Candidate",
+        candidate_phone="+998901234567",
+        candidate_email="async@example.com",
+        question_set=question_set
+    )
+    # Concurrent candidates on one event loop
+    others = await asyncio.gather(*(
+        manager.create_session_async(
+            candidate_id=f"async_{i}",
+            candidate_name="Async Candidate",
+            candidate_phone="+998901234567",
+            candidate_email=f"async{i}@example.com",
+            question_set=question_set
+        ) for i in range(5)
+    ))
+    await asyncio.gather(*(manager.submit_answer_async(s.session_id, "concurrent answer") for s in others))
+
+    while await manager.get_current_question_async(session.session_id):
+        await manager.submit_answer_async(session.session_id, "python and sql answer")
+
+    # A fresh manager has to hydrate the finished session from the database
+    fresh = SessionManager(session_cache=SessionCache())
+    status = await fresh.get_session_status_async(session.session_id)
+    summary = await fresh.get_session_summary_async(session.session_id)
+    await fresh.update_status(session.session_id, "REVIEWED")
+    return session, status, summary
+
+def test_async_session_flow():
+    print("Testing async session flow...")
+
+    for mode in ["thread", "driver"]:
+        database.init_async_engine(mode)
+        print(f"\n=== Mode: {mode} (async engine: {database.async_engine is not None}) ===")
+        session, status, summary = asyncio.run(_interview(SessionManager()))
+        print(f"  {status.status} answers={summary.answered_questions}/{summary.total_questions}")
+        assert status.status == "finished"
+        assert summary.answered_questions == session.total_questions
+        assert status.current_question_index == session.total_questions
+
+        db = database.SessionLocal()
+        row = db.query(models.SessionModel).filter(models.SessionModel.id == session.session_id).first()
+        assert row.status_internal == "REVIEWED" and row.end_time is not None
+        db.close()
+    database.init_async_engine(database.DB_ASYNC_MODE)
+
+    print("\n=== Shared live store stays off the event loop ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ThreadRecordingStore(os.path.join(tmp, "live_sessions.db"))
+        session, status, summary = asyncio.run(_interview(SessionManager(session_store=store)))
+        print(f"  store calls on {len(store.threads)} worker thread(s)")
+        assert status.status == "finished"
+        assert store.threads and threading.get_ident() not in store.threads
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Thread offload [OK]")
+    print("- Async engine [OK]")
+    print("- Live store calls off the event loop [OK]")
+
+if __name__ == "__main__":
+    test_async_session_flow()
@@ -0,0 +1,126 @@
+import sys
+import os
+import time
+from datetime import datetime
+from typing import Optional
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.question_engine.question_selector import QuestionSelector
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.schemas import Answer, SessionSummary, SessionStatus
+from app.answer_analysis.detection_queue import AIDetectionQueue
+from app.answer_analysis.final_analyzer import FinalAnalyzer
+from app.database import engine
+from app import models
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+ANSWERS = [
+    "I would use a dictionary to count elements, then sort by value.",
+    "It's important to note that, furthermore, best practices suggest a comprehensive overview. Moreover, typically.",
+    "I would use a dictionary to count elements, then sort by the value.",
+    "Indexes speed up reads but slow down writes; I add them for frequent filters."
+]
+
+class CountingAnalyzer(FinalAnalyzer):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def analyze_answer(self, *args, **kwargs):
+        self.calls += 1
+        return super().analyze_answer(*args, **kwargs)
+
+def _run_interview(manager: SessionManager, candidate_id: str, answers: Optional[int] = None) -> str:
+    level_result = LevelDetectionResult(
+        candidate_name="Integrity Candidate",
+        level=CandidateLevel.JUNIOR,
+        confidence_overall=0.7,
+        skills=["python", "sql"]
+    )
+    question_set = QuestionSelector().select_questions(level_result, max_total_questions=2, lang="en")
+    session = manager.create_session(
+        candidate_id=candidate_id,
+        candidate_name="Integrity Candidate",
+        candidate_phone="+998901234567",
+        candidate_email="integrity@example.com",
+        question_set=question_set
+    )
+    for i in range(session.total_questions if answers is None else answers):
+        manager.submit_answer(session.session_id, ANSWERS[i % len(ANSWERS)])
+    return session.session_id
+
+def test_integrity_reports():
+    print("Testing Per-Answer Integrity Reports...")
+
+    print("\n=== Test 1: Reports stored at submit, aggregation re-analyzes nothing ===")
+    manager = SessionManager()
+    sid = _run_interview(manager, "integrity_001")
+    stored = manager.get_integrity_reports(sid)
+    summary = manager.get_session_summary(sid)
+    session = manager.get_session_status(sid)
+    analyzer = CountingAnalyzer()
+    aggregated = analyzer.analyze_session(summary, session.questions, stored)
+    print(f"  stored={len(stored)}/{len(summary.answers)}, analyze_answer calls={analyzer.calls}")
+    assert len(stored) == len(summary.answers) and analyzer.calls == 0
+    recomputed = FinalAnalyzer().analyze_session(summary, session.questions)
+    assert aggregated.model_dump() == recomputed.model_dump(), "Stored reports must match a full pass"
+    assert "high_self_similarity" in stored[2].analysis_results[3].flags  # only earlier answers compared
+
+    print("\n=== Test 2: Background queue stores the reports ===")
+    queue = AIDetectionQueue(max_size=100)
+    queued_manager = SessionManager(ai_queue=queue)
+    sid = _run_interview(queued_manager, "integrity_002")
+    assert queue.wait_idle(timeout=5)
+    queue.stop()
+    stored = queued_manager.get_integrity_reports(sid)
+    summary = queued_manager.get_session_summary(sid)
+    print(f"  stored={len(stored)}/{len(summary.answers)}, honesty={[r.honesty_score for r in stored.values()]}")
+    assert len(stored) == len(summary.answers)
+    assert stored[1].is_suspicious and stored[1].ai_probability > 0.5
+
+    # A report still pending does not hide the stored ones
+    queue = AIDetectionQueue(max_size=100)
+    queued_manager = SessionManager(ai_queue=queue)
+    sid = _run_interview(queued_manager, "integrity_003", answers=1)
+    assert queue.wait_idle(timeout=5)
+    queue.stop()  # the next answer's analysis stays pending
+    queued_manager.submit_answer(sid, ANSWERS[1])
+    stored = queued_manager.get_integrity_reports(sid)
+    print(f"  one analysis pending: stored reports for answers {sorted(stored)}")
+    assert sorted(stored) == [0]
+
+    print("\n=== Test 3: Aggregation cost vs full pass (40 answers) ===")
+    long_answers = [
+        Answer(question_id=i, answer_text=(ANSWERS[i % 4] + " ") * 8, time_spent=90, submitted_at=datetime.now())
+        for i in range(40)
+    ]
+    summary = SessionSummary(
+        session_id="bench", candidate_name="Bench", total_questions=40, answered_questions=40,
+        total_time_spent=3600, status=SessionStatus.FINISHED, answers=long_answers
+    )
+    questions = [{"id": i, "difficulty": "medium"} for i in range(40)]
+    full = FinalAnalyzer()
+    t0 = time.perf_counter()
+    report = full.analyze_session(summary, questions)
+    full_ms = (time.perf_counter() - t0) * 1000
+    stored = {i: r for i, r in enumerate(report.answer_reports)}
+    t0 = time.perf_counter()
+    again = full.analyze_session(summary, questions, stored)
+    aggregate_ms = (time.perf_counter() - t0) * 1000
+    print(f"  full pass={full_ms:.1f}ms, aggregation={aggregate_ms:.2f}ms")
+    assert again.model_dump() == report.model_dump()
+    assert aggregate_ms < full_ms
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Reports computed once per answer [OK]")
+    print("- Same result as a full pass [OK]")
+    print("- O(n) session aggregation [OK]")
+
+if __name__ == "__main__":
+    test_integrity_reports()
@@ -0,0 +1,118 @@
+import sys
+import os
+import asyncio
+from datetime import timedelta
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from sqlalchemy import event
+from app.candidate_level.schemas import CandidateLevel
+from app.question_engine.question_selector import QuestionSelector
+from app.question_engine.adaptive_tester import AdaptiveTester
+from app.scoring.score_engine import ScoreEngine
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.schemas import SessionStatus
+from app.database import engine, run_sync_db
+from app.models import SessionResume
+from app import models
+from session_fixtures import new_session, level_result
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def _move_question_start(session_id: str, seconds: int):
+    """Question started `seconds` earlier, on another host (monotonic reading unusable)"""
+    def move(db):
+        resume = db.query(SessionResume).filter(SessionResume.session_id == session_id).first()
+        resume.question_started_at = resume.question_started_at - timedelta(seconds=seconds)
+        resume.timer = {"clock": "other-host", "started_ns": 1}
+    run_sync_db(move)
+
+def test_interview_resume():
+    print("Testing Interview Resume...")
+    worker_a = SessionManager()
+    session = new_session(worker_a, "resume_001")
+    token = session.resume_token
+    worker_a.submit_answer(session.session_id, "Answer before the reload")
+    print(f"  token issued: {token[:8]}...")
+    assert token
+
+    print("\n=== Test 1: Another worker resumes the current question ===")
+    worker_b = SessionManager()
+    resumed = asyncio.run(worker_b.resume_session_async(token))
+    question = resumed.current_question
+    print(f"  index={resumed.current_question_index} question_id={question.question_id} remaining={question.time_remaining}s")
+    assert resumed.status == SessionStatus.ACTIVE
+    assert resumed.current_question_index == 1
+    assert question.question_id == session.questions[1]["id"]
+    assert question.time_limit - 5 <= question.time_remaining <= question.time_limit
+    assert len(resumed.answers) == 1
+    assert worker_b.store.load(session.session_id) is not None
+
+    print("\n=== Test 2: Remaining time comes from the persisted question start ===")
+    worker_c = SessionManager()
+    _move_question_start(session.session_id, 100)
+    moved = asyncio.run(worker_c.resume_session_async(token))
+    remaining = moved.current_question.time_remaining
+    print(f"  after 100s elsewhere: remaining={remaining}s of {moved.current_question.time_limit}s")
+    assert moved.current_question.time_limit - 105 <= remaining <= moved.current_question.time_limit - 100
+
+    print("\n=== Test 3: Rehydration is a single indexed read ===")
+    statements = []
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        run_sync_db(worker_c._db_fetch_by_resume_token, token)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    print(f"  SQL statements: {len(statements)}")
+    assert len(statements) == 1
+
+    print("\n=== Test 4: Resumed session continues to the end ===")
+    for i in range(1, session.total_questions):
+        worker_c.submit_answer(session.session_id, f"Answer {i} after the reload")
+    finished = asyncio.run(SessionManager().resume_session_async(token))
+    print(f"  status after last answer: {finished.status.value}")
+    assert finished.status == SessionStatus.FINISHED
+    assert finished.current_question is None
+    assert len(finished.answers) == session.total_questions
+    assert finished.answers[0].answer_text == "Answer before the reload"
+
+    print("\n=== Test 5: Unknown token ===")
+    try:
+        asyncio.run(worker_c.resume_session_async("no-such-token"))
+        assert False, "expected ValueError"
+    except ValueError as e:
+        print(f"  rejected: {e}")
+
+    print("\n=== Test 6: Adaptive session keeps its CAT state across a resume ===")
+    tester = AdaptiveTester(QuestionSelector(), ScoreEngine(), min_technical_questions=2)
+    adaptive = SessionManager(adaptive_tester=tester).create_adaptive_session(
+        candidate_id="resume_002",
+        candidate_name="Resume Candidate",
+        candidate_phone="+998901234567",
+        candidate_email="resume_002@example.com",
+        level_result=level_result(CandidateLevel.MIDDLE, ["python", "sql", "docker"]),
+        max_technical_questions=3
+    )
+    worker_d = SessionManager(adaptive_tester=tester)
+    resumed = asyncio.run(worker_d.resume_session_async(adaptive.resume_token))
+    print(f"  resumed: mode={resumed.mode} total={resumed.total_questions}")
+    assert resumed.mode == "adaptive" and resumed.adaptive_state is not None
+    worker_d.submit_answer(adaptive.session_id, "Indexes, EXPLAIN plans and batched writes.")
+    live = worker_d.store.load(adaptive.session_id)
+    print(f"  after the first answer: status={live.status.value} total={live.total_questions}")
+    assert live.status == SessionStatus.ACTIVE and live.current_question_index == 1
+    assert live.total_questions == 2
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Resume token [OK]")
+    print("- Current question + remaining time restored [OK]")
+    print("- Single indexed read [OK]")
+    print("- Adaptive state resumed [OK]")
+
+if __name__ == "__main__":
+    test_interview_resume()
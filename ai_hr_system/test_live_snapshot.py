@@ -0,0 +1,129 @@
+import sys
+import os
+import json
+import asyncio
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.session_store import InMemorySessionStore
+from app.interview_flow.timeout_scheduler import QuestionTimeoutScheduler
+from app.interview_flow.draft_buffer import DraftBuffer
+from app.interview_flow.schemas import SessionStatus
+from app.interview_flow.timer import Timer
+from app.database import engine, run_sync_db
+from app.models import SessionModel, InterviewAnswer
+from app import models
+from session_fixtures import new_session
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+class AppProcess:
+    """One app lifetime, like app.main's lifespan: restore on startup, snapshot on shutdown"""
+
+    def __init__(self, snapshot_path: str):
+        self.snapshot_path = snapshot_path
+        self.scheduler = QuestionTimeoutScheduler()
+        self.drafts = DraftBuffer()
+        # No event log: without the snapshot a restart would strand the interview
+        self.manager = SessionManager(
+            session_store=InMemorySessionStore(), timeout_scheduler=self.scheduler, drafts=self.drafts
+        )
+        self.restored = 0
+
+    async def __aenter__(self):
+        self.scheduler.start(self.manager.expire_question_async)
+        self.drafts.start()
+        self.restored = self.manager.restore_live(self.snapshot_path)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.scheduler.stop()
+        await self.drafts.stop()
+        self.manager.snapshot_live(self.snapshot_path)
+
+def _age_current_question(manager: SessionManager, session_id: str, seconds: int):
+    """Pretend the candidate has been on the current question for `seconds`"""
+    session = manager.store.load(session_id)
+    question = session.current_question
+    question.timer = Timer.from_elapsed(question.difficulty, seconds * 1_000_000_000, question.started_at).to_state()
+    manager.store.save(session)
+
+async def _run():
+    path = os.path.join(tempfile.mkdtemp(), "live_state.snapshot")
+
+    print("\n=== Test 1: Shutdown mid-interview writes a compact snapshot ===")
+    async with AppProcess(path) as app:
+        session = new_session(app.manager, "restart_001", questions=3)
+        sid = session.session_id
+        await app.manager.submit_answer_async(sid, "First answer before the deploy.")
+        await app.manager.save_draft_async(sid, 1, 0, 0, 0, "Half of the second answer")
+        _age_current_question(app.manager, sid, 100)
+        remaining_before = app.manager.get_current_question(sid).time_remaining
+        live_json = len(app.manager.store.load(sid).model_dump_json())
+    size = os.path.getsize(path)
+    print(f"  snapshot: {size} bytes (session JSON: {live_json} bytes), {remaining_before}s left")
+    assert size < live_json
+
+    print("\n=== Test 2: Restart restores progress, timer and deadline ===")
+    async with AppProcess(path) as app:
+        assert app.restored == 1 and not os.path.exists(path)
+        live = app.manager.store.load(sid)
+        question = app.manager.get_current_question(sid)
+        print(f"  restored at question {live.current_question_index}, {question.time_remaining}s left")
+        assert live.current_question_index == 1 and len(live.answers) == 1
+        assert remaining_before - 2 <= question.time_remaining <= remaining_before
+        assert app.scheduler.metrics()["tracked_sessions"] == 1
+        assert (await app.manager.get_draft_async(sid)).text == "Half of the second answer"
+
+    print("\n=== Test 3: After a reboot the timer resumes from the time spent ===")
+    real_clock = Timer.CLOCK_ID
+    Timer.CLOCK_ID = "another-boot"
+    try:
+        async with AppProcess(path) as app:
+            question = app.manager.get_current_question(sid)
+            print(f"  rebased timer: {question.time_remaining}s left of {question.time_limit}s")
+            assert app.restored == 1
+            assert question.time_limit - 102 <= question.time_remaining <= question.time_limit - 100
+
+            print("\n=== Test 4: The interview completes after the restarts ===")
+            while app.manager.store.load(sid) is not None:
+                await app.manager.submit_answer_async(sid, "Answer after the restart.")
+    finally:
+        Timer.CLOCK_ID = real_clock
+
+    def stored(db):
+        row = db.query(SessionModel.status).filter(SessionModel.id == sid).scalar()
+        answers = db.query(InterviewAnswer).filter(InterviewAnswer.session_id == sid).count()
+        return row, answers
+    status, answers = run_sync_db(stored)
+    print(f"  stored session: status={status}, answers={answers}/{session.total_questions}")
+    assert status == SessionStatus.FINISHED.value and answers == session.total_questions
+
+    print("\n=== Test 5: Nothing live, unreadable snapshots ===")
+    async with AppProcess(path) as app:
+        assert app.restored == 0
+    with open(path, "rb") as f:
+        header = f.read(4)
+    assert header == b"HRLS"
+    with open(path, "wb") as f:
+        f.write(json.dumps({"not": "a snapshot"}).encode("utf-8"))
+    async with AppProcess(path) as app:
+        print(f"  corrupt snapshot restored: {app.restored}")
+        assert app.restored == 0
+
+def test_live_snapshot():
+    print("Testing Live State Snapshot/Restore...")
+    asyncio.run(_run())
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Snapshot on graceful shutdown [OK]")
+    print("- Restore before serving, timers resumed [OK]")
+    print("- Interview completed across restarts [OK]")
+
+if __name__ == "__main__":
+    test_live_snapshot()
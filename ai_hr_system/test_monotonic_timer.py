@@ -0,0 +1,70 @@
+import sys
+import os
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.timer import Timer
+from app.interview_flow.schemas import QuestionProgress
+
+def test_monotonic_timer():
+    print("Testing Monotonic Timer...")
+
+    print("\n=== Test 1: Wall-clock jump does not change time_spent ===")
+    timer = Timer("easy")
+    timer.start()
+    # NTP/DST moves the wall clock by an hour while the candidate is typing
+    timer.started_at -= timedelta(hours=1)
+    time.sleep(1.1)
+    spent = timer.stop()
+    print(f"  time_spent={spent}s, remaining={timer.get_time_remaining()}s")
+    assert spent == 1
+    assert not timer.is_timeout()
+
+    print("\n=== Test 2: State survives serialization (worker hop) ===")
+    timer = Timer("medium")
+    timer.start()
+    timer.started_ns -= 90 * 10 ** 9
+    progress = QuestionProgress(
+        question_id=1, question_text="q", skill="python", difficulty="medium",
+        time_limit=timer.time_limit, started_at=timer.started_at, timer=timer.to_state()
+    )
+    restored_progress = QuestionProgress.model_validate_json(progress.model_dump_json())
+    restored = Timer.from_state("medium", restored_progress.timer, restored_progress.started_at)
+    print(f"  state={restored_progress.timer} spent={restored.get_time_spent()}s")
+    assert restored.get_time_spent() == 90
+    assert restored.get_time_remaining() == 510
+
+    print("\n=== Test 3: Foreign host falls back to the wall-clock start ===")
+    state = {"clock": "another-host", "started_ns": 42}
+    restored = Timer.from_state("hard", state, datetime.now() - timedelta(seconds=30))
+    print(f"  spent={restored.get_time_spent()}s")
+    assert 30 <= restored.get_time_spent() <= 31
+    legacy = Timer.from_state("hard", None, datetime.now() - timedelta(seconds=899, milliseconds=900))
+    time.sleep(0.2)
+    assert legacy.is_timeout()
+
+    print("\n=== Test 4: Slotted timers are small ===")
+    assert not hasattr(Timer("easy"), "__dict__")
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    timers = [Timer("medium") for _ in range(10000)]
+    for t in timers:
+        t.start()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    per_timer = sum(s.size_diff for s in after.compare_to(before, "filename")) / len(timers)
+    print(f"  ~{per_timer:.0f} bytes per running timer")
+    assert per_timer < 400
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Monotonic elapsed time [OK]")
+    print("- Serializable timer state [OK]")
+    print("- Cross-host fallback [OK]")
+
+if __name__ == "__main__":
+    test_monotonic_timer()
@@ -0,0 +1,78 @@
+import sys
+import os
+import random
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.question_engine.question_selector import QuestionSelector
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+
+KNOWN_SKILLS = ["python", "javascript", "react", "node.js", "django", "postgresql", "sql", "docker"]
+UNKNOWN_SKILLS = ["kotlin", "rust", "golang", "terraform", "graphql", "redis", "vue", "swift"]
+LANGS = ["ru", "en", "uz"]
+ITERATIONS = 300
+
+def _random_case(rng: random.Random):
+    pool = KNOWN_SKILLS + UNKNOWN_SKILLS
+    skills = rng.sample(pool, rng.randint(0, len(pool)))
+    # Messy input: duplicates, case and whitespace variations, empties
+    skills += [s.upper() for s in rng.sample(skills, min(len(skills), rng.randint(0, 3)))]
+    skills += [" " + s + " " for s in rng.sample(skills, min(len(skills), rng.randint(0, 2)))]
+    skills += [""] * rng.randint(0, 2)
+    rng.shuffle(skills)
+    level_result = LevelDetectionResult(
+        candidate_name="Property Test",
+        level=rng.choice(list(CandidateLevel)),
+        confidence_overall=rng.random(),
+        skills=skills
+    )
+    return level_result, rng.randint(1, 10), rng.choice(LANGS)
+
+def test_question_engine_properties():
+    print("Testing Question Engine Invariants...")
+
+    rng = random.Random(20240601)
+    selector = QuestionSelector()
+
+    for i in range(ITERATIONS):
+        random.seed(i)  # selector uses the global RNG
+        level_result, max_total, lang = _random_case(rng)
+        qs = selector.select_questions(level_result, max_total_questions=max_total, lang=lang)
+        context = f"case={i} lang={lang} max={max_total} skills={level_result.skills}"
+
+        # 1. No duplicates (by content key and by ID)
+        keys = [(q.skill.lower().strip(), q.question.strip(), str(q.difficulty), str(q.type)) for q in qs.questions]
+        assert len(keys) == len(set(keys)), f"Duplicate question: {context}"
+        ids = [q.id for q in qs.questions]
+        assert len(ids) == len(set(ids)), f"Duplicate question ID: {context}"
+
+        # 2. Language consistency
+        assert all(q.lang == lang for q in qs.questions), f"Mixed languages: {context}"
+
+        # 3. Exactly three soft-skill questions, technical part within limits
+        soft = [q for q in qs.questions if q.skill == "soft_skills"]
+        technical = [q for q in qs.questions if q.skill != "soft_skills"]
+        assert len(soft) == 3, f"Expected 3 soft-skill questions, got {len(soft)}: {context}"
+        assert len(technical) <= max_total, f"Too many technical questions: {context}"
+
+        # 4. Only the candidate's (normalized, capped) skills and the level difficulty
+        candidate_skills = {s.lower().strip() for s in level_result.skills if s and s.strip()}
+        assert all(q.skill in candidate_skills for q in technical), f"Foreign skill: {context}"
+        assert len({q.skill for q in technical}) <= 10, f"Skill cap exceeded: {context}"
+        expected_difficulty = selector.level_difficulty_map[level_result.level]
+        assert all(q.difficulty == expected_difficulty for q in qs.questions), f"Wrong difficulty: {context}"
+
+        # 5. Declared total matches the payload
+        assert qs.total_questions == len(qs.questions)
+
+    print(f"  {ITERATIONS} random cases checked")
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- No duplicates [OK]")
+    print("- Language consistency [OK]")
+    print("- Soft-skill count [OK]")
+
+if __name__ == "__main__":
+    test_question_engine_properties()
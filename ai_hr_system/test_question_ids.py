@@ -0,0 +1,86 @@
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.question_engine.question_bank import QuestionBank
+from app.question_engine.question_generator import QuestionGenerator, GENERATED_ID_BASE
+from app.question_engine.schemas import DifficultyLevel, QuestionType
+
+def test_question_ids():
+    print("Testing Question ID Allocation...")
+
+    bank = QuestionBank()
+    print("\n=== Test 1: Generated IDs never collide with bank IDs ===")
+    gen = QuestionGenerator()
+    generated = []
+    for skill in ["kotlin", "rust", "golang", "python"]:
+        for difficulty in DifficultyLevel:
+            for lang in ["ru", "en", "uz"]:
+                generated.extend(gen.generate_questions(skill, difficulty, count=6, lang=lang))
+    bank_ids = set(bank.by_id)
+    gen_ids = [q.id for q in generated]
+    print(f"  Bank IDs: {len(bank_ids)}, generated: {len(gen_ids)}")
+    assert all(i >= GENERATED_ID_BASE for i in gen_ids)
+    assert not bank_ids & set(gen_ids)
+    assert all(QuestionGenerator.is_generated_id(i) for i in gen_ids)
+
+    print("\n=== Test 2: IDs are content hashes (stable across instances) ===")
+    by_id = {}
+    for q in generated:
+        if q.id in by_id:
+            assert by_id[q.id].question == q.question, "Same ID must mean same question"
+        by_id[q.id] = q
+    other = QuestionGenerator()
+    q1 = gen.generate_question("kotlin", DifficultyLevel.HARD, QuestionType.CASE, lang="en",
+                               template_ru=gen.templates[DifficultyLevel.HARD][QuestionType.CASE][0])
+    q2 = other.generate_question("kotlin", DifficultyLevel.HARD, QuestionType.CASE, lang="en",
+                                 template_ru=other.templates[DifficultyLevel.HARD][QuestionType.CASE][0])
+    print(f"  {q1.id} == {q2.id}")
+    assert q1.id == q2.id
+    assert QuestionGenerator.get_cached(q1.id).question == q1.question
+
+    print("\n=== Test 3: One call repeats a question only past the templates ===")
+    batch = gen.generate_questions("scala", DifficultyLevel.MEDIUM, count=6, lang="ru")
+    assert len({q.id for q in batch}) == len(batch) == 6
+    # 3 theory + 3 case templates: 8 questions means exactly 2 repeats
+    batch = gen.generate_questions("scala", DifficultyLevel.MEDIUM, count=8, lang="ru")
+    print(f"  count=8: {len(batch)} questions, {len({q.id for q in batch})} distinct")
+    assert len(batch) == 8 and len({q.id for q in batch}) == 6
+
+    print("\n=== Test 4: Concurrent generation ===")
+    def worker(i):
+        g = QuestionGenerator()
+        return [(q.id, q.question) for q in g.generate_questions(f"skill{i % 7}", DifficultyLevel.EASY, count=4, lang="en")]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = [pair for batch in pool.map(worker, range(200)) for pair in batch]
+    text_by_id = {}
+    for qid, text in results:
+        assert text_by_id.setdefault(qid, text) == text, "ID collision under concurrency"
+    print(f"  {len(results)} questions, {len(text_by_id)} distinct IDs")
+
+    print("\n=== Test 5: Cache is a bounded LRU ===")
+    QuestionGenerator.CACHE_MAX = 50
+    try:
+        for i in range(40):
+            gen.generate_questions(f"lru{i}", DifficultyLevel.HARD, count=2, lang="en")
+        recent = gen.generate_question("lru39", DifficultyLevel.HARD, QuestionType.CASE, lang="en")
+        metrics = QuestionGenerator.cache_metrics()
+        print(f"  {metrics}")
+        assert metrics["size"] == 50 and metrics["evictions"] > 0
+        assert QuestionGenerator.get_cached(q1.id) is None, "Least recently used entry must be evicted"
+        assert QuestionGenerator.template_for(recent.id) is not None
+    finally:
+        QuestionGenerator.CACHE_MAX = 4096
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Namespaced IDs [OK]")
+    print("- Deterministic content hashes [OK]")
+    print("- Cross-session cache [OK]")
+    print("- Bounded LRU cache [OK]")
+
+if __name__ == "__main__":
+    test_question_ids()
@@ -0,0 +1,109 @@
+import sys
+import os
+import time
+import random
+import asyncio
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.timeout_scheduler import QuestionTimeoutScheduler
+from app.database import engine
+from app import models
+from session_fixtures import new_session
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+FAR_FUTURE = 10 ** 6  # seconds added to the monotonic clock to make every deadline due
+
+async def _scheduler_scale():
+    fired = []
+
+    async def on_expire(session_id, question_index):
+        fired.append((session_id, question_index))
+
+    scheduler = QuestionTimeoutScheduler(grace_seconds=0)
+    scheduler._on_expire = on_expire
+    rng = random.Random(7)
+    n = 20000
+    t0 = time.perf_counter()
+    for i in range(n):
+        scheduler.schedule(f"s{i}", 0, rng.uniform(300, 900))
+    # Half of the sessions answered their first question: the old deadline must not fire
+    for i in range(0, n, 2):
+        scheduler.schedule(f"s{i}", 1, rng.uniform(300, 900))
+    elapsed_us = (time.perf_counter() - t0) / (n * 1.5) * 1e6
+    assert await scheduler.expire_due(time.monotonic() + 1) == 0
+    await scheduler.expire_due(time.monotonic() + FAR_FUTURE)
+    return scheduler, fired, n, elapsed_us
+
+async def _abandoned_interview():
+    scheduler = QuestionTimeoutScheduler(grace_seconds=0)
+    manager = SessionManager(timeout_scheduler=scheduler)
+    scheduler._on_expire = manager.expire_question_async
+
+    session = new_session(manager, "timeout_001")
+    sid = session.session_id
+    manager.submit_answer(sid, "first answer, then the tab is closed")
+
+    rounds = 0
+    while manager.store.load(sid) and rounds < 20:
+        live = manager.store.load(sid)
+        # The candidate is gone: pretend the question started long ago
+        live.current_question.timer["started_ns"] -= (live.current_question.time_limit + 1) * 10 ** 9
+        manager.store.save(live)
+        await scheduler.expire_due(time.monotonic() + FAR_FUTURE)
+        rounds += 1
+    return manager, scheduler, sid
+
+async def _background_task():
+    fired = asyncio.Event()
+
+    async def on_expire(session_id, question_index):
+        fired.set()
+
+    scheduler = QuestionTimeoutScheduler(grace_seconds=0)
+    scheduler.start(on_expire)
+    scheduler.schedule("later", 0, 3600)
+    scheduler.schedule("soon", 0, 0.05)  # earlier deadline must wake the sleeping task
+    await asyncio.wait_for(fired.wait(), timeout=2)
+    await scheduler.stop()
+    return scheduler
+
+def test_question_timeouts():
+    print("Testing Question Timeout Scheduler...")
+
+    print("\n=== Test 1: 20k sessions, stale deadlines skipped ===")
+    scheduler, fired, n, per_schedule_us = asyncio.run(_scheduler_scale())
+    print(f"  schedule(): {per_schedule_us:.2f}us, fired={len(fired)}, metrics={scheduler.metrics()}")
+    assert len(fired) == n
+    assert all(idx == 1 for sid, idx in fired if int(sid[1:]) % 2 == 0), "Superseded deadlines must not fire"
+    assert scheduler.metrics()["stale_skipped"] == n // 2
+    assert scheduler.metrics()["tracked_sessions"] == 0
+
+    print("\n=== Test 2: Abandoned interview times out and finishes ===")
+    manager, scheduler, sid = asyncio.run(_abandoned_interview())
+    final = manager.get_session_status(sid)
+    timeouts = [a for a in final.answers if a.is_timeout]
+    print(f"  status={final.status.value} answers={len(final.answers)} timeouts={len(timeouts)}")
+    assert final.status == "finished"
+    assert len(final.answers) == final.total_questions
+    assert len(timeouts) == final.total_questions - 1 and all(a.answer_text == "" for a in timeouts)
+    assert manager.store.count() == 0 and sid not in manager.answer_handlers
+    assert scheduler.metrics()["tracked_sessions"] == 0
+
+    print("\n=== Test 3: Background task wakes for earlier deadlines ===")
+    scheduler = asyncio.run(_background_task())
+    print(f"  {scheduler.metrics()}")
+    assert scheduler.metrics()["expired"] == 1
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- O(log n) heap scheduling [OK]")
+    print("- Timeout answers advance and finish sessions [OK]")
+    print("- Single background task [OK]")
+
+if __name__ == "__main__":
+    test_question_timeouts()
@@ -0,0 +1,161 @@
+import sys
+import os
+import asyncio
+import threading
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.question_engine.question_selector import QuestionSelector
+from app.interview_flow.session_manager import SessionManager
+from app.scoring.recommendation_cache import RecommendationCache
+from app.scoring.schemas import FinalRecommendation, ScoreBreakdown, RecommendationLevel, ConfidenceLevel
+from app.scoring import weight_config
+from app.answer_analysis.ai_detector import AIDetector
+from app.answer_analysis.detection_queue import AIDetectionQueue
+from app.database import engine
+from app import models
+from session_fixtures import new_session
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def _recommendation(session_id: str, score: int) -> FinalRecommendation:
+    return FinalRecommendation(
+        session_id=session_id,
+        candidate_name="Memo Candidate",
+        final_score=score,
+        decision=RecommendationLevel.REVIEW,
+        confidence=ConfidenceLevel.MEDIUM,
+        hr_comment="review",
+        score_breakdown=ScoreBreakdown(
+            knowledge_score=50, honesty_score=80, time_behavior_score=70, problem_solving_score=40
+        ),
+        flags=[],
+        metadata={"difficulty_mix": "medium"}
+    )
+
+class GatedDetector(AIDetector):
+    """Background detection that waits for the test to let it finish"""
+    def __init__(self, gate: threading.Event):
+        self.gate = gate
+
+    def analyze(self, text: str, time_spent: int = 0):
+        self.gate.wait()
+        return super().analyze(text, time_spent=time_spent)
+
+async def _flow():
+    manager = SessionManager()
+    level_result = LevelDetectionResult(
+        candidate_name="Memo Candidate",
+        level=CandidateLevel.JUNIOR,
+        confidence_overall=0.7,
+        skills=["python", "sql"]
+    )
+    question_set = QuestionSelector().select_questions(level_result, max_total_questions=2, lang="en")
+    session = manager.create_session(
+        candidate_id="memo_001",
+        candidate_name="Memo Candidate",
+        candidate_phone="+998901234567",
+        candidate_email="memo@example.com",
+        question_set=question_set
+    )
+    sid = session.session_id
+    results = {}
+
+    manager.submit_answer(sid, "first answer")
+    results["v_after_one"] = await manager.get_session_version_async(sid)
+    for i in range(1, session.total_questions):
+        manager.submit_answer(sid, f"answer {i}")
+    version = await manager.get_session_version_async(sid)
+    analyzed = await manager.get_analysis_version_async(sid)
+    results["v_finished"] = version
+
+    cache = RecommendationCache()
+    results["first_get"] = await cache.get(sid, version, analyzed)
+    await cache.put(_recommendation(sid, 61), version, analyzed)
+    results["memory_hit"] = await cache.get(sid, version, analyzed)
+
+    # Another worker (empty in-process cache) reads the stored copy
+    other_worker = RecommendationCache()
+    results["db_hit"] = await other_worker.get(sid, version, analyzed)
+
+    # Exactly one notification per version, even with concurrent clicks
+    claims = await asyncio.gather(*(cache.claim_notification(sid, version) for _ in range(5)))
+    results["claims"] = claims
+
+    # Status change bumps the version and invalidates the memo
+    await manager.update_status(sid, "REVIEWED", None, actor="TEST")
+    new_version = await manager.get_session_version_async(sid)
+    results["v_status"] = new_version
+    results["stale_get"] = await cache.get(sid, new_version, analyzed)
+    results["new_claim"] = await cache.claim_notification(sid, new_version)
+
+    # Scoring config change invalidates as well
+    await cache.put(_recommendation(sid, 64), new_version, analyzed)
+    weight_config.SCORING_LOGIC_VERSION += 1
+    results["config_get"] = await cache.get(sid, new_version, analyzed)
+    weight_config.SCORING_LOGIC_VERSION -= 1
+
+    # A background analysis landing invalidates a result computed while it was pending
+    gate = threading.Event()
+    queue = AIDetectionQueue(detector=GatedDetector(gate), max_size=10)
+    queued = SessionManager(ai_queue=queue)
+    qsid = new_session(queued, "memo_002").session_id
+    queued.submit_answer(qsid, "answer still being analyzed")
+    q_version = await queued.get_session_version_async(qsid)
+    pending = await queued.get_analysis_version_async(qsid)
+    await cache.put(_recommendation(qsid, 50), q_version, pending)
+    gate.set()
+    assert await asyncio.to_thread(queue.wait_idle, 5)
+    queue.stop()
+    landed = await queued.get_analysis_version_async(qsid)
+    results["analysis_versions"] = (pending, landed)
+    results["analysis_same_version"] = await queued.get_session_version_async(qsid) == q_version
+    results["analysis_get"] = await cache.get(qsid, q_version, landed)
+    results["analysis_claims"] = [
+        await cache.claim_notification(qsid, q_version), await cache.claim_notification(qsid, q_version)
+    ]
+    results["metrics"] = cache.metrics()
+    results["total"] = session.total_questions
+    return results
+
+def test_recommendation_cache():
+    print("Testing Memoized Recommendations...")
+    r = asyncio.run(_flow())
+
+    print("\n=== Test 1: Session version follows answers ===")
+    print(f"  after 1 answer: v{r['v_after_one']}, finished: v{r['v_finished']}")
+    assert r["v_after_one"] == 1 and r["v_finished"] == r["total"]
+
+    print("\n=== Test 2: Memory and database hits ===")
+    assert r["first_get"] is None
+    assert r["memory_hit"].final_score == 61
+    assert r["db_hit"] is not None and r["db_hit"].final_score == 61
+
+    print("\n=== Test 3: One notification per version ===")
+    print(f"  claims: {r['claims']}")
+    assert r["claims"].count(True) == 1
+
+    print("\n=== Test 4: Status change and scoring config invalidate ===")
+    print(f"  after status change: v{r['v_status']}, {r['metrics']}")
+    assert r["v_status"] == r["v_finished"] + 1
+    assert r["stale_get"] is None and r["new_claim"] is True
+    assert r["config_get"] is None
+
+    print("\n=== Test 5: Landed background analysis invalidates ===")
+    print(f"  analysis version: {r['analysis_versions'][0]} -> {r['analysis_versions'][1]}")
+    assert r["analysis_versions"] == (0, 1) and r["analysis_same_version"]
+    assert r["analysis_get"] is None
+    assert r["analysis_claims"] == [True, False]
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Versioned recommendation memo [OK]")
+    print("- Shared across workers via DB [OK]")
+    print("- Notification once per version [OK]")
+    print("- Analysis version in the memo key [OK]")
+
+if __name__ == "__main__":
+    test_recommendation_cache()
@@ -0,0 +1,85 @@
+import sys
+import os
+import re
+import zlib
+import numpy as np
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.question_engine.question_selector import QuestionSelector
+from app.question_engine.schemas import Question, QuestionType, DifficultyLevel
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.utils.translator import Translator
+
+class BagOfWordsEncoder:
+    """Small deterministic stand-in with the SentenceTransformer.encode() interface"""
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.calls = 0
+
+    def encode(self, texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True):
+        self.calls += 1
+        out = np.zeros((len(texts), self.dim), dtype=np.float64)
+        for i, text in enumerate(texts):
+            for token in re.findall(r"\w+", text.lower()):
+                out[i, zlib.crc32(token.encode("utf-8")) % self.dim] += 1.0
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        return out / np.maximum(norms, 1e-9)
+
+def test_semantic_dedup():
+    print("Testing Semantic Question De-duplication...")
+
+    selector = QuestionSelector()
+    # Paraphrase of bank question 13 ("Что такое Virtual DOM и зачем он нужен?")
+    paraphrase = Question(
+        id=5001, skill="react", difficulty=DifficultyLevel.EASY, type=QuestionType.THEORY,
+        question="What is Virtual DOM?", expected_topics=["virtual DOM"], lang="en"
+    )
+    selector.question_bank.questions.append(paraphrase)
+    selector.question_bank._build_indexes()
+
+    encoder = BagOfWordsEncoder()
+    index = selector.build_semantic_index(encoder, threshold=0.6)
+
+    print("\n=== Test 1: Compact float32 matrix ===")
+    print(f"  Matrix: {index.matrix.shape} {index.matrix.dtype}")
+    assert index.matrix.dtype == np.float32
+    assert np.allclose(np.linalg.norm(index.matrix, axis=1), 1.0, atol=1e-4)
+
+    print("\n=== Test 2: Translated bank question vs paraphrase ===")
+    original = selector.question_bank.by_id[13].model_copy()
+    original.question = Translator.translate(original.question, "en")
+    original.lang = "en"
+    kept = index.filter_near_duplicates([original, paraphrase])
+    print(f"  '{original.question}' ~ '{paraphrase.question}' -> kept {len(kept)}")
+    assert [q.id for q in kept] == [13]
+
+    print("\n=== Test 3: Same template, different skills are not duplicates ===")
+    gen = selector.generator
+    template = gen.templates[DifficultyLevel.EASY][QuestionType.THEORY][0]
+    q_kotlin = gen.generate_question("kotlin", DifficultyLevel.EASY, QuestionType.THEORY, lang="en", template_ru=template)
+    q_rust = gen.generate_question("rust", DifficultyLevel.EASY, QuestionType.THEORY, lang="en", template_ru=template)
+    assert len(index.filter_near_duplicates([q_kotlin, q_rust])) == 2
+
+    print("\n=== Test 4: No encoder calls on the request path ===")
+    calls_before = encoder.calls
+    level_result = LevelDetectionResult(
+        candidate_name="Semantic Test", level=CandidateLevel.JUNIOR,
+        confidence_overall=0.6, skills=["react", "javascript", "python", "kotlin"]
+    )
+    for _ in range(50):
+        qs = selector.select_questions(level_result, max_total_questions=5, lang="en")
+        ids = [q.id for q in qs.questions]
+        assert not (13 in ids and 5001 in ids), "Paraphrases selected together"
+    print(f"  Encoder calls: before={calls_before}, after={encoder.calls}")
+    assert encoder.calls == calls_before
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Precomputed float32 embeddings [OK]")
+    print("- Paraphrase suppression [OK]")
+    print("- Vectorized lookup without encoding [OK]")
+
+if __name__ == "__main__":
+    test_semantic_dedup()
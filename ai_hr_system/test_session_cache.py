@@ -0,0 +1,90 @@
+import sys
+import os
+import time
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.candidate_level.schemas import CandidateLevel, LevelDetectionResult
+from app.question_engine.question_selector import QuestionSelector
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.session_store import InMemorySessionStore
+from app.interview_flow.session_cache import SessionCache
+from app.database import engine, SessionLocal
+from app import models
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def _create(manager, n):
+    level_result = LevelDetectionResult(
+        candidate_name="Cache Candidate",
+        level=CandidateLevel.JUNIOR,
+        confidence_overall=0.7,
+        skills=["python"]
+    )
+    question_set = QuestionSelector().select_questions(level_result, max_total_questions=1, lang="en")
+    return manager.create_session(
+        candidate_id=f"cache_{n}",
+        candidate_name="Cache Candidate",
+        candidate_phone="+998901234567",
+        candidate_email="cache@example.com",
+        question_set=question_set
+    )
+
+def test_session_cache():
+    print("Testing Session Cache...")
+
+    print("\n=== Test 1: LRU bound and TTL ===")
+    cache = SessionCache(max_size=2, ttl_seconds=0.2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"  # "b" is now least recently used
+    cache.put("c", "C")
+    assert cache.get("b") is None and cache.get("a") == "A" and cache.get("c") == "C"
+    time.sleep(0.25)
+    assert cache.get("a") is None, "Entries must expire after the TTL"
+    metrics = cache.metrics()
+    print(f"  {metrics}")
+    assert metrics["evictions"] == 1 and metrics["expirations"] == 1
+    assert metrics["hits"] == 3 and metrics["misses"] == 2
+
+    print("\n=== Test 2: Historical browsing stays bounded ===")
+    db = SessionLocal()
+    ids = [row.id for row in db.query(models.SessionModel.id).limit(20).all()]
+    db.close()
+    manager = SessionManager(session_cache=SessionCache(max_size=5, ttl_seconds=60))
+    for sid in ids + ids[:3]:
+        manager.get_session_status(sid)
+    metrics = manager.cache_metrics()
+    print(f"  browsed {len(ids)} sessions: {metrics['hydrated']}")
+    assert metrics["hydrated"]["size"] <= 5
+    if len(ids) > 5:
+        assert metrics["hydrated"]["evictions"] >= len(ids) - 5
+
+    print("\n=== Test 3: Active sessions pinned, abandoned ones expire ===")
+    store = InMemorySessionStore(ttl_seconds=0.3)
+    manager = SessionManager(session_store=store, session_cache=SessionCache(max_size=1, ttl_seconds=60))
+    finished = _create(manager, 1)
+    while manager.get_current_question(finished.session_id):
+        manager.submit_answer(finished.session_id, "python answer")
+    abandoned = _create(manager, 2)
+    active = [_create(manager, 3 + i) for i in range(3)]
+    assert finished.session_id not in manager.answer_handlers, "Finished sessions release their handler"
+    assert all(manager.get_current_question(s.session_id) for s in active), "Active sessions are never evicted"
+    time.sleep(0.35)
+    _create(manager, 9)  # new sessions purge timed-out ones
+    metrics = manager.cache_metrics()
+    print(f"  {metrics}")
+    assert manager.get_current_question(abandoned.session_id) is None
+    assert abandoned.session_id not in manager.answer_handlers
+    assert metrics["active"]["active"] == 1 and metrics["active"]["expired"] == 4
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- LRU + TTL eviction [OK]")
+    print("- Bounded historical cache [OK]")
+    print("- Active session pinning and timeout [OK]")
+
+if __name__ == "__main__":
+    test_session_cache()
@@ -0,0 +1,88 @@
+import sys
+import os
+import asyncio
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.event_log import SessionEventLog, fold, attach_answer_texts
+from app.interview_flow.schemas import SessionStatus
+from app.database import engine, run_sync_db
+from app import models
+from session_fixtures import new_session
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def test_session_events():
+    print("Testing Session Event Log...")
+    log = SessionEventLog(snapshot_every=4)
+    manager = SessionManager(event_log=log)
+
+    print("\n=== Test 1: Every state change is an appended event ===")
+    session = new_session(manager, "events_001", questions=3)
+    sid = session.session_id
+    for i in range(session.total_questions):
+        manager.submit_answer(sid, f"Answer {i}: I would profile first, then optimize the hot path.")
+    asyncio.run(manager.update_status(sid, "REVIEWED", None, actor="TEST"))
+    session = manager.get_session_status(sid)
+
+    events = run_sync_db(log.events, sid)
+    types = [e["type"] for e in events]
+    print(f"  {len(events)} events: {types}")
+    assert types[0] == "SessionCreated"
+    assert types.count("QuestionStarted") == session.total_questions
+    assert types.count("AnswerSubmitted") == session.total_questions
+    assert types[-2:] == ["Finished", "StatusChanged"]
+    assert [e["seq"] for e in events] == list(range(len(events)))
+
+    print("\n=== Test 2: State is a fold over events ===")
+    # Answer texts live in interview_answers only; events refer to them by seq
+    assert all("answer_text" not in e["data"]["answer"] for e in events if e["type"] == "AnswerSubmitted")
+    folded = run_sync_db(lambda db: attach_answer_texts(db, fold((e["type"], e["data"]) for e in events)))
+    assert folded.status == SessionStatus.FINISHED
+    assert folded.status_internal == "REVIEWED"
+    assert [a.answer_text for a in folded.answers] == [a.answer_text for a in session.answers]
+    assert folded.end_time == session.end_time
+
+    print("\n=== Test 3: Hydration starts from the latest snapshot ===")
+    before = log.replayed_events
+    hydrated = run_sync_db(log.hydrate, sid)
+    replayed = log.replayed_events - before
+    print(f"  snapshots taken: {log.snapshots}, events replayed on hydrate: {replayed}/{len(events)}")
+    assert hydrated.model_dump() == folded.model_dump()
+    assert replayed < len(events)
+
+    print("\n=== Test 4: Crashed worker rebuilds a live session ===")
+    live = new_session(manager, "events_002", questions=3)
+    manager.submit_answer(live.session_id, "First answer before the crash.")
+    # New worker: empty live store, same database
+    restarted = SessionManager(event_log=SessionEventLog(snapshot_every=4))
+    question = restarted.get_current_question(live.session_id)
+    print(f"  recovered question index: {restarted.store.load(live.session_id).current_question_index}")
+    assert question is not None and question.question_id == live.questions[1]["id"]
+    restarted.submit_answer(live.session_id, "Second answer after the crash.")
+    recovered = run_sync_db(restarted.event_log.hydrate, live.session_id)
+    assert [a.answer_text for a in recovered.answers] == ["First answer before the crash.", "Second answer after the crash."]
+
+    print("\n=== Test 5: Replay re-scores history ===")
+    from replay_session_events import score_session
+    from app.answer_analysis.final_analyzer import FinalAnalyzer
+    from app.scoring.score_engine import ScoreEngine
+    from app.scoring.recommendation import RecommendationEngine
+    from app.scoring.confidence_level import ConfidenceAnalyzer
+    score, decision = score_session(folded, FinalAnalyzer(), ScoreEngine(), RecommendationEngine(), ConfidenceAnalyzer())
+    print(f"  replayed score: {score} ({decision.value})")
+    assert 0 <= score <= 100
+    print(f"  metrics: {log.metrics()}")
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Append-only session events [OK]")
+    print("- Fold + snapshot hydration [OK]")
+    print("- Crash recovery from history [OK]")
+    print("- Scoring replay [OK]")
+
+if __name__ == "__main__":
+    test_session_events()
@@ -0,0 +1,68 @@
+import sys
+import os
+import json
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.schemas import InterviewSession
+from app.interview_flow.payloads import SessionPayloadCache, FastJSONResponse
+from app.database import engine
+from app import models
+from session_fixtures import new_session, select_questions
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+def _model_json(session: InterviewSession):
+    """What the InterviewSession response_model produced"""
+    return InterviewSession.model_validate(session.model_dump()).model_dump(mode="json")
+
+def test_session_payloads():
+    print("Testing Session Payload Serialization...")
+    manager = SessionManager()
+    payloads = SessionPayloadCache(max_sessions=2)
+
+    print("\n=== Test 1: Question dicts without a string round trip ===")
+    question_set = select_questions(4)
+    session = new_session(manager, "payload_001", question_set=question_set)
+    legacy = [json.loads(q.model_dump_json()) for q in question_set.questions]
+    assert session.questions == legacy
+    print(f"  {len(session.questions)} questions, same dicts as json.loads(q.json())")
+
+    print("\n=== Test 2: Rendered session equals the response model ===")
+    first = payloads.render(session)
+    assert json.loads(first) == _model_json(session)
+    manager.submit_answer(session.session_id, "Use EXPLAIN, add the missing index, batch the writes.")
+    live = manager.store.load(session.session_id)
+    second = payloads.render(live)
+    assert json.loads(second) == _model_json(live)
+    assert json.loads(second)["answers"][0]["answer_text"].startswith("Use EXPLAIN")
+    print(f"  metrics after 2 renders: {payloads.metrics()}")
+    assert payloads.hits == 1 and payloads.misses == 1
+
+    print("\n=== Test 3: Grown question list (adaptive) is re-rendered ===")
+    live.questions.append(dict(live.questions[0], id=999999))
+    live.total_questions += 1
+    grown = json.loads(payloads.render(live))
+    assert grown["questions"][-1]["id"] == 999999 and grown == _model_json(live)
+    assert payloads.misses == 2
+
+    print("\n=== Test 4: Cache is bounded; dict responses ===")
+    for i in range(3):
+        payloads.render(new_session(manager, f"payload_00{i + 2}", questions=4))
+    assert payloads.metrics()["sessions"] == 2
+    response = FastJSONResponse({"answer": live.answers[0].model_dump(mode="json"), 1: "non-str key"})
+    body = json.loads(response.body)
+    print(f"  backend: {payloads.metrics()['json_backend']}, keys: {sorted(body)}")
+    assert body["answer"]["answer_text"] == live.answers[0].answer_text and body["1"] == "non-str key"
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- model_dump(mode=json) questions [OK]")
+    print("- Cached question JSON in session responses [OK]")
+    print("- orjson responses [OK]")
+
+if __name__ == "__main__":
+    test_session_payloads()
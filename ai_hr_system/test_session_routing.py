@@ -0,0 +1,207 @@
+import sys
+import os
+import uuid
+import asyncio
+from typing import Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI, Body, Header, Request
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.session_store import InMemorySessionStore
+from app.interview_flow.draft_buffer import DraftBuffer
+from app.routing.hash_ring import HashRing
+from app.routing.router import SessionRouter
+from app.database import engine
+from app import models
+from session_fixtures import select_questions
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+TOKEN = "test-internal-token"
+
+def _worker_app(name: str, manager: SessionManager, question_set) -> FastAPI:
+    """Stand-in for app.main on one worker: the routed endpoints plus /internal"""
+    app = FastAPI()
+
+    @app.post("/start-interview")
+    async def start(candidate_id: str = Body(..., embed=True), x_session_id: Optional[str] = Header(None)):
+        session = await manager.create_session_async(
+            candidate_id=candidate_id,
+            candidate_name="Routing Candidate",
+            candidate_phone="+998901234567",
+            candidate_email=f"{candidate_id}@example.com",
+            question_set=question_set,
+            session_id=x_session_id
+        )
+        return {"session_id": session.session_id, "worker": name}
+
+    @app.get("/session-status/{session_id}")
+    async def status(session_id: str):
+        return {"worker": name, "live": manager.store.load(session_id) is not None}
+
+    @app.post("/submit-answer-stream/{session_id}")
+    async def submit_stream(session_id: str, request: Request):
+        chunks = [chunk async for chunk in request.stream() if chunk]
+        return {"worker": name, "chunks": len(chunks), "bytes": sum(len(c) for c in chunks)}
+
+    @app.get("/candidates")
+    async def candidates():
+        return {"worker": name}
+
+    @app.get("/internal/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.post("/internal/handoff")
+    async def handoff(workers: List[str] = Body(...), node: str = Body(...), vnodes: int = Body(160)):
+        ring = HashRing(workers, vnodes)
+        return {"sessions": await manager.release_sessions_async(lambda sid: ring.node_for(sid) == node)}
+
+    @app.post("/internal/adopt")
+    async def adopt(sessions: List[Dict] = Body(..., embed=True)):
+        return {"adopted": await manager.adopt_sessions_async(sessions)}
+
+    return app
+
+class WorkerTransport(httpx.AsyncBaseTransport):
+    """Sends each request to the in-process app of its worker URL"""
+
+    def __init__(self, apps: Dict[str, FastAPI]):
+        self.transports = {url: httpx.ASGITransport(app=app) for url, app in apps.items()}
+
+    async def handle_async_request(self, request):
+        url = f"{request.url.scheme}://{request.url.host}:{request.url.port}"
+        if url not in self.transports:
+            raise httpx.ConnectError(f"{url} is down", request=request)
+        return await self.transports[url].handle_async_request(request)
+
+async def _run():
+    print("\n=== Test 1: Ring spreads sessions and remaps few on join ===")
+    nodes = [f"http://127.0.0.1:{8101 + i}" for i in range(4)]
+    ring = HashRing(nodes)
+    keys = [str(uuid.uuid4()) for _ in range(20000)]
+    before = {k: ring.node_for(k) for k in keys}
+    shares = [sum(1 for k in keys if before[k] == n) / len(keys) for n in nodes]
+    print(f"  shares: {[round(s, 3) for s in shares]}")
+    assert all(0.18 < s < 0.32 for s in shares)
+    ring.add("http://127.0.0.1:8105")
+    moved = [k for k in keys if ring.node_for(k) != before[k]]
+    print(f"  moved on join: {len(moved) / len(keys):.1%}")
+    assert 0.12 < len(moved) / len(keys) < 0.28
+    assert all(ring.node_for(k) == "http://127.0.0.1:8105" for k in moved)
+    ring.remove("http://127.0.0.1:8105")
+    assert all(ring.node_for(k) == before[k] for k in keys)
+
+    print("\n=== Test 2: Sessions stay on their worker ===")
+    question_set = select_questions()
+    urls = ["http://worker-a:8101", "http://worker-b:8102", "http://worker-c:8103"]
+    managers = {url: SessionManager(session_store=InMemorySessionStore(), drafts=DraftBuffer()) for url in urls}
+    apps = {url: _worker_app(url, managers[url], question_set) for url in urls}
+    transport = WorkerTransport(apps)
+    router = SessionRouter(
+        urls[:2], TOKEN, health_interval=0, client=httpx.AsyncClient(transport=transport),
+        answer_max_chars=1000, answer_stream_max_chars=4000
+    )
+    await router.start()
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=router), base_url="http://router")
+
+    created = []
+    for i in range(30):
+        res = await client.post("/start-interview", json={"candidate_id": f"routing_{i:03d}"})
+        assert res.status_code == 200
+        created.append(res.json())
+    for item in created:
+        assert item["worker"] == router.ring.node_for(item["session_id"])
+        for _ in range(3):
+            status = (await client.get(f"/session-status/{item['session_id']}")).json()
+            assert status == {"worker": item["worker"], "live": True}
+    per_worker = {url: managers[url].store.count() for url in urls}
+    print(f"  live sessions per worker: {per_worker}")
+    assert per_worker[urls[2]] == 0 and min(per_worker[urls[0]], per_worker[urls[1]]) > 0
+    others = {(await client.get("/candidates")).json()["worker"] for _ in range(4)}
+    assert others == set(urls[:2])
+    # The session ID header only comes from the router
+    res = await client.post("/start-interview", json={"candidate_id": "routing_spoof"}, headers={"X-Session-Id": "spoofed"})
+    assert res.json()["session_id"] != "spoofed"
+
+    print("\n=== Test 3: Joining worker takes its share, with drafts ===")
+    owner = created[0]["worker"]
+    sid = created[0]["session_id"]
+    await managers[owner].save_draft_async(sid, 0, 0, 0, 0, "half-typed answer")
+    moved = await router.add_worker(urls[2])
+    print(f"  moved on join: {moved}, per worker: {[managers[u].store.count() for u in urls]}")
+    assert moved == managers[urls[2]].store.count() > 0
+    for item in created:
+        sid_i = item["session_id"]
+        new_owner = router.ring.node_for(sid_i)
+        status = (await client.get(f"/session-status/{sid_i}")).json()
+        assert status == {"worker": new_owner, "live": True}
+        for url in urls:
+            if url != new_owner:
+                assert managers[url].store.load(sid_i) is None
+    holder = managers[router.ring.node_for(sid)]
+    assert (await holder.get_draft_async(sid)).text == "half-typed answer"
+
+    print("\n=== Test 4: Graceful leave hands sessions back ===")
+    leaving = urls[0]
+    count = managers[leaving].store.count()
+    moved = await router.remove_worker(leaving)
+    print(f"  moved on leave: {moved} of {count}")
+    assert moved == count and managers[leaving].store.count() == 0
+    for item in created:
+        status = (await client.get(f"/session-status/{item['session_id']}")).json()
+        assert status["worker"] != leaving and status["live"]
+    total = sum(managers[url].store.count() for url in urls)
+    assert total == len(created) + 1
+
+    print("\n=== Test 5: Unreachable worker is dropped by the health check ===")
+    del transport.transports[urls[1]]
+    await router.check_health()
+    print(f"  status: {router.metrics()}")
+    assert router.ring.nodes == [urls[2]]
+    res = await client.get(f"/session-status/{created[1]['session_id']}")
+    assert res.json()["worker"] == urls[2]
+
+    print("\n=== Test 6: Bodies streamed through, answer limits, admin token ===")
+    async def upload(parts: int, size: int):
+        for _ in range(parts):
+            yield b"x" * size
+    sid = created[0]["session_id"]
+    res = await client.post(f"/submit-answer-stream/{sid}", content=upload(8, 1000))
+    print(f"  chunked 8KB upload: {res.status_code} {res.json()}")
+    assert res.status_code == 200 and res.json()["bytes"] == 8000
+    assert res.json()["chunks"] > 1  # forwarded as it arrived, not as one buffered body
+    res = await client.post(f"/submit-answer-stream/{sid}", content=upload(20, 1000))
+    assert res.status_code == 413
+    res = await client.post(f"/submit-answer-stream/{sid}", content=b"x" * 20000)
+    assert res.status_code == 413
+    res = await client.post(f"/submit-answer/{sid}", json={"answer_text": "x" * 7000})
+    assert res.status_code == 413
+    assert router.metrics()["rejected_bodies"] == 3
+    assert (await client.get("/router/status")).status_code == 403
+    assert (await client.get("/router/status", headers={"X-Internal-Token": "wrong"})).status_code == 403
+    res = await client.get("/router/status", headers={"X-Internal-Token": TOKEN})
+    assert res.status_code == 200 and res.json()["workers"] == [urls[2]]
+
+    await client.aclose()
+    await router.stop()
+    await router.client.aclose()
+
+def test_session_routing():
+    print("Testing Sticky Session Routing...")
+    asyncio.run(_run())
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Consistent hashing with minimal remap [OK]")
+    print("- Same session -> same worker [OK]")
+    print("- Handoff on join/leave [OK]")
+    print("- Streamed bodies, answer limits, admin token [OK]")
+
+if __name__ == "__main__":
+    test_session_routing()
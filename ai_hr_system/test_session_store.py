@@ -0,0 +1,208 @@
+import sys
+import os
+import tempfile
+import fnmatch
+from datetime import timedelta
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.session_store import (
+    SessionStore, SQLiteSessionStore, RedisSessionStore, InMemorySessionStore, StaleSessionError, WatchError
+)
+from app.database import engine
+from app import models
+from session_fixtures import new_session
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+class LocalRedis:
+    """Local stand-in for the GET/SET/DEL subset of a Redis server"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def scan_iter(self, match="*"):
+        return [k for k in self.data if fnmatch.fnmatch(k, match)]
+
+    def pipeline(self):
+        return LocalPipeline(self)
+
+class LocalPipeline:
+    """WATCH/MULTI/EXEC: the queued commands run only if no watched key changed"""
+
+    def __init__(self, server):
+        self.server = server
+        self.watched = {}
+        self.queued = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def watch(self, key):
+        self.watched[key] = self.server.get(key)
+
+    def get(self, key):
+        return self.server.get(key)
+
+    def multi(self):
+        self.queued = []
+
+    def set(self, key, value, ex=None):
+        self.queued.append(lambda: self.server.set(key, value, ex))
+
+    def delete(self, key):
+        self.queued.append(lambda: self.server.delete(key))
+
+    def execute(self):
+        if any(self.server.get(key) != value for key, value in self.watched.items()):
+            raise WatchError("watched key changed")
+        for command in self.queued:
+            command()
+
+def _run_across_workers(store_a, store_b):
+    """Two SessionManagers (two workers) sharing one store serve one interview alternately"""
+    worker_a = SessionManager(session_store=store_a)
+    worker_b = SessionManager(session_store=store_b)
+    session = new_session(worker_a, "store_001")
+    sid = session.session_id
+
+    # Worker B sees the question worker A started, with the same start time
+    question = worker_b.get_current_question(sid)
+    assert question is not None, "Second worker must find the live session"
+    assert question.question_id == session.current_question.question_id
+    assert question.started_at == session.current_question.started_at
+    assert 0 < question.time_remaining <= question.time_limit
+
+    workers = [worker_b, worker_a]
+    for i in range(session.total_questions):
+        workers[i % 2].submit_answer(sid, f"Answer {i}: python sql indexes transactions")
+
+    final = worker_a.get_session_status(sid)
+    assert final.status == "finished"
+    assert len(final.answers) == session.total_questions
+    assert worker_b.get_current_question(sid) is None
+    try:
+        worker_b.submit_answer(sid, "late")
+        assert False, "Finished session must not accept answers"
+    except ValueError:
+        pass
+    return final
+
+def _race_on_one_question(store_a, store_b):
+    """Two workers answer the same question; the one holding a stale copy is rejected"""
+    worker_a = SessionManager(session_store=store_a)
+    worker_b = SessionManager(session_store=store_b)
+    session = new_session(worker_a, "store_003")
+    sid = session.session_id
+
+    # B read the record before A's answer landed
+    stale = store_b.load(sid)
+    worker_a.submit_answer(sid, "Answer from worker A")
+    store_b.load = lambda session_id: stale
+    try:
+        worker_b.submit_answer(sid, "Answer from worker B")
+        assert False, "Stale copy must not overwrite the session"
+    except StaleSessionError as e:
+        print(f"  worker B rejected: {e}")
+
+    live = store_a.load(sid)
+    assert len(live.answers) == 1 and live.answers[0].answer_text == "Answer from worker A"
+    assert live.current_question_index == 1
+    # The winner's answer is the one the database has too
+    stored = worker_a._load_session_from_db(sid)
+    assert [a.answer_text for a in stored.answers] == ["Answer from worker A"]
+
+    # Finishing with a stale copy fails as well: the record stays live
+    for _ in range(1, session.total_questions - 1):
+        worker_a.submit_answer(sid, "Next answer from worker A")
+    stale = store_b.load(sid)
+    store_a.save(store_a.load(sid))
+    try:
+        store_b.delete(sid, revision=stale.revision)
+        assert False, "Stale delete must fail"
+    except StaleSessionError:
+        pass
+    assert store_a.load(sid) is not None
+
+def test_session_store():
+    print("Testing Session Store...")
+
+    print("\n=== Test 1: Shared SQLite (WAL) store ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "live_sessions.db")
+        final = _run_across_workers(SQLiteSessionStore(path), SQLiteSessionStore(path))
+        print(f"  {final.session_id}: {len(final.answers)} answers over 2 workers")
+        assert SQLiteSessionStore(path).count() == 0, "Finished sessions leave the live store"
+
+    print("\n=== Test 2: Redis-compatible store ===")
+    server = LocalRedis()
+    final = _run_across_workers(RedisSessionStore(client=server), RedisSessionStore(client=server))
+    print(f"  {final.session_id}: {len(final.answers)} answers over 2 workers")
+    assert not server.data
+
+    print("\n=== Test 3: Concurrent answers, compare-and-set ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "live_sessions.db")
+        _race_on_one_question(SQLiteSessionStore(path), SQLiteSessionStore(path))
+    server = LocalRedis()
+    _race_on_one_question(RedisSessionStore(client=server), RedisSessionStore(client=server))
+    # In-process store: loads are copies, so an earlier copy goes stale too
+    store = InMemorySessionStore()
+    sid = new_session(SessionManager(session_store=store), "store_004").session_id
+    first, second = store.load(sid), store.load(sid)
+    assert first is not second
+    first.status_internal = "REVIEWED"
+    assert store.load(sid).status_internal == "PENDING"
+    store.save(first)
+    try:
+        store.save(second)
+        assert False, "Stale in-memory copy must not overwrite the session"
+    except StaleSessionError:
+        pass
+    # A backend missing a method fails when it is created, not on first use
+    class PartialStore(SessionStore):
+        def load(self, session_id):
+            return None
+    try:
+        PartialStore()
+        assert False, "Incomplete store must not be instantiable"
+    except TypeError as e:
+        print(f"  incomplete backend: {e}")
+
+    print("\n=== Test 4: Timer survives a reload ===")
+    store = InMemorySessionStore()
+    manager = SessionManager(session_store=store)
+    session = new_session(manager, "store_002")
+    # Simulate a question started 2 minutes ago on another worker
+    session.current_question.started_at -= timedelta(seconds=120)
+    session.current_question.timer["started_ns"] -= 120 * 10 ** 9
+    store.save(session)
+    restarted = SessionManager(session_store=store)
+    answer = restarted.submit_answer(session.session_id, "python answer")
+    print(f"  time_spent after reload: {answer.time_spent}s")
+    assert 120 <= answer.time_spent <= 125
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- SQLite WAL store shared by workers [OK]")
+    print("- Redis-compatible store [OK]")
+    print("- Stale writes rejected [OK]")
+    print("- Question start time persisted [OK]")
+
+if __name__ == "__main__":
+    test_session_store()
@@ -0,0 +1,94 @@
+import sys
+import os
+import asyncio
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.getcwd())
+
+from app.interview_flow.session_manager import SessionManager
+from app.interview_flow.event_log import SessionEventLog
+from app.interview_flow.write_behind import WriteBehindWriter
+from app.database import engine, run_sync_db
+from app.models import InterviewAnswer, SessionModel
+from app import models
+from session_fixtures import new_session, select_questions
+
+# Initialize database for tests
+models.Base.metadata.create_all(bind=engine)
+
+QUESTION_SET = select_questions()
+
+def _stored_answers(session_id: str) -> int:
+    return run_sync_db(lambda db: db.query(InterviewAnswer).filter(InterviewAnswer.session_id == session_id).count())
+
+def _writer(journal: str, flush_interval_ms: int) -> WriteBehindWriter:
+    return WriteBehindWriter(journal, flush_interval_ms=flush_interval_ms, max_batch=10_000)
+
+def test_write_behind():
+    print("Testing Write-Behind Persistence...")
+    journal_dir = tempfile.mkdtemp()
+
+    print("\n=== Test 1: Writes are committed in batches ===")
+    writer = _writer(os.path.join(journal_dir, "batched.journal"), 100)
+    manager = SessionManager(event_log=SessionEventLog(), write_behind=writer)
+    writer.start(manager.apply_write)
+    sessions = [new_session(manager, f"behind_{i}", question_set=QUESTION_SET) for i in range(4)]
+    for session in sessions:
+        for i in range(session.total_questions):
+            manager.submit_answer(session.session_id, f"answer {i}")
+    assert writer.drain(timeout=10)
+    metrics = writer.metrics()
+    print(f"  {metrics['written']} writes in {metrics['commits']} commits, saved {metrics['commits_saved']}")
+    assert metrics["written"] == metrics["submitted"]
+    assert metrics["commits"] < metrics["written"]
+    for session in sessions:
+        assert _stored_answers(session.session_id) == session.total_questions
+
+    print("\n=== Test 2: Reads wait for the session's pending writes ===")
+    session = new_session(manager, "behind_read", question_set=QUESTION_SET)
+    manager.submit_answer(session.session_id, "read my write")
+    version = asyncio.run(manager.get_session_version_async(session.session_id))
+    print(f"  version right after submit: {version}")
+    assert version == 1
+    writer.stop()
+
+    print("\n=== Test 3: Journaled writes survive a crash ===")
+    journal = os.path.join(journal_dir, "crash.journal")
+    crashed_writer = _writer(journal, 3_600_000)  # never flushes on its own
+    crashed = SessionManager(event_log=SessionEventLog(), write_behind=crashed_writer)
+    crashed_writer.start(crashed.apply_write)
+    lost = new_session(crashed, "behind_crash", question_set=QUESTION_SET)
+    crashed.submit_answer(lost.session_id, "acknowledged before the crash")
+    exists = run_sync_db(lambda db: db.query(SessionModel).filter(SessionModel.id == lost.session_id).count())
+    print(f"  before restart: session rows={exists}, journal entries={crashed_writer.metrics()['submitted']}")
+    assert exists == 0
+
+    # Restart: a new writer on the same journal replays it
+    restarted_writer = _writer(journal, 100)
+    restarted = SessionManager(event_log=SessionEventLog(), write_behind=restarted_writer)
+    restarted_writer.start(restarted.apply_write)
+    print(f"  recovered writes: {restarted_writer.recovered}")
+    assert restarted_writer.recovered == 2
+    assert _stored_answers(lost.session_id) == 1
+    events = asyncio.run(restarted.get_session_events_async(lost.session_id))
+    assert [e["type"] for e in events][:3] == ["SessionCreated", "QuestionStarted", "AnswerSubmitted"]
+    restarted_writer.stop()
+
+    print("\n=== Test 4: Replay is exactly once ===")
+    again = _writer(journal, 100)
+    again.start(SessionManager(write_behind=again).apply_write)
+    print(f"  recovered on second restart: {again.recovered}")
+    assert again.recovered == 0
+    assert _stored_answers(lost.session_id) == 1
+    again.stop()
+
+    print("\n\n=== Validation ===")
+    print("[SUCCESS] All tests passed!")
+    print("- Batched commits [OK]")
+    print("- Read-your-writes [OK]")
+    print("- Journal recovery after crash [OK]")
+    print("- Exactly-once replay [OK]")
+
+if __name__ == "__main__":
+    test_write_behind()